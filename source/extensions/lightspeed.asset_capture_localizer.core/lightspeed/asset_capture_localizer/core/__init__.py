@@ -15,4 +15,5 @@
 * limitations under the License.
 """
 
+from .capture_mesh_index import CaptureMeshEntry, CaptureMeshIndex, get_capture_mesh_index
 from .core import *  # noqa: F401
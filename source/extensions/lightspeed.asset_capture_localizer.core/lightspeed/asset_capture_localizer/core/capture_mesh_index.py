@@ -0,0 +1,288 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["CaptureMeshEntry", "CaptureMeshIndex", "get_capture_mesh_index"]
+
+import json
+import os
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import carb
+import carb.tokens
+from pxr import Sdf, Usd
+
+_INDEX_VERSION = 2
+_DEFAULT_CACHE_FILE = "${cache}/lightspeed.asset_capture_localizer.core/capture_mesh_index.json"
+# Capture prims are named after their hash: mesh_0123456789ABCDEF, inst_0123456789ABCDEF_0, etc.
+_CAPTURE_PRIM_NAME_REGEX = re.compile(r"^[a-zA-Z]+_[A-Z0-9]{16}(_[0-9]+)*$")
+
+
+class CaptureMeshEntry(NamedTuple):
+    prim_path: str
+    asset_path: Optional[str]  # The absolute path of the first asset referenced by the prim, if any
+
+
+class CaptureMeshIndex:
+    """
+    Index of the prims of capture layers: prim name (mesh hash) to prim path and referenced asset.
+
+    The capture layer and its sublayers are read with Sdf, without composing a stage. When prims other than the
+    capture prims carry composition arcs, the children they bring can only be found on the composed stage, so the
+    capture file is opened on a stage instead.
+
+    Each layer index is keyed by the modification time of every layer it was built from, so it's only built again
+    when one of them changes, and the index can be persisted in a JSON file to be reused across sessions.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None):
+        """
+        Args:
+            cache_file: the JSON file to persist the index in. If None, the index is only kept in memory.
+        """
+        self._cache_file = cache_file
+        self._layers: Dict[str, dict] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def get_layer_index(self, layer_path: str) -> Dict[str, CaptureMeshEntry]:
+        """
+        Get the index of a capture layer, building it if the layer or one of its dependencies changed since it was
+        indexed
+
+        Args:
+            layer_path: the path of the capture layer
+
+        Returns:
+            The prim name to entry index of the layer. Empty if the layer can't be read.
+        """
+        self._load()
+        key = self._get_key(layer_path)
+        if not os.path.exists(layer_path):
+            if self._layers.pop(key, None) is not None:
+                self._dirty = True
+            return {}
+
+        cached = self._layers.get(key)
+        if cached is None or not self._is_up_to_date(cached["dependencies"]):
+            result = self._build_layer_index(layer_path)
+            if result is None:
+                return {}
+            meshes, dependencies = result
+            cached = {"dependencies": self._get_mtimes(dependencies), "meshes": meshes}
+            self._layers[key] = cached
+            self._dirty = True
+        return cached["meshes"]
+
+    def get_mesh_dict(self, layer_paths: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the capture layer of every indexed prim. When a prim name is found in multiple layers, the last layer wins.
+
+        Args:
+            layer_paths: the paths of the capture layers
+
+        Returns:
+            The prim name to capture layer path dictionary
+        """
+        result = {}
+        for layer_path in layer_paths:
+            for name in self.get_layer_index(layer_path):
+                result[name] = layer_path
+        self.save()
+        return result
+
+    def save(self):
+        """Persist the index in the cache file, if any index changed"""
+        if not self._cache_file or not self._dirty:
+            return
+        data = {
+            "version": _INDEX_VERSION,
+            "layers": {
+                key: {
+                    "dependencies": value["dependencies"],
+                    "meshes": {name: list(entry) for name, entry in value["meshes"].items()},
+                }
+                for key, value in self._layers.items()
+            },
+        }
+        try:
+            os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+            temp_file = f"{self._cache_file}.tmp"
+            with open(temp_file, "w", encoding="utf8") as file:
+                json.dump(data, file)
+            os.replace(temp_file, self._cache_file)
+            self._dirty = False
+        except OSError as e:
+            carb.log_warn(f"Unable to save the capture mesh index in {self._cache_file}: {e}")
+
+    def clear(self):
+        """Remove all the indexed layers"""
+        self._layers.clear()
+        self._loaded = True
+        self._dirty = True
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._cache_file or not os.path.exists(self._cache_file):
+            return
+        try:
+            with open(self._cache_file, encoding="utf8") as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            carb.log_warn(f"Unable to read the capture mesh index {self._cache_file}: {e}")
+            return
+        if data.get("version") != _INDEX_VERSION:
+            # The index is built again, overwrite the outdated file on the next save
+            self._dirty = True
+            return
+        for key, value in data.get("layers", {}).items():
+            # Drop the index of the capture layers that were deleted since the last session
+            if not os.path.exists(key):
+                self._dirty = True
+                continue
+            self._layers[key] = {
+                "dependencies": value["dependencies"],
+                "meshes": {name: CaptureMeshEntry(*entry) for name, entry in value["meshes"].items()},
+            }
+
+    @staticmethod
+    def _get_key(layer_path: str) -> str:
+        return os.path.normcase(os.path.abspath(layer_path))
+
+    @classmethod
+    def _get_mtimes(cls, layer_paths: Iterable[str]) -> Dict[str, float]:
+        mtimes = {}
+        for layer_path in layer_paths:
+            try:
+                mtimes[cls._get_key(layer_path)] = os.path.getmtime(layer_path)
+            except OSError:
+                # Missing or remote layers are not tracked
+                continue
+        return mtimes
+
+    @staticmethod
+    def _is_up_to_date(dependencies: Dict[str, float]) -> bool:
+        for layer_path, mtime in dependencies.items():
+            try:
+                if os.path.getmtime(layer_path) != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _get_reference_asset_path(prim_spec: Sdf.PrimSpec) -> Optional[str]:
+        # Explicit, prepended and appended references, in the order they compose
+        for reference in prim_spec.referenceList.GetAppliedItems():
+            if reference.assetPath:
+                return prim_spec.layer.ComputeAbsolutePath(reference.assetPath)
+        return None
+
+    @staticmethod
+    def _has_namespace_arcs(prim_spec: Sdf.PrimSpec) -> bool:
+        """Whether the prim spec carries composition arcs that can bring child prims from other specs"""
+        return bool(
+            prim_spec.hasReferences
+            or prim_spec.hasPayloads
+            or prim_spec.inheritPathList.GetAppliedItems()
+            or prim_spec.specializesList.GetAppliedItems()
+            or prim_spec.variantSetNameList.GetAppliedItems()
+        )
+
+    @classmethod
+    def _get_layer_stack(cls, layer: Sdf.Layer, layer_stack: List[Sdf.Layer]) -> List[Sdf.Layer]:
+        """Get the layer and its sublayers, recursively, strongest first"""
+        if layer in layer_stack:
+            return layer_stack
+        layer_stack.append(layer)
+        for sublayer_path in layer.subLayerPaths:
+            sublayer = Sdf.Layer.FindOrOpen(layer.ComputeAbsolutePath(sublayer_path))
+            if not sublayer:
+                carb.log_warn(f"Unable to open the sublayer {sublayer_path} of the capture layer {layer.identifier}")
+                continue
+            cls._get_layer_stack(sublayer, layer_stack)
+        return layer_stack
+
+    @classmethod
+    def _build_layer_index(cls, layer_path: str) -> Optional[Tuple[Dict[str, CaptureMeshEntry], List[str]]]:
+        layer = Sdf.Layer.FindOrOpen(layer_path)
+        if not layer:
+            carb.log_warn(f"Unable to open the capture layer {layer_path}")
+            return None
+
+        layer_stack = cls._get_layer_stack(layer, [])
+        meshes = {}
+        asset_paths = {}
+        needs_composition = False
+
+        for stack_layer in layer_stack:
+
+            def index_spec(path: Sdf.Path, stack_layer=stack_layer):
+                nonlocal needs_composition
+                if not path.IsPrimPath():
+                    return
+                prim_spec = stack_layer.GetPrimAtPath(path)
+                if not prim_spec:
+                    return
+                # Arcs on capture prims point to their mesh or material files. Arcs on any other prim can compose
+                # capture prims under it, which are only found on the composed stage.
+                if not _CAPTURE_PRIM_NAME_REGEX.match(path.name) and cls._has_namespace_arcs(prim_spec):
+                    needs_composition = True
+                # The strongest layer referencing an asset wins
+                if asset_paths.get(path.name) is None:
+                    asset_paths[path.name] = cls._get_reference_asset_path(prim_spec)
+                    meshes[path.name] = CaptureMeshEntry(str(path), asset_paths[path.name])
+
+            stack_layer.Traverse(Sdf.Path.absoluteRootPath, index_spec)
+            if needs_composition:
+                return cls._build_composed_index(layer_path)
+
+        return meshes, [stack_layer.realPath for stack_layer in layer_stack if stack_layer.realPath]
+
+    @classmethod
+    def _build_composed_index(cls, layer_path: str) -> Optional[Tuple[Dict[str, CaptureMeshEntry], List[str]]]:
+        stage = Usd.Stage.Open(layer_path)
+        if not stage:
+            carb.log_warn(f"Unable to open the capture layer {layer_path}")
+            return None
+
+        meshes = {}
+        for prim in Usd.PrimRange(stage.GetPseudoRoot(), Usd.PrimAllPrimsPredicate):
+            if prim.IsPseudoRoot():
+                continue
+            asset_path = None
+            for prim_spec in prim.GetPrimStack():
+                asset_path = cls._get_reference_asset_path(prim_spec)
+                if asset_path:
+                    break
+            meshes[prim.GetName()] = CaptureMeshEntry(str(prim.GetPath()), asset_path)
+
+        dependencies = [used_layer.realPath for used_layer in stage.GetUsedLayers() if used_layer.realPath]
+        return meshes, dependencies
+
+
+_CAPTURE_MESH_INDEX = None
+
+
+def get_capture_mesh_index() -> CaptureMeshIndex:
+    """Get the capture mesh index shared by every localizer, persisted in the Kit cache folder"""
+    global _CAPTURE_MESH_INDEX
+    if _CAPTURE_MESH_INDEX is None:
+        _CAPTURE_MESH_INDEX = CaptureMeshIndex(carb.tokens.get_tokens_interface().resolve(_DEFAULT_CACHE_FILE))
+    return _CAPTURE_MESH_INDEX
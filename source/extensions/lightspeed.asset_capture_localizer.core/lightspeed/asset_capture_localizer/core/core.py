@@ -26,6 +26,8 @@ from lightspeed.layer_manager.core import LayerManagerCore, LayerType
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from pxr import Sdf, Usd
 
+from .capture_mesh_index import get_capture_mesh_index as _get_capture_mesh_index
+
 
 class AssetCaptureLocalizerCore:
     def __init__(self, context: omni.usd.UsdContext):
@@ -54,16 +56,8 @@ class AssetCaptureLocalizerCore:
         return capture_usd_files
 
     def get_capture_mesh_dict(self):
-        capture_files = self.get_capture_usd_files()
-        result = {}
-        for layer_path in capture_files:
-            sub_stage = Usd.Stage.Open(layer_path)
-            all_prims = list(self.__traverse_instanced_children(sub_stage.GetPseudoRoot()))
-            if not all_prims:
-                continue
-            for prim in all_prims:
-                result[prim.GetName()] = layer_path
-        return result
+        # The capture layers are indexed once and only indexed again when they change
+        return _get_capture_mesh_index().get_mesh_dict(self.get_capture_usd_files())
 
     def get_all_user_references(self) -> List[Tuple[Usd.Prim, Sdf.Reference, Sdf.Layer, str]]:
         stage = self._context.get_stage()
@@ -0,0 +1,177 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TestCaptureMeshIndex"]
+
+import json
+import os
+import tempfile
+
+import omni.kit.test
+from lightspeed.asset_capture_localizer.core.capture_mesh_index import CaptureMeshIndex
+from pxr import Sdf
+
+
+class TestCaptureMeshIndex(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.layer_path = os.path.join(self.temp_dir.name, "capture.usda")
+        self.asset_path = os.path.join(self.temp_dir.name, "assets", "mesh.usda")
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    def _create_capture_layer(self, reference_list_field: str) -> None:
+        layer = Sdf.Layer.CreateNew(self.layer_path)
+        prim_spec = Sdf.CreatePrimInLayer(layer, "/RootNode/meshes/mesh_0123456789ABCDEF")
+        prim_spec.specifier = Sdf.SpecifierDef
+        getattr(prim_spec.referenceList, reference_list_field).append(Sdf.Reference("./assets/mesh.usda"))
+        layer.Save()
+
+    async def test_get_layer_index_explicit_reference_should_index_asset(self):
+        # Arrange
+        self._create_capture_layer("explicitItems")
+        index = CaptureMeshIndex()
+
+        # Act
+        meshes = index.get_layer_index(self.layer_path)
+
+        # Assert
+        self.assertListEqual(["mesh_0123456789ABCDEF"], list(meshes.keys()))
+        entry = meshes["mesh_0123456789ABCDEF"]
+        self.assertEqual("/RootNode/meshes/mesh_0123456789ABCDEF", entry.prim_path)
+        self.assertEqual(os.path.normcase(self.asset_path), os.path.normcase(os.path.normpath(entry.asset_path)))
+
+    async def test_get_layer_index_prepended_reference_should_index_asset(self):
+        # Arrange
+        self._create_capture_layer("prependedItems")
+        index = CaptureMeshIndex()
+
+        # Act
+        meshes = index.get_layer_index(self.layer_path)
+
+        # Assert
+        entry = meshes["mesh_0123456789ABCDEF"]
+        self.assertEqual("/RootNode/meshes/mesh_0123456789ABCDEF", entry.prim_path)
+        self.assertEqual(os.path.normcase(self.asset_path), os.path.normcase(os.path.normpath(entry.asset_path)))
+
+    async def test_get_layer_index_appended_reference_should_index_asset(self):
+        # Arrange
+        self._create_capture_layer("appendedItems")
+        index = CaptureMeshIndex()
+
+        # Act
+        meshes = index.get_layer_index(self.layer_path)
+
+        # Assert
+        entry = meshes["mesh_0123456789ABCDEF"]
+        self.assertEqual(os.path.normcase(self.asset_path), os.path.normcase(os.path.normpath(entry.asset_path)))
+
+    async def test_get_layer_index_unchanged_layer_should_reuse_index(self):
+        # Arrange
+        self._create_capture_layer("prependedItems")
+        index = CaptureMeshIndex()
+        meshes = index.get_layer_index(self.layer_path)
+
+        # Act
+        cached_meshes = index.get_layer_index(self.layer_path)
+
+        # Assert
+        self.assertIs(meshes, cached_meshes)
+
+    async def test_get_layer_index_sublayer_should_index_sublayer_prims(self):
+        # Arrange
+        self._create_capture_layer("prependedItems")
+        sublayer_path = os.path.join(self.temp_dir.name, "capture_sublayer.usda")
+        sublayer = Sdf.Layer.CreateNew(sublayer_path)
+        Sdf.CreatePrimInLayer(sublayer, "/RootNode/meshes/mesh_FEDCBA9876543210").specifier = Sdf.SpecifierDef
+        sublayer.Save()
+        layer = Sdf.Layer.FindOrOpen(self.layer_path)
+        layer.subLayerPaths.append("./capture_sublayer.usda")
+        layer.Save()
+        index = CaptureMeshIndex()
+
+        # Act
+        meshes = index.get_layer_index(self.layer_path)
+
+        # Assert
+        self.assertIn("mesh_0123456789ABCDEF", meshes)
+        self.assertIn("mesh_FEDCBA9876543210", meshes)
+
+    async def test_get_layer_index_sublayer_changed_should_rebuild_index(self):
+        # Arrange
+        self._create_capture_layer("prependedItems")
+        sublayer_path = os.path.join(self.temp_dir.name, "capture_sublayer.usda")
+        sublayer = Sdf.Layer.CreateNew(sublayer_path)
+        sublayer.Save()
+        layer = Sdf.Layer.FindOrOpen(self.layer_path)
+        layer.subLayerPaths.append("./capture_sublayer.usda")
+        layer.Save()
+        index = CaptureMeshIndex()
+        index.get_layer_index(self.layer_path)
+
+        Sdf.CreatePrimInLayer(sublayer, "/RootNode/meshes/mesh_FEDCBA9876543210").specifier = Sdf.SpecifierDef
+        sublayer.Save()
+        mtime = os.path.getmtime(sublayer_path) + 10
+        os.utime(sublayer_path, (mtime, mtime))
+
+        # Act
+        meshes = index.get_layer_index(self.layer_path)
+
+        # Assert
+        self.assertIn("mesh_FEDCBA9876543210", meshes)
+
+    async def test_get_layer_index_referenced_capture_prims_should_index_composed_prims(self):
+        # Arrange
+        referenced_path = os.path.join(self.temp_dir.name, "referenced.usda")
+        referenced_layer = Sdf.Layer.CreateNew(referenced_path)
+        Sdf.CreatePrimInLayer(referenced_layer, "/Root/meshes/mesh_FEDCBA9876543210").specifier = Sdf.SpecifierDef
+        referenced_layer.defaultPrim = "Root"
+        referenced_layer.Save()
+        layer = Sdf.Layer.CreateNew(self.layer_path)
+        prim_spec = Sdf.CreatePrimInLayer(layer, "/RootNode")
+        prim_spec.specifier = Sdf.SpecifierDef
+        prim_spec.referenceList.prependedItems.append(Sdf.Reference("./referenced.usda"))
+        layer.Save()
+        index = CaptureMeshIndex()
+
+        # Act
+        meshes = index.get_layer_index(self.layer_path)
+
+        # Assert
+        self.assertEqual("/RootNode/meshes/mesh_FEDCBA9876543210", meshes["mesh_FEDCBA9876543210"].prim_path)
+
+    async def test_load_deleted_layer_should_prune_index(self):
+        # Arrange
+        cache_file = os.path.join(self.temp_dir.name, "cache", "capture_mesh_index.json")
+        self._create_capture_layer("prependedItems")
+        index = CaptureMeshIndex(cache_file)
+        index.get_mesh_dict([self.layer_path])
+        os.remove(self.layer_path)
+
+        # Act
+        loaded_index = CaptureMeshIndex(cache_file)
+        loaded_index._load()  # noqa PLW0212
+        loaded_index.save()
+
+        # Assert
+        self.assertDictEqual({}, loaded_index._layers)  # noqa PLW0212
+        with open(cache_file, encoding="utf8") as file:
+            self.assertDictEqual({}, json.load(file)["layers"])
@@ -15,4 +15,5 @@
 * limitations under the License.
 """
 
+from .commands import BakeCaptureReferencesCommand
 from .extension import EventCopyRefToPrimExtension
@@ -0,0 +1,40 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import omni.kit.commands
+from lightspeed.events_manager import get_instance as _get_event_manager_instance
+
+from .core import CopyRefToPrimCore as _CopyRefToPrimCore
+
+
+class BakeCaptureReferencesCommand(omni.kit.commands.Command):
+    """
+    Re-bake every captured prim in the capture baker layer.
+
+    By default, only the captured prims that changed since the last bake are baked when a replacement layer is saved.
+    Use this command if the capture baker layer got out of sync.
+
+    The capture baker layer is saved after the bake, so this command has no undo and is not added to the undo stack.
+    """
+
+    def do(self):
+        core = _get_event_manager_instance().get_registered_event(_CopyRefToPrimCore.EVENT_NAME)
+        if core:
+            core.bake_all()
+
+
+omni.kit.commands.register_all_commands_in_module(__name__)
@@ -15,7 +15,9 @@
 * limitations under the License.
 """
 
+import asyncio
 import re
+from typing import List, Optional, Set
 
 import carb
 import carb.settings
@@ -32,17 +34,29 @@ from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.decorators import ignore_function_decorator as _ignore_function_decorator
 from omni.kit.usd.layers import LayerUtils as _LayerUtils
 from omni.usd.commands import remove_prim_spec as _remove_prim_spec
-from pxr import Sdf, Usd
+from pxr import Sdf, Tf, Usd
 
 _CONTEXT = "/exts/lightspeed.event.copy_ref_to_override/context"
 
+# Captured prims are baked per folder: root path -> (capture folder, reference prim path prefix)
+_BAKED_FOLDERS = {
+    Sdf.Path(_constants.ROOTNODE_LIGHTS): (_constants.LIGHTS_FOLDER, _constants.CAPTURED_LIGHT_PATH_PREFIX),
+    Sdf.Path(_constants.ROOTNODE_LOOKS): (_constants.MATERIALS_FOLDER, _constants.CAPTURED_MAT_PATH_PREFIX),
+    Sdf.Path(_constants.ROOTNODE_MESHES): (_constants.MESHES_FOLDER, _constants.CAPTURED_MESH_PATH_PREFIX),
+}
+
 
 class CopyRefToPrimCore(_ILSSEvent):
+    EVENT_NAME = "Bake Reference from prim override"
+
     def __init__(self):
         super().__init__()
         self.default_attr = {
             "_subscription_layer": None,
+            "_stage_event_sub": None,
+            "_usd_listener": None,
             "_layer_manager": None,
+            "_save_task": None,
         }
         for attr, value in self.default_attr.items():
             setattr(self, attr, value)
@@ -51,14 +65,27 @@ class CopyRefToPrimCore(_ILSSEvent):
         self._context = omni.usd.get_context(self._context_name)
         self._layer_manager = _LayerManagerCore(self._context_name)
 
+        # Captured prims changed since the last bake
+        self._dirty_prim_paths: Set[Sdf.Path] = set()
+        # Bake every captured prim on the next bake, instead of the dirty prims only
+        self._full_bake_required = True
+        # A bake was requested while the capture baker layer was being saved
+        self._bake_pending = False
+        # State of the stage and capture baker layer after the last bake. If it changed, the bake can't be incremental
+        self._last_bake_state = None
+
     @property
     def name(self) -> str:
         """Name of the event"""
-        return "Bake Reference from prim override"
+        return self.EVENT_NAME
 
     def _install(self):
         """Function that will create the behavior"""
         self._install_layer_listener()
+        self._stage_event_sub = self._context.get_stage_event_stream().create_subscription_to_pop(
+            self.__on_stage_event, name="StageEventListener"
+        )
+        self.__install_usd_listener()
 
     def _install_layer_listener(self):
         self._uninstall_layer_listener()
@@ -67,6 +94,54 @@ class CopyRefToPrimCore(_ILSSEvent):
             self.__on_layer_event, name="LayerChange"
         )
 
+    def __install_usd_listener(self):
+        self.__uninstall_usd_listener()
+        self._dirty_prim_paths.clear()
+        self._full_bake_required = True
+        stage = self._context.get_stage()
+        if stage:
+            self._usd_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self.__on_usd_changed, stage)
+
+    def __uninstall_usd_listener(self):
+        if self._usd_listener:
+            self._usd_listener.Revoke()
+        self._usd_listener = None
+
+    def __on_stage_event(self, event):
+        if event.type in [int(omni.usd.StageEventType.OPENED), int(omni.usd.StageEventType.CLOSED)]:
+            self.__install_usd_listener()
+
+    @_ignore_function_decorator(attrs=["_ignore_on_event"])
+    def __on_usd_changed(self, notice, _stage):
+        # Changes made while baking are ignored thanks to the shared ignore attribute
+        for path in notice.GetResyncedPaths():
+            self.__mark_path_dirty(path, True)
+        for path in notice.GetChangedInfoOnlyPaths():
+            self.__mark_path_dirty(path, False)
+
+    def __mark_path_dirty(self, path: Sdf.Path, resynced: bool):
+        prim_path = path.GetPrimPath()
+        for root_path in _BAKED_FOLDERS:
+            # The change is on a parent of the captured prims: re-bake everything
+            if root_path.HasPrefix(prim_path):
+                if resynced or prim_path != Sdf.Path.absoluteRootPath:
+                    self._full_bake_required = True
+                return
+            if prim_path.HasPrefix(root_path):
+                self._dirty_prim_paths.add(prim_path.GetPrefixes()[root_path.pathElementCount])
+                return
+
+    @_ignore_function_decorator(attrs=["_ignore_on_event"])
+    def bake_all(self):
+        """
+        Re-bake every captured prim in the capture baker layer, ignoring the tracked changes.
+
+        Use this if the capture baker layer got out of sync, for example after it was edited externally.
+        """
+        self._full_bake_required = True
+        with omni.kit.undo.group():
+            self.__process_layer()
+
     def __create_capture_package_layer(self):
         replacement_layer = self._layer_manager.get_layer(_LayerType.replacement)
         if not replacement_layer:
@@ -246,150 +321,146 @@ class CopyRefToPrimCore(_ILSSEvent):
                 should_copy_children,
             )
 
-        # we copy the children (mat_*) of the looks node
-        looks_prim = (
-            stage.GetPrimAtPath(_constants.ROOTNODE_LOOKS),
-            _constants.MATERIALS_FOLDER,
-            _constants.CAPTURED_MAT_PATH_PREFIX,
-        )
-        # we copy the children (mesh_*) of the mesh node
-        meshes_prim = (
-            stage.GetPrimAtPath(_constants.ROOTNODE_MESHES),
-            _constants.MESHES_FOLDER,
-            _constants.CAPTURED_MESH_PATH_PREFIX,
-        )
-        # we copy the children (light_*) of the lights node
-        lights_prim = (
-            stage.GetPrimAtPath(_constants.ROOTNODE_LIGHTS),
-            _constants.LIGHTS_FOLDER,
-            _constants.CAPTURED_LIGHT_PATH_PREFIX,
-        )
-        prims = [lights_prim, looks_prim, meshes_prim]
-
-        for prim, folder, capture_prefix in prims:  # noqa PLR1702
+        # loop over /RootNode/lights, /RootNode/Looks, /RootNode/meshes
+        for root_path in _BAKED_FOLDERS:
+            prim = stage.GetPrimAtPath(root_path)
             if not prim or not prim.IsValid():  # noqa PLE1101
                 continue
-            # loop over /RootNode/lights, /RootNode/Looks, /RootNode/meshes
             for prim_child in prim.GetAllChildren():  # noqa PLE1101
-                # if the prim has any override(s)
-                is_override = CopyRefToPrimCore._is_prim_overridden(prim_child.GetPath(), all_replacements_layers)
-                if not is_override:
-                    # if there is no override, we don't need to back the ref into the output layer
-                    # check if the ref was previously backed. If yes, clean up!
-                    if output_layer.GetPrimAtPath(prim_child.GetPath()):
-                        _remove_prim_spec(output_layer, str(prim_child.GetPath()))
-                    continue
-
-                capture_asset_abs_path = CopyRefToPrimCore._get_capture_asset_path(
-                    prim_child, source_layer, output_layer, folder
-                )
+                self.__bake_prim(prim_child, source_layer, output_layer, all_replacements_layers)
+
+    def __update_dirty_stage_nodes(self, stage, source_layer, output_layer, all_replacements_layers, prim_paths):
+        for prim_path in prim_paths:
+            prim = stage.GetPrimAtPath(prim_path)
+            if not prim or not prim.IsValid():
+                # the captured prim doesn't exist anymore, clean up the previous bake
+                if output_layer.GetPrimAtPath(prim_path):
+                    _remove_prim_spec(output_layer, str(prim_path))
+                continue
+            self.__bake_prim(prim, source_layer, output_layer, all_replacements_layers)
+
+    def __bake_prim(self, prim_child, source_layer, output_layer, all_replacements_layers):  # noqa PLR0912
+        folder, capture_prefix = _BAKED_FOLDERS[prim_child.GetPath().GetParentPath()]
+        # if the prim has any override(s)
+        is_override = CopyRefToPrimCore._is_prim_overridden(prim_child.GetPath(), all_replacements_layers)
+        if not is_override:
+            # if there is no override, we don't need to back the ref into the output layer
+            # check if the ref was previously backed. If yes, clean up!
+            if output_layer.GetPrimAtPath(prim_child.GetPath()):
+                _remove_prim_spec(output_layer, str(prim_child.GetPath()))
+            return
+
+        capture_asset_abs_path = CopyRefToPrimCore._get_capture_asset_path(
+            prim_child, source_layer, output_layer, folder
+        )
 
-                # check if the ref was intentionally deleted
-                intentionally_deleted = False
-                stack = prim_child.GetPrimStack()
-                # by default, we set the primPath of the ref in the output layer
-                copy_ref_prim_path = capture_prefix + prim_child.GetName()
-                for prim_spec in stack:
-                    if prim_spec.HasInfo(Sdf.PrimSpec.ReferencesKey):
-                        op = prim_spec.GetInfo(Sdf.PrimSpec.ReferencesKey)
-                        if op.isExplicit:
-                            for ref in op.explicitItems:
-                                if prim_spec.layer.ComputeAbsolutePath(ref.assetPath) == capture_asset_abs_path:
-                                    copy_ref_prim_path = ref.primPath
-                                    break
-                            intentionally_deleted = True
+        # check if the ref was intentionally deleted
+        intentionally_deleted = False
+        stack = prim_child.GetPrimStack()
+        # by default, we set the primPath of the ref in the output layer
+        copy_ref_prim_path = capture_prefix + prim_child.GetName()
+        for prim_spec in stack:
+            if prim_spec.HasInfo(Sdf.PrimSpec.ReferencesKey):
+                op = prim_spec.GetInfo(Sdf.PrimSpec.ReferencesKey)
+                if op.isExplicit:
+                    for ref in op.explicitItems:
+                        if prim_spec.layer.ComputeAbsolutePath(ref.assetPath) == capture_asset_abs_path:
+                            copy_ref_prim_path = ref.primPath
                             break
-                        # Will happen if we delete the initial original reference
-                        for ref in op.deletedItems:
-                            if prim_spec.layer.ComputeAbsolutePath(ref.assetPath) == capture_asset_abs_path:
-                                intentionally_deleted = True
-                                # if a ref was deleted, be sure that the ref on the output layer uses the same primPath
-                                # than the deleted one. Or the delete will not work.
-                                copy_ref_prim_path = ref.primPath
-                                break
-
-                # special case for mesh. If the ref was not intentionally deleted
-                add_preserve_original_attribute = False
-                has_ref_children = False
-                is_mesh_override = True
-                sub_mesh_path = prim_child.GetPath().AppendChild(_constants.MESH_SUB_MESH_NAME)  # mesh_*/mesh
-                if folder == _constants.MESHES_FOLDER and not intentionally_deleted:
-                    # if there is not an override on mesh_*/mesh but there is child like mesh_*/custom_cube or
-                    # mesh_*/ref we need to set the PRESERVE_ORIGINAL_ATTRIBUTE attribute.
-                    # In a case where we want to set a child to the original ref. For example a light that
-                    # follow a character. So we need to preserve the original call of the asset.
-                    # In the app, this is when we don't touch the original ref, but "append" some ref(s) to it
-                    is_mesh_override = CopyRefToPrimCore._is_prim_overridden(sub_mesh_path, all_replacements_layers)
-                # we grab the children. We will have mesh_*/mesh, but check if we have other children
-                # that are not part of the ref
-                # grab the original ref
-                sub_children = prim_child.GetChildren()
-                # if we have at least 1 child that is not mesh_*/mesh, it means we need to add
-                # PRESERVE_ORIGINAL_ATTRIBUTE
-                for sub_child in sub_children:
-                    if sub_child.GetPath() == sub_mesh_path:
-                        continue
-                    has_ref_children = True
-                    if not is_mesh_override:
-                        add_preserve_original_attribute = True
+                    intentionally_deleted = True
                     break
-
-                if intentionally_deleted:
-                    # if the ref is deleted, and not child ref was added, we need to tell that we should not draw
-                    # anything for meshes and add PRESERVE_ORIGINAL_ATTRIBUTE
-                    if not has_ref_children and folder == _constants.MESHES_FOLDER:
-                        prim_spec = Sdf.CreatePrimInLayer(output_layer, prim_child.GetPath())
-                        prim_spec.specifier = Sdf.SpecifierDef
-
-                        attr = prim_spec.properties.get(_constants.PRESERVE_ORIGINAL_ATTRIBUTE) or Sdf.AttributeSpec(
-                            prim_spec, _constants.PRESERVE_ORIGINAL_ATTRIBUTE, Sdf.ValueTypeNames.Int
-                        )
-                        attr.default = 0
-                        # delete reference if the previous capture_baker layer has some
-                        prim_spec.SetInfo(Sdf.PrimSpec.ReferencesKey, Sdf.ReferenceListOp())
-                    # Case where we replace a ref.
-                    # Because the replacement/mod layer set an explicit ref, we don't need to copy anything
-                    # So we delete the prim spec if it exists in the output layer
-                    # But for things that are not meshes, if we delete completely this thing, because we don't need
-                    # PRESERVE_ORIGINAL_ATTRIBUTE, we don't need any prim spec
-                    elif (
-                        has_ref_children and output_layer.GetPrimAtPath(prim_child.GetPath())
-                    ) or not has_ref_children:
-                        _remove_prim_spec(output_layer, str(prim_child.GetPath()))
-                else:
-                    capture_asset_rel_path = omni.client.make_relative_url(
-                        output_layer.identifier, str(capture_asset_abs_path)
-                    )
-                    prim_spec = Sdf.CreatePrimInLayer(output_layer, prim_child.GetPath())
-                    prim_spec.specifier = Sdf.SpecifierDef
-                    if (
-                        add_preserve_original_attribute
-                        and _constants.PRESERVE_ORIGINAL_ATTRIBUTE not in prim_spec.properties
-                    ):
-                        attr = Sdf.AttributeSpec(
-                            prim_spec, _constants.PRESERVE_ORIGINAL_ATTRIBUTE, Sdf.ValueTypeNames.Int
-                        )
-                        attr.default = 1
-                    elif (
-                        not add_preserve_original_attribute
-                        and _constants.PRESERVE_ORIGINAL_ATTRIBUTE in prim_spec.properties
-                    ):
-                        prim_spec.RemoveProperty(prim_spec.properties[_constants.PRESERVE_ORIGINAL_ATTRIBUTE])
-
-                    # because we preserve the original call, we dont need to add the reference
-                    expected_refs = Sdf.ReferenceListOp()
-                    if not add_preserve_original_attribute:
-                        expected_refs.explicitItems = [
-                            Sdf.Reference(assetPath=capture_asset_rel_path, primPath=copy_ref_prim_path)
-                        ]
-                    prim_spec.SetInfo(Sdf.PrimSpec.ReferencesKey, expected_refs)
+                # Will happen if we delete the initial original reference
+                for ref in op.deletedItems:
+                    if prim_spec.layer.ComputeAbsolutePath(ref.assetPath) == capture_asset_abs_path:
+                        intentionally_deleted = True
+                        # if a ref was deleted, be sure that the ref on the output layer uses the same primPath
+                        # than the deleted one. Or the delete will not work.
+                        copy_ref_prim_path = ref.primPath
+                        break
+
+        # special case for mesh. If the ref was not intentionally deleted
+        add_preserve_original_attribute = False
+        has_ref_children = False
+        is_mesh_override = True
+        sub_mesh_path = prim_child.GetPath().AppendChild(_constants.MESH_SUB_MESH_NAME)  # mesh_*/mesh
+        if folder == _constants.MESHES_FOLDER and not intentionally_deleted:
+            # if there is not an override on mesh_*/mesh but there is child like mesh_*/custom_cube or
+            # mesh_*/ref we need to set the PRESERVE_ORIGINAL_ATTRIBUTE attribute.
+            # In a case where we want to set a child to the original ref. For example a light that
+            # follow a character. So we need to preserve the original call of the asset.
+            # In the app, this is when we don't touch the original ref, but "append" some ref(s) to it
+            is_mesh_override = CopyRefToPrimCore._is_prim_overridden(sub_mesh_path, all_replacements_layers)
+        # we grab the children. We will have mesh_*/mesh, but check if we have other children
+        # that are not part of the ref
+        # grab the original ref
+        sub_children = prim_child.GetChildren()
+        # if we have at least 1 child that is not mesh_*/mesh, it means we need to add
+        # PRESERVE_ORIGINAL_ATTRIBUTE
+        for sub_child in sub_children:
+            if sub_child.GetPath() == sub_mesh_path:
+                continue
+            has_ref_children = True
+            if not is_mesh_override:
+                add_preserve_original_attribute = True
+            break
+
+        if intentionally_deleted:
+            # if the ref is deleted, and not child ref was added, we need to tell that we should not draw
+            # anything for meshes and add PRESERVE_ORIGINAL_ATTRIBUTE
+            if not has_ref_children and folder == _constants.MESHES_FOLDER:
+                prim_spec = Sdf.CreatePrimInLayer(output_layer, prim_child.GetPath())
+                prim_spec.specifier = Sdf.SpecifierDef
+
+                attr = prim_spec.properties.get(_constants.PRESERVE_ORIGINAL_ATTRIBUTE) or Sdf.AttributeSpec(
+                    prim_spec, _constants.PRESERVE_ORIGINAL_ATTRIBUTE, Sdf.ValueTypeNames.Int
+                )
+                attr.default = 0
+                # delete reference if the previous capture_baker layer has some
+                prim_spec.SetInfo(Sdf.PrimSpec.ReferencesKey, Sdf.ReferenceListOp())
+            # Case where we replace a ref.
+            # Because the replacement/mod layer set an explicit ref, we don't need to copy anything
+            # So we delete the prim spec if it exists in the output layer
+            # But for things that are not meshes, if we delete completely this thing, because we don't need
+            # PRESERVE_ORIGINAL_ATTRIBUTE, we don't need any prim spec
+            elif (has_ref_children and output_layer.GetPrimAtPath(prim_child.GetPath())) or not has_ref_children:
+                _remove_prim_spec(output_layer, str(prim_child.GetPath()))
+        else:
+            capture_asset_rel_path = omni.client.make_relative_url(output_layer.identifier, str(capture_asset_abs_path))
+            prim_spec = Sdf.CreatePrimInLayer(output_layer, prim_child.GetPath())
+            prim_spec.specifier = Sdf.SpecifierDef
+            if add_preserve_original_attribute and _constants.PRESERVE_ORIGINAL_ATTRIBUTE not in prim_spec.properties:
+                attr = Sdf.AttributeSpec(prim_spec, _constants.PRESERVE_ORIGINAL_ATTRIBUTE, Sdf.ValueTypeNames.Int)
+                attr.default = 1
+            elif not add_preserve_original_attribute and _constants.PRESERVE_ORIGINAL_ATTRIBUTE in prim_spec.properties:
+                prim_spec.RemoveProperty(prim_spec.properties[_constants.PRESERVE_ORIGINAL_ATTRIBUTE])
+
+            # because we preserve the original call, we dont need to add the reference
+            expected_refs = Sdf.ReferenceListOp()
+            if not add_preserve_original_attribute:
+                expected_refs.explicitItems = [
+                    Sdf.Reference(assetPath=capture_asset_rel_path, primPath=copy_ref_prim_path)
+                ]
+            prim_spec.SetInfo(Sdf.PrimSpec.ReferencesKey, expected_refs)
 
     @staticmethod
     def _get_capture_asset_path(prim, capture_layer, output_layer, capture_folder):
         return Sdf.ComputeAssetPathRelativeToLayer(capture_layer, capture_folder + "/" + prim.GetName() + ".usd")
 
-    # @omni.usd.handle_exception
-    # async def __do_process_layer(self, stage):
+    @staticmethod
+    def _get_layer_modified_time(layer: Sdf.Layer):
+        result, entry = omni.client.stat(layer.realPath)
+        if result != omni.client.Result.OK:
+            return None
+        return entry.modified_time
+
+    def __get_bake_state(self, current_capture_layer, capture_package_layer, all_replacements_layers):
+        return (
+            current_capture_layer.identifier,
+            tuple(layer.identifier for layer in all_replacements_layers),
+            capture_package_layer.identifier,
+            self._get_layer_modified_time(capture_package_layer),
+        )
+
     def __do_process_layer(self, stage):
         if not stage:
             return
@@ -401,27 +472,81 @@ class CopyRefToPrimCore(_ILSSEvent):
         current_capture_layer = self._layer_manager.get_layer(_LayerType.capture)
         if not current_capture_layer:
             return
+        # a save of the capture baker layer is running: bake when it's done so the layer is not edited while saved
+        if self._save_task and not self._save_task.done():
+            self._bake_pending = True
+            return
         # get all replacement layers that the user works on.
         # we grab the replacement layer + all sublayers (but exclude sublayer/replacement layers from others mods)
         all_replacements_layers = self.__get_all_replacement_layers(replacements_layer)
         all_replacements_layers.insert(0, replacements_layer)
         # we create/insert the capture_baker layer.
         capture_package_layer = self.__create_capture_package_layer()
+
+        # If the capture, the replacement layers or the capture baker file changed since the last bake (for example
+        # if an user edited the capture_baker layer externally), we clean up and process the whole thing
+        bake_state = self.__get_bake_state(current_capture_layer, capture_package_layer, all_replacements_layers)
+        full_bake = self._full_bake_required or bake_state != self._last_bake_state
+        dirty_prim_paths = sorted(self._dirty_prim_paths)
+        self._dirty_prim_paths.clear()
+        self._full_bake_required = False
+
         with Sdf.ChangeBlock():
-            self.__create_default_stage_nodes(
-                stage, current_capture_layer, capture_package_layer, all_replacements_layers
+            if full_bake:
+                self.__create_default_stage_nodes(
+                    stage, current_capture_layer, capture_package_layer, all_replacements_layers
+                )
+            else:
+                self.__update_dirty_stage_nodes(
+                    stage, current_capture_layer, capture_package_layer, all_replacements_layers, dirty_prim_paths
+                )
+
+        if not full_bake and not dirty_prim_paths:
+            return
+
+        # we save the layer in a task so the bake state is updated once the checkpoint is created
+        carb.log_info(
+            f"Bake references into {capture_package_layer.realPath} "
+            f"({'all prims' if full_bake else f'{len(dirty_prim_paths)} prims'})"
+        )
+        self._save_task = asyncio.ensure_future(
+            self.__save_capture_package_layer_async(
+                capture_package_layer, current_capture_layer, all_replacements_layers
             )
+        )
 
-        # we save the layer
-        carb.log_info(f"Bake references into {capture_package_layer.realPath}")
-        self._layer_manager.save_layer(_LayerType.capture_baker, show_checkpoint_error=False)
+    async def __save_capture_package_layer_async(
+        self, capture_package_layer: Sdf.Layer, current_capture_layer: Sdf.Layer, all_replacements_layers: List
+    ):
+        try:
+            # The layer is saved on the main thread since saving sends Sdf notices to the listeners. Only the checkpoint
+            # is awaited.
+            capture_package_layer.Save()
+            result, _ = await omni.client.stat_async(capture_package_layer.realPath)
+            if result == omni.client.Result.OK:
+                await omni.client.create_checkpoint_async(capture_package_layer.realPath, "", force=True)
+        except Exception as e:  # noqa PLW0718
+            carb.log_error(f"Failed to save the capture baker layer {capture_package_layer.realPath}: {e}")
+            self._last_bake_state = None
+        else:
+            self._last_bake_state = self.__get_bake_state(
+                current_capture_layer, capture_package_layer, all_replacements_layers
+            )
+        if self._bake_pending:
+            self._bake_pending = False
+            self.__process_pending_bake()
+
+    @_ignore_function_decorator(attrs=["_ignore_on_event"])
+    def __process_pending_bake(self):
+        with omni.kit.undo.group():
+            self.__process_layer()
 
-    def __process_layer(self, stage: Usd.Stage = None):
+    def __process_layer(self, stage: Optional[Usd.Stage] = None):
         if stage is None:
             stage = self._context.get_stage()
-        # each time we save a layer part of the replacement layer, we process the whole
-        # replacement layer + capture_baker. We do that as a whole process because we want to be sure that if an user
-        # edit the capture_baker layer externally, we are still cleaning up and processing the whole thing nicely
+        # each time we save a layer part of the replacement layer, we re-bake the captured prims that changed since
+        # the last bake. The whole replacement layer + capture_baker is processed for the first bake, when the layer
+        # stack changed, or if an user edited the capture_baker layer externally
         self.__do_process_layer(stage)
 
     @_ignore_function_decorator(attrs=["_ignore_on_event"])
@@ -456,6 +581,8 @@ class CopyRefToPrimCore(_ILSSEvent):
     def _uninstall(self):
         """Function that will delete the behavior"""
         self._uninstall_layer_listener()
+        self.__uninstall_usd_listener()
+        self._stage_event_sub = None
 
     def _uninstall_layer_listener(self):
         self._subscription_layer = None
@@ -17,13 +17,18 @@
 
 import contextlib
 import tempfile
+from unittest.mock import patch
 
 import omni.kit.app
+import omni.kit.commands
+import omni.kit.undo
 import omni.usd
+from lightspeed.event.copy_ref_to_override.core import CopyRefToPrimCore as _CopyRefToPrimCore
+from lightspeed.events_manager import get_instance as _get_event_manager_instance
 from lightspeed.layer_manager.core import LayerManagerCore as _LayerManagerCore
 from lightspeed.layer_manager.core.data_models import LayerType as _LayerType
 from omni.kit.test.async_unittest import AsyncTestCase
-from pxr import Usd, UsdGeom
+from pxr import Sdf, Usd, UsdGeom
 
 
 @contextlib.asynccontextmanager
@@ -172,3 +177,72 @@ class TestCore(AsyncTestCase):
                 layer_replacement.subLayerPaths[:3],
                 [layer_random_01.identifier, layer_random_02.identifier, layer_random_03.identifier],
             )
+
+    async def __create_captured_meshes(self, layer_capture, names):
+        for name in names:
+            Sdf.CreatePrimInLayer(layer_capture, f"/RootNode/meshes/{name}").specifier = Sdf.SpecifierDef
+        layer_capture.Save()
+
+    async def __save_and_wait_for_bake(self, layer_replacement):
+        layer_replacement.Save()
+        # wait for the event
+        await omni.kit.app.get_app().next_update_async()
+        core = _get_event_manager_instance().get_registered_event(_CopyRefToPrimCore.EVENT_NAME)
+        if core._save_task:  # noqa PLW0212
+            await core._save_task  # noqa PLW0212
+
+    async def test_capture_baker_only_bakes_changed_prims(self):
+        context = omni.usd.get_context()
+        async with make_temp_directory(context) as temp_dir:
+            _, layer_replacement, layer_capture = await self.__create_stage_and_layers(temp_dir=temp_dir)
+            await self.__create_captured_meshes(layer_capture, ["mesh_A", "mesh_B"])
+            await omni.kit.app.get_app().next_update_async()
+
+            # override the first mesh: the first bake processes all the captured prims
+            Sdf.CreatePrimInLayer(layer_replacement, "/RootNode/meshes/mesh_A")
+            await omni.kit.app.get_app().next_update_async()
+            with patch.object(
+                _CopyRefToPrimCore,
+                "_CopyRefToPrimCore__create_default_stage_nodes",
+                autospec=True,
+                side_effect=_CopyRefToPrimCore._CopyRefToPrimCore__create_default_stage_nodes,  # noqa PLW0212
+            ) as full_bake_mock:
+                await self.__save_and_wait_for_bake(layer_replacement)
+
+                # override the second mesh: only this mesh is baked
+                Sdf.CreatePrimInLayer(layer_replacement, "/RootNode/meshes/mesh_B")
+                await omni.kit.app.get_app().next_update_async()
+                await self.__save_and_wait_for_bake(layer_replacement)
+
+            self.assertEqual(1, full_bake_mock.call_count)
+            capture_baker_layer = self._layer_manager.get_layer(_LayerType.capture_baker)
+            self.assertTrue(capture_baker_layer.GetPrimAtPath("/RootNode/meshes/mesh_A"))
+            self.assertTrue(capture_baker_layer.GetPrimAtPath("/RootNode/meshes/mesh_B"))
+
+    async def test_bake_capture_references_command_bakes_all_prims(self):
+        context = omni.usd.get_context()
+        async with make_temp_directory(context) as temp_dir:
+            _, layer_replacement, layer_capture = await self.__create_stage_and_layers(temp_dir=temp_dir)
+            await self.__create_captured_meshes(layer_capture, ["mesh_A"])
+            await omni.kit.app.get_app().next_update_async()
+
+            Sdf.CreatePrimInLayer(layer_replacement, "/RootNode/meshes/mesh_A")
+            await omni.kit.app.get_app().next_update_async()
+            await self.__save_and_wait_for_bake(layer_replacement)
+
+            with patch.object(
+                _CopyRefToPrimCore,
+                "_CopyRefToPrimCore__create_default_stage_nodes",
+                autospec=True,
+                side_effect=_CopyRefToPrimCore._CopyRefToPrimCore__create_default_stage_nodes,  # noqa PLW0212
+            ) as full_bake_mock:
+                undo_stack_size = len(omni.kit.undo.get_undo_stack())
+                omni.kit.commands.execute("BakeCaptureReferencesCommand")
+                core = _get_event_manager_instance().get_registered_event(_CopyRefToPrimCore.EVENT_NAME)
+                await core._save_task  # noqa PLW0212
+
+            self.assertEqual(1, full_bake_mock.call_count)
+            # The bake is saved right away, it can't be undone
+            self.assertEqual(undo_stack_size, len(omni.kit.undo.get_undo_stack()))
+            capture_baker_layer = self._layer_manager.get_layer(_LayerType.capture_baker)
+            self.assertTrue(capture_baker_layer.GetPrimAtPath("/RootNode/meshes/mesh_A"))
@@ -87,11 +87,7 @@ class EventLayersCleanupCore(_ILSSEvent):
 
     def __cleanup_layers(self):
         broken_stack = self._layer_manager.broken_layers_stack()
-        all_invalid_paths = []
-        for parent_broken_layer, broken_layer_path in broken_stack:
-            all_invalid_paths.extend(
-                self._layer_manager.remove_broken_layer(parent_broken_layer.identifier, broken_layer_path)
-            )
+        all_invalid_paths = self._layer_manager.remove_broken_layers(broken_stack) if broken_stack else []
 
         if all_invalid_paths:
             self._post_notification(all_invalid_paths)
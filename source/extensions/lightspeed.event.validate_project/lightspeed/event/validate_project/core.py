@@ -102,17 +102,24 @@ class EventValidateProjectCore(_ILSSEvent):
         carb.log_warn(message)
 
     def __validate_project(self):
-        project_layer = self.__layer_manager.get_layer(LayerType.workfile)
+        # Every layer stack event triggers a validation: read the layers from the shared snapshot instead of walking the
+        # layer stack once per layer type
+        snapshot = self.__layer_manager.get_layer_stack_snapshot()
+        if not snapshot:
+            carb.log_warn("Could not validate project. No stage is opened.")
+            return
+
+        project_layer = next(iter(snapshot.get_layers(LayerType.workfile)), None)
         if not project_layer:
             carb.log_warn("Could not validate project. No project layer was found.")
             return
 
-        capture_layer = self.__layer_manager.get_layer(LayerType.capture)
+        capture_layer = next(iter(snapshot.get_layers(LayerType.capture)), None)
         if not capture_layer:
             carb.log_warn("Could not validate project. No capture layer was found.")
             return
 
-        mod_layer = self.__layer_manager.get_layer(LayerType.replacement)
+        mod_layer = next(iter(snapshot.get_layers(LayerType.replacement)), None)
         if not mod_layer:
             carb.log_warn("Could not validate project. No mod layer was found.")
             return
@@ -21,6 +21,8 @@ from typing import Any, Callable, List, Optional
 import carb
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
+from omni.flux.utils.common.event_profiler import EventStats as _EventStats
+from omni.flux.utils.common.event_profiler import get_event_profiler as _get_event_profiler
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from .i_ds_event import ILSSEvent as _ILSSEvent
@@ -33,11 +35,19 @@ class EventsManagerCore:
         self.__ds_events = []
         self.__global_custom_events = {}
 
-        self.__on_event_registered = _Event()
-        self.__on_event_unregistered = _Event()
+        self.__on_event_registered = _Event(name=self._get_profiler_event_name("event_registered"))
+        self.__on_event_unregistered = _Event(name=self._get_profiler_event_name("event_unregistered"))
 
-        self.__on_global_custom_event_registered = _Event()
-        self.__on_global_custom_event_unregistered = _Event()
+        self.__on_global_custom_event_registered = _Event(
+            name=self._get_profiler_event_name("global_custom_event_registered")
+        )
+        self.__on_global_custom_event_unregistered = _Event(
+            name=self._get_profiler_event_name("global_custom_event_unregistered")
+        )
+
+    @staticmethod
+    def _get_profiler_event_name(name: str) -> str:
+        return f"{__name__}.{name}"
 
     def get_registered_global_event_names(self) -> List[str]:
         """
@@ -60,7 +70,7 @@ class EventsManagerCore:
             if show_warning:
                 carb.log_warn(f"Custom event {name} already exist")
             return
-        self.__global_custom_events[name] = _Event()
+        self.__global_custom_events[name] = _Event(name=self._get_profiler_event_name(name))
         self.__on_global_custom_event_registered(name)
 
     def unregister_global_custom_event(self, name: str):
@@ -114,6 +124,23 @@ class EventsManagerCore:
             raise ValueError(message)
         self.__global_custom_events[name](*args, **kwargs)
 
+    def get_global_custom_event_stats(self, name: Optional[str] = None) -> List[_EventStats]:
+        """
+        Get the timing statistics of the subscribers of the global custom events, slowest first.
+        The statistics are only recorded while the event profiler is enabled.
+
+        Args:
+            name: only get the statistics of the subscribers of this event
+
+        Returns:
+            The statistics of every subscriber
+        """
+        names = [name] if name is not None else self.get_registered_global_event_names()
+        stats = []
+        for event_name in names:
+            stats.extend(_get_event_profiler().get_subscriber_stats(self._get_profiler_event_name(event_name)))
+        return sorted(stats, key=lambda s: s.total_time, reverse=True)
+
     def _event_registered(self):
         """Call the event object that has the list of functions"""
         self.__on_event_registered(self.__ds_events[-1])
@@ -18,12 +18,15 @@
 from typing import Optional
 
 import carb
+import carb.settings
 import omni.ext
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
+from omni.flux.utils.common.event_profiler import get_event_profiler as _get_event_profiler
 
 from .core import EventsManagerCore as _EventsManagerCore
 
 _EVENTS_MANAGER_INSTANCE = None
+_PROFILE_EVENTS_SETTING = "/exts/lightspeed.events_manager/profile_events"
 
 
 def get_instance() -> Optional[_EventsManagerCore]:
@@ -45,9 +48,14 @@ class EventsManagerExtension(omni.ext.IExt):
         carb.log_info("[lightspeed.events_manager] Lightspeed Events Manager startup")
         self._events_manager = _EventsManagerCore()
         _EVENTS_MANAGER_INSTANCE = self._events_manager
+        if carb.settings.get_settings().get(_PROFILE_EVENTS_SETTING):
+            _get_event_profiler().enable()
 
     def on_shutdown(self):
         global _EVENTS_MANAGER_INSTANCE
         carb.log_info("[lightspeed.events_manager] Lightspeed Events Manager shutdown")
+        profiler = _get_event_profiler()
+        if profiler.enabled:
+            carb.log_info(f"[lightspeed.events_manager] Event timings:\n{profiler.dump()}")
         _reset_default_attrs(self)
         _EVENTS_MANAGER_INSTANCE = None
@@ -15,12 +15,14 @@
 * limitations under the License.
 """
 
+import time
 from unittest.mock import Mock, call, patch
 
 import carb
 from lightspeed.events_manager import ILSSEvent as _ILSSEvent
 from lightspeed.events_manager import get_instance as _get_instance
 from lightspeed.events_manager.core import EventsManagerCore as _EventsManagerCore
+from omni.flux.utils.common.event_profiler import get_event_profiler as _get_event_profiler
 from omni.kit.test.async_unittest import AsyncTestCase
 
 
@@ -208,6 +210,33 @@ class TestCore(AsyncTestCase):
         self.assertFalse(core.get_registered_global_event_names())
         self.assertFalse(core.get_registered_events())
 
+    async def test_global_custom_event_stats(self):
+        def slow_subscriber(*_):
+            time.sleep(0.01)
+
+        core = _EventsManagerCore()
+        await self.__register_global_events(core)
+        _sub1 = core.subscribe_global_custom_event("testEvent01", slow_subscriber)  # noqa
+        _sub2 = core.subscribe_global_custom_event("testEvent02", Mock())  # noqa
+
+        # nothing is recorded when the profiler is disabled
+        _get_event_profiler().reset()
+        core.call_global_custom_event("testEvent01")
+        self.assertFalse(core.get_global_custom_event_stats())
+
+        with _get_event_profiler().profile():
+            core.call_global_custom_event("testEvent01")
+            core.call_global_custom_event("testEvent01")
+            core.call_global_custom_event("testEvent02")
+
+        stats = core.get_global_custom_event_stats()
+        self.assertEqual(2, len(stats))
+        # slowest first
+        self.assertTrue(stats[0].subscriber_name.endswith("slow_subscriber"))
+        self.assertEqual(2, stats[0].call_count)
+        self.assertGreaterEqual(stats[0].p99_time, 0.01)
+        self.assertEqual(1, len(core.get_global_custom_event_stats("testEvent02")))
+
     async def test_get_instance(self):
         inst = _get_instance()
 
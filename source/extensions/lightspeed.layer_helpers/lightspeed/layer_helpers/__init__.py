@@ -16,3 +16,4 @@
 """
 
 from .texture_process import *  # noqa F401
+from .batch_texture_runner import *  # noqa F401
@@ -0,0 +1,233 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["BatchTextureRunner", "TextureJobManifest"]
+
+import asyncio
+import functools
+import hashlib
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+import carb
+
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def _get_processing_method_key(processing_method: Callable) -> str:
+    """Get a key for a processing method that is stable across sessions"""
+    if isinstance(processing_method, functools.partial):
+        # Object arguments have a memory address in their repr: use their name or type instead
+        args = [
+            repr(arg) if isinstance(arg, _PRIMITIVE_TYPES) else getattr(arg, "name", None) or type(arg).__qualname__
+            for arg in processing_method.args
+        ]
+        keywords = [f"{key}={value!r}" for key, value in sorted(processing_method.keywords.items())]
+        return f"{_get_processing_method_key(processing_method.func)}({', '.join(args + keywords)})"
+    return f"{getattr(processing_method, '__module__', '')}.{getattr(processing_method, '__qualname__', '')}"
+
+
+def _get_file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TextureJobManifest:
+    """
+    Journal of the completed texture processing jobs, to skip them when a batch is run again after a failure.
+
+    Each completed job is appended as a JSON line, so a crash can only lose the job that was being written. The
+    manifest is used from the executor threads of the batch, so the entries and the journal file are guarded by a lock.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: the journal file. If None, the completed jobs are only kept in memory.
+        """
+        self._path = path
+        self._entries: Dict[str, dict] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def is_done(self, key: str, output_path: str) -> bool:
+        """
+        Check if a job was completed and its output was not changed since
+
+        Args:
+            key: the key of the job
+            output_path: the output of the job
+
+        Returns:
+            True if the job can be skipped
+        """
+        self.load()
+        with self._lock:
+            entry = self._entries.get(key)
+        if not entry or entry["output"] != output_path:
+            return False
+        try:
+            return os.path.getsize(output_path) == entry["size"]
+        except OSError:
+            return False
+
+    def mark_done(self, key: str, output_path: str):
+        """
+        Record a completed job
+
+        Args:
+            key: the key of the job
+            output_path: the output of the job
+        """
+        self.load()
+        try:
+            size = os.path.getsize(output_path)
+        except OSError:
+            # The processing method didn't write the output: nothing to skip next time
+            return
+        entry = {"key": key, "output": output_path, "size": size}
+        with self._lock:
+            self._entries[key] = entry
+            if not self._path:
+                return
+            try:
+                os.makedirs(os.path.dirname(self._path), exist_ok=True)
+                with open(self._path, "a", encoding="utf8") as file:
+                    file.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                carb.log_warn(f"Unable to write the texture processing manifest {self._path}: {e}")
+
+    def clear(self):
+        """Forget all the completed jobs"""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            if self._path and os.path.exists(self._path):
+                try:
+                    os.remove(self._path)
+                except OSError as e:
+                    carb.log_warn(f"Unable to remove the texture processing manifest {self._path}: {e}")
+
+    def load(self):
+        """Read the completed jobs from the journal file, if they were not read yet"""
+        with self._lock:
+            if self._loaded:
+                return
+            if self._path and os.path.exists(self._path):
+                try:
+                    with open(self._path, "r", encoding="utf8") as file:
+                        for line in file:
+                            try:
+                                entry = json.loads(line)
+                            except ValueError:
+                                # The last line can be incomplete if the app crashed while writing it
+                                continue
+                            self._entries[entry["key"]] = entry
+                except OSError as e:
+                    carb.log_warn(f"Unable to read the texture processing manifest {self._path}: {e}")
+            # Only flag the manifest as loaded once the entries were read
+            self._loaded = True
+
+
+class BatchTextureRunner:
+    """
+    Run a texture processing method on a batch of textures, with a bounded number of textures processed at the
+    same time.
+
+    A texture that fails doesn't stop the batch. The completed jobs are recorded in a manifest keyed by the input
+    texture content, the processing method and the output path, so running the batch again after a crash or a
+    failure skips them. The manifest is cleared once a batch completes without failure.
+    """
+
+    def __init__(
+        self, processing_method: Callable[[str, str], None], max_concurrent: int = 1, manifest_path: str = None
+    ):
+        """
+        Args:
+            processing_method: the method to process a texture, called with the input and output texture paths
+            max_concurrent: the maximum number of textures processed at the same time
+            manifest_path: the file to record the completed jobs in. If None, the jobs can't be resumed.
+        """
+        self._processing_method = processing_method
+        self._processing_method_key = _get_processing_method_key(processing_method)
+        self._max_concurrent = max(1, max_concurrent or 1)
+        self._manifest = TextureJobManifest(manifest_path)
+
+    async def run(
+        self,
+        input_paths: List[str],
+        output_paths: List[str],
+        progress_callback: Callable[[float], None] = None,
+    ) -> Dict[str, str]:
+        """
+        Process the textures
+
+        Args:
+            input_paths: the textures to process
+            output_paths: the output texture of each input texture
+            progress_callback: called with the progress, between 0 and 1, when a texture is processed or skipped
+
+        Returns:
+            The error message of each input texture that failed
+        """
+        if len(input_paths) != len(output_paths):
+            raise RuntimeError("List length mismatch.")
+
+        loop = asyncio.get_event_loop()
+        # Read the completed jobs before any job is scheduled
+        await loop.run_in_executor(None, self._manifest.load)
+
+        semaphore = asyncio.Semaphore(self._max_concurrent)
+        total = len(input_paths)
+        finished = 0
+        failures = {}
+
+        async def _process(input_path: str, output_path: str):
+            nonlocal finished
+            async with semaphore:
+                try:
+                    await loop.run_in_executor(None, self._process_texture, input_path, output_path)
+                except Exception as e:  # noqa PLW0718
+                    carb.log_error(f"Unable to process the texture {input_path}: {e}")
+                    failures[input_path] = str(e)
+            finished += 1
+            if progress_callback:
+                progress_callback(finished / total)
+
+        await asyncio.gather(
+            *(_process(input_path, output_path) for input_path, output_path in zip(input_paths, output_paths))
+        )
+
+        if not failures:
+            self._manifest.clear()
+        return failures
+
+    def _process_texture(self, input_path: str, output_path: str):
+        """Process a texture if the same job was not already completed. Run in an executor thread."""
+        digest = hashlib.sha256(self._processing_method_key.encode("utf8"))
+        digest.update(_get_file_digest(input_path).encode("utf8"))
+        digest.update(output_path.encode("utf8"))
+        key = digest.hexdigest()
+        if self._manifest.is_done(key, output_path):
+            return
+        self._processing_method(input_path, output_path)
+        self._manifest.mark_done(key, output_path)
@@ -0,0 +1,160 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TestBatchTextureRunner"]
+
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import omni.kit.test
+from lightspeed.layer_helpers import BatchTextureRunner, TextureJobManifest
+
+
+class TestBatchTextureRunner(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.temp_dir.name, "cache", "manifest.jsonl")
+        self.input_paths = []
+        self.output_paths = []
+        for index in range(4):
+            input_path = os.path.join(self.temp_dir.name, f"texture_{index}.dds")
+            with open(input_path, "wb") as file:
+                file.write(f"texture {index}".encode("utf8"))
+            self.input_paths.append(input_path)
+            self.output_paths.append(os.path.join(self.temp_dir.name, f"texture_{index}.a.rtex.dds"))
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    @staticmethod
+    def _copy_texture(input_path: str, output_path: str):
+        with open(input_path, "rb") as input_file, open(output_path, "wb") as output_file:
+            output_file.write(input_file.read())
+
+    async def test_run_partial_run_should_resume_failed_textures_only(self):
+        # Arrange
+        processed = []
+        failing_path = self.input_paths[2]
+
+        def process(input_path: str, output_path: str):
+            processed.append(input_path)
+            if input_path == failing_path:
+                raise ValueError("Test Failure")
+            self._copy_texture(input_path, output_path)
+
+        # Act
+        failures = await BatchTextureRunner(process, manifest_path=self.manifest_path).run(
+            self.input_paths, self.output_paths
+        )
+        failing_path = None
+        processed.clear()
+        resumed_failures = await BatchTextureRunner(process, manifest_path=self.manifest_path).run(
+            self.input_paths, self.output_paths
+        )
+
+        # Assert
+        self.assertListEqual([self.input_paths[2]], list(failures.keys()))
+        self.assertDictEqual({}, resumed_failures)
+        self.assertListEqual([self.input_paths[2]], processed)
+        # The manifest is removed once the batch completes without failure
+        self.assertFalse(os.path.exists(self.manifest_path))
+
+    async def test_run_changed_output_should_process_texture_again(self):
+        # Arrange
+        processed = []
+
+        def process(input_path: str, output_path: str):
+            processed.append(input_path)
+            if input_path == self.input_paths[0] and not os.path.exists(output_path + ".done"):
+                Path(output_path + ".done").touch()
+                raise ValueError("Test Failure")
+            self._copy_texture(input_path, output_path)
+
+        await BatchTextureRunner(process, manifest_path=self.manifest_path).run(self.input_paths, self.output_paths)
+        with open(self.output_paths[1], "ab") as file:
+            file.write(b"edited")
+        processed.clear()
+
+        # Act
+        await BatchTextureRunner(process, manifest_path=self.manifest_path).run(self.input_paths, self.output_paths)
+
+        # Assert
+        self.assertListEqual(sorted([self.input_paths[0], self.input_paths[1]]), sorted(processed))
+
+    async def test_run_should_not_exceed_max_concurrent(self):
+        # Arrange
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def process(input_path: str, output_path: str):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.05)
+            self._copy_texture(input_path, output_path)
+            with lock:
+                running -= 1
+
+        # Act
+        failures = await BatchTextureRunner(process, max_concurrent=2).run(self.input_paths, self.output_paths)
+
+        # Assert
+        self.assertDictEqual({}, failures)
+        self.assertEqual(2, max_running)
+
+    async def test_run_default_max_concurrent_should_process_one_texture_at_a_time(self):
+        # Arrange
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def process(input_path: str, output_path: str):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        # Act
+        await BatchTextureRunner(process).run(self.input_paths, self.output_paths)
+
+        # Assert
+        self.assertEqual(1, max_running)
+
+    async def test_manifest_load_should_read_completed_jobs(self):
+        # Arrange
+        self._copy_texture(self.input_paths[0], self.output_paths[0])
+        TextureJobManifest(self.manifest_path).mark_done("key", self.output_paths[0])
+        manifest = TextureJobManifest(self.manifest_path)
+
+        # Act
+        manifest.load()
+
+        # Assert
+        self.assertTrue(manifest.is_done("key", self.output_paths[0]))
+        self.assertFalse(manifest.is_done("key", self.output_paths[1]))
+        self.assertFalse(manifest.is_done("other_key", self.output_paths[0]))
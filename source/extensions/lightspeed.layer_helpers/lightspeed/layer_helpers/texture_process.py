@@ -15,14 +15,20 @@
 * limitations under the License.
 """
 
-import asyncio
+import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
+import carb.settings
+import carb.tokens
 import omni.usd
 from lightspeed.common import constants
 from lightspeed.layer_manager.core import LayerManagerCore, LayerType
 
+from .batch_texture_runner import BatchTextureRunner as _BatchTextureRunner
+
+_MAX_CONCURRENT_SETTING = "/exts/lightspeed.layer_helpers/texture_processing/max_concurrent"
+
 
 class LightspeedTextureProcessingCore:
     @staticmethod
@@ -40,17 +46,47 @@ class LightspeedTextureProcessingCore:
     @staticmethod
     @omni.usd.handle_exception
     async def async_batch_texture_process(
-        processing_method, asset_absolute_paths, output_asset_absolute_paths, progress_callback=None
-    ):
-        loop = asyncio.get_event_loop()
-        if len(asset_absolute_paths) != len(output_asset_absolute_paths):
-            raise RuntimeError("List length mismatch.")
-        total = len(asset_absolute_paths)
-        for i, asset_absolute_path in enumerate(asset_absolute_paths):
-            # perform upscale and place the output textures next to the enhancements layer location
-            await loop.run_in_executor(None, processing_method, asset_absolute_path, output_asset_absolute_paths[i])
-            if progress_callback:
-                progress_callback((i + 1) / total)
+        processing_method,
+        asset_absolute_paths,
+        output_asset_absolute_paths,
+        progress_callback=None,
+        max_concurrent=None,
+        manifest_path=None,
+    ) -> Dict[str, str]:
+        """
+        Process the textures in executor threads. A texture that fails doesn't stop the batch.
+
+        Args:
+            processing_method: the method to process a texture, called with the input and output texture paths
+            asset_absolute_paths: the textures to process
+            output_asset_absolute_paths: the output texture of each input texture
+            progress_callback: called with the progress, between 0 and 1
+            max_concurrent: the maximum number of textures processed at the same time. If None, use the setting.
+            manifest_path: the file to record the completed textures in, to skip them if the batch is run again
+
+        Returns:
+            The error message of each input texture that failed
+        """
+        if max_concurrent is None:
+            max_concurrent = carb.settings.get_settings().get(_MAX_CONCURRENT_SETTING) or 1
+        runner = _BatchTextureRunner(processing_method, max_concurrent=max_concurrent, manifest_path=manifest_path)
+        return await runner.run(asset_absolute_paths, output_asset_absolute_paths, progress_callback=progress_callback)
+
+    @staticmethod
+    def get_batch_manifest_path(output_directory: str, output_suffix: str) -> str:
+        """
+        Get the manifest file of the texture processing jobs writing in a directory
+
+        Args:
+            output_directory: the directory the output textures are written in
+            output_suffix: the suffix of the output textures
+
+        Returns:
+            The manifest file path, in the cache directory
+        """
+        name = hashlib.sha1(f"{output_directory}{output_suffix}".encode("utf8")).hexdigest()
+        cache_dir = carb.tokens.get_tokens_interface().resolve("${cache}")
+        return str(Path(cache_dir).joinpath("lightspeed.layer_helpers", f"{name}.jsonl"))
 
     @staticmethod
     def blocking_batch_texture_process(processing_method, asset_absolute_paths, output_asset_absolute_paths):
@@ -115,8 +151,15 @@ class LightspeedTextureProcessingCore:
         out_abs_paths = [
             str(Path(replacement_layer_path).parent.joinpath(out_rel_path)) for out_rel_path in out_rel_paths
         ]
-        await LightspeedTextureProcessingCore.async_batch_texture_process(
-            processing_method, abs_paths, out_abs_paths, progress_callback
+        # Textures completed by a previous run that failed or was interrupted are skipped
+        failures = await LightspeedTextureProcessingCore.async_batch_texture_process(
+            processing_method,
+            abs_paths,
+            out_abs_paths,
+            progress_callback,
+            manifest_path=LightspeedTextureProcessingCore.get_batch_manifest_path(
+                str(Path(replacement_layer_path).parent), output_suffix
+            ),
         )
         prim_paths, out_rel_paths = LightspeedTextureProcessingCore.lss_filter_lists_for_file_existence(
             prim_paths, out_abs_paths, out_rel_paths
@@ -124,6 +167,10 @@ class LightspeedTextureProcessingCore:
         LightspeedTextureProcessingCore.lss_generate_populate_and_child_autoupscale_layer(
             output_texture_type, prim_paths, out_rel_paths, context_name
         )
+        if failures:
+            return f"{len(failures)} textures failed to process:\n" + "\n".join(
+                f"{path}: {error}" for path, error in failures.items()
+            )
         return None
 
     @staticmethod
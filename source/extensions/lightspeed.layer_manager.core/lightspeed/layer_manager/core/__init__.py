@@ -23,8 +23,12 @@ __all__ = [
     "LSS_LAYER_MOD_NOTES",
     "LSS_LAYER_MOD_VERSION",
     "LayerManagerCore",
+    "LayerManagerCoreExtension",
+    "LayerStackSnapshot",
     "LayerType",
     "LayerTypeKeys",
+    "destroy_layer_stack_snapshots",
+    "get_layer_stack_snapshot",
 ]
 
 from .constants import (
@@ -37,3 +41,5 @@ from .constants import (
 )
 from .core import LayerManagerCore
 from .data_models import LayerType, LayerTypeKeys
+from .extension import LayerManagerCoreExtension
+from .layer_stack_snapshot import LayerStackSnapshot, destroy_layer_stack_snapshots, get_layer_stack_snapshot
@@ -57,6 +57,8 @@ from .data_models import (
     SaveLayerPathParamModel,
     SetEditTargetPathParamModel,
 )
+from .layer_stack_snapshot import LayerStackSnapshot
+from .layer_stack_snapshot import get_layer_stack_snapshot as _get_layer_stack_snapshot
 from .layers import autoupscale, capture, capture_baker, i_layer, replacement, workfile
 
 
@@ -442,6 +444,16 @@ class LayerManagerCore:
 
         return any(self.get_custom_data_layer_type(layer) == layer_type.value for layer in layer_stack)
 
+    def get_layer_stack_snapshot(self) -> Optional[LayerStackSnapshot]:
+        """
+        Get the shared snapshot of the layer stack. The snapshot is only computed again after the layer stack changed, so
+        it should be preferred over walking the stack when reacting to layer events.
+
+        Returns:
+            The layer stack snapshot, or None if no stage is opened
+        """
+        return _get_layer_stack_snapshot(self.context_name)
+
     def broken_layers_stack(self) -> list[tuple[Sdf.Layer, str]]:
         """
         Return broken layers (like a layer in the stack but doesn't exist on the disk)
@@ -449,24 +461,37 @@ class LayerManagerCore:
         Returns:
             Tuple of the broken layers + the parent like: (parent layer, broken layer)
         """
+        snapshot = self.get_layer_stack_snapshot()
+        if not snapshot:
+            return []
+        return list(snapshot.broken_layers)
 
-        result = []
+    def remove_broken_layers(self, broken_layers: list[tuple[Sdf.Layer, str]]) -> list[str]:
+        """
+        Remove a list of broken layers from their parent layers, without walking the layer stack again.
 
-        def get_layer_stack(_layer: Sdf.Layer) -> List[Sdf.Layer]:
-            _layer_stack = []
-            for sublayer_path in _layer.subLayerPaths:
-                sdf_layer = Sdf.Layer.FindOrOpenRelativeToLayer(_layer, sublayer_path)
-                if sdf_layer:
-                    _layer_stack.extend(get_layer_stack(sdf_layer))
-                else:
-                    _layer_stack.append((_layer, sublayer_path))
+        Args:
+            broken_layers: The broken layers to remove, as returned by `broken_layers_stack`
 
-            return _layer_stack
+        Returns:
+            List of removed layer path
+        """
+        paths_by_parent = {}
+        for parent_layer, broken_layer in broken_layers:
+            paths_by_parent.setdefault(parent_layer, []).append(broken_layer)
 
-        root_layer = self.__context.get_stage().GetRootLayer()
-        result.extend(get_layer_stack(root_layer))
+        result_list = []
+        for parent_layer, invalid_paths in paths_by_parent.items():
+            sublayer_paths = parent_layer.subLayerPaths.copy()
+            removed_paths = [path for path in invalid_paths if path in sublayer_paths]
+            if not removed_paths:
+                continue
+            for removed_path in removed_paths:
+                sublayer_paths.remove(removed_path)
+            parent_layer.subLayerPaths = sublayer_paths
+            result_list.extend(removed_paths)
 
-        return result
+        return result_list
 
     def remove_broken_layer(self, parent_layer_identifier: str, broken_layer: str) -> list[str]:
         """
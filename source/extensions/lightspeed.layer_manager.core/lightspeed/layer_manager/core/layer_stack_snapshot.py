@@ -0,0 +1,227 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["LayerStackSnapshot", "destroy_layer_stack_snapshots", "get_layer_stack_snapshot"]
+
+import omni.kit.usd.layers as _layers
+import omni.usd
+from omni.flux.utils.common.context_listener import ContextInstances as _ContextInstances
+from omni.flux.utils.common.context_listener import ContextStageListener as _ContextStageListener
+from pxr import Sdf, Tf, Usd
+
+from .data_models import LayerType, LayerTypeKeys
+
+
+def _get_layer_signature(layer: Sdf.Layer) -> tuple[tuple[str, ...], str | None]:
+    """The parts of a layer that change the snapshot when they are edited"""
+    return tuple(layer.subLayerPaths), layer.customLayerData.get(LayerTypeKeys.layer_type.value)
+
+
+class LayerStackSnapshot:
+    """
+    A read-only view of the layer stack of a stage, computed in a single walk of the sublayer tree.
+
+    Attributes:
+        version: Incremented every time a new snapshot is computed for the context
+        layers: Every layer in the stack, in depth-first order starting with the root layer
+        broken_layers: The sublayer paths that can't be opened, with their parent layer: (parent layer, sublayer path)
+        muted_layers: The identifiers of the muted layers
+        locked_layers: The identifiers of the locked layers
+    """
+
+    def __init__(
+        self,
+        version: int,
+        layers: list[Sdf.Layer],
+        broken_layers: list[tuple[Sdf.Layer, str]],
+        muted_layers: set[str],
+        locked_layers: set[str],
+    ):
+        self.version = version
+        self.layers = tuple(layers)
+        self.broken_layers = tuple(broken_layers)
+        self.muted_layers = frozenset(muted_layers)
+        self.locked_layers = frozenset(locked_layers)
+
+        self._signatures = {}
+        self._layers_by_type: dict[str | None, list[Sdf.Layer]] = {}
+        for layer in self.layers:
+            signature = _get_layer_signature(layer)
+            self._signatures[layer.identifier] = signature
+            self._layers_by_type.setdefault(signature[1], []).append(layer)
+
+    def get_layers(self, layer_type: LayerType | None, find_muted_layers: bool = True) -> list[Sdf.Layer]:
+        """
+        Get all layers of a given layer type.
+
+        Args:
+            layer_type: The type of layer to look for. None layer type is valid.
+            find_muted_layers: Whether to include the muted layers or not
+
+        Returns:
+            A list of layers with the given layer type, in stack order
+        """
+        layers = self._layers_by_type.get(layer_type.value if layer_type is not None else None, [])
+        if find_muted_layers:
+            return list(layers)
+        return [layer for layer in layers if layer.identifier not in self.muted_layers]
+
+    def is_outdated_by(self, layer: Sdf.Layer) -> bool:
+        """
+        Args:
+            layer: A layer that was edited
+
+        Returns:
+            Whether the edit changed the sublayers or the type of a layer in the snapshot
+        """
+        signature = self._signatures.get(layer.identifier)
+        return signature is not None and signature != _get_layer_signature(layer)
+
+
+class _LayerStackSnapshotTracker:
+    """
+    Keep the layer stack snapshot of a context. The snapshot is computed on first access after a change, so multiple
+    consumers reacting to the same change share a single walk of the stack.
+
+    Only the stage of the context is listened to: edits to layers outside of its layer stack are never processed.
+    """
+
+    def __init__(self, context_name: str = ""):
+        self._context = omni.usd.get_context(context_name)
+        self._version = 0
+        self._snapshot = None
+
+        self._muting_listener = None
+        self._stage_listener = _ContextStageListener(
+            context_name,
+            self._on_objects_changed,
+            name="LayerStackSnapshot",
+            on_stage_changed=self._on_stage_changed,
+        )
+        self._layer_event_sub = (
+            _layers.get_layers(self._context)
+            .get_event_stream()
+            .create_subscription_to_pop(self._on_layer_event, name="LayerStackSnapshotLayerListener")
+        )
+
+    @property
+    def snapshot(self) -> LayerStackSnapshot | None:
+        stage = self._stage_listener.update()
+        if not stage:
+            self.invalidate()
+            return None
+
+        if self._snapshot is None:
+            self._snapshot = self._compute_snapshot(stage)
+        return self._snapshot
+
+    def invalidate(self):
+        self._snapshot = None
+
+    def destroy(self):
+        self._stage_listener.destroy()
+        self._revoke_muting_listener()
+        self._layer_event_sub = None
+        self.invalidate()
+
+    def _compute_snapshot(self, stage: Usd.Stage) -> LayerStackSnapshot:
+        layers = []
+        broken_layers = []
+        visited = set()
+
+        def walk(layer: Sdf.Layer):
+            if layer.identifier in visited:
+                return
+            visited.add(layer.identifier)
+            layers.append(layer)
+            for sublayer_path in layer.subLayerPaths:
+                sublayer = Sdf.Layer.FindOrOpenRelativeToLayer(layer, sublayer_path)
+                if sublayer:
+                    walk(sublayer)
+                else:
+                    broken_layers.append((layer, sublayer_path))
+
+        walk(stage.GetRootLayer())
+
+        layers_state = _layers.get_layers(self._context).get_layers_state()
+        self._version += 1
+        return LayerStackSnapshot(
+            self._version,
+            layers,
+            broken_layers,
+            {layer.identifier for layer in layers if stage.IsLayerMuted(layer.identifier)},
+            {layer.identifier for layer in layers if layers_state.is_layer_locked(layer.identifier)},
+        )
+
+    def _on_objects_changed(self, notice, _sender):
+        # Layer stack edits are notified synchronously, so the snapshot is never read outdated after a stack change
+        if self._snapshot is None:
+            return
+        root_path = Sdf.Path.absoluteRootPath
+        if root_path in notice.GetResyncedPaths():
+            self.invalidate()
+        elif root_path in notice.GetChangedInfoOnlyPaths():
+            # Layer metadata was edited in the stack: only invalidate if the type of a layer changed
+            if any(self._snapshot.is_outdated_by(layer) for layer in self._snapshot.layers):
+                self.invalidate()
+
+    def _on_muting_changed(self, _notice, _sender):
+        self.invalidate()
+
+    def _on_stage_changed(self):
+        self._revoke_muting_listener()
+        self.invalidate()
+        if self._stage_listener.listening:
+            self._muting_listener = Tf.Notice.Register(
+                Usd.Notice.LayerMutingChanged, self._on_muting_changed, self._context.get_stage()
+            )
+
+    def _revoke_muting_listener(self):
+        if self._muting_listener:
+            self._muting_listener.Revoke()
+        self._muting_listener = None
+
+    def _on_layer_event(self, event):
+        payload = _layers.get_layer_event_payload(event)
+        if payload and payload.event_type in [
+            _layers.LayerEventType.LOCK_STATE_CHANGED,
+            _layers.LayerEventType.MUTENESS_SCOPE_CHANGED,
+            _layers.LayerEventType.MUTENESS_STATE_CHANGED,
+        ]:
+            self.invalidate()
+
+
+_TRACKERS = _ContextInstances(_LayerStackSnapshotTracker)
+
+
+def get_layer_stack_snapshot(context_name: str = "") -> LayerStackSnapshot | None:
+    """
+    Get the layer stack snapshot of a context. The snapshot is shared by all the consumers of the context and is only
+    computed again after the layer stack changed.
+
+    Args:
+        context_name: The USD context name
+
+    Returns:
+        The layer stack snapshot, or None if no stage is opened
+    """
+    return _TRACKERS.get(context_name).snapshot
+
+
+def destroy_layer_stack_snapshots():
+    """Stop tracking the layer stack of every USD context. Called when the extension shuts down."""
+    _TRACKERS.destroy()
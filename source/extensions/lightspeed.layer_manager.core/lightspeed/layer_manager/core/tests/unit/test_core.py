@@ -387,6 +387,93 @@ class TestLayerManagerCore(AsyncTestCase):
             # Assert 2
             self.assertEqual([str(sublayer) for sublayer in root_layer.subLayerPaths], ["./mod.usda", "./capture.usda"])
 
+    async def test_remove_broken_layers(self):
+        # Arrange
+        async with open_test_project("usd/full_project/full_project.usda", __name__):
+            # Setup
+            root_layer = self.context.get_stage().GetRootLayer()
+            copy_layers = root_layer.subLayerPaths.copy()
+            copy_layers.extend(["./wrong_layer.usda", "./wrong_layer_02.usda"])
+            root_layer.subLayerPaths = copy_layers
+
+            # Act
+            value = self.layer_manager.remove_broken_layers(self.layer_manager.broken_layers_stack())
+
+            # Assert
+            self.assertEqual(value, ["./wrong_layer.usda", "./wrong_layer_02.usda"])
+            self.assertEqual([str(sublayer) for sublayer in root_layer.subLayerPaths], ["./mod.usda", "./capture.usda"])
+            self.assertListEqual(self.layer_manager.broken_layers_stack(), [])
+
+    async def test_get_layer_stack_snapshot_should_only_update_when_stack_changes(self):
+        # Arrange
+        async with open_test_project("usd/full_project/full_project.usda", __name__):
+            root_layer = self.context.get_stage().GetRootLayer()
+            snapshot = self.layer_manager.get_layer_stack_snapshot()
+
+            # Act
+            unchanged_snapshot = self.layer_manager.get_layer_stack_snapshot()
+            root_layer.subLayerPaths = root_layer.subLayerPaths.copy()[:1]
+            changed_snapshot = self.layer_manager.get_layer_stack_snapshot()
+
+        # Assert
+        self.assertIs(snapshot, unchanged_snapshot)
+        self.assertIsNot(snapshot, changed_snapshot)
+        self.assertGreater(changed_snapshot.version, snapshot.version)
+        self.assertEqual(snapshot.layers[0], root_layer)
+        self.assertEqual(snapshot.get_layers(LayerType.workfile), [root_layer])
+        self.assertEqual(len(snapshot.get_layers(LayerType.capture)), 1)
+        self.assertListEqual(changed_snapshot.get_layers(LayerType.capture), [])
+
+    async def test_get_layer_stack_snapshot_should_ignore_layers_outside_of_stack(self):
+        # Arrange
+        outside_layer = Sdf.Layer.CreateAnonymous()
+        async with open_test_project("usd/full_project/full_project.usda", __name__):
+            snapshot = self.layer_manager.get_layer_stack_snapshot()
+
+            # Act
+            outside_layer.subLayerPaths.append(Sdf.Layer.CreateAnonymous().identifier)
+            outside_layer.customLayerData = {LayerTypeKeys.layer_type.value: LayerType.capture.value}
+            unchanged_snapshot = self.layer_manager.get_layer_stack_snapshot()
+
+        # Assert
+        self.assertIs(snapshot, unchanged_snapshot)
+
+    async def test_get_layer_stack_snapshot_should_update_when_layer_type_changes(self):
+        # Arrange
+        async with open_test_project("usd/full_project/full_project.usda", __name__):
+            snapshot = self.layer_manager.get_layer_stack_snapshot()
+            capture_layer = snapshot.get_layers(LayerType.capture)[0]
+
+            # Act
+            custom_data = capture_layer.customLayerData
+            custom_data[LayerTypeKeys.layer_type.value] = LayerType.replacement.value
+            capture_layer.customLayerData = custom_data
+            changed_snapshot = self.layer_manager.get_layer_stack_snapshot()
+
+        # Assert
+        self.assertIsNot(snapshot, changed_snapshot)
+        self.assertListEqual(changed_snapshot.get_layers(LayerType.capture), [])
+        self.assertIn(capture_layer, changed_snapshot.get_layers(LayerType.replacement))
+
+    async def test_get_layer_stack_snapshot_should_update_when_layer_is_muted(self):
+        # Arrange
+        async with open_test_project("usd/full_project/full_project.usda", __name__):
+            stage = self.context.get_stage()
+            snapshot = self.layer_manager.get_layer_stack_snapshot()
+            capture_layer = snapshot.get_layers(LayerType.capture)[0]
+
+            # Act
+            stage.MuteLayer(capture_layer.identifier)
+            muted_snapshot = self.layer_manager.get_layer_stack_snapshot()
+            stage.UnmuteLayer(capture_layer.identifier)
+            unmuted_snapshot = self.layer_manager.get_layer_stack_snapshot()
+
+        # Assert
+        self.assertNotIn(capture_layer.identifier, snapshot.muted_layers)
+        self.assertIn(capture_layer.identifier, muted_snapshot.muted_layers)
+        self.assertListEqual(muted_snapshot.get_layers(LayerType.capture, find_muted_layers=False), [])
+        self.assertNotIn(capture_layer.identifier, unmuted_snapshot.muted_layers)
+
     async def test_layer_type_in_stack_should_return_correct_value(self):
         # Arrange
         async with open_test_project("usd/full_project/full_project.usda", __name__) as project_url:
@@ -17,18 +17,31 @@
 
 __all__ = ["LightGizmosLayer"]
 
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
 import carb
 import omni.usd
 from lightspeed.trex.viewports.manipulators.global_selection import GlobalSelection
+from omni.flux.utils.common.usd_notice import subscribe_objects_changed as _subscribe_objects_changed
 from omni.kit.scene_view.opengl import ViewportOpenGLSceneView
-from pxr import Tf, Usd, UsdGeom, UsdLux
+from omni.ui import scene as sc
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdLux
 
 from .manipulator import LightGizmosManipulator
-from .model import LightGizmosModel
+from .model import LightGizmosModel, LightType
+from .xform_cache import SubtreeXformCache
 
 CARB_SETTING_GIZMO_SCALE = "/persistent/app/viewport/gizmo/scale"
 CARB_SETTING_CONST_GIZMO_SCALE = "/persistent/app/viewport/gizmo/constantScale"
 CARB_SETTING_CONST_SCALE_ENABLED = "/persistent/app/viewport/gizmo/constantScaleEnabled"
+CARB_SETTING_CULL_OFFSCREEN = "/exts/lightspeed.light.gizmos/culling/offscreen"
+CARB_SETTING_CULL_MAX_DISTANCE = "/exts/lightspeed.light.gizmos/culling/max_distance"
+
+# Extra NDC space around the viewport where the lights are not culled, so gizmos partially on screen stay visible
+_OFFSCREEN_MARGIN = 0.1
+# Lights without a meaningful position are never culled
+_NEVER_CULLED_LIGHT_TYPES = (LightType.DistantLight, LightType.DomeLight)
 
 
 class LightGizmosLayer:
@@ -50,8 +63,11 @@ class LightGizmosLayer:
         self._stage_listener = None
         self._current_stage = None
         self._ignore_update = False
+        self._view_change_sub = None
 
         self._gizmo_scale = 1.0
+        self._cull_offscreen = False
+        self._cull_max_distance = 0.0
 
         self._light_visible_setting = f"/app/viewport/usdcontext-{self._usd_context_name}/scene/lights/visible"
         carb.settings.get_settings().set(self._light_visible_setting, True)
@@ -61,6 +77,8 @@ class LightGizmosLayer:
         isettings.subscribe_to_node_change_events(CARB_SETTING_GIZMO_SCALE, self._light_gizmo_setting_change)
         isettings.subscribe_to_node_change_events(CARB_SETTING_CONST_GIZMO_SCALE, self._light_gizmo_setting_change)
         isettings.subscribe_to_node_change_events(CARB_SETTING_CONST_SCALE_ENABLED, self._light_gizmo_setting_change)
+        isettings.subscribe_to_node_change_events(CARB_SETTING_CULL_OFFSCREEN, self._light_gizmo_setting_change)
+        isettings.subscribe_to_node_change_events(CARB_SETTING_CULL_MAX_DISTANCE, self._light_gizmo_setting_change)
 
         # Create a default SceneView (it has a default camera-model)
         self._scene_view = ViewportOpenGLSceneView(self._viewport_api, visible=True)
@@ -69,6 +87,17 @@ class LightGizmosLayer:
         self._viewport_api.add_scene_view(self._scene_view)
 
         self._manipulators = {}
+        # The light paths under every ancestor of the lights, to find the lights affected by a change without scanning
+        # all the manipulators
+        self._light_paths_by_ancestor: Dict[Sdf.Path, Set[str]] = defaultdict(set)
+        # Transforms shared by all the light models, invalidated per subtree when a transform changes
+        self._xform_cache = SubtreeXformCache()
+        # Paths resynced since the last hierarchy change, where lights may have been added or removed
+        self._pending_resynced_paths: Set[Sdf.Path] = set()
+        self._full_rebuild_required = True
+        # Every manipulator lives in its own container, cleared when the light is removed and reused by the next light
+        self._manipulator_containers: Dict[str, sc.Transform] = {}
+        self._free_manipulator_containers: List[sc.Transform] = []
 
         # Trigger a settings update to obtain defaults
         self._light_gizmo_setting_change(None, carb.settings.ChangeEventType.CHANGED)
@@ -79,8 +108,10 @@ class LightGizmosLayer:
     def _light_gizmo_setting_change(self, item: carb.dictionary.Item, event_type: carb.settings.ChangeEventType):
         if event_type != carb.settings.ChangeEventType.CHANGED:
             return
-        self.visible = bool(carb.settings.get_settings().get(self._light_visible_setting))
+        settings = carb.settings.get_settings()
+        self.visible = bool(settings.get(self._light_visible_setting))
         self.gizmo_scale = self._get_global_gizmo_scale()
+        self._set_culling(bool(settings.get(CARB_SETTING_CULL_OFFSCREEN)), settings.get(CARB_SETTING_CULL_MAX_DISTANCE))
 
     def _get_global_gizmo_scale(self):
         try:
@@ -118,6 +149,61 @@ class LightGizmosLayer:
             for manipulator in self._manipulators.values():
                 manipulator.model.set_gizmo_scale(value)
 
+    @property
+    def culling_enabled(self) -> bool:
+        return self._cull_offscreen or self._cull_max_distance > 0
+
+    def _set_culling(self, cull_offscreen: bool, max_distance: Optional[float]):
+        """
+        Set how lights are culled. Culled lights don't have any gizmo.
+
+        Args:
+            cull_offscreen: cull the lights outside of the viewport
+            max_distance: cull the lights further away from the camera than this distance. 0 doesn't cull any light.
+        """
+        try:
+            max_distance = max(float(max_distance or 0.0), 0.0)
+        except (TypeError, ValueError):
+            max_distance = 0.0
+        if self._cull_offscreen == cull_offscreen and self._cull_max_distance == max_distance:
+            return
+        self._cull_offscreen = cull_offscreen
+        self._cull_max_distance = max_distance
+
+        # Culling is updated every time the camera moves
+        self._view_change_sub = None
+        if self.culling_enabled and self._viewport_api:
+            self._view_change_sub = self._viewport_api.subscribe_to_view_change(self._on_view_changed)
+        self._update_culling(self._manipulators.values())
+
+    def _on_view_changed(self, _viewport_api):
+        self._update_culling(self._manipulators.values())
+
+    def _update_culling(self, manipulators: Iterable[LightGizmosManipulator]):
+        enabled = self.culling_enabled and self._viewport_api is not None
+        world_to_ndc = None
+        camera_position = None
+        if enabled:
+            world_to_ndc = self._viewport_api.world_to_ndc
+            camera_position = self._viewport_api.transform.Transform(Gf.Vec3d(0, 0, 0))
+        for manipulator in manipulators:
+            model = manipulator.model
+            model.set_culled(enabled and self._is_culled(model, world_to_ndc, camera_position))
+
+    def _is_culled(self, model: LightGizmosModel, world_to_ndc: Gf.Matrix4d, camera_position: Gf.Vec3d) -> bool:
+        if model.light_type.value in _NEVER_CULLED_LIGHT_TYPES:
+            return False
+        position = model.world_position
+        if self._cull_max_distance > 0 and (position - camera_position).GetLength() > self._cull_max_distance:
+            return True
+        if self._cull_offscreen:
+            ndc_position = world_to_ndc.Transform(position)
+            limit = 1.0 + _OFFSCREEN_MARGIN
+            # Behind the camera or outside the viewport
+            if ndc_position[2] > 1.0 or abs(ndc_position[0]) > limit or abs(ndc_position[1]) > limit:
+                return True
+        return False
+
     def _get_context(self) -> Usd.Stage:
         # Get the UsdContext we are attached to
         return omni.usd.get_context(self._usd_context_name)
@@ -129,6 +215,7 @@ class LightGizmosLayer:
         self._revoke_listeners()
         self._destroy_manipulators()
         # Remove our references to these objects
+        self._view_change_sub = None
         self._viewport_api = None
         self._scene_view = None
         self._stage_event_sub = None
@@ -150,47 +237,152 @@ class LightGizmosLayer:
         elif event.type == int(omni.usd.StageEventType.OPENED):
             self._current_stage = self._get_context().get_stage()
             self._create_listener(self._current_stage)
+            self._full_rebuild_required = True
         elif event.type == int(omni.usd.StageEventType.HIERARCHY_CHANGED) or event.type == int(
             omni.usd.StageEventType.ACTIVE_LIGHT_COUNTS_CHANGED
         ):
             stage = self._get_context().get_stage()
-            # Create the manipulators
-            self._create_manipulators(stage)
+            # Create or update the manipulators
+            self._update_manipulators(stage)
         elif event.type == int(omni.usd.StageEventType.CLOSED):
             self._revoke_listeners()
             self._destroy_manipulators()
+            self._current_stage = None
+            self._full_rebuild_required = True
 
     def _create_listener(self, stage):
         # Do no work if there is no stage
         if not stage:
             return
-        # Add a Tf.Notice listener to update the transforms of all lights
+        # Add a USD notice subscriber to update the transforms of all lights
         if self._stage_listener:
             self._revoke_listeners()
-        self._stage_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._notice_changed, stage)
+        self._stage_listener = _subscribe_objects_changed(stage, self._notice_changed)
 
     def _notice_changed(self, notice, stage):
-        """Called by Tf.Notice"""
+        """Called by the USD notice dispatcher"""
         # Check to see if we need to update some transforms
         if self._ignore_update or stage != self._current_stage:
             return
         self._ignore_update = True
+        light_paths_to_update = set()
+        for path in notice.GetResyncedPaths():
+            # Lights are added or removed on the next hierarchy change, existing lights are updated right away
+            prim_path = path.GetPrimPath()
+            self._xform_cache.invalidate(prim_path)
+            self._pending_resynced_paths.add(prim_path)
+            light_paths_to_update.update(self._get_light_paths(prim_path))
         for path in notice.GetChangedInfoOnlyPaths():
             if not path.IsPropertyPath():
                 continue
-            prim_path = str(path.GetPrimPath())
-            if prim_path in self._manipulators:
-                self._manipulators[prim_path].model.update_from_prim()
-            else:
-                # Update on any parent transformation changes too
-                for manipulator in self._manipulators.values():
-                    if not manipulator.model.get_prim_path().startswith(prim_path):
-                        continue
-                    if UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(path.name):
-                        manipulator.model.update_from_prim()
-        GlobalSelection.g_set_lightmanipulators(self._manipulators)
+            prim_path = path.GetPrimPath()
+            is_transform_change = UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(path.name)
+            if is_transform_change:
+                self._xform_cache.invalidate(prim_path)
+            if str(prim_path) in self._manipulators:
+                light_paths_to_update.add(str(prim_path))
+            elif is_transform_change or path.name == UsdGeom.Tokens.visibility:
+                # Update on any parent transformation or visibility changes too
+                light_paths_to_update.update(self._get_light_paths(prim_path))
+
+        manipulators = [self._manipulators[p] for p in light_paths_to_update if p in self._manipulators]
+        for manipulator in manipulators:
+            manipulator.model.update_from_prim()
+        if self.culling_enabled:
+            self._update_culling(manipulators)
         self._ignore_update = False
 
+    def _get_light_paths(self, prim_path: Sdf.Path) -> Set[str]:
+        """Get the paths of the lights at or under a prim path"""
+        if prim_path == Sdf.Path.absoluteRootPath:
+            return set(self._manipulators.keys())
+        light_paths = set(self._light_paths_by_ancestor.get(prim_path, ()))
+        if str(prim_path) in self._manipulators:
+            light_paths.add(str(prim_path))
+        return light_paths
+
+    @staticmethod
+    def _is_light(prim: Usd.Prim) -> bool:
+        return prim.HasAPI(UsdLux.LightAPI) if hasattr(UsdLux, "LightAPI") else prim.IsA(UsdLux.Light)
+
+    def _update_manipulators(self, stage):
+        """Add and remove only the manipulators of the lights under the paths resynced since the last update"""
+        # Do no work if there is no stage
+        if not stage:
+            return
+
+        # Without a listener on this stage, the changes are unknown
+        if self._full_rebuild_required or stage != self._current_stage or not self._stage_listener:
+            self._current_stage = stage
+            self._create_listener(stage)
+            self._create_manipulators(stage)
+            return
+
+        resynced_paths = sorted(self._pending_resynced_paths)
+        self._pending_resynced_paths = set()
+        if Sdf.Path.absoluteRootPath in resynced_paths:
+            self._create_manipulators(stage)
+            return
+
+        added_manipulators = []
+        with self._scene_view.scene:
+            last_root_path = None
+            for path in resynced_paths:
+                # Sorted paths: descendants directly follow their ancestor, which already covers them
+                if last_root_path is not None and path.HasPrefix(last_root_path):
+                    continue
+                last_root_path = path
+
+                existing_light_paths = self._get_light_paths(path)
+                prim = stage.GetPrimAtPath(path)
+                if prim:
+                    for light in filter(self._is_light, Usd.PrimRange(prim, Usd.PrimAllPrimsPredicate)):
+                        light_path = str(light.GetPath())
+                        if light_path in existing_light_paths:
+                            # The prim was recomposed, keep the manipulator
+                            existing_light_paths.discard(light_path)
+                            self._manipulators[light_path].model.set_prim(light)
+                        else:
+                            added_manipulators.append(self._add_manipulator(light))
+                for light_path in existing_light_paths:
+                    self._remove_manipulator(light_path)
+
+        if self.culling_enabled:
+            self._update_culling(added_manipulators)
+        GlobalSelection.g_set_lightmanipulators(self._manipulators)
+
+    def _add_manipulator(self, light: Usd.Prim) -> LightGizmosManipulator:
+        """Create the manipulator of a light. Should be called in the scene of the scene view."""
+        light_path = light.GetPath()
+        container = self._free_manipulator_containers.pop() if self._free_manipulator_containers else sc.Transform()
+        with container:
+            manipulator = LightGizmosManipulator(
+                self._viewport_api,
+                model=LightGizmosModel(light, self._usd_context_name, self._gizmo_scale, xform_cache=self._xform_cache),
+            )
+        self._manipulators[str(light_path)] = manipulator
+        self._manipulator_containers[str(light_path)] = container
+        for ancestor_path in light_path.GetParentPath().GetPrefixes():
+            self._light_paths_by_ancestor[ancestor_path].add(str(light_path))
+        return manipulator
+
+    def _remove_manipulator(self, light_path: str):
+        manipulator = self._manipulators.pop(light_path, None)
+        if not manipulator:
+            return
+        for ancestor_path in Sdf.Path(light_path).GetParentPath().GetPrefixes():
+            light_paths = self._light_paths_by_ancestor.get(ancestor_path)
+            if light_paths is None:
+                continue
+            light_paths.discard(light_path)
+            if not light_paths:
+                del self._light_paths_by_ancestor[ancestor_path]
+        # Take the manipulator out of the scene and release it
+        container = self._manipulator_containers.pop(light_path)
+        container.clear()
+        manipulator.destroy()
+        self._free_manipulator_containers.append(container)
+
     def _create_manipulators(self, stage):
         # Do no work if there is no stage
         if not stage:
@@ -198,23 +390,20 @@ class LightGizmosLayer:
 
         # Release stale manipulators
         self._destroy_manipulators()
+        self._pending_resynced_paths = set()
+        self._full_rebuild_required = False
 
         # trigger settings update
         self._light_gizmo_setting_change(None, carb.settings.ChangeEventType.CHANGED)
 
         # Add the manipulator into the SceneView's scene
         with self._scene_view.scene:
-            lights = [
-                prim
-                for prim in stage.TraverseAll()
-                if (prim.HasAPI(UsdLux.LightAPI) if hasattr(UsdLux, "LightAPI") else prim.IsA(UsdLux.Light))
+            manipulators: List[LightGizmosManipulator] = [
+                self._add_manipulator(prim) for prim in stage.TraverseAll() if self._is_light(prim)
             ]
-            for light in lights:
-                manipulator = LightGizmosManipulator(
-                    self._viewport_api, model=LightGizmosModel(light, self._usd_context_name, self._gizmo_scale)
-                )
-                self._manipulators[str(light.GetPrimPath())] = manipulator
             GlobalSelection.g_set_lightmanipulators(self._manipulators)
+        if self.culling_enabled:
+            self._update_culling(manipulators)
 
     def _destroy_manipulators(self):
         if self._scene_view:
@@ -224,4 +413,8 @@ class LightGizmosLayer:
         for manipulator in self._manipulators.values():
             manipulator.destroy()
         self._manipulators = {}
+        self._manipulator_containers = {}
+        self._free_manipulator_containers = []
+        self._light_paths_by_ancestor = defaultdict(set)
+        self._xform_cache.clear()
         GlobalSelection.g_set_lightmanipulators(self._manipulators)
@@ -498,6 +498,7 @@ class LightGizmosManipulator(sc.Manipulator):
         self._root = sc.Transform()
         self._polygon_mesh = None
         self._is_visible = True
+        self._is_building = False
 
         # image based gizmos crash omniverse just now (105.1.2)
         # style = ui.Style.get_instance()
@@ -512,13 +513,17 @@ class LightGizmosManipulator(sc.Manipulator):
 
     def on_build(self):
         """Called when the model is changed and rebuilds the whole gizmo"""
+        self._is_building = True
         self.model.update_from_prim()
+        self._is_building = False
 
         # get up to date state
         self._update_root_transform()
         self._update_icon_geometry()
         self._update_visibility()
 
+        # The manipulator can be rebuilt when the visibility changes
+        self._root.clear()
         if not self._is_visible:
             return
 
@@ -550,7 +555,11 @@ class LightGizmosManipulator(sc.Manipulator):
             self._update_icon_geometry()
 
         if item == self.model.get_item("visible"):
+            was_visible = self._is_visible
             self._update_visibility()
+            # Only visible gizmos are built, so rebuild when a light is shown or hidden
+            if was_visible != self._is_visible and not self._is_building:
+                self.invalidate()
 
     def _update_root_transform(self):
         transform = self.model.get_as_floats(self.model.get_item("transform"))
@@ -18,12 +18,15 @@
 __all__ = ["LightGizmosModel"]
 
 from enum import IntEnum
+from typing import Optional
 
 import omni.kit.commands
 import omni.usd
 from omni.ui import scene as sc
 from pxr import Gf, Usd, UsdGeom, UsdLux
 
+from .xform_cache import SubtreeXformCache as _SubtreeXformCache
+
 
 class LightType(IntEnum):
     DiskLight = 0
@@ -55,11 +58,18 @@ class LightGizmosModel(sc.AbstractManipulatorModel):
             super().__init__()
             self.value = LightType.UnknownLight
 
-    def __init__(self, prim: Usd.Prim, usd_context_name, scale: float):
+    def __init__(
+        self, prim: Usd.Prim, usd_context_name, scale: float, xform_cache: Optional[_SubtreeXformCache] = None
+    ):
         super().__init__()
 
         self._usd_context_name = usd_context_name
         self._gizmo_scale = scale
+        # The transforms can be shared between all the light models
+        self._xform_cache = xform_cache
+        self._world_position = Gf.Vec3d(0.0)
+        # Culled lights are hidden without changing their USD visibility
+        self._culled = False
 
         # Current selection
         self._prim = prim
@@ -68,6 +78,7 @@ class LightGizmosModel(sc.AbstractManipulatorModel):
         self.transform = LightGizmosModel.TransformItem(self._get_transform())
         self.visible = LightGizmosModel.VisibleItem()
         self.light_type = LightGizmosModel.LightTypeItem()
+        self.light_type.value = self._get_light_type()
 
         # gizmo scale will modify the transform directly
         self.set_gizmo_scale(scale)
@@ -76,7 +87,14 @@ class LightGizmosModel(sc.AbstractManipulatorModel):
         # Get the UsdContext we are attached to
         return omni.usd.get_context(self._usd_context_name)
 
+    def set_prim(self, prim: Usd.Prim):
+        """Track a new prim handle for the same light, when the light prim was recomposed"""
+        self._prim = prim
+        self.update_from_prim()
+
     def update_from_prim(self):
+        if not self._prim.IsValid():
+            return
         self.set_value(self.transform, self._get_transform())
         self.set_value(self.light_type, self._get_light_type())
         self.set_value(self.visible, self._is_visible())
@@ -120,6 +138,22 @@ class LightGizmosModel(sc.AbstractManipulatorModel):
     def get_prim_path(self):
         return self._current_path
 
+    @property
+    def world_position(self) -> Gf.Vec3d:
+        """The world position of the light, as of the last transform update"""
+        return self._world_position
+
+    @property
+    def culled(self) -> bool:
+        return self._culled
+
+    def set_culled(self, value: bool):
+        """Hide or show the gizmo without changing the visibility of the light"""
+        if self._culled == value:
+            return
+        self._culled = value
+        self.set_value(self.visible, self._is_visible())
+
     def set_gizmo_scale(self, scale):
         self._gizmo_scale = scale
         # recalculate the transform since that will need to change
@@ -127,9 +161,9 @@ class LightGizmosModel(sc.AbstractManipulatorModel):
 
     def _is_visible(self):
         stage = self._get_context().get_stage()
-        if not stage or not self._current_path:
+        if not stage or not self._current_path or self._culled:
             return False
-        if not self._prim.IsActive():
+        if not self._prim.IsValid() or not self._prim.IsActive():
             return False
         imageable = UsdGeom.Imageable(self._prim)
         return imageable.ComputeVisibility() != UsdGeom.Tokens.invisible
@@ -143,8 +177,12 @@ class LightGizmosModel(sc.AbstractManipulatorModel):
             return [j for sub in final_transform for j in sub]
 
         # Get transform directly from USD
-        light_transform = UsdGeom.Imageable(self._prim).ComputeLocalToWorldTransform(Usd.TimeCode.Default())
-        final_transform.SetTranslateOnly(light_transform.ExtractTranslation())
+        if self._xform_cache:
+            light_transform = self._xform_cache.get_local_to_world_transform(self._prim)
+        else:
+            light_transform = UsdGeom.Imageable(self._prim).ComputeLocalToWorldTransform(Usd.TimeCode.Default())
+        self._world_position = light_transform.ExtractTranslation()
+        final_transform.SetTranslateOnly(self._world_position)
 
         return [j for sub in final_transform for j in sub]
 
@@ -16,3 +16,5 @@
 """
 
 from .e2e.test_info import TestInfo
+from .e2e.test_layer import TestLightGizmosLayer
+from .unit.test_xform_cache import TestXformCache
@@ -0,0 +1,145 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TestLightGizmosLayer"]
+
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+from lightspeed.light.gizmos.layer import LightGizmosLayer
+from omni.kit.viewport.utility import get_active_viewport
+from pxr import Gf, Sdf, UsdGeom, UsdLux
+
+
+class TestLightGizmosLayer(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.stage = self.context.get_stage()
+        UsdGeom.Xform.Define(self.stage, "/World/Group")
+        UsdLux.SphereLight.Define(self.stage, "/World/Group/Light01")
+        UsdLux.SphereLight.Define(self.stage, "/World/Light02")
+        self.layer = LightGizmosLayer({"viewport_api": get_active_viewport()})
+        self.layer._update_manipulators(self.stage)  # noqa PLW0212
+
+    # After running each test
+    async def tearDown(self):
+        self.layer.destroy()
+        self.layer = None
+        await self.context.close_stage_async()
+        self.stage = None
+
+    async def test_update_manipulators_first_update_should_create_all_manipulators(self):
+        # Assert
+        self.assertSetEqual({"/World/Group/Light01", "/World/Light02"}, set(self.layer._manipulators))  # noqa PLW0212
+        self.assertSetEqual(
+            {"/World/Group/Light01"},
+            self.layer._light_paths_by_ancestor[Sdf.Path("/World/Group")],  # noqa PLW0212
+        )
+        self.assertSetEqual(
+            {"/World/Group/Light01", "/World/Light02"},
+            self.layer._light_paths_by_ancestor[Sdf.Path("/World")],  # noqa PLW0212
+        )
+
+    async def test_update_manipulators_added_light_should_keep_existing_manipulators(self):
+        # Arrange
+        existing = dict(self.layer._manipulators)  # noqa PLW0212
+
+        # Act
+        UsdLux.RectLight.Define(self.stage, "/World/Group/Light03")
+        self.layer._update_manipulators(self.stage)  # noqa PLW0212
+
+        # Assert
+        manipulators = self.layer._manipulators  # noqa PLW0212
+        self.assertSetEqual({"/World/Group/Light01", "/World/Group/Light03", "/World/Light02"}, set(manipulators))
+        for path, manipulator in existing.items():
+            self.assertIs(manipulator, manipulators[path])
+        self.assertIn(
+            "/World/Group/Light03", self.layer._light_paths_by_ancestor[Sdf.Path("/World/Group")]  # noqa PLW0212
+        )
+
+    async def test_update_manipulators_removed_light_should_destroy_manipulator(self):
+        # Arrange
+        removed = self.layer._manipulators["/World/Group/Light01"]  # noqa PLW0212
+        container = self.layer._manipulator_containers["/World/Group/Light01"]  # noqa PLW0212
+
+        # Act
+        self.stage.RemovePrim("/World/Group/Light01")
+        self.layer._update_manipulators(self.stage)  # noqa PLW0212
+
+        # Assert
+        self.assertSetEqual({"/World/Light02"}, set(self.layer._manipulators))  # noqa PLW0212
+        self.assertNotIn("/World/Group/Light01", self.layer._manipulator_containers)  # noqa PLW0212
+        self.assertNotIn(Sdf.Path("/World/Group"), self.layer._light_paths_by_ancestor)  # noqa PLW0212
+        self.assertIsNone(removed._root)  # noqa PLW0212
+        self.assertIn(container, self.layer._free_manipulator_containers)  # noqa PLW0212
+
+    async def test_update_manipulators_added_light_should_reuse_removed_container(self):
+        # Arrange
+        container = self.layer._manipulator_containers["/World/Light02"]  # noqa PLW0212
+        self.stage.RemovePrim("/World/Light02")
+        self.layer._update_manipulators(self.stage)  # noqa PLW0212
+
+        # Act
+        UsdLux.DiskLight.Define(self.stage, "/World/Light04")
+        self.layer._update_manipulators(self.stage)  # noqa PLW0212
+
+        # Assert
+        self.assertIs(container, self.layer._manipulator_containers["/World/Light04"])  # noqa PLW0212
+        self.assertListEqual([], self.layer._free_manipulator_containers)  # noqa PLW0212
+
+    async def test_update_manipulators_resynced_ancestor_should_rebind_lights(self):
+        # Arrange
+        manipulator = self.layer._manipulators["/World/Group/Light01"]  # noqa PLW0212
+
+        # Act
+        # Changing the type of the group resyncs it and everything under it
+        self.stage.GetPrimAtPath("/World/Group").SetTypeName("Scope")
+        self.layer._update_manipulators(self.stage)  # noqa PLW0212
+
+        # Assert
+        self.assertIs(manipulator, self.layer._manipulators["/World/Group/Light01"])  # noqa PLW0212
+        self.assertTrue(manipulator.model._prim.IsValid())  # noqa PLW0212
+
+    async def test_notice_changed_ancestor_transform_should_update_lights(self):
+        # Act
+        UsdGeom.Xformable(self.stage.GetPrimAtPath("/World/Group")).AddTranslateOp().Set(Gf.Vec3d(10, 0, 0))
+
+        # Assert
+        model = self.layer._manipulators["/World/Group/Light01"].model  # noqa PLW0212
+        self.assertEqual(Gf.Vec3d(10, 0, 0), model.world_position)
+        model = self.layer._manipulators["/World/Light02"].model  # noqa PLW0212
+        self.assertEqual(Gf.Vec3d(0, 0, 0), model.world_position)
+
+    async def test_set_culling_max_distance_should_cull_far_lights(self):
+        # Arrange
+        far_light = self.layer._manipulators["/World/Group/Light01"].model  # noqa PLW0212
+        UsdGeom.Xformable(self.stage.GetPrimAtPath("/World/Group")).AddTranslateOp().Set(Gf.Vec3d(1e6, 0, 0))
+
+        # Act
+        self.layer._set_culling(False, 1e5)  # noqa PLW0212
+
+        # Assert
+        self.assertTrue(far_light.culled)
+        self.assertFalse(self.layer._manipulators["/World/Light02"].model.culled)  # noqa PLW0212
+
+        # Act
+        self.layer._set_culling(False, 0)  # noqa PLW0212
+
+        # Assert
+        self.assertFalse(far_light.culled)
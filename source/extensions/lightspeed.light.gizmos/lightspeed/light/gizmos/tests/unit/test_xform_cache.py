@@ -0,0 +1,66 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TestXformCache"]
+
+import omni.kit.test
+from lightspeed.light.gizmos.xform_cache import SubtreeXformCache
+from pxr import Gf, Usd, UsdGeom
+
+
+class TestXformCache(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        self.parent = UsdGeom.Xform.Define(self.stage, "/World")
+        self.parent.AddTranslateOp().Set(Gf.Vec3d(10, 0, 0))
+        self.light = UsdGeom.Xform.Define(self.stage, "/World/Group/Light")
+        self.light.AddTranslateOp().Set(Gf.Vec3d(0, 5, 0))
+        self.cache = SubtreeXformCache()
+
+    async def test_get_local_to_world_transform_matches_usd(self):
+        # Act
+        transform = self.cache.get_local_to_world_transform(self.light.GetPrim())
+
+        # Assert
+        expected = self.light.ComputeLocalToWorldTransform(Usd.TimeCode.Default())
+        self.assertEqual(transform, expected)
+        self.assertEqual(transform.ExtractTranslation(), Gf.Vec3d(10, 5, 0))
+
+    async def test_invalidate_parent_updates_descendants(self):
+        # Arrange
+        self.cache.get_local_to_world_transform(self.light.GetPrim())
+        self.parent.GetOrderedXformOps()[0].Set(Gf.Vec3d(20, 0, 0))
+
+        # Act
+        cached = self.cache.get_local_to_world_transform(self.light.GetPrim())
+        self.cache.invalidate(self.parent.GetPath())
+        updated = self.cache.get_local_to_world_transform(self.light.GetPrim())
+
+        # Assert
+        self.assertEqual(cached.ExtractTranslation(), Gf.Vec3d(10, 5, 0))
+        self.assertEqual(updated.ExtractTranslation(), Gf.Vec3d(20, 5, 0))
+
+    async def test_reset_xform_stack_ignores_parents(self):
+        # Arrange
+        self.light.SetResetXformStack(True)
+
+        # Act
+        transform = self.cache.get_local_to_world_transform(self.light.GetPrim())
+
+        # Assert
+        self.assertEqual(transform.ExtractTranslation(), Gf.Vec3d(0, 5, 0))
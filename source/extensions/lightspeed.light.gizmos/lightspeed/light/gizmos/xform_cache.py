@@ -0,0 +1,86 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["SubtreeXformCache"]
+
+from collections import defaultdict
+from typing import Dict, Set
+
+from pxr import Gf, Sdf, Usd, UsdGeom
+
+
+class SubtreeXformCache:
+    """
+    Cache of local-to-world transforms shared by all the light gizmos.
+
+    The world transform of a prim is computed from the cached transform of its parent, so lights sharing ancestors
+    only compute those ancestors once. A transform change only invalidates the subtree of the changed prim.
+    """
+
+    def __init__(self, time: Usd.TimeCode = Usd.TimeCode.Default()):
+        self._time = time
+        self._transforms: Dict[Sdf.Path, Gf.Matrix4d] = {}
+        self._children: Dict[Sdf.Path, Set[Sdf.Path]] = defaultdict(set)
+
+    def get_local_to_world_transform(self, prim: Usd.Prim) -> Gf.Matrix4d:
+        """
+        Get the local-to-world transform of a prim, computing and caching it and its ancestors if needed
+
+        Args:
+            prim: the prim to get the transform of
+
+        Returns:
+            The local-to-world transform of the prim
+        """
+        path = prim.GetPath()
+        transform = self._transforms.get(path)
+        if transform is not None:
+            return transform
+
+        local_transform = Gf.Matrix4d(1.0)
+        resets_xform_stack = False
+        xformable = UsdGeom.Xformable(prim)
+        if xformable:
+            local_transform, resets_xform_stack = xformable.GetLocalTransformation(self._time)
+
+        parent = prim.GetParent()
+        if resets_xform_stack or not parent or parent.IsPseudoRoot():
+            transform = local_transform
+        else:
+            transform = local_transform * self.get_local_to_world_transform(parent)
+
+        self._transforms[path] = transform
+        self._children[path.GetParentPath()].add(path)
+        return transform
+
+    def invalidate(self, path: Sdf.Path):
+        """
+        Remove the cached transforms of a prim and all its descendants
+
+        Args:
+            path: the path of the prim to invalidate
+        """
+        to_invalidate = [path]
+        while to_invalidate:
+            current_path = to_invalidate.pop()
+            self._transforms.pop(current_path, None)
+            to_invalidate.extend(self._children.pop(current_path, ()))
+
+    def clear(self):
+        """Remove all the cached transforms"""
+        self._transforms.clear()
+        self._children.clear()
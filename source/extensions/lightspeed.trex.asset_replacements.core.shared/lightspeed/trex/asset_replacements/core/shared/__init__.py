@@ -15,6 +15,16 @@
 * limitations under the License.
 """
 
-__all__ = ["Setup"]
+__all__ = [
+    "ContentAddressedAssetStore",
+    "LayerPrimProbe",
+    "Setup",
+    "SkelJointRemapper",
+    "get_asset_store",
+    "get_layer_prim_probe",
+]
 
+from .asset_store import ContentAddressedAssetStore, get_asset_store
+from .layer_prim_probe import LayerPrimProbe, get_layer_prim_probe
 from .setup import Setup
+from .skel_joint_remapper import SkelJointRemapper
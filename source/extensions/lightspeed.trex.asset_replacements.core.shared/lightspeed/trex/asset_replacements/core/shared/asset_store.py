@@ -0,0 +1,150 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["ContentAddressedAssetStore", "get_asset_store"]
+
+import hashlib
+import json
+from typing import Dict, Optional
+
+import carb
+import omni.client
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+
+
+class ContentAddressedAssetStore:
+    """
+    Index the assets copied in a directory by the hash of their source content, so a source file that was already
+    copied in the directory can be reused instead of being copied again.
+
+    The store never deletes files: a stored file can be referenced by edits that are not saved yet or that can be
+    undone, and by layers that were not edited through the store. Entries whose stored file was modified or deleted
+    outside the store are discarded.
+
+    Files are accessed through `omni.client`, so the directory can be a local path or a Nucleus URL.
+    """
+
+    INDEX_FILE_NAME = ".asset_store.json"
+
+    def __init__(self, directory: str):
+        self._directory = _OmniUrl(directory)
+        self._index_path = str(self._directory / self.INDEX_FILE_NAME)
+        self._entries: Dict[str, Dict] = self._load()
+
+    @property
+    def directory(self) -> str:
+        return str(self._directory)
+
+    @staticmethod
+    def hash_content(file_path: str) -> Optional[str]:
+        """
+        Args:
+            file_path: the file to hash
+
+        Returns:
+            The hash of the file content, or None if the file can't be read
+        """
+        result, _, content = omni.client.read_file(file_path)
+        if result != omni.client.Result.OK:
+            carb.log_error(f"Error reading asset file for hashing: {file_path}, error code: {result}.")
+            return None
+        return hashlib.md5(memoryview(content)).hexdigest()
+
+    def find(self, content_hash: str) -> Optional[str]:
+        """
+        Get the stored file for a content hash
+
+        Args:
+            content_hash: the hash of the source content
+
+        Returns:
+            The absolute path of the stored file, or None if the content is not stored
+        """
+        entry = self._entries.get(content_hash)
+        if not entry:
+            return None
+        path = str(self._directory / entry["name"])
+        if self._get_stat(path) != (entry["size"], entry["mtime"]):
+            # The stored file was edited or removed since it was added
+            del self._entries[content_hash]
+            self._save()
+            return None
+        return path
+
+    def add(self, content_hash: str, path: str):
+        """
+        Register a file that was copied in the store directory
+
+        Args:
+            content_hash: the hash of the source content
+            path: the absolute path of the copied file
+        """
+        stat = self._get_stat(path)
+        if stat is None:
+            carb.log_error(f"Can't add the asset to the asset store, the file doesn't exist: {path}")
+            return
+        for existing_hash, entry in list(self._entries.items()):
+            # A file copied over an existing entry replaces it
+            if entry["name"] == _OmniUrl(path).name:
+                del self._entries[existing_hash]
+        self._entries[content_hash] = {"name": _OmniUrl(path).name, "size": stat[0], "mtime": stat[1]}
+        self._save()
+
+    @staticmethod
+    def _get_stat(path: str) -> Optional[tuple[int, float]]:
+        result, entry = omni.client.stat(path)
+        if result != omni.client.Result.OK:
+            return None
+        return entry.size, entry.modified_time.timestamp()
+
+    def _load(self) -> Dict[str, Dict]:
+        result, _, content = omni.client.read_file(self._index_path)
+        if result == omni.client.Result.ERROR_NOT_FOUND:
+            return {}
+        try:
+            if result != omni.client.Result.OK:
+                raise IOError(f"Error code: {result}")
+            return json.loads(memoryview(content).tobytes()).get("entries", {})
+        except (IOError, ValueError):
+            carb.log_warn(f"The asset store index is invalid and will be rebuilt: {self._index_path}")
+            return {}
+
+    def _save(self):
+        result = omni.client.write_file(
+            self._index_path, json.dumps({"entries": self._entries}, indent=4).encode("utf-8")
+        )
+        if result != omni.client.Result.OK:
+            carb.log_warn(f"The asset store index could not be saved: {self._index_path}, error code: {result}")
+
+
+_ASSET_STORES: Dict[str, ContentAddressedAssetStore] = {}
+
+
+def get_asset_store(directory: str) -> ContentAddressedAssetStore:
+    """
+    Get the asset store of a directory
+
+    Args:
+        directory: the directory the assets are copied to
+
+    Returns:
+        The asset store shared by every copy to the directory
+    """
+    key = omni.client.normalize_url(str(_OmniUrl(directory)))
+    if key not in _ASSET_STORES:
+        _ASSET_STORES[key] = ContentAddressedAssetStore(key)
+    return _ASSET_STORES[key]
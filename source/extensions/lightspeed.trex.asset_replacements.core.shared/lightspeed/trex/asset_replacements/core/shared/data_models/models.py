@@ -19,7 +19,7 @@ from pathlib import Path
 
 from lightspeed.trex.utils.common.prim_utils import PrimTypes
 from omni.flux.asset_importer.core.data_models import TextureTypeNames
-from omni.flux.service.shared import BaseServiceModel
+from omni.flux.service.shared import BaseServiceModel, PaginatedQueryModel, PaginatedResponseModel
 from pydantic import root_validator
 
 from .validators import AssetReplacementsValidators
@@ -72,7 +72,7 @@ class PrimReferencePathParamModel(BaseServiceModel):
 # QUERY MODELS
 
 
-class GetPrimsQueryModel(BaseServiceModel):
+class GetPrimsQueryModel(PaginatedQueryModel):
     asset_hashes: set[str] | None = None
     asset_types: set[PrimTypes] | None = None
     return_selection: bool = False
@@ -88,18 +88,18 @@ class GetPrimsQueryModel(BaseServiceModel):
         return values
 
 
-class GetTexturesQueryModel(BaseServiceModel):
+class GetTexturesQueryModel(PaginatedQueryModel):
     texture_types: set[TextureTypeNames] | None = None
 
 
 # RESPONSE MODELS
 
 
-class PrimsResponseModel(BaseServiceModel):
+class PrimsResponseModel(PaginatedResponseModel):
     asset_paths: list[str]
 
 
-class TexturesResponseModel(BaseServiceModel):
+class TexturesResponseModel(PaginatedResponseModel):
     # Format: [(asset_path, texture_path)]
     textures: list[tuple[str, Path]]
 
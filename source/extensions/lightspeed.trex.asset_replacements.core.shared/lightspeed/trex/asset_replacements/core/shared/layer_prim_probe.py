@@ -0,0 +1,185 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["LayerPrimProbe", "get_layer_prim_probe"]
+
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Set, Tuple
+
+import omni.client
+from pxr import Sdf, Usd
+
+# Number of layer summaries kept in memory, the least recently used summaries are evicted first
+_MAX_CACHED_SUMMARIES = 512
+
+
+class _LayerSummary(NamedTuple):
+    prim_paths: Set[Sdf.Path]
+    # Prims with composition arcs or variant sets: the composed children can differ from the specs
+    composed_paths: Set[Sdf.Path]
+    # Deactivated prims: their descendants don't exist in the composed file, unless a stronger layer activates them
+    deactivated_paths: Set[Sdf.Path]
+    sublayer_paths: List[str]
+    default_prim: str
+
+
+class LayerPrimProbe:
+    """
+    Check if a prim exists in a USD file from the prim specs of its layers, without composing a stage.
+
+    If the prim is not found and one of its ancestors has composition arcs, or if one of its ancestors is deactivated
+    in any layer, the file is composed to answer. The layer summaries are cached by layer identifier and modification
+    time, and the least recently used summaries are evicted.
+    """
+
+    def __init__(self, max_cached_summaries: int = _MAX_CACHED_SUMMARIES):
+        """
+        Args:
+            max_cached_summaries: the number of layer summaries kept in memory
+        """
+        self._max_cached_summaries = max_cached_summaries
+        self._summaries: OrderedDict[str, Tuple[Optional[str], _LayerSummary]] = OrderedDict()
+
+    def has_prim(self, file_path: str, prim_path: Sdf.Path) -> bool:
+        """
+        Check if a prim exists in a USD file
+
+        Args:
+            file_path: the absolute path of the USD file
+            prim_path: the absolute path of the prim
+
+        Returns:
+            True if the prim exists in the composed file
+        """
+        has_spec = False
+        composed = False
+        deactivated = False
+        ancestor_paths = list(prim_path.GetParentPath().GetAncestorsRange())
+        # Every layer is read: a weaker layer can still deactivate an ancestor of a prim found in a stronger layer
+        for summary in self._iter_layer_stack(file_path):
+            has_spec = has_spec or prim_path in summary.prim_paths
+            composed = composed or any(path in summary.composed_paths for path in prim_path.GetAncestorsRange())
+            deactivated = deactivated or any(path in summary.deactivated_paths for path in ancestor_paths)
+        if not deactivated:
+            if has_spec:
+                return True
+            if not composed:
+                return False
+        stage = Usd.Stage.Open(file_path, load=Usd.Stage.LoadAll)
+        return bool(stage and stage.GetPrimAtPath(prim_path))
+
+    def get_default_prim_path(self, file_path: str) -> Optional[Sdf.Path]:
+        """
+        Get the path of the default prim of a USD file, if it exists
+
+        Args:
+            file_path: the absolute path of the USD file
+
+        Returns:
+            The path of the default prim, or None if the file has no default prim or the prim doesn't exist
+        """
+        summary = self._get_layer_summary(file_path)
+        if summary is None or not summary.default_prim:
+            return None
+        prim_path = Sdf.Path.absoluteRootPath.AppendPath(Sdf.Path(summary.default_prim))
+        return prim_path if self.has_prim(file_path, prim_path) else None
+
+    def clear(self):
+        """Clear the cached layer summaries"""
+        self._summaries.clear()
+
+    def _iter_layer_stack(self, file_path: str):
+        """Yield the summaries of the layer stack of a file, strongest first. Sublayers are read on demand."""
+        to_visit = [file_path]
+        visited = set()
+        while to_visit:
+            layer_path = to_visit.pop(0)
+            if layer_path in visited:
+                continue
+            visited.add(layer_path)
+            summary = self._get_layer_summary(layer_path)
+            if summary is None:
+                continue
+            yield summary
+            to_visit[0:0] = summary.sublayer_paths
+
+    def _get_layer_summary(self, layer_path: str) -> Optional[_LayerSummary]:
+        opened_layer = Sdf.Layer.Find(layer_path)
+        if opened_layer and opened_layer.dirty:
+            # The unsaved edits are not reflected by the modification time
+            return self._build_layer_summary(opened_layer)
+
+        result, entry = omni.client.stat(layer_path)
+        modified_time = str(entry.modified_time) if result == omni.client.Result.OK else None
+
+        cached = self._summaries.get(layer_path)
+        if cached is not None and cached[0] == modified_time:
+            self._summaries.move_to_end(layer_path)
+            return cached[1]
+
+        layer = Sdf.Layer.FindOrOpen(layer_path)
+        if not layer:
+            return None
+        summary = self._build_layer_summary(layer)
+        self._summaries[layer_path] = (modified_time, summary)
+        self._summaries.move_to_end(layer_path)
+        while len(self._summaries) > self._max_cached_summaries:
+            self._summaries.popitem(last=False)
+        return summary
+
+    @staticmethod
+    def _build_layer_summary(layer: Sdf.Layer) -> _LayerSummary:
+        prim_paths = set()
+        composed_paths = set()
+        deactivated_paths = set()
+
+        def _on_path(path: Sdf.Path):
+            if path.IsPrimVariantSelectionPath():
+                composed_paths.add(path.GetPrimPath())
+                return
+            if not path.IsPrimPath() or path.ContainsPrimVariantSelection():
+                return
+            prim_paths.add(path)
+            prim_spec = layer.GetPrimAtPath(path)
+            # Any authored inherits or specializes list op, including prepended and appended items
+            if (
+                prim_spec.hasReferences
+                or prim_spec.hasPayloads
+                or prim_spec.HasInfo(Sdf.PrimSpec.InheritPathsKey)
+                or prim_spec.HasInfo(Sdf.PrimSpec.SpecializesKey)
+            ):
+                composed_paths.add(path)
+            if prim_spec.HasInfo(Sdf.PrimSpec.ActiveKey) and not prim_spec.active:
+                deactivated_paths.add(path)
+
+        layer.Traverse(Sdf.Path.absoluteRootPath, _on_path)
+
+        sublayer_paths = [
+            omni.client.normalize_url(layer.ComputeAbsolutePath(sublayer_path)) for sublayer_path in layer.subLayerPaths
+        ]
+        return _LayerSummary(prim_paths, composed_paths, deactivated_paths, sublayer_paths, layer.defaultPrim)
+
+
+_LAYER_PRIM_PROBE = None
+
+
+def get_layer_prim_probe() -> LayerPrimProbe:
+    """Get the layer prim probe shared by the asset replacements core instances"""
+    global _LAYER_PRIM_PROBE
+    if _LAYER_PRIM_PROBE is None:
+        _LAYER_PRIM_PROBE = LayerPrimProbe()
+    return _LAYER_PRIM_PROBE
@@ -39,8 +39,11 @@ from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filte
 from lightspeed.trex.utils.common.prim_utils import get_children_prims
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
 from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
+from lightspeed.trex.utils.common.stage_revision import StageQueryCache as _StageQueryCache
 from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
+from omni.flux.service.shared import PaginatedQueryModel as _PaginatedQueryModel
+from omni.flux.service.shared import paginate as _paginate
 from omni.flux.utils.common import path_utils as _path_utils
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
@@ -67,6 +70,8 @@ from .data_models import (
     SetSelectionPathParamModel,
     TexturesResponseModel,
 )
+from .layer_prim_probe import get_layer_prim_probe as _get_layer_prim_probe
+from .skel_joint_remapper import SkelJointRemapper as _SkelJointRemapper
 
 _DEFAULT_PRIM_TAG = "<Default Prim>"
 
@@ -77,15 +82,23 @@ class Setup:
             "_context_name": None,
             "_context": None,
             "_layer_manager": None,
+            "_query_cache": None,
         }
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
         self._context_name = context_name
         self._context = omni.usd.get_context(context_name)
         self._layer_manager = _LayerManagerCore(context_name=context_name)
+        self._query_cache = _StageQueryCache(context_name)
 
     # DATA MODEL FUNCTIONS
 
+    def is_query_up_to_date(self, query: _PaginatedQueryModel) -> bool:
+        """
+        Check if the stage didn't change since the revision given in the query, so the query can be skipped
+        """
+        return self._query_cache.is_query_up_to_date(query)
+
     def get_selected_prim_paths_with_data_model(self) -> PrimsResponseModel:
         return PrimsResponseModel(asset_paths=self.get_selected_prim_paths())
 
@@ -93,24 +106,30 @@ class Setup:
         self.select_prim_paths(body.asset_path)
 
     def get_prim_paths_with_data_model(self, query: GetPrimsQueryModel) -> PrimsResponseModel:
-        prim_paths = []
-
-        selection = None
-        if query.return_selection:
-            selection = _get_extended_selection(self._context_name)
-
-        for prim_type in query.asset_types if query.asset_types is not None else [None]:
-            prim_paths += _get_prim_paths(
-                asset_hashes=query.asset_hashes,
-                prim_type=prim_type,
-                selection=selection,
-                filter_session_prims=query.filter_session_prims,
-                layer_id=query.layer_identifier,
-                exists=query.exists,
-                context_name=self._context_name,
-            )
+        def get_prim_paths():
+            prim_paths = []
+
+            selection = None
+            if query.return_selection:
+                selection = _get_extended_selection(self._context_name)
+
+            for prim_type in query.asset_types if query.asset_types is not None else [None]:
+                prim_paths += _get_prim_paths(
+                    asset_hashes=query.asset_hashes,
+                    prim_type=prim_type,
+                    selection=selection,
+                    filter_session_prims=query.filter_session_prims,
+                    layer_id=query.layer_identifier,
+                    exists=query.exists,
+                    context_name=self._context_name,
+                )
+            return prim_paths
+
+        # Keep the full result for the current stage revision so the next pages don't traverse the stage again
+        prim_paths, revision = self._query_cache.get_query_result("prim_paths", query, get_prim_paths)
 
-        return PrimsResponseModel(asset_paths=prim_paths)
+        page, next_cursor = _paginate(prim_paths, query.cursor, query.limit, revision)
+        return PrimsResponseModel(asset_paths=page, revision=revision, next_cursor=next_cursor)
 
     def get_instances_with_data_model(self, params: PrimInstancesPathParamModel) -> PrimsResponseModel:
         return PrimsResponseModel(asset_paths=list(self.get_instances_from_mesh_path(params.asset_path)))
@@ -118,9 +137,10 @@ class Setup:
     def get_textures_with_data_model(
         self, params: PrimTexturesPathParamModel, query: GetTexturesQueryModel
     ) -> TexturesResponseModel:
-        return TexturesResponseModel(
-            textures=self.get_textures_from_material_path(params.asset_path, query.texture_types)
-        )
+        revision = self._query_cache.revision
+        textures = self.get_textures_from_material_path(params.asset_path, query.texture_types)
+        page, next_cursor = _paginate(textures, query.cursor, query.limit, revision)
+        return TexturesResponseModel(textures=page, revision=revision, next_cursor=next_cursor)
 
     def get_reference_with_data_model(self, params: PrimReferencePathParamModel) -> ReferenceResponseModel:
         stage = self._context.get_stage()
@@ -383,21 +403,6 @@ class Setup:
         return self.get_corresponding_prototype_prims(prims)
 
     def remove_prim_overrides(self, prim_path: Union[Sdf.Path, str]):
-        # Recursively remove prim specs from given layer and all its sublayers
-        def remove_prim_specs_recursive(layer, prim_spec_paths):
-            for prim_spec_path in prim_spec_paths:
-                if layer.GetPrimAtPath(prim_spec_path):
-                    omni.kit.commands.execute(
-                        "RemovePrimSpecCommand",
-                        layer_identifier=layer.identifier,
-                        prim_spec_path=prim_spec_path,
-                        usd_context=self._context_name,
-                    )
-            for sublayer_path in layer.subLayerPaths:
-                sublayer = Sdf.Layer.FindOrOpen(layer.ComputeAbsolutePath(sublayer_path))
-                if sublayer:
-                    remove_prim_specs_recursive(sublayer, prim_spec_paths)
-
         # Get the root-level replacement layer
         replacement_layer = self._layer_manager.get_layer(_LayerType.replacement)
         if not replacement_layer:
@@ -405,10 +410,27 @@ class Setup:
 
         # Since we're expecting a mesh prim, make sure to grab the related material prims
         material_prims = _ToolMaterialCore.get_materials_from_prim_paths([prim_path], self._context_name) or []
-        material_prim_paths = [m.GetPath() for m in material_prims]
+        prim_spec_paths = [Sdf.Path(str(prim_path)), *[m.GetPath() for m in material_prims]]
+
+        # Gather the specs to remove from the replacement layer and all its sublayers
+        prim_specs = {}
+        layers = [replacement_layer]
+        visited = set()
+        while layers:
+            layer = layers.pop()
+            if layer.identifier in visited:
+                continue
+            visited.add(layer.identifier)
+            layer_prim_spec_paths = [path for path in prim_spec_paths if layer.GetPrimAtPath(path)]
+            if layer_prim_spec_paths:
+                prim_specs[layer.identifier] = layer_prim_spec_paths
+            for sublayer_path in layer.subLayerPaths:
+                sublayer = Sdf.Layer.FindOrOpen(layer.ComputeAbsolutePath(sublayer_path))
+                if sublayer:
+                    layers.append(sublayer)
 
-        with omni.kit.undo.group():
-            remove_prim_specs_recursive(replacement_layer, [prim_path, *material_prim_paths])
+        if prim_specs:
+            omni.kit.commands.execute("RemovePrimSpecsCommand", prim_specs=prim_specs)
 
     def get_selected_prim_paths(self) -> list[str]:
         return self._context.get_selection().get_selected_prim_paths()
@@ -551,18 +573,16 @@ class Setup:
         _, entry = omni.client.stat(abs_new_asset_path)
         if not entry.flags & omni.client.ItemFlags.READABLE_FILE:
             return False
-        ref_stage = Usd.Stage.Open(abs_new_asset_path)
+        # Answer from the layer specs when possible instead of composing the whole referenced file
+        probe = _get_layer_prim_probe()
         if prim_path == _DEFAULT_PRIM_TAG:
-            ref_root_prim = ref_stage.GetDefaultPrim()
-            if ref_root_prim and ref_root_prim.IsValid():
+            if probe.get_default_prim_path(abs_new_asset_path):
                 return True
             if log_error:
                 carb.log_error(f"No default prim find in {abs_new_asset_path}")
             return False
-        iterator = iter(ref_stage.TraverseAll())
-        for prim in iterator:
-            if str(prim.GetPath()) == prim_path:
-                return True
+        if Sdf.Path.IsValidPathString(prim_path) and probe.has_prim(abs_new_asset_path, Sdf.Path(prim_path)):
+            return True
         if log_error:
             carb.log_error(f"{prim_path} can't be find in {abs_new_asset_path}")
         return False
@@ -601,125 +621,130 @@ class Setup:
         skeleton = UsdSkel.Skeleton(skeleton_prim)
 
         if UsdSkel.Root(prim) and bool(skeleton):
-            # The Joints Attr contains full paths to each bone, we only care about the actual bone's name.
-            skel_joints = [joint.split("/")[-1] for joint in skeleton.GetJointsAttr().Get()]
-
-            for ref_prim in Usd.PrimRange(child_prim):
-                # Nested SkelRoot prims cause problems, so override their type to XForm
-                root_api = UsdSkel.Root(ref_prim)
-                if root_api:
-                    omni.kit.commands.execute(
-                        "SetPrimTypeName",
-                        prim=ref_prim,
-                        type_name="Xform",
-                    )
-                    continue
+            detail_message += self.__remap_skinned_meshes(stage, child_prim, skeleton_prim, skeleton)
 
-                binding_api = UsdSkel.BindingAPI(ref_prim)
-                if not binding_api:
-                    continue
+        if detail_message:
+            popup = ErrorPopup(
+                "Add Reference Errors",
+                "Content problem(s) when adding a reference.",
+                detail_message,
+                window_size=(900, 300),
+            )
+            popup.show()
+        return new_ref, child_prim_path
+
+    @staticmethod
+    def __remap_skinned_meshes(
+        stage: Usd.Stage, child_prim: Usd.Prim, skeleton_prim: Usd.Prim, skeleton: UsdSkel.Skeleton
+    ) -> str:
+        """
+        Bind the skinned meshes under a new reference to the captured skeleton, and remap their joint indices.
+
+        All the attribute edits are authored with a single command, and all the edits are grouped in a single undo.
 
-                indices_primvar = binding_api.GetJointIndicesPrimvar()
-                indices = indices_primvar.Get()
-                if not indices:
-                    carb.log_warn(
-                        f"{ref_prim.GetPath()} contained a skeleton binding API, but is missing "
-                        f"`primvars:skel:jointIndices`."
+        Returns:
+            The details of the meshes that need to be manually remapped
+        """
+        detail_message = ""
+        remapper = _SkelJointRemapper(skeleton.GetJointsAttr().Get())
+
+        skel_roots = []
+        binding_apis = []
+        property_changes = []
+        for ref_prim in Usd.PrimRange(child_prim):
+            # Nested SkelRoot prims cause problems, so override their type to XForm
+            if UsdSkel.Root(ref_prim):
+                skel_roots.append(ref_prim)
+                continue
+
+            binding_api = UsdSkel.BindingAPI(ref_prim)
+            if not binding_api:
+                continue
+
+            indices = binding_api.GetJointIndicesPrimvar().Get()
+            if not indices:
+                carb.log_warn(
+                    f"{ref_prim.GetPath()} contained a skeleton binding API, but is missing "
+                    f"`primvars:skel:jointIndices`."
+                )
+                detail_message += (
+                    f"{ref_prim.GetPath()}\n"
+                    f" - Contains a binding API but no `primvars:skel:jointIndices`.\n"
+                    f"   The joints will need to be manually remapped."
+                )
+                continue
+            original_joints = binding_api.GetJointsAttr().Get()
+            if not original_joints:
+                carb.log_warn(f"{ref_prim.GetPath()} contained a skeleton binding API, but is missing `skel:joints`.")
+                detail_message += (
+                    f"{ref_prim.GetPath()}\n"
+                    f" - Contains a binding API but no `skel:joints`.\n"
+                    f"   The joints will need to be manually remapped."
+                )
+                continue
+
+            # Force the mesh to bind to the captured skeleton
+            binding_apis.append(binding_api)
+
+            mesh_joints = remapper.get_joint_names(original_joints)
+            if not mesh_joints:
+                carb.log_warn(f"{ref_prim.GetPath()} `skel:joints` was empty.")
+                detail_message += (
+                    f"{ref_prim.GetPath()}\n"
+                    f" - Contains a binding API but `skel:joints` was empty`"
+                    f"   The joints will need to be manually remapped."
+                )
+                continue
+
+            # First, check if the joint arrays match
+            if remapper.needs_remapping(mesh_joints):
+                carb.log_info(
+                    f"Replacement mesh {ref_prim.GetPath()} joint names don't match skeleton.  Attempting to"
+                    " automatically remap the joint indices."
+                )
+                joint_map = remapper.get_joint_map(mesh_joints)
+                if joint_map is None:
+                    # mesh contains a joint name not in the skeleton, auto remapping by name isn't safe.
+                    # TODO (REMIX-1811) this should prompt the user to launch a remapping utility.
+                    carb.log_error(
+                        f"Replacement mesh at {ref_prim.GetPath()} contains joint names that are not in the"
+                        " captured skeleton and could not be remapped."
+                        f" - Skeleton: {remapper.joint_names}\n"
+                        f" - Mesh: {mesh_joints}\n"
                     )
                     detail_message += (
                         f"{ref_prim.GetPath()}\n"
-                        f" - Contains a binding API but no `primvars:skel:jointIndices`.\n"
-                        f"   The joints will need to be manually remapped."
+                        f" - Contains joint names that are not in the captured skeleton.  The joints will"
+                        f" need to be manually remapped.\n"
+                        f" - Skeleton: {remapper.joint_names}\n"
+                        f" - Mesh: {mesh_joints}\n"
                     )
-                    continue
-                original_joints = binding_api.GetJointsAttr().Get()
-                if not original_joints:
-                    carb.log_warn(
-                        f"{ref_prim.GetPath()} contained a skeleton binding API, but is missing `skel:joints`."
+                else:
+                    property_changes.append(
+                        {
+                            "prop_path": binding_api.GetJointIndicesAttr().GetPath(),
+                            "value": remapper.remap_indices(joint_map, indices),
+                        }
                     )
-                    detail_message += (
-                        f"{ref_prim.GetPath()}\n"
-                        f" - Contains a binding API but no `skel:joints`.\n"
-                        f"   The joints will need to be manually remapped."
-                    )
-                    continue
+                    carb.log_info(f"joint indices successfully remapped for {ref_prim.GetPath()}")
 
-                # Force the mesh to bind to the captured skeleton
+            # Set skel:joints property to None.
+            property_changes.append({"prop_path": binding_api.GetJointsAttr().GetPath(), "value": Sdf.ValueBlock()})
+
+        with omni.kit.undo.group():
+            for skel_root in skel_roots:
+                omni.kit.commands.execute("SetPrimTypeName", prim=skel_root, type_name="Xform")
+            # The command uses the Usd API and records the previous targets for undo, it can't run in a change block
+            for binding_api in binding_apis:
                 omni.kit.commands.execute(
                     "SetRelationshipTargetsCommand",
                     relationship=binding_api.GetSkeletonRel(),
                     targets=[skeleton_prim.GetPath()],
                 )
+            if property_changes:
+                omni.kit.commands.execute("ChangePropertiesCommand", changes=property_changes, stage=stage)
 
-                original_joints = binding_api.GetJointsAttr().Get()
-                mesh_joints = [joint.split("/")[-1] for joint in original_joints]
-                if not mesh_joints:
-                    carb.log_warn(f"{ref_prim.GetPath()} `skel:joints` was empty.")
-                    detail_message += (
-                        f"{ref_prim.GetPath()}\n"
-                        f" - Contains a binding API but `skel:joints` was empty`"
-                        f"   The joints will need to be manually remapped."
-                    )
-                    continue
-
-                # First, check if the joint arrays match
-                needs_remapping = not all(m == s for m, s in zip(mesh_joints, skel_joints))
-                if needs_remapping:
-                    carb.log_info(
-                        f"Replacement mesh {ref_prim.GetPath()} joint names don't match skeleton.  Attempting to"
-                        " automatically remap the joint indices."
-                    )
-                    joint_map = [-1] * len(mesh_joints)
-                    try:
-                        for index, joint_name in enumerate(mesh_joints):
-                            joint_map[index] = skel_joints.index(joint_name)
-                    except ValueError:
-                        # mesh contains a joint name not in the skeleton, auto remapping by name isn't safe.
-                        # TODO (REMIX-1811) this should prompt the user to launch a remapping utility.
-                        joint_map = None
-                        carb.log_error(
-                            f"Replacement mesh at {ref_prim.GetPath()} contains joint names that are not in the"
-                            " captured skeleton and could not be remapped."
-                            f" - Skeleton: {skel_joints}\n"
-                            f" - Mesh: {mesh_joints}\n"
-                        )
-                        detail_message += (
-                            f"{ref_prim.GetPath()}\n"
-                            f" - Contains joint names that are not in the captured skeleton.  The joints will"
-                            f" need to be manually remapped.\n"
-                            f" - Skeleton: {skel_joints}\n"
-                            f" - Mesh: {mesh_joints}\n"
-                        )
-
-                    if joint_map and indices:
-                        remapped_indices = [joint_map[index] for index in indices]
-                        omni.kit.commands.execute(
-                            "ChangePropertyCommand",
-                            usd_context_name=stage,
-                            prop_path=binding_api.GetJointIndicesAttr().GetPath(),
-                            value=remapped_indices,
-                            prev=indices,
-                        )
-                        carb.log_info(f"joint indices successfully remapped for {ref_prim.GetPath()}")
-
-                # Set skel:joints property to None.
-                omni.kit.commands.execute(
-                    "ChangePropertyCommand",
-                    usd_context_name=stage,
-                    prop_path=binding_api.GetJointsAttr().GetPath(),
-                    value=Sdf.ValueBlock(),
-                    prev=original_joints,
-                )
-
-        if detail_message:
-            popup = ErrorPopup(
-                "Add Reference Errors",
-                "Content problem(s) when adding a reference.",
-                detail_message,
-                window_size=(900, 300),
-            )
-            popup.show()
-        return new_ref, child_prim_path
+        return detail_message
 
     def __anchor_reference_asset_path_to_layer(
         self, ref: Sdf.Reference, intro_layer: Sdf.Layer, anchor_layer: Sdf.Layer
@@ -960,4 +985,6 @@ class Setup:
                 )
 
     def destroy(self):
+        if self._query_cache:
+            self._query_cache.clear()
         _reset_default_attrs(self)
@@ -0,0 +1,97 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["SkelJointRemapper"]
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+from pxr import Vt
+
+
+class SkelJointRemapper:
+    """
+    Remap the joint indices of skinned meshes to the joints of a skeleton, matching the joints by name.
+
+    The joint name to skeleton index table is built once per skeleton and the indices are remapped in bulk, so
+    remapping meshes with a lot of joint influences stays linear.
+    """
+
+    def __init__(self, skeleton_joints: Sequence[str]):
+        """
+        Args:
+            skeleton_joints: the joints of the skeleton, as joint paths
+        """
+        # The joints contain the full path of each bone, we only care about the bone names.
+        self._joint_names = self.get_joint_names(skeleton_joints)
+        self._joint_indices: Dict[str, int] = {}
+        for index, joint_name in enumerate(self._joint_names):
+            self._joint_indices.setdefault(joint_name, index)
+
+    @property
+    def joint_names(self) -> list[str]:
+        """The names of the skeleton joints"""
+        return self._joint_names
+
+    @staticmethod
+    def get_joint_names(joints: Sequence[str]) -> list[str]:
+        """Get the bone names of joint paths"""
+        return [joint.split("/")[-1] for joint in joints]
+
+    def needs_remapping(self, mesh_joint_names: Sequence[str]) -> bool:
+        """
+        Check if the mesh joints don't match the skeleton joints
+
+        Args:
+            mesh_joint_names: the names of the joints the mesh indices refer to
+
+        Returns:
+            True if the mesh joint indices need to be remapped
+        """
+        return any(mesh_joint != skel_joint for mesh_joint, skel_joint in zip(mesh_joint_names, self._joint_names))
+
+    def get_joint_map(self, mesh_joint_names: Sequence[str]) -> Optional[np.ndarray]:
+        """
+        Get the skeleton joint index of each mesh joint
+
+        Args:
+            mesh_joint_names: the names of the joints the mesh indices refer to
+
+        Returns:
+            The skeleton joint index by mesh joint index, or None if a mesh joint is not in the skeleton
+        """
+        joint_map = np.empty(len(mesh_joint_names), dtype=np.int32)
+        for index, joint_name in enumerate(mesh_joint_names):
+            skel_index = self._joint_indices.get(joint_name)
+            if skel_index is None:
+                return None
+            joint_map[index] = skel_index
+        return joint_map
+
+    @staticmethod
+    def remap_indices(joint_map: np.ndarray, indices: Sequence[int]) -> Vt.IntArray:
+        """
+        Remap joint indices to the skeleton joints
+
+        Args:
+            joint_map: the skeleton joint index by mesh joint index, from `get_joint_map()`
+            indices: the joint indices of the mesh
+
+        Returns:
+            The joint indices of the skeleton joints
+        """
+        return Vt.IntArray.FromNumpy(joint_map[np.asarray(indices, dtype=np.int32)])
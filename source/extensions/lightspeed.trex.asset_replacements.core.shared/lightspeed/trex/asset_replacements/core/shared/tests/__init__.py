@@ -15,5 +15,9 @@
 * limitations under the License.
 """
 
+from .unit.test_asset_store import TestContentAddressedAssetStore
 from .unit.test_core import TestAssetReplacementsCore
 from .unit.test_validators import TestAssetReplacementsValidators
+from .unit.test_layer_prim_probe import TestLayerPrimProbe
+from .unit.test_skel_joint_remapper import TestSkelJointRemapper
+from .unit.test_usd_copier import TestUsdCopier
@@ -0,0 +1,70 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from lightspeed.trex.asset_replacements.core.shared import ContentAddressedAssetStore as _ContentAddressedAssetStore
+from omni.kit.test.async_unittest import AsyncTestCase
+
+
+class TestContentAddressedAssetStore(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.source_path = Path(self.temp_dir.name) / "source" / "texture.dds"
+        self.source_path.parent.mkdir()
+        self.source_path.write_bytes(b"texture content")
+        self.store_dir = Path(self.temp_dir.name) / "ingested"
+        self.store_dir.mkdir()
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    def _copy_to_store(self, store: _ContentAddressedAssetStore) -> tuple[str, str]:
+        content_hash = store.hash_content(str(self.source_path))
+        stored_path = self.store_dir / self.source_path.name
+        stored_path.write_bytes(self.source_path.read_bytes())
+        store.add(content_hash, str(stored_path))
+        return content_hash, str(stored_path)
+
+    async def test_find_should_reuse_stored_content(self):
+        # Arrange
+        store = _ContentAddressedAssetStore(str(self.store_dir))
+        content_hash, stored_path = self._copy_to_store(store)
+
+        # Act
+        reused_path = store.find(content_hash)
+        reloaded_path = _ContentAddressedAssetStore(str(self.store_dir)).find(content_hash)
+
+        # Assert
+        self.assertEqual(Path(reused_path), Path(stored_path))
+        self.assertEqual(Path(reloaded_path), Path(stored_path))
+        self.assertIsNone(store.find("unknown_hash"))
+
+    async def test_find_should_discard_modified_files(self):
+        # Arrange
+        store = _ContentAddressedAssetStore(str(self.store_dir))
+        content_hash, stored_path = self._copy_to_store(store)
+
+        # Act
+        Path(stored_path).write_bytes(b"edited texture content")
+
+        # Assert
+        self.assertIsNone(store.find(content_hash))
@@ -0,0 +1,156 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from lightspeed.trex.asset_replacements.core.shared import LayerPrimProbe as _LayerPrimProbe
+from omni.kit.test.async_unittest import AsyncTestCase
+from pxr import Sdf, Usd
+
+
+class TestLayerPrimProbe(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+
+        # sublayer.usda: /Root/FromSublayer
+        self.sublayer_path = str(Path(self.temp_dir.name) / "sublayer.usda")
+        sublayer = Sdf.Layer.CreateNew(self.sublayer_path)
+        Sdf.CreatePrimInLayer(sublayer, "/Root/FromSublayer")
+        sublayer.Save()
+
+        # referenced.usda: /Ref/Child
+        self.referenced_path = str(Path(self.temp_dir.name) / "referenced.usda")
+        referenced = Sdf.Layer.CreateNew(self.referenced_path)
+        Sdf.CreatePrimInLayer(referenced, "/Ref/Child")
+        referenced.defaultPrim = "Ref"
+        referenced.Save()
+
+        # root.usda: /Root, /Root/WithRef -> referenced.usda, sublayer.usda
+        self.root_path = str(Path(self.temp_dir.name) / "root.usda")
+        root = Sdf.Layer.CreateNew(self.root_path)
+        root.subLayerPaths.append("./sublayer.usda")
+        Sdf.CreatePrimInLayer(root, "/Root")
+        with_ref = Sdf.CreatePrimInLayer(root, "/Root/WithRef")
+        with_ref.referenceList.Prepend(Sdf.Reference("./referenced.usda"))
+        root.defaultPrim = "Root"
+        root.Save()
+
+    # After running each test
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    async def test_has_prim_from_specs_should_not_compose_stage(self):
+        # Arrange
+        probe = _LayerPrimProbe()
+
+        with patch.object(Usd.Stage, "Open") as open_mock:
+            # Act
+            from_root = probe.has_prim(self.root_path, Sdf.Path("/Root"))
+            from_sublayer = probe.has_prim(self.root_path, Sdf.Path("/Root/FromSublayer"))
+            missing = probe.has_prim(self.root_path, Sdf.Path("/Missing"))
+
+        # Assert
+        self.assertTrue(from_root)
+        self.assertTrue(from_sublayer)
+        self.assertFalse(missing)
+        open_mock.assert_not_called()
+
+    async def test_has_prim_under_composition_arc_should_compose_stage(self):
+        # Arrange
+        probe = _LayerPrimProbe()
+
+        # Act
+        from_reference = probe.has_prim(self.root_path, Sdf.Path("/Root/WithRef/Child"))
+        missing = probe.has_prim(self.root_path, Sdf.Path("/Root/WithRef/Missing"))
+
+        # Assert
+        self.assertTrue(from_reference)
+        self.assertFalse(missing)
+
+    async def test_get_default_prim_path(self):
+        # Arrange
+        probe = _LayerPrimProbe()
+
+        # Act
+        root_default_prim = probe.get_default_prim_path(self.root_path)
+        sublayer_default_prim = probe.get_default_prim_path(self.sublayer_path)
+
+        # Assert
+        self.assertEqual(root_default_prim, Sdf.Path("/Root"))
+        self.assertIsNone(sublayer_default_prim)
+
+    async def test_has_prim_layer_changed_should_update_cache(self):
+        # Arrange
+        probe = _LayerPrimProbe()
+        self.assertFalse(probe.has_prim(self.sublayer_path, Sdf.Path("/Root/Added")))
+
+        # Act
+        sublayer = Sdf.Layer.FindOrOpen(self.sublayer_path)
+        Sdf.CreatePrimInLayer(sublayer, "/Root/Added")
+
+        # Assert
+        self.assertTrue(probe.has_prim(self.sublayer_path, Sdf.Path("/Root/Added")))
+
+    async def test_has_prim_under_prepended_inherits_should_compose_stage(self):
+        # Arrange
+        root = Sdf.Layer.FindOrOpen(self.root_path)
+        Sdf.CreatePrimInLayer(root, "/_Class/Child").specifier = Sdf.SpecifierClass
+        root.GetPrimAtPath("/_Class").specifier = Sdf.SpecifierClass
+        with_inherits = Sdf.CreatePrimInLayer(root, "/Root/WithInherits")
+        with_inherits.inheritPathList.Prepend("/_Class")
+        root.Save()
+        probe = _LayerPrimProbe()
+
+        # Act
+        from_inherits = probe.has_prim(self.root_path, Sdf.Path("/Root/WithInherits/Child"))
+
+        # Assert
+        self.assertTrue(from_inherits)
+
+    async def test_has_prim_under_deactivated_ancestor_should_return_false(self):
+        # Arrange
+        sublayer = Sdf.Layer.FindOrOpen(self.sublayer_path)
+        sublayer.GetPrimAtPath("/Root").active = False
+        sublayer.Save()
+        probe = _LayerPrimProbe()
+
+        # Act
+        deactivated = probe.has_prim(self.root_path, Sdf.Path("/Root"))
+        under_deactivated = probe.has_prim(self.root_path, Sdf.Path("/Root/FromSublayer"))
+
+        # Assert
+        self.assertTrue(deactivated)
+        self.assertFalse(under_deactivated)
+
+    async def test_get_layer_summary_should_evict_least_recently_used(self):
+        # Arrange
+        probe = _LayerPrimProbe(max_cached_summaries=2)
+
+        # Act
+        probe.has_prim(self.sublayer_path, Sdf.Path("/Root"))
+        probe.has_prim(self.referenced_path, Sdf.Path("/Ref"))
+        probe.has_prim(self.sublayer_path, Sdf.Path("/Root"))
+        probe.has_prim(self.root_path, Sdf.Path("/Missing"))
+
+        # Assert
+        self.assertEqual(2, len(probe._summaries))  # noqa PLW0212
+        self.assertIn(self.root_path, probe._summaries)  # noqa PLW0212
+        self.assertNotIn(self.referenced_path, probe._summaries)  # noqa PLW0212
@@ -0,0 +1,57 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from lightspeed.trex.asset_replacements.core.shared import SkelJointRemapper as _SkelJointRemapper
+from omni.kit.test.async_unittest import AsyncTestCase
+from pxr import Vt
+
+
+class TestSkelJointRemapper(AsyncTestCase):
+    async def test_needs_remapping(self):
+        # Arrange
+        remapper = _SkelJointRemapper(["root", "root/hip", "root/hip/knee"])
+
+        # Act
+        same_joints = remapper.needs_remapping(["root", "hip", "knee"])
+        other_joints = remapper.needs_remapping(["root", "knee", "hip"])
+
+        # Assert
+        self.assertFalse(same_joints)
+        self.assertTrue(other_joints)
+
+    async def test_remap_indices_should_match_joints_by_name(self):
+        # Arrange
+        remapper = _SkelJointRemapper(["root", "root/hip", "root/hip/knee"])
+
+        # Act
+        joint_map = remapper.get_joint_map(["knee", "root", "hip"])
+        remapped_indices = remapper.remap_indices(joint_map, [0, 1, 2, 2, 0])
+
+        # Assert
+        self.assertListEqual(list(joint_map), [2, 0, 1])
+        self.assertIsInstance(remapped_indices, Vt.IntArray)
+        self.assertListEqual(list(remapped_indices), [2, 0, 1, 1, 2])
+
+    async def test_get_joint_map_unknown_joint_should_return_none(self):
+        # Arrange
+        remapper = _SkelJointRemapper(["root", "root/hip"])
+
+        # Act
+        joint_map = remapper.get_joint_map(["root", "elbow"])
+
+        # Assert
+        self.assertIsNone(joint_map)
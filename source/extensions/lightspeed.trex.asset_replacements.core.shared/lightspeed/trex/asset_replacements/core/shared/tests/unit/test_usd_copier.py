@@ -0,0 +1,88 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import omni.usd
+from lightspeed.common import constants
+from lightspeed.trex.asset_replacements.core.shared.usd_copier import copy_non_usd_asset as _copy_non_usd_asset
+from omni.flux.utils.common import path_utils as _path_utils
+from omni.flux.validator.factory import VALIDATION_PASSED
+from omni.kit.test.async_unittest import AsyncTestCase
+from pxr import Sdf
+
+
+class TestUsdCopier(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.ingested_dir = Path(self.temp_dir.name) / "project" / constants.REMIX_INGESTED_ASSETS_FOLDER
+        self.ingested_dir.mkdir(parents=True)
+
+        project_path = Path(self.temp_dir.name) / "project" / "project.usda"
+        Sdf.Layer.CreateNew(str(project_path)).Save()
+        self.context = omni.usd.get_context()
+        await self.context.open_stage_async(str(project_path))
+
+    # After running each test
+    async def tearDown(self):
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.context = None
+        self.temp_dir.cleanup()
+        self.temp_dir = None
+
+    def _create_source_texture(self, name: str) -> str:
+        source_path = Path(self.temp_dir.name) / "source" / name
+        source_path.parent.mkdir(exist_ok=True)
+        source_path.write_bytes(b"texture content")
+        _path_utils.write_metadata(file_path=str(source_path), key=VALIDATION_PASSED, value=True)
+        return str(source_path)
+
+    def _get_ingested_textures(self) -> list[str]:
+        return sorted(path.name for path in self.ingested_dir.iterdir() if path.suffix == ".dds")
+
+    async def test_copy_non_usd_asset_should_reuse_identical_content(self):
+        # Arrange
+        copied_paths = []
+
+        # Act
+        _copy_non_usd_asset(self.context, self._create_source_texture("texture_a.dds"), copied_paths.append)
+        _copy_non_usd_asset(self.context, self._create_source_texture("texture_b.dds"), copied_paths.append)
+
+        # Assert
+        self.assertEqual(len(copied_paths), 2)
+        self.assertEqual(copied_paths[0], copied_paths[1])
+        self.assertListEqual(self._get_ingested_textures(), ["texture_a.dds"])
+
+    async def test_removed_override_should_keep_stored_asset(self):
+        # Arrange
+        stage = self.context.get_stage()
+        copied_paths = []
+        _copy_non_usd_asset(self.context, self._create_source_texture("texture_a.dds"), copied_paths.append)
+        prim = stage.DefinePrim("/Material/Shader", "Shader")
+        prim.CreateAttribute("inputs:diffuse_texture", Sdf.ValueTypeNames.Asset).Set(copied_paths[0])
+
+        # Act
+        # The removal can be undone or never saved, the stored file must stay on disk
+        stage.RemovePrim("/Material")
+        _copy_non_usd_asset(self.context, self._create_source_texture("texture_b.dds"), copied_paths.append)
+
+        # Assert
+        self.assertEqual(copied_paths[0], copied_paths[1])
+        self.assertListEqual(self._get_ingested_textures(), ["texture_a.dds"])
@@ -25,6 +25,7 @@ import omni.client
 import omni.usd
 from lightspeed.common import constants
 from lightspeed.trex.asset_replacements.core.shared import Setup as _AssetReplacementsCore
+from lightspeed.trex.asset_replacements.core.shared.asset_store import get_asset_store as _get_asset_store
 from omni.flux.utils.common import path_utils as _path_utils
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 from omni.flux.validator.factory import BASE_HASH_KEY, VALIDATION_PASSED
@@ -46,6 +47,8 @@ def copy_usd_asset(context: omni.usd.UsdContext, asset_path: str, callback_func:
     is_valid_usd_file(asset_path)
 
     # init collector to copy the asset to the appropriate project subdirectory
+    # USD assets are not reused from the asset store: the collected layer also depends on the content of every
+    # dependency collected with it
     asset_replacements_core = _AssetReplacementsCore(context.get_name())
     asset_path_response_model = asset_replacements_core.get_default_output_directory_with_data_model()
     dest_path = asset_path_response_model.asset_path
@@ -81,9 +84,24 @@ def copy_non_usd_asset(context: omni.usd.UsdContext, asset_path: str, callback_f
         asset_path_basename = _OmniUrl(asset_path).name
         dest_path_url = str(dest_dir_path_url / asset_path_basename)
 
-        # copy the non-usd asset and it's metadata file
-        omni.client.copy(asset_path, dest_path_url, omni.client.CopyBehavior.OVERWRITE)
-        _copy_metadata(asset_path, dest_dir_path)
+        asset_store = _get_asset_store(dest_dir_path)
+        content_hash = asset_store.hash_content(asset_path)
+        stored_path = asset_store.find(content_hash) if content_hash else None
+        if stored_path:
+            # the same content was already copied in the project, reuse it
+            dest_path_url = stored_path
+        else:
+            # the destination might already hold the same content if it was copied before being indexed
+            if not (
+                content_hash
+                and _OmniUrl(dest_path_url).exists
+                and asset_store.hash_content(dest_path_url) == content_hash
+            ):
+                # copy the non-usd asset and it's metadata file
+                omni.client.copy(asset_path, dest_path_url, omni.client.CopyBehavior.OVERWRITE)
+                _copy_metadata(asset_path, dest_dir_path)
+            if content_hash:
+                asset_store.add(content_hash, dest_path_url)
 
         # re-reference the newly copied asset
         callback_func(_AssetReplacementsCore.switch_ref_abs_to_rel_path(context.get_stage(), dest_path_url))
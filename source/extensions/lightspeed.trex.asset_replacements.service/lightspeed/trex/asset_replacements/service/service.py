@@ -90,19 +90,34 @@ class AssetReplacementsService(ServiceBase):
                 "Filter an asset if it exists or not on a given layer. Use in conjunction with `layer_identifier` "
                 "to filter on a given layer, otherwise this parameter will be ignored.",
             ),
+            cursor: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The `next_cursor` value of the previous page. Leave empty to get the first page."
+            ),
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The maximum number of assets to return in a page. Leave empty to get all the assets."
+            ),
+            revision: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None,
+                "The `revision` value of a previous response. "
+                "If the stage didn't change since, an empty `304 Not Modified` response is returned.",
+            ),
         ) -> PrimsResponseModel:
             try:
-                return self.__asset_core.get_prim_paths_with_data_model(
-                    GetPrimsQueryModel(
-                        asset_hashes=asset_hashes,
-                        asset_types=asset_types,
-                        return_selection=selection,
-                        filter_session_prims=filter_session_assets,
-                        layer_identifier=layer_identifier,
-                        exists=exists,
-                        context_name=context_name,
-                    )
+                query = GetPrimsQueryModel(
+                    asset_hashes=asset_hashes,
+                    asset_types=asset_types,
+                    return_selection=selection,
+                    filter_session_prims=filter_session_assets,
+                    layer_identifier=layer_identifier,
+                    exists=exists,
+                    cursor=cursor,
+                    limit=limit,
+                    revision=revision,
+                    context_name=context_name,
                 )
+                if self.__asset_core.is_query_up_to_date(query):
+                    return ServiceBase.not_modified_response()
+                return self.__asset_core.get_prim_paths_with_data_model(query)
             except ValueError as e:
                 ServiceBase.raise_error(422, e)
 
@@ -134,10 +149,27 @@ class AssetReplacementsService(ServiceBase):
             texture_types: set[TextureTypeNames] | None = ServiceBase.describe_query_param(  # noqa B008
                 None, "The type of textures to look for in the given material."
             ),
+            cursor: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The `next_cursor` value of the previous page. Leave empty to get the first page."
+            ),
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The maximum number of textures to return in a page. Leave empty to get all the textures."
+            ),
+            revision: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None,
+                "The `revision` value of a previous response. "
+                "If the stage didn't change since, an empty `304 Not Modified` response is returned.",
+            ),
         ) -> TexturesResponseModel:
-            return self.__asset_core.get_textures_with_data_model(
-                asset_path, GetTexturesQueryModel(texture_types=texture_types)
-            )
+            try:
+                query = GetTexturesQueryModel(
+                    texture_types=texture_types, cursor=cursor, limit=limit, revision=revision
+                )
+                if self.__asset_core.is_query_up_to_date(query):
+                    return ServiceBase.not_modified_response()
+                return self.__asset_core.get_textures_with_data_model(asset_path, query)
+            except ValueError as e:
+                ServiceBase.raise_error(422, e)
 
         @self.router.get(
             path="/{asset_path:path}/file-paths",
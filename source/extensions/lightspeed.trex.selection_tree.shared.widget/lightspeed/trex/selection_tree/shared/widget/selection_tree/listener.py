@@ -21,7 +21,9 @@ from typing import Dict, List
 
 from lightspeed.common.constants import REGEX_HASH
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
-from pxr import Tf, Usd
+from omni.flux.utils.common.usd_notice import UsdNoticeSubscription as _UsdNoticeSubscription
+from omni.flux.utils.common.usd_notice import subscribe_objects_changed as _subscribe_objects_changed
+from pxr import Usd
 
 if typing.TYPE_CHECKING:
     from .model import ListModel
@@ -34,13 +36,14 @@ class USDListener:
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
         self.__models: List["ListModel"] = []
-        self._listeners: Dict[Usd.Stage, Tf.Listener] = {}
+        self._listeners: Dict[Usd.Stage, _UsdNoticeSubscription] = {}
         self.__regex_hash = re.compile(REGEX_HASH)
 
     def _enable_listener(self, stage: Usd.Stage):
         """Enable the USD listener to see if an attribute is changed"""
         assert stage not in self._listeners
-        self._listeners[stage] = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_usd_changed, stage)
+        # The models are refreshed once per frame with the changes of all the notices sent during the frame
+        self._listeners[stage] = _subscribe_objects_changed(stage, self._on_usd_changed, deferred=True)
 
     def _disable_listener(self, stage: Usd.Stage):
         """Disable the USD listener"""
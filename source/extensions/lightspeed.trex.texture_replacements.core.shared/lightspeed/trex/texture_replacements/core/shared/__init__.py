@@ -15,6 +15,13 @@
 * limitations under the License.
 """
 
-__all__ = ["TextureReplacementsCore"]
+__all__ = [
+    "TextureConsumerIndex",
+    "TextureReplacementsCore",
+    "TextureReplacementsCoreExtension",
+    "get_texture_consumer_index",
+]
 
+from .extension import TextureReplacementsCoreExtension
 from .setup import TextureReplacementsCore
+from .texture_consumer_index import TextureConsumerIndex, get_texture_consumer_index
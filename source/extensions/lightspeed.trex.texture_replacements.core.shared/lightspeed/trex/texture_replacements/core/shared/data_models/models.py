@@ -18,7 +18,7 @@
 from pathlib import Path
 
 from omni.flux.asset_importer.core.data_models import TextureTypeNames
-from omni.flux.service.shared import BaseServiceModel
+from omni.flux.service.shared import BaseServiceModel, PaginatedQueryModel, PaginatedResponseModel
 from pydantic import root_validator
 
 from .validators import TextureReplacementsValidators
@@ -49,7 +49,7 @@ class TextureFilePathParamModel(BaseServiceModel):
 # QUERY MODELS
 
 
-class GetTexturesQueryModel(BaseServiceModel):
+class GetTexturesQueryModel(PaginatedQueryModel):
     asset_hashes: set[str] | None = None
     texture_types: set[TextureTypeNames] | None = None
     return_selection: bool = False
@@ -68,7 +68,7 @@ class GetTexturesQueryModel(BaseServiceModel):
 # RESPONSE MODELS
 
 
-class TexturesResponseModel(BaseServiceModel):
+class TexturesResponseModel(PaginatedResponseModel):
     textures: list[tuple[str, Path]]
 
 
@@ -89,7 +89,12 @@ class ReplaceTexturesRequestModel(BaseServiceModel):
 
     @root_validator(allow_reuse=True)
     def root_validators(cls, values):  # noqa
-        for texture_entry in values.get("textures"):
-            TextureReplacementsValidators.is_valid_texture_prim(texture_entry, values.get("context_name"))
-            TextureReplacementsValidators.is_valid_texture_asset(texture_entry, values.get("force"))
+        textures = values.get("textures") or []
+        prim_errors = TextureReplacementsValidators.get_texture_prims_errors(textures, values.get("context_name"))
+        asset_errors = TextureReplacementsValidators.get_texture_assets_errors(textures, values.get("force"))
+        # Report the first invalid entry, like validating the entries one by one would
+        for property_path, asset_path in textures:
+            error = prim_errors.get(str(property_path)) or asset_errors.get(str(asset_path))
+            if error:
+                raise ValueError(error)
         return values
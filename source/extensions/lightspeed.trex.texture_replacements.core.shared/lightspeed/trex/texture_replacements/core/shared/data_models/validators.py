@@ -17,6 +17,7 @@
 
 __all__ = ["TextureReplacementsValidators"]
 
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from pathlib import Path
 
 import omni.usd
@@ -30,7 +31,32 @@ class TextureReplacementsValidators:
     @classmethod
     def is_valid_texture_prim(cls, texture_tuple: tuple[str, Path], context_name: str):
         property_path, _ = texture_tuple
+        cls._validate_texture_prim(omni.usd.get_context(context_name).get_stage(), property_path)
+        return texture_tuple
+
+    @classmethod
+    def get_texture_prims_errors(cls, textures: list[tuple[str, Path]], context_name: str) -> dict[str, str]:
+        """
+        Validate the texture properties of a list of textures in one pass. Each property is only validated once.
+
+        Args:
+            textures: A list of tuples in the format (texture property, asset path)
+            context_name: The context to validate the properties in
 
+        Returns:
+            The validation error of each invalid texture property
+        """
+        stage = omni.usd.get_context(context_name).get_stage()
+        errors = {}
+        for property_path in dict.fromkeys(str(property_path) for property_path, _ in textures):
+            try:
+                cls._validate_texture_prim(stage, property_path)
+            except ValueError as e:
+                errors[property_path] = str(e)
+        return errors
+
+    @classmethod
+    def _validate_texture_prim(cls, stage, property_path: str):
         try:
             path = Sdf.Path(property_path)
             if not path:
@@ -38,7 +64,7 @@ class TextureReplacementsValidators:
         except Exception as e:
             raise ValueError(f"The string is not a valid path: {property_path}") from e
 
-        usd_property = omni.usd.get_context(context_name).get_stage().GetPropertyAtPath(path)
+        usd_property = stage.GetPropertyAtPath(path)
         if not usd_property:
             raise ValueError(f"The property path does not exist in the current stage: {property_path}")
 
@@ -50,11 +76,45 @@ class TextureReplacementsValidators:
         if not shader.GetInput(usd_property.GetBaseName()):
             raise ValueError(f"The property path does not point to a valid USD shader input: {property_path}")
 
-        return texture_tuple
-
     @classmethod
     def is_valid_texture_asset(cls, texture_tuple: tuple[str, Path], force: bool):
         _, asset_path = texture_tuple
+        cls._validate_texture_asset(asset_path, force)
+        return texture_tuple
+
+    @classmethod
+    def get_texture_assets_errors(
+        cls, textures: list[tuple[str, Path]], force: bool, max_workers: int = 8
+    ) -> dict[str, str]:
+        """
+        Validate the assets of a list of textures. Each asset is only validated once, and the file checks are run in
+        parallel.
+
+        Args:
+            textures: A list of tuples in the format (texture property, asset path)
+            force: Whether to skip the ingestion validation
+            max_workers: The maximum number of assets validated at the same time
+
+        Returns:
+            The validation error of each invalid asset path
+        """
+        asset_paths = list(dict.fromkeys(str(asset_path) for _, asset_path in textures))
+        if not asset_paths:
+            return {}
+
+        def get_error(asset_path: str) -> str | None:
+            try:
+                cls._validate_texture_asset(asset_path, force)
+            except ValueError as e:
+                return str(e)
+            return None
+
+        with _ThreadPoolExecutor(max_workers=min(max_workers, len(asset_paths))) as executor:
+            results = executor.map(get_error, asset_paths)
+            return {asset_path: error for asset_path, error in zip(asset_paths, results) if error}
+
+    @classmethod
+    def _validate_texture_asset(cls, asset_path: str | Path, force: bool):
         asset_url = OmniUrl(asset_path)
 
         if asset_url.suffix.lower() not in SUPPORTED_TEXTURE_EXTENSIONS:
@@ -63,11 +123,10 @@ class TextureReplacementsValidators:
         if not asset_url.exists:
             raise ValueError(f"The asset path does not point to an existing file: {asset_path}")
 
-        if not is_asset_ingested(str(asset_url)) and not force:
+        # Only hash the asset to validate the ingestion when it's required
+        if not force and not is_asset_ingested(str(asset_url)):
             raise ValueError(f"The asset was not ingested. Ingest the asset before replacing the texture: {asset_path}")
 
-        return texture_tuple
-
     @classmethod
     def layer_is_in_project(cls, layer_id: Path | None, context_name: str):
         if layer_id is None:
@@ -21,18 +21,15 @@ import omni.usd
 from lightspeed.trex.utils.common.asset_utils import TEXTURE_TYPE_INPUT_MAP as _TEXTURE_TYPE_INPUT_MAP
 from lightspeed.trex.utils.common.asset_utils import get_ingested_texture_type as _get_ingested_texture_type
 from lightspeed.trex.utils.common.asset_utils import get_texture_type_input_name as _get_texture_type_input_name
-from lightspeed.trex.utils.common.prim_utils import PrimTypes as _PrimTypes
 from lightspeed.trex.utils.common.prim_utils import filter_prims_paths as _filter_prims_paths
 from lightspeed.trex.utils.common.prim_utils import get_extended_selection as _get_extended_selection
-from lightspeed.trex.utils.common.prim_utils import get_prim_paths as _get_prim_paths
 from lightspeed.trex.utils.common.prim_utils import includes_hash as _includes_hash
-from lightspeed.trex.utils.common.prim_utils import is_shader as _is_shader
-from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
+from lightspeed.trex.utils.common.stage_revision import StageQueryCache as _StageQueryCache
 from omni.flux.asset_importer.core.data_models import TextureTypeNames as _TextureTypeNames
 from omni.flux.asset_importer.core.data_models import TextureTypes as _TextureTypes
+from omni.flux.service.shared import paginate as _paginate
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
-from omni.flux.utils.common.omni_url import OmniUrl
-from omni.kit import commands, undo
+from omni.kit import commands
 from pxr import Sdf, UsdShade
 
 from .data_models import (
@@ -43,6 +40,7 @@ from .data_models import (
     TextureReplacementsValidators,
     TexturesResponseModel,
 )
+from .texture_consumer_index import get_texture_consumer_index as _get_texture_consumer_index
 
 
 class TextureReplacementsCore:
@@ -50,18 +48,28 @@ class TextureReplacementsCore:
         self._default_attr = {
             "_context_name": None,
             "_context": None,
+            "_query_cache": None,
+            "_consumer_index": None,
         }
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
 
         self._context_name = context_name
         self._context = omni.usd.get_context(context_name)
+        self._query_cache = _StageQueryCache(context_name)
+        self._consumer_index = _get_texture_consumer_index(context_name)
 
     # DATA MODEL FUNCTIONS
 
+    def is_query_up_to_date(self, query: GetTexturesQueryModel) -> bool:
+        """
+        Check if the stage didn't change since the revision given in the query, so the query can be skipped
+        """
+        return self._query_cache.is_query_up_to_date(query)
+
     def get_texture_prims_assets_with_data_models(self, query: GetTexturesQueryModel) -> TexturesResponseModel:
-        return TexturesResponseModel(
-            textures=self.get_texture_prims_assets(
+        def get_textures():
+            return self.get_texture_prims_assets(
                 asset_hashes=query.asset_hashes,
                 texture_types=query.texture_types,
                 return_selection=query.return_selection,
@@ -69,7 +77,12 @@ class TextureReplacementsCore:
                 layer_id=query.layer_identifier,
                 exists=query.exists,
             )
-        )
+
+        # Keep the full result for the current stage revision so the next pages don't traverse the stage again
+        textures, revision = self._query_cache.get_query_result("texture_prims_assets", query, get_textures)
+
+        page, next_cursor = _paginate(textures, query.cursor, query.limit, revision)
+        return TexturesResponseModel(textures=page, revision=revision, next_cursor=next_cursor)
 
     def replace_texture_with_data_models(self, body: ReplaceTexturesRequestModel):
         self.replace_textures(body.textures)
@@ -130,43 +143,34 @@ class TextureReplacementsCore:
             A list of tuples in the format (texture property, asset path) where the texture property will always be
             a shader input and the asset path will be the absolute path to the texture asset
         """
-        stage = self._context.get_stage()
         textures = []
 
-        selection = None
+        shader_paths = [str(path) for path in self._consumer_index.get_shader_paths()]
         if return_selection:
-            selection = _get_extended_selection(self._context_name)
+            selected_paths = set(_get_extended_selection(self._context_name))
+            shader_paths = [path for path in shader_paths if path in selected_paths]
+
+        texture_input_names = None
+        if texture_types is not None:
+            texture_input_names = {
+                _get_texture_type_input_name(_TextureTypes[texture_type.value]) for texture_type in texture_types
+            }
 
-        # Get every asset-type input for every shader and validate that the asset path has a supported texture extension
+        # The index only contains the shader inputs with a supported texture asset
         for shader_path in _filter_prims_paths(
-            lambda prim: bool(_is_shader(prim) and _includes_hash(prim, asset_hashes)),
-            prim_paths=selection,
+            lambda prim: _includes_hash(prim, asset_hashes),
+            prim_paths=shader_paths,
             filter_session_prims=filter_session_prims,
             layer_id=layer_id,
             exists=exists,
             context_name=self._context_name,
         ):
-            shader = UsdShade.Shader(stage.GetPrimAtPath(shader_path))
-            for shader_input in shader.GetInputs():
+            for texture_input_path, texture_asset_path in self._consumer_index.get_shader_textures(shader_path).items():
                 # Make sure the input matches the filter if set
-                if texture_types is not None:
-                    texture_type_names = [
-                        _get_texture_type_input_name(_TextureTypes[texture_type.value])
-                        for texture_type in texture_types
-                    ]
-                    if shader_input.GetFullName() not in texture_type_names:
-                        continue
-                # Make sure the input expects an asset
-                if shader_input.GetTypeName() != Sdf.ValueTypeNames.Asset:
+                if texture_input_names is not None and texture_input_path.name not in texture_input_names:
                     continue
-                # Make sure the asset is a supported texture
-                texture_asset_path = shader_input.Get().resolvedPath
-                if OmniUrl(texture_asset_path).suffix.lower() not in _SUPPORTED_TEXTURE_EXTENSIONS:
-                    continue
-                # Build the full property path
-                texture_input_path = Sdf.Path(shader_path).AppendProperty(shader_input.GetFullName())
                 # Store the texture property and the asset path
-                textures.append((str(texture_input_path), str(texture_asset_path)))
+                textures.append((str(texture_input_path), texture_asset_path))
 
         return textures
 
@@ -179,28 +183,31 @@ class TextureReplacementsCore:
                       a shader input and the asset path should be the absolute path to the texture asset
             force: Whether to force replace the texture or validate it was ingested correctly
         """
-        with undo.group():
-            for texture_attr_path, texture_asset_path in textures:
-                try:
-                    TextureReplacementsValidators.is_valid_texture_prim(
-                        (texture_attr_path, texture_asset_path), self._context_name
-                    )
-                    TextureReplacementsValidators.is_valid_texture_asset((texture_attr_path, texture_asset_path), force)
-                except ValueError:
-                    continue
+        # Validate every texture in one pass before authoring anything
+        prim_errors = TextureReplacementsValidators.get_texture_prims_errors(textures, self._context_name)
+        asset_errors = TextureReplacementsValidators.get_texture_assets_errors(textures, force)
 
-                commands.execute(
-                    "ChangeProperty",
-                    prop_path=texture_attr_path,
-                    value=Sdf.AssetPath(
-                        omni.usd.make_path_relative_to_current_edit_target(
-                            str(texture_asset_path), stage=self._context.get_stage()
-                        )
+        stage = self._context.get_stage()
+        edit_target_layer = stage.GetEditTarget().GetLayer()
+        changes = []
+        for texture_attr_path, texture_asset_path in textures:
+            if str(texture_attr_path) in prim_errors or str(texture_asset_path) in asset_errors:
+                continue
+            changes.append(
+                {
+                    "prop_path": str(texture_attr_path),
+                    "value": Sdf.AssetPath(
+                        omni.usd.make_path_relative_to_current_edit_target(str(texture_asset_path), stage=stage)
                     ),
-                    prev=None,
-                    usd_context_name=self._context_name,
-                    target_layer=self._context.get_stage().GetEditTarget().GetLayer(),
-                )
+                    "target_layer": edit_target_layer,
+                }
+            )
+
+        if not changes:
+            return
+
+        # Author every texture inside a single change block, as a single undo step
+        commands.execute("ChangePropertiesCommand", changes=changes, context_name=self._context_name, stage=stage)
 
     def get_texture_material(self, texture_prim_path: str) -> str | None:
         """
@@ -212,24 +219,20 @@ class TextureReplacementsCore:
         Returns:
             the prim path to the associated material or None if no material is found
         """
-        stage = self._context.get_stage()
+        material_path = self._consumer_index.get_shader_material(texture_prim_path)
+        return str(material_path) if material_path else None
 
-        # Get the prim path for the shader input
-        shader_path = Sdf.Path(texture_prim_path).GetPrimPath()
-        # Get all materials in the stage. Materials are linked to their shader via their output
-        material_paths = _get_prim_paths(prim_type=_PrimTypes.MATERIALS)
+    def get_texture_consumers(self, texture_asset_path: str) -> list[str]:
+        """
+        Get the shader inputs using a texture asset
 
-        for material_path in material_paths:
-            # Get the outputs for the material
-            for output in UsdShade.Material(stage.GetPrimAtPath(material_path)).GetOutputs():
-                # Get the connection of the output
-                for connection_path in output.GetRawConnectedSourcePaths():
-                    # Make sure the output connection points to our shader
-                    if Sdf.Path(connection_path).GetPrimPath() == shader_path:
-                        return material_path
+        Args:
+            texture_asset_path: The absolute path to the texture asset
 
-        # No material is connected to our shader
-        return None
+        Returns:
+            The property paths of the shader inputs using the texture asset
+        """
+        return [str(path) for path in self._consumer_index.get_texture_consumers(texture_asset_path)]
 
     async def get_expected_texture_material_inputs(
         self,
@@ -262,4 +265,6 @@ class TextureReplacementsCore:
         ]
 
     def destroy(self):
+        if self._query_cache:
+            self._query_cache.clear()
         _reset_default_attrs(self)
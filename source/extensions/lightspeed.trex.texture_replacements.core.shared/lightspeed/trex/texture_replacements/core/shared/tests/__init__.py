@@ -15,5 +15,6 @@
 * limitations under the License.
 """
 
-from .unit.test_core import TestTextureReplacementsCore
+from .unit.test_core import TestTextureReplacementsCore, TestTextureReplacementsCorePagination
+from .unit.test_texture_consumer_index import TestTextureConsumerIndex
 from .unit.test_validators import TestTextureReplacementsValidators
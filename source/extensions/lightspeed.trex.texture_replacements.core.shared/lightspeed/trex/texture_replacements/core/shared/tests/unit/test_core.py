@@ -15,7 +15,15 @@
 * limitations under the License.
 """
 
+import tempfile
+from pathlib import Path
+
+import omni.usd
+from lightspeed.trex.texture_replacements.core.shared import TextureReplacementsCore
+from lightspeed.trex.texture_replacements.core.shared.data_models import GetTexturesQueryModel
 from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import wait_stage_loading
+from pxr import Sdf, UsdShade
 
 
 class TestTextureReplacementsCore(AsyncTestCase):
@@ -32,3 +40,64 @@ class TestTextureReplacementsCore(AsyncTestCase):
         # Act
         # Assert
         pass
+
+
+class TestTextureReplacementsCorePagination(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    # After running each test
+    async def tearDown(self):
+        await wait_stage_loading()
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.temp_dir.cleanup()
+        self.context = None
+        self.temp_dir = None
+
+    async def test_get_texture_prims_assets_with_data_models_paginates_for_a_stage_revision(self):
+        # Arrange
+        stage = self.context.get_stage()
+        for i in range(3):
+            texture_path = Path(self.temp_dir.name) / f"texture_{i}.dds"
+            texture_path.touch()
+            shader = UsdShade.Shader.Define(stage, f"/RootNode/Looks/mat_{i}/Shader")
+            shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset).Set(Sdf.AssetPath(str(texture_path)))
+
+        core = TextureReplacementsCore()
+
+        # Act
+        first_page = core.get_texture_prims_assets_with_data_models(GetTexturesQueryModel(limit=2))
+        last_page = core.get_texture_prims_assets_with_data_models(
+            GetTexturesQueryModel(limit=2, cursor=first_page.next_cursor)
+        )
+        up_to_date = core.is_query_up_to_date(GetTexturesQueryModel(revision=first_page.revision))
+
+        stage.DefinePrim("/RootNode/Test", "Scope")
+
+        outdated = core.is_query_up_to_date(GetTexturesQueryModel(revision=first_page.revision))
+
+        # Assert
+        self.assertEqual(2, len(first_page.textures))
+        self.assertEqual(1, len(last_page.textures))
+        self.assertIsNotNone(first_page.revision)
+        self.assertEqual(first_page.revision, last_page.revision)
+        self.assertIsNotNone(first_page.next_cursor)
+        self.assertIsNone(last_page.next_cursor)
+        self.assertEqual(
+            [f"/RootNode/Looks/mat_{i}/Shader.inputs:diffuse_texture" for i in range(3)],
+            sorted(str(path) for path, _ in first_page.textures + last_page.textures),
+        )
+        self.assertTrue(up_to_date)
+        self.assertFalse(outdated)
+
+        # The cursor was built for the previous stage revision
+        with self.assertRaises(ValueError):
+            core.get_texture_prims_assets_with_data_models(
+                GetTexturesQueryModel(limit=2, cursor=first_page.next_cursor)
+            )
+
+        core.destroy()
@@ -0,0 +1,179 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import tempfile
+from pathlib import Path
+
+import omni.kit.app
+import omni.usd
+from lightspeed.trex.texture_replacements.core.shared import TextureConsumerIndex
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import wait_stage_loading
+from pxr import Sdf, UsdShade
+
+
+class TestTextureConsumerIndex(AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    # After running each test
+    async def tearDown(self):
+        await wait_stage_loading()
+        if self.context.can_close_stage():
+            await self.context.close_stage_async()
+        self.temp_dir.cleanup()
+        self.context = None
+        self.temp_dir = None
+
+    def __create_texture(self, name: str) -> str:
+        texture_path = Path(self.temp_dir.name) / name
+        texture_path.touch()
+        return str(texture_path)
+
+    def __create_material(self, material_path: str, texture_path: str) -> UsdShade.Shader:
+        stage = self.context.get_stage()
+        material = UsdShade.Material.Define(stage, material_path)
+        shader = UsdShade.Shader.Define(stage, f"{material_path}/Shader")
+        shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset).Set(Sdf.AssetPath(texture_path))
+        shader.CreateInput("metallic_constant", Sdf.ValueTypeNames.Float).Set(0.5)
+        material.CreateSurfaceOutput("mdl").ConnectToSource(shader.ConnectableAPI(), "out")
+        return shader
+
+    async def test_get_texture_consumers_returns_shader_inputs_using_texture(self):
+        # Arrange
+        texture_01 = self.__create_texture("texture_01.dds")
+        texture_02 = self.__create_texture("texture_02.dds")
+        self.__create_material("/RootNode/Looks/mat_01", texture_01)
+        self.__create_material("/RootNode/Looks/mat_02", texture_01)
+        self.__create_material("/RootNode/Looks/mat_03", texture_02)
+
+        index = TextureConsumerIndex()
+
+        # Act
+        consumers = index.get_texture_consumers(texture_01)
+
+        # Assert
+        self.assertListEqual(
+            [
+                Sdf.Path("/RootNode/Looks/mat_01/Shader.inputs:diffuse_texture"),
+                Sdf.Path("/RootNode/Looks/mat_02/Shader.inputs:diffuse_texture"),
+            ],
+            consumers,
+        )
+        self.assertListEqual(
+            [Sdf.Path("/RootNode/Looks/mat_03/Shader.inputs:diffuse_texture")],
+            list(index.get_shader_textures("/RootNode/Looks/mat_03/Shader")),
+        )
+
+        index.destroy()
+
+    async def test_get_shader_material_returns_connected_material(self):
+        # Arrange
+        texture = self.__create_texture("texture.dds")
+        self.__create_material("/RootNode/Looks/mat_01", texture)
+
+        index = TextureConsumerIndex()
+
+        # Act
+        material_path = index.get_shader_material("/RootNode/Looks/mat_01/Shader.inputs:diffuse_texture")
+        missing_material_path = index.get_shader_material("/RootNode/Looks/mat_02/Shader.inputs:diffuse_texture")
+
+        # Assert
+        self.assertEqual(Sdf.Path("/RootNode/Looks/mat_01"), material_path)
+        self.assertIsNone(missing_material_path)
+
+        index.destroy()
+
+    async def test_get_shader_materials_shader_shared_by_materials_should_keep_every_material(self):
+        # Arrange
+        stage = self.context.get_stage()
+        texture = self.__create_texture("texture.dds")
+        shader = self.__create_material("/RootNode/Looks/mat_01", texture)
+        material_02 = UsdShade.Material.Define(stage, "/RootNode/Looks/mat_02")
+        material_02.CreateSurfaceOutput("mdl").ConnectToSource(shader.ConnectableAPI(), "out")
+
+        index = TextureConsumerIndex()
+
+        # Act
+        material_paths = index.get_shader_materials("/RootNode/Looks/mat_01/Shader")
+        stage.RemovePrim("/RootNode/Looks/mat_01")
+        stage.DefinePrim("/RootNode/Looks/mat_01/Shader", "Shader")
+        remaining_material_paths = index.get_shader_materials("/RootNode/Looks/mat_01/Shader")
+
+        # Assert
+        self.assertListEqual([Sdf.Path("/RootNode/Looks/mat_01"), Sdf.Path("/RootNode/Looks/mat_02")], material_paths)
+        self.assertListEqual([Sdf.Path("/RootNode/Looks/mat_02")], remaining_material_paths)
+        self.assertEqual(Sdf.Path("/RootNode/Looks/mat_02"), index.get_shader_material("/RootNode/Looks/mat_01/Shader"))
+
+        index.destroy()
+
+    async def test_closed_stage_should_drop_index(self):
+        # Arrange
+        texture = self.__create_texture("texture.dds")
+        self.__create_material("/RootNode/Looks/mat_01", texture)
+
+        index = TextureConsumerIndex()
+        index.get_shader_paths()  # Build the index
+
+        # Act
+        await self.context.close_stage_async()
+        # The stage events are dispatched on the next update
+        await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertFalse(index._listener.listening)  # noqa PLW0212
+        self.assertDictEqual({}, index._shader_textures)  # noqa PLW0212
+        self.assertListEqual([], index.get_shader_paths())
+
+        index.destroy()
+
+    async def test_index_is_updated_by_stage_changes(self):
+        # Arrange
+        stage = self.context.get_stage()
+        texture_01 = self.__create_texture("texture_01.dds")
+        texture_02 = self.__create_texture("texture_02.dds")
+        shader = self.__create_material("/RootNode/Looks/mat_01", texture_01)
+        self.__create_material("/RootNode/Looks/mat_02", texture_01)
+
+        index = TextureConsumerIndex()
+        index.get_shader_paths()  # Build the index
+
+        # Act
+        shader.GetInput("diffuse_texture").Set(Sdf.AssetPath(texture_02))
+        stage.RemovePrim("/RootNode/Looks/mat_02")
+        self.__create_material("/RootNode/Looks/mat_03", texture_01)
+
+        # Assert
+        self.assertListEqual(
+            [Sdf.Path("/RootNode/Looks/mat_03/Shader.inputs:diffuse_texture")],
+            index.get_texture_consumers(texture_01),
+        )
+        self.assertListEqual(
+            [Sdf.Path("/RootNode/Looks/mat_01/Shader.inputs:diffuse_texture")],
+            index.get_texture_consumers(texture_02),
+        )
+        self.assertListEqual(
+            [Sdf.Path("/RootNode/Looks/mat_01/Shader"), Sdf.Path("/RootNode/Looks/mat_03/Shader")],
+            sorted(index.get_shader_paths()),
+        )
+        self.assertIsNone(index.get_shader_material("/RootNode/Looks/mat_02/Shader"))
+        self.assertEqual(Sdf.Path("/RootNode/Looks/mat_03"), index.get_shader_material("/RootNode/Looks/mat_03/Shader"))
+
+        index.destroy()
@@ -125,3 +125,71 @@ class TestTextureReplacementsValidators(AsyncTestCase):
                     self.assertEqual(value, input_val)
                 else:
                     self.assertEqual(str(cm.exception), f"{message}: {asset_path}")
+
+    async def test_get_texture_prims_errors_validates_each_property_once(self):
+        # Arrange
+        valid_prim_path = "/test/prim/value/Shader"
+        valid_property_path = f"{valid_prim_path}.inputs:diffuse_texture"
+        invalid_property_path = f"{valid_prim_path}.test"
+
+        stage = self.context.get_stage()
+        shader = UsdShade.Shader.Define(stage, valid_prim_path)
+        shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset).Set(Sdf.AssetPath("C:/Test/texture.png"))
+        shader.GetPrim().CreateAttribute("test", Sdf.ValueTypeNames.Float).Set(100.0)
+
+        textures = [
+            (valid_property_path, "C:/Test/texture_01.png"),
+            (invalid_property_path, "C:/Test/texture_02.png"),
+            (valid_property_path, "C:/Test/texture_03.png"),
+            (invalid_property_path, "C:/Test/texture_04.png"),
+        ]
+
+        # Act
+        with patch.object(
+            TextureReplacementsValidators,
+            "_validate_texture_prim",
+            wraps=TextureReplacementsValidators._validate_texture_prim,  # noqa PLW0212
+        ) as validate_mock:
+            errors = TextureReplacementsValidators.get_texture_prims_errors(textures, "")
+
+        # Assert
+        self.assertEqual(2, validate_mock.call_count)
+        self.assertEqual(
+            {
+                invalid_property_path: (
+                    f"The property path does not point to a valid USD shader input: {invalid_property_path}"
+                )
+            },
+            errors,
+        )
+
+    async def test_get_texture_assets_errors_validates_each_asset_once(self):
+        # Arrange
+        valid_asset_path = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
+        non_existent_path = "Z:/Test/non_existent.png"
+        unsupported_path = "Z:/Test/invalid_type.docx"
+
+        textures = [
+            ("/test/prim/value/Shader.inputs:diffuse_texture", valid_asset_path.name),
+            ("/test/prim/value/Shader.inputs:normalmap_texture", non_existent_path),
+            ("/test/prim/value/Shader.inputs:roughness_texture", unsupported_path),
+            ("/test/prim/value/Shader_01.inputs:diffuse_texture", valid_asset_path.name),
+        ]
+
+        with patch(
+            "lightspeed.trex.texture_replacements.core.shared.data_models.validators.is_asset_ingested"
+        ) as was_ingested_mock:
+            was_ingested_mock.return_value = True
+
+            # Act
+            errors = TextureReplacementsValidators.get_texture_assets_errors(textures, False)
+
+        # Assert
+        self.assertEqual(1, was_ingested_mock.call_count)
+        self.assertEqual(
+            {
+                non_existent_path: f"The asset path does not point to an existing file: {non_existent_path}",
+                unsupported_path: f"The asset path points to an unsupported texture file type: {unsupported_path}",
+            },
+            errors,
+        )
@@ -0,0 +1,267 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TextureConsumerIndex", "destroy_texture_consumer_indexes", "get_texture_consumer_index"]
+
+import os
+
+from lightspeed.trex.utils.common.prim_utils import is_material as _is_material
+from lightspeed.trex.utils.common.prim_utils import is_shader as _is_shader
+from omni.flux.asset_importer.core.data_models import SUPPORTED_TEXTURE_EXTENSIONS as _SUPPORTED_TEXTURE_EXTENSIONS
+from omni.flux.utils.common.context_listener import ContextInstances as _ContextInstances
+from omni.flux.utils.common.context_listener import ContextStageListener as _ContextStageListener
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from pxr import Sdf, Usd, UsdShade
+
+# Past this number of pending changed paths, rebuilding the whole index is cheaper than updating it
+_MAX_PENDING_PATHS = 10000
+
+
+def _get_texture_key(asset_path: str) -> str:
+    return os.path.normcase(str(asset_path).replace("\\", "/"))
+
+
+class TextureConsumerIndex:
+    """
+    Index of the texture inputs of the shaders in a stage, by texture asset path, and of the material owning each
+    shader.
+
+    The index is built on the first query and then kept current with the `ObjectsChanged` notices of the stage: only
+    the prims that changed since the last query are indexed again. The index is dropped when the stage is closed.
+    """
+
+    def __init__(self, context_name: str = ""):
+        self._listener = _ContextStageListener(
+            context_name, self._on_objects_changed, name="TextureConsumerIndex", on_stage_changed=self._reset
+        )
+
+        self._needs_rebuild = True
+        self._resynced_paths = set()
+        self._changed_prim_paths = set()
+
+        # Shader path -> {Shader input property path: resolved texture asset path}
+        self._shader_textures: dict[Sdf.Path, dict[Sdf.Path, str]] = {}
+        # Texture key -> Shader input property paths
+        self._texture_consumers: dict[str, set[Sdf.Path]] = {}
+        # Shader path -> Material paths. A shader can be connected to the outputs of multiple materials.
+        self._shader_materials: dict[Sdf.Path, set[Sdf.Path]] = {}
+        # Material path -> Shader paths connected to the material outputs
+        self._material_shaders: dict[Sdf.Path, set[Sdf.Path]] = {}
+
+    def get_shader_paths(self) -> list[Sdf.Path]:
+        """
+        Returns:
+            The paths of every shader with at least one texture input
+        """
+        self._update()
+        return list(self._shader_textures)
+
+    def get_shader_textures(self, shader_path: str | Sdf.Path) -> dict[Sdf.Path, str]:
+        """
+        Args:
+            shader_path: The path of a shader
+
+        Returns:
+            The texture inputs of the shader and their resolved texture asset paths
+        """
+        self._update()
+        return dict(self._shader_textures.get(Sdf.Path(str(shader_path)), {}))
+
+    def get_texture_consumers(self, texture_asset_path: str) -> list[Sdf.Path]:
+        """
+        Args:
+            texture_asset_path: The resolved path of a texture asset
+
+        Returns:
+            The shader input properties using the texture
+        """
+        self._update()
+        return sorted(self._texture_consumers.get(_get_texture_key(texture_asset_path), set()))
+
+    def get_shader_materials(self, shader_path: str | Sdf.Path) -> list[Sdf.Path]:
+        """
+        Args:
+            shader_path: The path of a shader, or of one of its properties
+
+        Returns:
+            The paths of the materials connected to the shader, sorted
+        """
+        self._update()
+        return sorted(self._shader_materials.get(Sdf.Path(str(shader_path)).GetPrimPath(), set()))
+
+    def get_shader_material(self, shader_path: str | Sdf.Path) -> Sdf.Path | None:
+        """
+        Args:
+            shader_path: The path of a shader, or of one of its properties
+
+        Returns:
+            The path of the material connected to the shader, or None if no material is connected to the shader. If
+            multiple materials are connected to the shader, the first one in path order.
+        """
+        material_paths = self.get_shader_materials(shader_path)
+        return material_paths[0] if material_paths else None
+
+    def clear(self):
+        """Drop the index. The index will be rebuilt on the next query."""
+        self._reset()
+
+    def destroy(self):
+        self._listener.destroy()
+        self._reset()
+
+    def _reset(self):
+        self._needs_rebuild = True
+        self._resynced_paths.clear()
+        self._changed_prim_paths.clear()
+        self._shader_textures.clear()
+        self._texture_consumers.clear()
+        self._shader_materials.clear()
+        self._material_shaders.clear()
+
+    def _on_objects_changed(self, notice, _sender):
+        if self._needs_rebuild:
+            return
+        self._resynced_paths.update(notice.GetResyncedPaths())
+        self._changed_prim_paths.update(path.GetPrimPath() for path in notice.GetChangedInfoOnlyPaths())
+        if len(self._resynced_paths) + len(self._changed_prim_paths) > _MAX_PENDING_PATHS:
+            self._needs_rebuild = True
+            self._resynced_paths.clear()
+            self._changed_prim_paths.clear()
+
+    def _update(self):
+        # A new stage is indexed from scratch
+        stage = self._listener.update()
+        if not stage:
+            return
+
+        if self._needs_rebuild:
+            self._reset()
+            self._needs_rebuild = False
+            self._index_subtree(stage.GetPseudoRoot())
+            return
+
+        if not self._resynced_paths and not self._changed_prim_paths:
+            return
+
+        resynced_paths = self._resynced_paths
+        changed_prim_paths = self._changed_prim_paths
+        self._resynced_paths = set()
+        self._changed_prim_paths = set()
+
+        # Property resyncs (added or removed properties) only affect their prim
+        resynced_prim_paths = {path for path in resynced_paths if path.IsPrimPath() or path.IsAbsoluteRootPath()}
+        changed_prim_paths.update(path.GetPrimPath() for path in resynced_paths if path.IsPropertyPath())
+
+        resynced_roots = set(Sdf.Path.RemoveDescendentPaths(list(resynced_prim_paths)))
+        if Sdf.Path.absoluteRootPath in resynced_roots:
+            self._reset()
+            self._needs_rebuild = False
+            self._index_subtree(stage.GetPseudoRoot())
+            return
+
+        if resynced_roots:
+            # Drop everything indexed under the resynced prims, then index the resynced hierarchies again
+            for path in list(self._shader_textures) + list(self._material_shaders):
+                if any(prefix in resynced_roots for prefix in path.GetPrefixes()):
+                    self._remove_prim(path)
+            for path in resynced_roots:
+                self._index_subtree(stage.GetPrimAtPath(path))
+
+        for path in changed_prim_paths:
+            if any(prefix in resynced_roots for prefix in path.GetPrefixes()):
+                continue
+            self._remove_prim(path)
+            self._index_prim(stage.GetPrimAtPath(path))
+
+    def _index_subtree(self, root_prim: Usd.Prim):
+        if not root_prim:
+            return
+        for prim in Usd.PrimRange(root_prim, Usd.PrimAllPrimsPredicate):
+            self._index_prim(prim)
+
+    def _index_prim(self, prim: Usd.Prim):
+        if _is_shader(prim):
+            self._index_shader(prim)
+        elif _is_material(prim):
+            self._index_material(prim)
+
+    def _index_shader(self, prim: Usd.Prim):
+        shader_path = prim.GetPath()
+        textures = {}
+        for shader_input in UsdShade.Shader(prim).GetInputs():
+            # Make sure the input expects an asset
+            if shader_input.GetTypeName() != Sdf.ValueTypeNames.Asset:
+                continue
+            value = shader_input.Get()
+            texture_asset_path = value.resolvedPath if value else ""
+            # Make sure the asset is a supported texture
+            if _OmniUrl(texture_asset_path).suffix.lower() not in _SUPPORTED_TEXTURE_EXTENSIONS:
+                continue
+            input_path = shader_path.AppendProperty(shader_input.GetFullName())
+            textures[input_path] = str(texture_asset_path)
+            self._texture_consumers.setdefault(_get_texture_key(texture_asset_path), set()).add(input_path)
+        if textures:
+            self._shader_textures[shader_path] = textures
+
+    def _index_material(self, prim: Usd.Prim):
+        material_path = prim.GetPath()
+        shader_paths = set()
+        for output in UsdShade.Material(prim).GetOutputs():
+            for connection_path in output.GetRawConnectedSourcePaths():
+                shader_path = Sdf.Path(connection_path).GetPrimPath()
+                shader_paths.add(shader_path)
+                self._shader_materials.setdefault(shader_path, set()).add(material_path)
+        if shader_paths:
+            self._material_shaders[material_path] = shader_paths
+
+    def _remove_prim(self, path: Sdf.Path):
+        for input_path, texture_asset_path in self._shader_textures.pop(path, {}).items():
+            key = _get_texture_key(texture_asset_path)
+            consumers = self._texture_consumers.get(key)
+            if consumers is None:
+                continue
+            consumers.discard(input_path)
+            if not consumers:
+                del self._texture_consumers[key]
+        for shader_path in self._material_shaders.pop(path, set()):
+            material_paths = self._shader_materials.get(shader_path)
+            if material_paths is None:
+                continue
+            material_paths.discard(path)
+            if not material_paths:
+                del self._shader_materials[shader_path]
+
+
+_INDEXES = _ContextInstances(TextureConsumerIndex)
+
+
+def get_texture_consumer_index(context_name: str = "") -> TextureConsumerIndex:
+    """
+    Get the texture consumer index shared by everything working on a USD context
+
+    Args:
+        context_name: The USD context name
+
+    Returns:
+        The texture consumer index of the context
+    """
+    return _INDEXES.get(context_name)
+
+
+def destroy_texture_consumer_indexes():
+    """Drop the texture consumer index of every USD context. Called when the extension shuts down."""
+    _INDEXES.destroy()
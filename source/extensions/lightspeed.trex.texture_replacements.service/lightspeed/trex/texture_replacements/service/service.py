@@ -79,19 +79,34 @@ class TextureReplacementsService(ServiceBase):
                 "Filter an texture if it exists or not on a given layer. Use in conjunction with `layer_identifier` "
                 "to filter on a given layer, otherwise this parameter will be ignored.",
             ),
+            cursor: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The `next_cursor` value of the previous page. Leave empty to get the first page."
+            ),
+            limit: int | None = ServiceBase.describe_query_param(  # noqa B008
+                None, "The maximum number of textures to return in a page. Leave empty to get all the textures."
+            ),
+            revision: str | None = ServiceBase.describe_query_param(  # noqa B008
+                None,
+                "The `revision` value of a previous response. "
+                "If the stage didn't change since, an empty `304 Not Modified` response is returned.",
+            ),
         ) -> TexturesResponseModel:
             try:
-                return self.__texture_core.get_texture_prims_assets_with_data_models(
-                    GetTexturesQueryModel(
-                        asset_hashes=asset_hashes,
-                        texture_types=texture_types,
-                        return_selection=selection,
-                        filter_session_prims=filter_session_prims,
-                        layer_identifier=layer_identifier,
-                        exists=exists,
-                        context_name=context_name,
-                    )
+                query = GetTexturesQueryModel(
+                    asset_hashes=asset_hashes,
+                    texture_types=texture_types,
+                    return_selection=selection,
+                    filter_session_prims=filter_session_prims,
+                    layer_identifier=layer_identifier,
+                    exists=exists,
+                    cursor=cursor,
+                    limit=limit,
+                    revision=revision,
+                    context_name=context_name,
                 )
+                if self.__texture_core.is_query_up_to_date(query):
+                    return ServiceBase.not_modified_response()
+                return self.__texture_core.get_texture_prims_assets_with_data_models(query)
             except ValueError as e:
                 ServiceBase.raise_error(422, e)
 
@@ -14,3 +14,7 @@
 * See the License for the specific language governing permissions and
 * limitations under the License.
 """
+
+__all__ = ["TrexUtilsCommonExtension"]
+
+from .extension import TrexUtilsCommonExtension
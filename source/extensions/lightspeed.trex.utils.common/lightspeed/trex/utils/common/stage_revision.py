@@ -0,0 +1,293 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "StageQueryCache",
+    "StageRevisionTracker",
+    "destroy_stage_revision_trackers",
+    "get_stage_revision_tracker",
+]
+
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, TypeVar
+
+from omni.flux.utils.common.context_listener import ContextInstances as _ContextInstances
+from omni.flux.utils.common.context_listener import ContextStageListener as _ContextStageListener
+from pxr import Sdf, Usd, UsdGeom
+
+if TYPE_CHECKING:
+    from omni.flux.service.shared import PaginatedQueryModel as _PaginatedQueryModel
+
+_T = TypeVar("_T")
+
+# Query fields that select a page or validate the query, but don't change the query result
+_PAGINATION_FIELDS = frozenset({"context_name", "cursor", "limit", "revision"})
+
+# Metadata that doesn't change what the stage queries return
+_IGNORED_FIELDS = frozenset(
+    {
+        "comment",
+        "customData",
+        "displayGroup",
+        "displayName",
+        "documentation",
+        "hidden",
+    }
+)
+
+
+class StageRevisionTracker:
+    """
+    Track a revision token for the stage of a USD context. The revision changes whenever the composed scene description
+    queried on the stage changes, or when another stage is opened in the context.
+
+    Changes that can't change the query results don't bump the revision: transform, visibility and extent edits, and
+    display metadata edits. Edits only authored in the session layers (like the viewport cameras) are tracked
+    separately, so the queries filtering out the session prims are not invalidated by them.
+    """
+
+    def __init__(self, context_name: str = ""):
+        # Make sure revisions from a previous session can't match the current revisions
+        self._session = uuid.uuid4().hex[:8]
+        self._counter = 0
+        self._session_layers_counter = 0
+        self._listener = _ContextStageListener(
+            context_name,
+            self._on_objects_changed,
+            name="StageRevisionTracker",
+            on_stage_changed=self._on_stage_changed,
+        )
+
+    @property
+    def revision(self) -> str | None:
+        """
+        Returns:
+            The revision of the current stage, including the session layers, or None if no stage is opened
+        """
+        return self.get_revision()
+
+    def get_revision(self, include_session_layers: bool = True) -> str | None:
+        """
+        Args:
+            include_session_layers: Whether edits only authored in the session layers change the revision
+
+        Returns:
+            The revision of the current stage, or None if no stage is opened
+        """
+        if not self._listener.update():
+            return None
+        if include_session_layers:
+            return f"{self._session}-{self._counter}-{self._session_layers_counter}"
+        return f"{self._session}-{self._counter}"
+
+    def _on_stage_changed(self):
+        self._counter += 1
+
+    def _on_objects_changed(self, notice, stage: Usd.Stage):
+        session_layers = None
+        session_layers_changed = False
+        # Adding or removing a transform, visibility or extent attribute doesn't change the query results
+        changed_paths = [
+            path
+            for path in notice.GetResyncedPaths()
+            if not (path.IsPropertyPath() and self._is_ignored_property(path.name))
+        ]
+        changed_paths += [
+            path for path in notice.GetChangedInfoOnlyPaths() if not self._is_ignored_info_change(notice, path)
+        ]
+        for path in changed_paths:
+            if session_layers is None:
+                session_layers = self._get_session_layers(stage)
+            if not self._is_session_only(stage, path, session_layers):
+                self._counter += 1
+                return
+            session_layers_changed = True
+        if session_layers_changed:
+            self._session_layers_counter += 1
+
+    @staticmethod
+    def _is_ignored_property(name: str) -> bool:
+        return name in (UsdGeom.Tokens.visibility, UsdGeom.Tokens.extent) or (
+            UsdGeom.Xformable.IsTransformationAffectedByAttrNamed(name)
+        )
+
+    def _is_ignored_info_change(self, notice, path: Sdf.Path) -> bool:
+        if path.IsPropertyPath() and self._is_ignored_property(path.name):
+            return True
+        changed_fields = notice.GetChangedFields(path)
+        return bool(changed_fields) and all(field in _IGNORED_FIELDS for field in changed_fields)
+
+    @staticmethod
+    def _get_session_layers(stage: Usd.Stage) -> set[Sdf.Layer]:
+        return set(stage.GetLayerStack(includeSessionLayers=True)) - set(
+            stage.GetLayerStack(includeSessionLayers=False)
+        )
+
+    @staticmethod
+    def _is_session_only(stage: Usd.Stage, path: Sdf.Path, session_layers: set[Sdf.Layer]) -> bool:
+        """Whether a changed object only has opinions in the session layers"""
+        if not session_layers or path.IsAbsoluteRootPath():
+            return False
+        prim = stage.GetPrimAtPath(path.GetPrimPath())
+        if not prim:
+            # Removed prims can't be told apart, consider the change relevant
+            return False
+        if path.IsPropertyPath():
+            prop = prim.GetProperty(path.name)
+            specs = prop.GetPropertyStack(Usd.TimeCode.Default()) if prop else []
+        else:
+            specs = prim.GetPrimStack()
+        return bool(specs) and all(spec.layer in session_layers for spec in specs)
+
+    def destroy(self):
+        self._listener.destroy()
+
+
+_TRACKERS = _ContextInstances(StageRevisionTracker)
+
+
+def get_stage_revision_tracker(context_name: str = "") -> StageRevisionTracker:
+    """
+    Get the revision tracker shared by everything working on a USD context
+
+    Args:
+        context_name: The USD context name
+
+    Returns:
+        The revision tracker of the context
+    """
+    return _TRACKERS.get(context_name)
+
+
+def destroy_stage_revision_trackers():
+    """Stop tracking the revisions of every USD context. Called when the extension shuts down."""
+    _TRACKERS.destroy()
+
+
+class StageQueryCache:
+    """
+    Cache the results of stage queries. The cached results are only valid for the stage revision they were computed
+    for, so any change on the stage invalidates them.
+    """
+
+    def __init__(self, context_name: str = "", max_entries: int = 16):
+        """
+        Args:
+            context_name: The USD context name
+            max_entries: The maximum number of query results kept
+        """
+        self._tracker = get_stage_revision_tracker(context_name)
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[str, Any]] = OrderedDict()
+
+    @property
+    def revision(self) -> str | None:
+        """
+        Returns:
+            The current revision of the stage, or None if no stage is opened
+        """
+        return self._tracker.revision
+
+    def get(
+        self, key: Hashable, compute: Callable[[], _T], include_session_layers: bool = True
+    ) -> tuple[_T, str | None]:
+        """
+        Get the result of a query for the current stage revision, computing it if it's not cached
+
+        Args:
+            key: A key identifying the query and its parameters
+            compute: The function computing the result of the query
+            include_session_layers: Whether edits only authored in the session layers change the query result
+
+        Returns:
+            The query result and the stage revision it's valid for
+        """
+        revision = self._tracker.get_revision(include_session_layers)
+        if revision is None:
+            return compute(), None
+
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] == revision:
+            self._entries.move_to_end(key)
+            return cached[1], revision
+
+        result = compute()
+        # The computation could have authored on the stage. Don't cache a result that is already outdated.
+        if self._tracker.get_revision(include_session_layers) == revision:
+            self._entries[key] = (revision, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return result, revision
+
+    def is_query_up_to_date(self, query: "_PaginatedQueryModel") -> bool:
+        """
+        Check if the stage didn't change since the revision given in a paginated query, so the query can be skipped
+
+        Args:
+            query: The paginated query
+
+        Returns:
+            True if the query result didn't change since the revision of the query
+        """
+        if not query.revision or query.cursor or not self._is_revisioned(query):
+            return False
+        return query.revision == self._tracker.get_revision(self._includes_session_layers(query))
+
+    def get_query_result(
+        self, name: str, query: "_PaginatedQueryModel", compute: Callable[[], _T]
+    ) -> tuple[_T, str | None]:
+        """
+        Get the full result of a paginated query for the current stage revision, so the next pages don't compute the
+        query again. The parameters of the query are part of the cache key, except the pagination parameters.
+
+        Args:
+            name: The name of the query
+            query: The paginated query
+            compute: The function computing the full result of the query
+
+        Returns:
+            The query result and the stage revision it's valid for, or None if the query is not revisioned
+        """
+        if not self._is_revisioned(query):
+            return compute(), None
+        key = (name, _freeze(query.dict(exclude=_PAGINATION_FIELDS)))
+        return self.get(key, compute, include_session_layers=self._includes_session_layers(query))
+
+    @staticmethod
+    def _is_revisioned(query: "_PaginatedQueryModel") -> bool:
+        # The selection is not part of the stage revision
+        return not getattr(query, "return_selection", False)
+
+    @staticmethod
+    def _includes_session_layers(query: "_PaginatedQueryModel") -> bool:
+        return not getattr(query, "filter_session_prims", False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Make the parameters of a query hashable"""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
@@ -0,0 +1,201 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TestStageRevision"]
+
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+from lightspeed.trex.utils.common.stage_revision import StageQueryCache, StageRevisionTracker
+from pxr import Gf, Sdf, Usd, UsdGeom, UsdShade
+from pydantic import BaseModel
+
+
+class _QueryModel(BaseModel):
+    cursor: str | None = None
+    limit: int | None = None
+    revision: str | None = None
+    asset_hashes: set[str] | None = None
+    return_selection: bool = False
+    filter_session_prims: bool = False
+
+
+class TestStageRevision(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.stage = self.context.get_stage()
+        self.xform = UsdGeom.Xform.Define(self.stage, "/World/Mesh")
+        self.shader = UsdShade.Shader.Define(self.stage, "/World/Looks/Material/Shader")
+        self.shader.CreateInput("diffuse_texture", Sdf.ValueTypeNames.Asset).Set("./texture_a.dds")
+        self.tracker = StageRevisionTracker()
+
+    # After running each test
+    async def tearDown(self):
+        self.tracker.destroy()
+        self.tracker = None
+        if self.context.get_stage():
+            await self.context.close_stage_async()
+        self.stage = None
+
+    async def test_revision_relevant_change_should_change_revision(self):
+        # Arrange
+        revision = self.tracker.revision
+
+        # Act
+        self.shader.GetInput("diffuse_texture").Set("./texture_b.dds")
+
+        # Assert
+        self.assertIsNotNone(revision)
+        self.assertNotEqual(revision, self.tracker.revision)
+
+    async def test_revision_no_change_should_keep_revision(self):
+        # Act
+        revision = self.tracker.revision
+
+        # Assert
+        self.assertEqual(revision, self.tracker.revision)
+
+    async def test_revision_transform_and_visibility_changes_should_keep_revision(self):
+        # Arrange
+        revision = self.tracker.revision
+
+        # Act
+        self.xform.AddTranslateOp().Set(Gf.Vec3d(1, 2, 3))
+        self.xform.GetVisibilityAttr().Set(UsdGeom.Tokens.invisible)
+
+        # Assert
+        self.assertEqual(revision, self.tracker.revision)
+
+    async def test_revision_display_metadata_changes_should_keep_revision(self):
+        # Arrange
+        revision = self.tracker.revision
+
+        # Act
+        self.xform.GetPrim().SetCustomDataByKey("test", 1)
+        self.xform.GetPrim().SetDocumentation("Test")
+
+        # Assert
+        self.assertEqual(revision, self.tracker.revision)
+
+    async def test_revision_session_layer_only_changes_should_only_change_session_revision(self):
+        # Arrange
+        revision = self.tracker.revision
+        revision_without_session = self.tracker.get_revision(include_session_layers=False)
+
+        # Act
+        with Usd.EditContext(self.stage, self.stage.GetSessionLayer()):
+            UsdGeom.Xform.Define(self.stage, "/SessionOnly")
+            self.stage.GetPrimAtPath("/SessionOnly").CreateAttribute("test", Sdf.ValueTypeNames.Int).Set(1)
+
+        # Assert
+        self.assertNotEqual(revision, self.tracker.revision)
+        self.assertEqual(revision_without_session, self.tracker.get_revision(include_session_layers=False))
+
+    async def test_revision_session_layer_override_of_root_layer_prim_should_change_revision(self):
+        # Arrange
+        revision = self.tracker.revision
+
+        # Act
+        with Usd.EditContext(self.stage, self.stage.GetSessionLayer()):
+            self.shader.GetInput("diffuse_texture").Set("./texture_b.dds")
+
+        # Assert
+        self.assertNotEqual(revision, self.tracker.revision)
+
+    async def test_revision_closed_stage_should_revoke_listener(self):
+        # Arrange
+        self.assertIsNotNone(self.tracker.revision)
+
+        # Act
+        await self.context.close_stage_async()
+        # The stage events are dispatched on the next update
+        await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertFalse(self.tracker._listener.listening)  # noqa PLW0212
+        self.assertIsNone(self.tracker.revision)
+
+    async def test_revision_new_stage_should_change_revision(self):
+        # Arrange
+        revision = self.tracker.revision
+
+        # Act
+        await self.context.new_stage_async()
+
+        # Assert
+        new_revision = self.tracker.revision
+        self.assertIsNotNone(new_revision)
+        self.assertNotEqual(revision, new_revision)
+
+    async def test_query_cache_should_compute_once_per_revision(self):
+        # Arrange
+        cache = StageQueryCache()
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return len(calls)
+
+        # Act
+        result_01, revision_01 = cache.get("key", compute)
+        result_02, revision_02 = cache.get("key", compute)
+        self.shader.GetInput("diffuse_texture").Set("./texture_b.dds")
+        result_03, revision_03 = cache.get("key", compute)
+
+        # Assert
+        self.assertEqual((1, 1, 2), (result_01, result_02, result_03))
+        self.assertEqual(revision_01, revision_02)
+        self.assertNotEqual(revision_02, revision_03)
+
+    async def test_query_cache_query_result_should_ignore_pagination_parameters(self):
+        # Arrange
+        cache = StageQueryCache()
+        calls = []
+
+        def compute():
+            calls.append(None)
+            return len(calls)
+
+        # Act
+        result_01, revision_01 = cache.get_query_result("query", _QueryModel(asset_hashes={"a", "b"}, limit=1), compute)
+        result_02, revision_02 = cache.get_query_result(
+            "query", _QueryModel(asset_hashes={"b", "a"}, limit=2, revision=revision_01), compute
+        )
+        result_03, _ = cache.get_query_result("query", _QueryModel(asset_hashes={"a"}), compute)
+        result_04, revision_04 = cache.get_query_result("query", _QueryModel(return_selection=True), compute)
+
+        # Assert
+        self.assertEqual((1, 1, 2, 3), (result_01, result_02, result_03, result_04))
+        self.assertEqual(revision_01, revision_02)
+        self.assertIsNone(revision_04)
+
+    async def test_query_cache_session_layer_changes_should_only_outdate_queries_with_session_prims(self):
+        # Arrange
+        cache = StageQueryCache()
+        _, revision = cache.get_query_result("query", _QueryModel(), lambda: 1)
+        _, filtered_revision = cache.get_query_result("query", _QueryModel(filter_session_prims=True), lambda: 1)
+
+        # Act
+        with Usd.EditContext(self.stage, self.stage.GetSessionLayer()):
+            UsdGeom.Xform.Define(self.stage, "/SessionOnly")
+
+        # Assert
+        self.assertFalse(cache.is_query_up_to_date(_QueryModel(revision=revision)))
+        self.assertTrue(cache.is_query_up_to_date(_QueryModel(filter_session_prims=True, revision=filtered_revision)))
+        self.assertFalse(cache.is_query_up_to_date(_QueryModel(return_selection=True, revision=revision)))
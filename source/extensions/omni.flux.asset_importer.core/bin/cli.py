@@ -33,6 +33,7 @@ def main():
     )
     parser.add_argument("-c", "--config", type=str, help="Your config file (.json)", required=True)
     parser.add_argument("-d", "--default-output", help="A default folder to output results to.", default=None)
+    parser.add_argument("-j", "--jobs", type=int, help="The number of assets to import concurrently.", default=None)
     parser.add_argument(
         "-pk", "--print-keys", help="Print all of the valid fields that can be put into the json.", default=None
     )
@@ -51,12 +52,19 @@ def sub_progress_count_fn(value):
     print(f"Progress: {value}%")
 
 
+def sub_asset_imported_fn(input_path, output_path, success, duration):
+    print(f"{'Imported' if success else 'Failed to import'} {input_path} -> {output_path} ({duration:.2f}s)")
+
+
 async def run(parsed_args):
     exit_code = 1
     try:
         importer = ImporterCore()
         _sub = importer.subscribe_batch_progress(sub_progress_count_fn)  # noqa
-        success = await importer.import_batch_async(parsed_args.config, parsed_args.default_output)
+        _sub_asset = importer.subscribe_asset_imported(sub_asset_imported_fn)  # noqa
+        success = await importer.import_batch_async(
+            parsed_args.config, parsed_args.default_output, max_concurrent=parsed_args.jobs
+        )
         if success:
             exit_code = 0
     finally:
@@ -16,10 +16,14 @@
 """
 
 import asyncio
+import contextlib
+import functools
 import json
+import os
+import time
 import weakref
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Set, Tuple, Union
 
 import carb
 import carb.tokens
@@ -30,6 +34,7 @@ from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common import path_utils as _path_utils
 from omni.flux.utils.common.omni_url import OmniUrl
 from omni.kit.usd.collect import Collector
+from pxr import Sdf, UsdUtils
 from pydantic import BaseModel, Extra, create_model, validator
 
 from .data_models.enums import UsdExtensions as _UsdExtensions
@@ -84,8 +89,14 @@ class ImporterCore:
         """
         self.__on_batch_finished = _Event()
         self.__on_batch_progress = _Event()
+        self.__on_asset_imported = _Event()
 
-    def import_batch(self, batch_config: Union[str, Path, dict], default_output_folder: Union[str, Path] = None):
+    def import_batch(
+        self,
+        batch_config: Union[str, Path, dict],
+        default_output_folder: Union[str, Path] = None,
+        max_concurrent: Optional[int] = None,
+    ):
         """
         Function to convert batches of mesh files to usd.
 
@@ -107,21 +118,28 @@ class ImporterCore:
         Args:
             batch_config: can be a json file path or a dictionary.
             default_output_folder: the folder to place outputs in.  Overridden by "output_path" in batch_config.
+            max_concurrent: the number of assets to convert or collect concurrently. Defaults to the CPU count.
 
         """
-        return asyncio.ensure_future(self.import_batch_async(batch_config, default_output_folder))
+        return asyncio.ensure_future(self.import_batch_async(batch_config, default_output_folder, max_concurrent))
 
     @omni.usd.handle_exception
     async def import_batch_async(
-        self, batch_config: Union[str, Path, dict], default_output_folder: Union[str, Path] = None
+        self,
+        batch_config: Union[str, Path, dict],
+        default_output_folder: Union[str, Path] = None,
+        max_concurrent: Optional[int] = None,
     ):
         """
         As import_batch, but async.
         """
-        return await self.import_batch_async_with_error(batch_config, default_output_folder)
+        return await self.import_batch_async_with_error(batch_config, default_output_folder, max_concurrent)
 
     async def import_batch_async_with_error(
-        self, batch_config: Union[str, Path, dict], default_output_folder: Union[str, Path] = None
+        self,
+        batch_config: Union[str, Path, dict],
+        default_output_folder: Union[str, Path] = None,
+        max_concurrent: Optional[int] = None,
     ):
         """
         As import_batch, but async without error handling.  This is meant for testing.
@@ -152,9 +170,7 @@ class ImporterCore:
         model = AssetImporterModel(**batch_config)
 
         converter_manager = _kit_asset_converter.get_instance()
-        tasks = []
-        collections = []
-        all_success = True
+        jobs = []
         output_path = None
 
         for config in model.data:
@@ -181,10 +197,18 @@ class ImporterCore:
                     out_path = str(OmniUrl(output_folder) / input_url.name)
                     rename_task = (out_path, str(Path(out_path).with_suffix(desired_suffix)))
 
-                collector = Collector(config.input_path, output_folder, False, True, False)
-                collections.append((collector, rename_task))
-
                 output_path = str(OmniUrl(output_folder) / input_url.stem) + desired_suffix
+                collected_path = str(OmniUrl(output_folder) / input_url.name)
+                jobs.append(
+                    (
+                        config.input_path,
+                        rename_task[1] if rename_task else collected_path,
+                        functools.partial(self._collect_usd_async, config.input_path, output_folder, rename_task),
+                        self._get_collect_output_keys(
+                            config.input_path, output_folder, [collected_path, *(rename_task or [])]
+                        ),
+                    )
+                )
             else:
                 # Not a USD file, need to use asset converter.
                 if config.output_path is not None:
@@ -196,7 +220,16 @@ class ImporterCore:
                     output_path = str(input_url.with_suffix(desired_suffix))
 
                 context = self._context_from_model(config)
-                tasks.append(converter_manager.create_converter_task(config.input_path, output_path, None, context))
+                jobs.append(
+                    (
+                        config.input_path,
+                        output_path,
+                        functools.partial(
+                            self._convert_asset_async, converter_manager, config.input_path, output_path, context
+                        ),
+                        {("file", omni.client.normalize_url(str(output_path)))},
+                    )
+                )
 
         # If an asset with that name in output_folder already exists, delete it
         dest_asset_path = Path(str(output_path))
@@ -204,55 +237,148 @@ class ImporterCore:
             carb.log_warn(f"The asset at, {dest_asset_path}, already exists! Overwriting the asset...")
             dest_asset_path.unlink()
 
-        if (len(tasks) + len(collections)) == 0:
-            self._on_batch_finished(all_success)
-            return all_success
+        if not jobs:
+            self._on_batch_finished(True)
+            return True
+
+        # Progress of each job, between 0 and 1. The batch progress is the average of all the jobs.
+        jobs_progress = [0.0] * len(jobs)
+        semaphore = asyncio.Semaphore(max_concurrent or os.cpu_count() or 1)
+        # Jobs writing to the same file can't run at the same time: they share a lock for each file they write
+        output_locks = {output_key: asyncio.Lock() for *_, output_keys in jobs for output_key in output_keys}
+
+        def set_job_progress(index: int, value: float):
+            jobs_progress[index] = value
+            self._on_batch_progress(100 * sum(jobs_progress) / len(jobs_progress))
+
+        async def run_job(
+            index: int, input_path: str, job_output_path: str, job: Callable, output_keys: Set[Tuple[str, ...]]
+        ) -> bool:
+            async with contextlib.AsyncExitStack() as locks:
+                # Always take the locks in the same order so jobs waiting on each other can't deadlock
+                for output_key in sorted(output_keys):
+                    await locks.enter_async_context(output_locks[output_key])
+                await locks.enter_async_context(semaphore)
+                start = time.perf_counter()
+                try:
+                    success = await job(functools.partial(set_job_progress, index))
+                except Exception as e:  # noqa PLW0718
+                    carb.log_error(f"Failed to import {input_path}: {e}")
+                    success = False
+                duration = time.perf_counter() - start
+                set_job_progress(index, 1.0)
+                carb.log_info(f"Imported {input_path} -> {job_output_path} in {duration:.3f}s (success: {success})")
+                self._on_asset_imported(input_path, job_output_path, success, duration)
+                return success
+
+        self._on_batch_progress(0)
+        results = await asyncio.gather(*[run_job(index, *job) for index, job in enumerate(jobs)])
+        all_success = all(results)
+
+        self._on_batch_progress(100)
+        self._on_batch_finished(all_success)
+
+        return all_success
 
-        to_add = 100 / (len(tasks) + len(collections))
-        progress = 0
-        self._on_batch_progress(progress)
-        for task in tasks:
-            if not await task.wait_until_finished():
-                all_success = False
-            progress += to_add
-            self._on_batch_progress(progress)
+    @staticmethod
+    def _get_collect_output_keys(input_path: str, output_folder: str, output_paths: List[str]) -> Set[Tuple[str, ...]]:
+        """
+        Get the lock keys of the files written when collecting a USD asset.
 
-        rename_context = None
-        for collection, rename_task in collections:
+        The collector writes the dependencies in the output folder using their file names, so two collected assets
+        write the same files if they have a dependency with the same name, even if it comes from different folders.
 
-            collector_weakref = weakref.ref(collection)
+        Args:
+            input_path: the USD asset to collect
+            output_folder: the folder the asset is collected to
+            output_paths: the files written for the asset itself
+
+        Returns:
+            The lock keys of the collected asset, its renamed output and its dependencies
+        """
+        output_folder = omni.client.normalize_url(str(output_folder))
+        keys = {("file", omni.client.normalize_url(str(output_path))) for output_path in output_paths}
+        layers, assets, _unresolved_paths = UsdUtils.ComputeAllDependencies(input_path)
+        for dependency_path in [layer.realPath or layer.identifier for layer in layers] + list(assets):
+            name = OmniUrl(dependency_path).name
+            if name:
+                keys.add(("dependency", output_folder, name.lower()))
+        return keys
+
+    async def _convert_asset_async(
+        self,
+        converter_manager,
+        input_path: str,
+        output_path: str,
+        context: _kit_asset_converter.AssetConverterContext,
+        progress_callback: Callable[[float], None],
+    ) -> bool:
+        """
+        Convert a non-USD asset to USD using the asset converter.
 
-            def progress_callback(step, total):
-                if total != 0:
-                    self._on_batch_progress(progress + to_add * step / total)  # noqa B023
+        Returns:
+            True if the conversion succeeded, False otherwise
+        """
 
-            def on_finish():
-                collector_weakref().destroy()  # noqa
+        def converter_progress(current_step: int, total: int):
+            if total != 0:
+                progress_callback(current_step / total)
+
+        task = converter_manager.create_converter_task(input_path, output_path, converter_progress, context)
+        success = await task.wait_until_finished()
+        if not success:
+            carb.log_error(f"Failed to convert {input_path}: {task.get_status()} - {task.get_error_message()}")
+        return bool(success)
+
+    async def _collect_usd_async(
+        self,
+        input_path: str,
+        output_folder: str,
+        rename_task: Optional[Tuple[str, str]],
+        progress_callback: Callable[[float], None],
+    ) -> bool:
+        """
+        Collect a USD asset and its dependencies into the output folder, and rename it if needed.
 
-            await collection.collect(progress_callback, on_finish)
+        Returns:
+            True if the collection succeeded, False otherwise
+        """
+        collector = Collector(input_path, output_folder, False, True, False)
+        collector_weakref = weakref.ref(collector)
 
-            if rename_task:
-                if rename_context is None:
-                    rename_context = omni.usd.create_context("asset_importer_renamer")
+        def collector_progress(step, total):
+            if total != 0:
+                progress_callback(step / total)
 
-                if not rename_context.open_stage(rename_task[0]) or not rename_context.save_as_stage(rename_task[1]):
-                    all_success = False
-                    carb.log_error(f"Failed to rename imported USD from {rename_task[0]} to {rename_task[1]}")
+        def on_finish():
+            collector_weakref().destroy()  # noqa
 
-                rename_context.close_stage()
-                omni.client.delete(rename_task[0])
+        await collector.collect(collector_progress, on_finish)
 
-            progress += to_add
-            self._on_batch_progress(progress)
+        if not rename_task:
+            return True
 
-        if rename_context is not None:
-            rename_context = None
-            omni.usd.destroy_context("asset_importer_renamer")
+        success = self._rename_usd_layer(*rename_task)
+        if not success:
+            carb.log_error(f"Failed to rename imported USD from {rename_task[0]} to {rename_task[1]}")
+        return success
 
-        self._on_batch_progress(100)
-        self._on_batch_finished(all_success)
+    @staticmethod
+    def _rename_usd_layer(source_path: str, destination_path: str) -> bool:
+        """
+        Rename a USD file at the layer level. The layer is exported to the new path (the file format is picked from
+        the destination extension) without composing a stage, and the source file is deleted.
 
-        return all_success
+        Both paths are expected to be in the same directory so relative asset paths stay valid.
+        """
+        layer = Sdf.Layer.FindOrOpen(source_path)
+        if not layer:
+            return False
+        if not layer.Export(destination_path):
+            return False
+        layer = None  # noqa
+        omni.client.delete(source_path)
+        return True
 
     def _context_from_model(self, model: AssetItemImporterModel):
         context = _kit_asset_converter.AssetConverterContext()
@@ -269,6 +395,9 @@ class ImporterCore:
     def _on_batch_finished(self, result):
         self.__on_batch_finished(result)
 
+    def _on_asset_imported(self, input_path: str, output_path: str, success: bool, duration: float):
+        self.__on_asset_imported(input_path, output_path, success, duration)
+
     def subscribe_batch_finished(self, callback: Callable[[bool], Any]):
         """
         Return the object that will automatically unsubscribe when destroyed.
@@ -280,3 +409,12 @@ class ImporterCore:
         Return the object that will automatically unsubscribe when destroyed.
         """
         return _EventSubscription(self.__on_batch_progress, callback)
+
+    def subscribe_asset_imported(self, callback: Callable[[str, str, bool, float], Any]):
+        """
+        Subscribe to the individual asset imports. The callback receives the input path, the output path, whether
+        the import succeeded and the import duration in seconds.
+
+        Return the object that will automatically unsubscribe when destroyed.
+        """
+        return _EventSubscription(self.__on_asset_imported, callback)
@@ -15,15 +15,17 @@
 * limitations under the License.
 """
 
+import asyncio
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import carb
 import omni.kit
 import omni.kit.test
 import omni.usd
 from omni.flux.asset_importer.core import ImporterCore
-from pxr import Usd
+from pxr import Sdf, Usd
 from pydantic.error_wrappers import ValidationError
 
 # import subprocess
@@ -91,7 +93,7 @@ class TestAssetImporter(omni.kit.test.AsyncTestCase):
 
         self.assertTrue(sub_finished_count[-1])
         self.assertEqual(0.0, sub_progress_count[0])
-        self.assertEqual(50.0, sub_progress_count[3])
+        self.assertListEqual(sorted(sub_progress_count), sub_progress_count)
         self.assertEqual(100.0, sub_progress_count[-1])
 
     async def test_batch_conversion_separate_folders(self):
@@ -118,6 +120,106 @@ class TestAssetImporter(omni.kit.test.AsyncTestCase):
             stage = Usd.Stage.Open(str(path))
             self.assertIsNotNone(stage)
 
+    async def test_batch_conversion_asset_imported(self):
+        imported = []
+
+        def on_asset_imported(input_path, output_path, success, duration):
+            imported.append((input_path, output_path, success, duration))
+
+        _sub = self._importer.subscribe_asset_imported(on_asset_imported)  # noqa
+
+        output_folder = self.temp_path / Path("renamed")
+        output_folder.mkdir(exist_ok=True)
+        config = {"data": []}
+        expected_outputs = []
+        for path in TestAssetImporter.test_paths:
+            output_path = output_folder / f"{Path(path).stem}_imported.usda"
+            config["data"].append({"input_path": path, "output_path": output_path})
+            expected_outputs.append(output_path)
+
+        self.assertTrue(await self._importer.import_batch_async(config, max_concurrent=2))
+
+        # Every asset reported individually, including the renamed USD
+        self.assertEqual(len(TestAssetImporter.test_paths), len(imported))
+        self.assertSetEqual(set(TestAssetImporter.test_paths), {i[0] for i in imported})
+        for _, _, success, duration in imported:
+            self.assertTrue(success)
+            self.assertGreaterEqual(duration, 0.0)
+
+        for path in expected_outputs:
+            self.assertTrue(path.exists())
+            stage = Usd.Stage.Open(str(path))
+            self.assertIsNotNone(stage)
+
+        # The collected USD was renamed, the intermediate file should not be left behind
+        self.assertFalse((output_folder / "ref.usda").exists())
+
+    async def test_batch_conversion_same_output_should_not_run_concurrently(self):
+        running = []
+        max_running = 0
+
+        async def convert_asset_async(_converter_manager, _input_path, output_path, _context, _progress_callback):
+            nonlocal max_running
+            running.append(output_path)
+            max_running = max(max_running, running.count(output_path))
+            await asyncio.sleep(0.05)
+            running.remove(output_path)
+            return True
+
+        output_path = self.temp_path / "shared.usda"
+        config = {
+            "data": [{"input_path": path, "output_path": output_path} for path in TestAssetImporter.test_paths[:2]]
+        }
+
+        with patch.object(self._importer, "_convert_asset_async", side_effect=convert_asset_async):
+            self.assertTrue(await self._importer.import_batch_async(config, max_concurrent=2))
+
+        self.assertEqual(1, max_running)
+
+    async def _run_usd_collect_jobs(self, dependency_names: list[str]) -> int:
+        running = 0
+        max_running = 0
+
+        async def collect_usd_async(_input_path, _output_folder, _rename_task, _progress_callback):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return True
+
+        input_folder = self.temp_path / "input"
+        output_folder = self.temp_path / "output"
+        output_folder.mkdir()
+        config = {"data": []}
+        for index, dependency_name in enumerate(dependency_names):
+            dependency_path = input_folder / f"dependencies_{index}" / dependency_name
+            dependency_path.parent.mkdir(parents=True)
+            Sdf.Layer.CreateNew(str(dependency_path)).Save()
+            layer = Sdf.Layer.CreateNew(str(input_folder / f"asset_{index}.usda"))
+            layer.subLayerPaths.append(f"./dependencies_{index}/{dependency_name}")
+            layer.Save()
+            config["data"].append({"input_path": layer.realPath, "output_path": output_folder / f"asset_{index}.usda"})
+
+        with patch.object(self._importer, "_collect_usd_async", side_effect=collect_usd_async):
+            self.assertTrue(await self._importer.import_batch_async(config, max_concurrent=2))
+
+        return max_running
+
+    async def test_batch_collect_same_output_folder_should_run_concurrently(self):
+        # Act
+        max_running = await self._run_usd_collect_jobs(["material_a.usda", "material_b.usda"])
+
+        # Assert
+        self.assertEqual(2, max_running)
+
+    async def test_batch_collect_shared_dependency_name_should_not_run_concurrently(self):
+        # Act
+        max_running = await self._run_usd_collect_jobs(["material.usda", "material.usda"])
+
+        # Assert
+        self.assertEqual(1, max_running)
+
     async def test_batch_conversion_json(self):
         output_folder = self.temp_path / Path("json")
         output_folder.mkdir(exist_ok=True)
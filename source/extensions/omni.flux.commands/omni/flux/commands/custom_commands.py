@@ -21,7 +21,7 @@ import carb
 import omni.kit.commands
 import omni.kit.undo
 import omni.usd
-from omni.kit.usd_undo import UsdEditTargetUndo
+from omni.kit.usd_undo import UsdEditTargetUndo, UsdLayerUndo
 from omni.usd.commands import remove_prim_spec as _remove_prim_spec
 from pxr import Sdf, Usd, UsdGeom
 
@@ -164,6 +164,135 @@ class SetFluxXFormPrimCommand(omni.kit.commands.Command):
         self._create_attributes([])
 
 
+class PropertyChange(TypedDict):
+    prop_path: str | Sdf.Path
+    value: Any
+    target_layer: Sdf.Layer | None
+
+
+class ChangePropertiesCommand(omni.kit.commands.Command):
+    """
+    Set the default value of multiple attributes as a single undoable **Command**.
+
+    All the values are authored directly on the layer specs inside a single `Sdf.ChangeBlock`, so the stage only
+    recomposes and sends change notifications once for the whole batch.
+
+    Args:
+        changes (list[PropertyChange]): The attribute paths, values and layers to author the values on. The edit
+                                        target layer is used when no target layer is given.
+        context_name (str): Usd context name to run the command on.
+        stage (Usd.Stage): Stage to operate. Optional.
+    """
+
+    def __init__(self, changes: list[PropertyChange], context_name: str = "", stage: Usd.Stage = None):
+        self._changes = changes
+        self._context_name = context_name
+        self._stage = stage or omni.usd.get_context(context_name).get_stage()
+
+        # (layer, attribute path, created prim spec path, attribute spec existed, had default, previous default)
+        self._undo_data = []
+
+    def do(self):
+        self._undo_data = []
+        context = omni.usd.get_context(self._context_name)
+        edit_target_layer = self._stage.GetEditTarget().GetLayer()
+        with Sdf.ChangeBlock():
+            for change in self._changes:
+                attr = self._stage.GetAttributeAtPath(Sdf.Path(str(change["prop_path"])))
+                if not attr:
+                    carb.log_warn(f"{self.__class__.__name__}: {change['prop_path']} is not a valid attribute")
+                    continue
+                layer = change.get("target_layer") or edit_target_layer
+                if context and omni.usd.is_layer_locked(context, layer.identifier):
+                    carb.log_warn(f"{self.__class__.__name__}: Layer {layer.identifier} is locked")
+                    continue
+
+                attr_path = attr.GetPath()
+                prim_path = attr_path.GetPrimPath()
+
+                # Find the first prim spec that will be created, to be able to clean up the layer on undo
+                created_prim_path = None
+                for prefix in prim_path.GetPrefixes():
+                    if not layer.GetPrimAtPath(prefix):
+                        created_prim_path = prefix
+                        break
+
+                prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+                attr_spec = layer.GetAttributeAtPath(attr_path)
+                spec_existed = bool(attr_spec)
+                had_default = spec_existed and attr_spec.HasDefaultValue()
+                previous_default = attr_spec.default if had_default else None
+                if not spec_existed:
+                    attr_spec = Sdf.AttributeSpec(
+                        prim_spec, attr.GetName(), attr.GetTypeName(), attr.GetVariability(), attr.IsCustom()
+                    )
+
+                attr_spec.default = change["value"]
+                self._undo_data.append(
+                    (layer, attr_path, created_prim_path, spec_existed, had_default, previous_default)
+                )
+
+    def undo(self):
+        with Sdf.ChangeBlock():
+            for layer, attr_path, created_prim_path, spec_existed, had_default, previous_default in reversed(
+                self._undo_data
+            ):
+                if created_prim_path:
+                    if layer.GetPrimAtPath(created_prim_path):
+                        _remove_prim_spec(layer, created_prim_path)
+                    continue
+                attr_spec = layer.GetAttributeAtPath(attr_path)
+                if not attr_spec:
+                    continue
+                if not spec_existed:
+                    layer.GetPrimAtPath(attr_path.GetPrimPath()).RemoveProperty(attr_spec)
+                elif had_default:
+                    attr_spec.default = previous_default
+                else:
+                    attr_spec.ClearDefaultValue()
+        self._undo_data = []
+
+
+class RemovePrimSpecsCommand(omni.kit.commands.Command):
+    """
+    Remove prim specs from multiple layers as a single undoable **Command**.
+
+    All the specs are removed inside a single `Sdf.ChangeBlock`, so the stage only recomposes once.
+
+    Args:
+        prim_specs (dict[str, list[Sdf.Path]]): The prim spec paths to remove, by layer identifier. Paths without a
+                                                 spec in the layer are skipped.
+    """
+
+    def __init__(self, prim_specs: dict[str, list[Sdf.Path]]):
+        self._prim_specs = prim_specs
+        self._layer_undos = []
+
+    def do(self):
+        self._layer_undos = []
+        with Sdf.ChangeBlock():
+            for layer_identifier, prim_spec_paths in self._prim_specs.items():
+                layer = Sdf.Layer.Find(layer_identifier)
+                if not layer:
+                    carb.log_warn(f"{self.__class__.__name__}: Layer {layer_identifier} is not opened")
+                    continue
+                # Sort to remove the parents first: their children are removed with them
+                prim_spec_paths = sorted({Sdf.Path(str(path)) for path in prim_spec_paths})
+                layer_undo = UsdLayerUndo(layer)
+                for prim_spec_path in prim_spec_paths:
+                    if not layer.GetPrimAtPath(prim_spec_path):
+                        continue
+                    layer_undo.reserve(prim_spec_path)
+                    _remove_prim_spec(layer, prim_spec_path)
+                self._layer_undos.append(layer_undo)
+
+    def undo(self):
+        with Sdf.ChangeBlock():
+            for layer_undo in reversed(self._layer_undos):
+                layer_undo.undo()
+        self._layer_undos = []
+
+
 class RemoveOverrideCommand(omni.kit.commands.Command):
     """
     Will remove override for a given attribute
@@ -202,31 +331,16 @@ class RemoveOverrideCommand(omni.kit.commands.Command):
 
         self._edit_target_undo = None
 
-    def _has_attribute_override(self, prim: Usd.Prim) -> bool:
-        try:
-            attrs = prim.GetAttributes()
-        except RuntimeError:
-            return False
-        for attr in attrs:
-            stack = attr.GetPropertyStack(Usd.TimeCode.Default())
-            for item in stack:
-                if item.layer.identifier == self._layer.identifier:
-                    return True
-        return False
-
-    def _has_non_empty_child_overrides(self, prim: Usd.Prim, seen: set = None) -> bool:
-        # If there are no prims to work on, return.
-        if not prim.IsValid():
-            return False
-        children = prim.GetChildren()
-
-        for child in children:  # Noqa SIM110
-            if seen is None or child not in seen:
-                if self._has_attribute_override(child):
-                    return True
-                val = self._has_non_empty_child_overrides(child, seen=seen)
-                if val:
-                    return True
+    def _has_attribute_specs(self, prim_spec: Sdf.PrimSpec) -> bool:
+        """Check if the layer authors attributes on the prim spec or any of its children or variants"""
+        prim_specs = [prim_spec]
+        while prim_specs:
+            spec = prim_specs.pop()
+            if spec.attributes:
+                return True
+            prim_specs.extend(spec.nameChildren)
+            for variant_set_spec in spec.variantSets.values():
+                prim_specs.extend(variant_spec.primSpec for variant_spec in variant_set_spec.variants.values())
         return False
 
     def _remove_prim_spec(self):
@@ -237,30 +351,14 @@ class RemoveOverrideCommand(omni.kit.commands.Command):
             usd_context=self._context_name,
         )
 
-    def _remove_overrides_recursive(self, prim: Usd.Prim, seen: set = None):
-        # Return if there's no prim to work on
-        if not prim:
-            return
-
-        if seen is None:
-            seen = set()
-            seen.add(prim)
-
+    def _remove_empty_override(self):
         # If there is a prim given to check to, don't go past it
-        if self._check_up_to_prim and prim == self._check_up_to_prim:
+        if self._check_up_to_prim and self._prim == self._check_up_to_prim:
             return
-
-        any_overrides = self._has_non_empty_child_overrides(prim, seen=seen)
-        if not any_overrides and not self._has_attribute_override(prim):
+        # Answer from the layer specs: no need to compose the children or the property stacks
+        prim_spec = self._layer.GetPrimAtPath(self._prim.GetPath())
+        if prim_spec and not self._has_attribute_specs(prim_spec):
             self._remove_prim_spec()
-            # In case we hit the end of the line.
-            try:
-                parent = prim.GetParent()
-            except RuntimeError:
-                carb.log_info("Reached the end of prim tree for override check.")
-                parent = None
-
-            self._remove_overrides_recursive(parent, seen=seen)
 
     def _remove_attribute(self):
         with Sdf.ChangeBlock():
@@ -288,7 +386,7 @@ class RemoveOverrideCommand(omni.kit.commands.Command):
         with omni.kit.undo.group():
             if self._attribute:
                 self._remove_attribute()
-            self._remove_overrides_recursive(self._prim)
+            self._remove_empty_override()
 
     def undo(self):
         carb.log_info(f"{self.__class__.__name__}: Resetting attribute")
@@ -80,6 +80,104 @@ class TestCustomCommands(omni.kit.test.AsyncTestCase):
         self.assertTrue(self.stage.HasDefaultPrim())
         self.assertEqual(self.stage.GetDefaultPrim(), root_prim_1.GetParent())
 
+    async def test_change_properties_command_do(self):
+        # Arrange
+        layer1, prims = await self.__layer_setup()
+        attributes = [prim.GetAttribute("visibility") for prim in prims]
+
+        # Act
+        omni.kit.commands.execute(
+            "ChangePropertiesCommand",
+            changes=[
+                {"prop_path": attribute.GetPath(), "value": UsdGeom.Tokens.invisible, "target_layer": layer1}
+                for attribute in attributes
+            ],
+            stage=self.stage,
+        )
+
+        # Assert
+        for attribute in attributes:
+            self.assertEqual(attribute.Get(), UsdGeom.Tokens.invisible)
+            self.assertTrue(layer1.GetAttributeAtPath(attribute.GetPath()))
+
+    async def test_change_properties_command_undo(self):
+        # Arrange
+        layer1, prims = await self.__layer_setup()
+        attributes = [prim.GetAttribute("visibility") for prim in prims]
+        omni.kit.commands.execute(
+            "ChangeProperty",
+            prop_path=attributes[0].GetPath(),
+            value=UsdGeom.Tokens.invisible,
+            prev=None,
+            target_layer=layer1,
+        )
+
+        # Act
+        omni.kit.commands.execute(
+            "ChangePropertiesCommand",
+            changes=[
+                {"prop_path": attribute.GetPath(), "value": UsdGeom.Tokens.inherited, "target_layer": layer1}
+                for attribute in attributes
+            ],
+            stage=self.stage,
+        )
+        omni.kit.undo.undo()
+
+        # Assert
+        # A single undo should revert every attribute, and only the prim specs that existed before should be left
+        self.assertEqual(attributes[0].Get(), UsdGeom.Tokens.invisible)
+        self.assertTrue(layer1.GetAttributeAtPath(attributes[0].GetPath()))
+        for attribute in attributes[1:]:
+            self.assertEqual(attribute.Get(), UsdGeom.Tokens.inherited)
+            self.assertFalse(layer1.GetAttributeAtPath(attribute.GetPath()))
+        self.assertFalse(layer1.GetPrimAtPath(prims[-1].GetPath()))
+
+    async def test_remove_prim_specs_command_do(self):
+        # Arrange
+        layer1, prims = await self.__layer_setup()
+        layer0 = Sdf.Layer.Find(self.stage.GetRootLayer().subLayerPaths[0])
+        with Usd.EditContext(self.stage, layer1):
+            prims[2].GetAttribute("visibility").Set(UsdGeom.Tokens.invisible)
+
+        # Act
+        omni.kit.commands.execute(
+            "RemovePrimSpecsCommand",
+            prim_specs={
+                layer0.identifier: [prims[1].GetPath(), prims[2].GetPath()],
+                layer1.identifier: [prims[1].GetPath(), prims[0].GetPath().AppendChild("Missing")],
+            },
+        )
+
+        # Assert
+        self.assertTrue(layer0.GetPrimAtPath(prims[0].GetPath()))
+        self.assertFalse(layer0.GetPrimAtPath(prims[1].GetPath()))
+        self.assertFalse(layer0.GetPrimAtPath(prims[2].GetPath()))
+        self.assertTrue(layer1.GetPrimAtPath(prims[0].GetPath()))
+        self.assertFalse(layer1.GetPrimAtPath(prims[1].GetPath()))
+
+    async def test_remove_prim_specs_command_undo(self):
+        # Arrange
+        layer1, prims = await self.__layer_setup()
+        layer0 = Sdf.Layer.Find(self.stage.GetRootLayer().subLayerPaths[0])
+        with Usd.EditContext(self.stage, layer1):
+            prims[2].GetAttribute("visibility").Set(UsdGeom.Tokens.invisible)
+
+        omni.kit.commands.execute(
+            "RemovePrimSpecsCommand",
+            prim_specs={layer0.identifier: [prims[1].GetPath()], layer1.identifier: [prims[1].GetPath()]},
+        )
+
+        # Act
+        omni.kit.undo.undo()
+
+        # Assert
+        # A single undo should restore the specs of every layer
+        self.assertTrue(layer0.GetPrimAtPath(prims[2].GetPath()))
+        self.assertTrue(layer1.GetPrimAtPath(prims[2].GetPath()))
+        self.assertEqual(
+            self.stage.GetPrimAtPath(prims[2].GetPath()).GetAttribute("visibility").Get(), UsdGeom.Tokens.invisible
+        )
+
     async def __define_prim(self) -> "Usd.Prim":
         test_path = omni.usd.get_stage_next_free_path(self.stage, "/World/TestPrim", False)
         return self.stage.DefinePrim(test_path, "Xform")
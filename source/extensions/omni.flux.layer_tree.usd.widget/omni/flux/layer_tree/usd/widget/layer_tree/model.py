@@ -20,7 +20,7 @@ import weakref
 from contextlib import contextmanager
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Set, Tuple, Union
 
 import carb
 import omni.kit.usd.layers as _layers
@@ -133,12 +133,30 @@ class LayerModel(_TreeModelBase[ItemBase]):
                 self.refresh()
 
     def refresh(self) -> None:
-        """Force a refresh of the model."""
+        """
+        Force a refresh of the model.
+
+        The layer hierarchy is compared with the current items using the layer identifiers. Existing items are updated
+        in place, items are only created for the added layers and only the branches with added, removed or changed
+        items are re-emitted. The whole tree is only rebuilt when the root layer changes.
+        """
         if not self.stage or self._ignore_refresh:
             return
         root_layer = self.stage.GetRootLayer()
-        root_item = self._create_layer_items(root_layer, None)
-        self.set_items([root_item])
+        dirty_layers = set(_layers.LayerUtils.get_dirty_layers(self.stage))
+
+        current_root_item = self._items[0] if len(self._items) == 1 else None
+        if current_root_item is None or self._get_layer_identifier(current_root_item) != root_layer.identifier:
+            self.set_items([self._create_layer_items(root_layer, None, dirty_layers=dirty_layers)])
+            return
+
+        changed_parents = self._update_layer_items(current_root_item, root_layer, dirty_layers)
+        # The root item's row is rebuilt with the whole tree
+        if None in changed_parents:
+            self._item_changed(None)
+            return
+        for item in changed_parents:
+            self._item_changed(item)
 
     def enable_listeners(self, value: bool) -> None:
         """
@@ -648,8 +666,61 @@ class LayerModel(_TreeModelBase[ItemBase]):
         elif source is not None and item_target is not None:
             self.move_sublayer(source, item_target)
 
-    def _create_layer_items(self, layer, parent):
+    @staticmethod
+    def _get_layer_identifier(item: ItemBase) -> Optional[str]:
+        layer = item.data.get("layer") if item.data else None
+        return layer.identifier if layer else None
+
+    def _update_layer_items(self, item: ItemBase, layer, dirty_layers: Set[str]) -> List[Optional[ItemBase]]:
+        """
+        Update an existing item and its children in place from the layer hierarchy. Children are matched by layer
+        identifier so unchanged items are kept, and new items are only created for the added sublayers.
+
+        Args:
+            item: the existing item of the layer
+            layer: the layer to update the item with
+            dirty_layers: the identifiers of the dirty layers
+
+        Returns:
+            The items whose children should be re-emitted. None means the model's top-level items.
+        """
+        changed_parents = []
+
+        def add_changed_parent(parent):
+            if not any(parent is p for p in changed_parents):
+                changed_parents.append(parent)
+
+        existing_children = {}
+        for child in item.children:
+            existing_children.setdefault(self._get_layer_identifier(child), child)
+
         children = []
+        for child_layer in self._get_sublayers(layer):
+            child = existing_children.pop(child_layer.identifier, None)
+            if child is None:
+                children.append(self._create_layer_items(child_layer, layer, dirty_layers=dirty_layers))
+                continue
+            for parent in self._update_layer_items(child, child_layer, dirty_layers):
+                add_changed_parent(parent)
+            children.append(child)
+
+        if len(children) != len(item.children) or any(a is not b for a, b in zip(children, item.children)):
+            item.set_children(children, False)
+            add_changed_parent(item)
+
+        title, data = self._get_layer_item_data(layer, item.parent is None, children, dirty_layers)
+        if item.title != title or item.data != data:
+            item.title = title
+            item.data.clear()
+            item.data.update(data)
+            # An item's row is built with its parent's children
+            add_changed_parent(item.parent)
+
+        return changed_parents
+
+    @staticmethod
+    def _get_sublayers(layer) -> list:
+        sublayers = []
         for sub_layer in layer.subLayerPaths:
             sub_layer_path = layer.ComputeAbsolutePath(sub_layer)
             if layer.realPath == sub_layer_path:
@@ -657,14 +728,24 @@ class LayerModel(_TreeModelBase[ItemBase]):
             child_layer = _layers.LayerUtils.find_layer(sub_layer_path)
             if child_layer is None:
                 continue
-            children.append(self._create_layer_items(child_layer, layer))
+            sublayers.append(child_layer)
+        return sublayers
 
-        is_dirty = False
-        dirty_layers = _layers.LayerUtils.get_dirty_layers(self.stage)
-        for dirty_layer in dirty_layers:
-            if layer.identifier == dirty_layer:
-                is_dirty = True
-                break
+    def _create_layer_items(self, layer, parent, dirty_layers: Optional[Set[str]] = None):
+        if dirty_layers is None:
+            dirty_layers = set(_layers.LayerUtils.get_dirty_layers(self.stage))
+
+        children = [
+            self._create_layer_items(child_layer, layer, dirty_layers=dirty_layers)
+            for child_layer in self._get_sublayers(layer)
+        ]
+        layer_name, layer_data = self._get_layer_item_data(layer, parent is None, children, dirty_layers)
+        return LayerItem(layer_name, layer_data, parent, children)
+
+    def _get_layer_item_data(
+        self, layer, is_root: bool, children: List[ItemBase], dirty_layers: Set[str]
+    ) -> Tuple[str, dict]:
+        is_dirty = layer.identifier in dirty_layers
 
         # If any of the children is the edit target, all parents cannot be muted
         def has_authoring_child_recursive(items):
@@ -698,7 +779,7 @@ class LayerModel(_TreeModelBase[ItemBase]):
             excludes[exclude_type] = value
 
         layers_state = _layers.get_layers(self._context).get_layers_state()
-        layer_name = _layers.LayerUtils.get_custom_layer_name(layer) if parent is not None else "Root Layer"
+        layer_name = _layers.LayerUtils.get_custom_layer_name(layer) if not is_root else "Root Layer"
         is_authoring = _layers.LayerUtils.get_edit_target(self.stage) == layer.identifier
         layer_data = {
             "locked": layers_state.is_layer_locked(layer.identifier),
@@ -716,7 +797,7 @@ class LayerModel(_TreeModelBase[ItemBase]):
             "exclude_add_child": excludes[_LayerCustomData.EXCLUDE_ADD_CHILD],
             "exclude_move": excludes[_LayerCustomData.EXCLUDE_MOVE],
         }
-        return LayerItem(layer_name, layer_data, parent, children)
+        return layer_name, layer_data
 
     def _on_save_layer_as_internal(self, success, error_message, layers):
         """
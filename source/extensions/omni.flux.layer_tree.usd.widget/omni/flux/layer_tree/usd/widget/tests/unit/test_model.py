@@ -259,6 +259,88 @@ class TestModel(omni.kit.test.AsyncTestCase):
         finally:
             layer0_path.chmod(stat.S_IWRITE)
 
+    async def test_refresh_unchanged_layers_keeps_items(self):
+        # Arrange
+        layer0 = Sdf.Layer.CreateNew(str(Path(self.temp_dir.name) / "layer0.usda"))
+        layer1 = Sdf.Layer.CreateNew(str(Path(self.temp_dir.name) / "layer1.usda"))
+
+        root = self.stage.GetRootLayer()
+        root.subLayerPaths.append(layer0.identifier)
+        root.subLayerPaths.append(layer1.identifier)
+
+        model = LayerModel()
+        model.refresh()
+        items = model.get_item_children(recursive=True)
+
+        changed_items = []
+        _sub = model.subscribe_item_changed_fn(lambda _, item: changed_items.append(item))  # noqa F841
+
+        # Act
+        model.refresh()
+
+        # Assert
+        self.assertListEqual([], changed_items)
+        self.assertEqual(len(items), len(model.get_item_children(recursive=True)))
+        for item, refreshed_item in zip(items, model.get_item_children(recursive=True)):
+            self.assertIs(item, refreshed_item)
+
+    async def test_refresh_new_sublayer_only_updates_changed_items(self):
+        # Arrange
+        layer0 = Sdf.Layer.CreateNew(str(Path(self.temp_dir.name) / "layer0.usda"))
+        layer1 = Sdf.Layer.CreateNew(str(Path(self.temp_dir.name) / "layer1.usda"))
+        layer2 = Sdf.Layer.CreateNew(str(Path(self.temp_dir.name) / "layer2.usda"))
+
+        root = self.stage.GetRootLayer()
+        root.subLayerPaths.append(layer0.identifier)
+        root.subLayerPaths.append(layer1.identifier)
+
+        model = LayerModel()
+        model.refresh()
+        root_item = model.get_item_children()[0]
+        layer0_item, layer1_item = root_item.children
+
+        changed_items = []
+        _sub = model.subscribe_item_changed_fn(lambda _, item: changed_items.append(item))  # noqa F841
+
+        # Act
+        layer1.subLayerPaths.append(layer2.identifier)
+        model.refresh()
+
+        # Assert
+        # The existing items are kept and updated in place
+        self.assertIs(root_item, model.get_item_children()[0])
+        self.assertIs(layer0_item, root_item.children[0])
+        self.assertIs(layer1_item, root_item.children[1])
+        self.assertEqual(1, len(layer1_item.children))
+        self.assertEqual(layer2, layer1_item.children[0].data["layer"])
+        self.assertEqual(layer1_item, layer1_item.children[0].parent)
+        self.assertTrue(layer1_item.data["dirty"])
+
+        # Only the branches with changes are re-emitted
+        self.assertIn(layer1_item, changed_items)
+        self.assertNotIn(layer0_item, changed_items)
+        self.assertNotIn(None, changed_items)
+
+    async def test_refresh_new_sublayer_only_creates_added_items(self):
+        # Arrange
+        layer0 = Sdf.Layer.CreateNew(str(Path(self.temp_dir.name) / "layer0.usda"))
+        layer1 = Sdf.Layer.CreateNew(str(Path(self.temp_dir.name) / "layer1.usda"))
+
+        root = self.stage.GetRootLayer()
+        root.subLayerPaths.append(layer0.identifier)
+
+        model = LayerModel()
+        model.refresh()
+
+        # Act
+        root.subLayerPaths.append(layer1.identifier)
+        with patch.object(LayerModel, "_create_layer_items", wraps=model._create_layer_items) as create_mock:
+            model.refresh()
+
+        # Assert
+        self.assertEqual(1, create_mock.call_count)
+        self.assertEqual(layer1, create_mock.call_args.args[0])
+
     async def test_delete_layer_no_parent_quick_return(self):
         # Arrange
         root_item = LayerItem("root")
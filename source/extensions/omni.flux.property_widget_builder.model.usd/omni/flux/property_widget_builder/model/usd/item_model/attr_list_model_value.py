@@ -15,10 +15,10 @@
 * limitations under the License.
 """
 
+from typing import List
+
 import omni.kit.commands
-import omni.kit.undo
-import omni.usd
-from pxr import Sdf
+from pxr import Usd
 
 from .base_list_model_value import UsdListModelBaseValueModel as _UsdListModelBaseValueModel
 
@@ -27,30 +27,18 @@ class UsdListModelAttrValueModel(_UsdListModelBaseValueModel):
     """Represent an attribute that has multiple value choices like enums"""
 
     def _set_attribute_value(self, attr, new_value: str):
-        attribute_path = str(attr.GetPath())
-        index = self._list_options.index(new_value)
+        self._set_attribute_values([attr], new_value)
 
-        # OM-75480: For props inside session layer, it will always change specs
-        # in the session layer to avoid shadowing. Why it needs to be def is that
-        # session layer is used for several runtime data for now as built-in cameras,
-        # MDL material params, and etc. Not all of them create runtime prims inside
-        # session layer. For those that are not defined inside session layer, we should
-        # avoid leaving delta inside other sublayers as they are shadowed and useless after
-        # stage close.
-        target_layer, _ = omni.usd.find_spec_on_session_or_its_sublayers(
-            self._stage, attr.GetPath().GetPrimPath(), lambda spec: spec.specifier == Sdf.SpecifierDef
+    def _set_attribute_values(self, attributes: List[Usd.Attribute], new_value: str):
+        index = self._list_options.index(new_value)
+        omni.kit.commands.execute(
+            "ChangePropertiesCommand",
+            changes=[
+                {"prop_path": attr.GetPath(), "value": index, "target_layer": self._get_target_layer(attr)}
+                for attr in attributes
+            ],
+            context_name=self._context_name,
         )
-        if not target_layer:
-            target_layer = self._stage.GetEditTarget().GetLayer()
-        with omni.kit.undo.group():
-            omni.kit.commands.execute(
-                "ChangeProperty",
-                prop_path=attribute_path,
-                value=index,
-                target_layer=target_layer,
-                prev=None,
-                usd_context_name=self._context_name,
-            )
 
     def _get_attribute_value(self, attr) -> str:
         value: int = attr.Get()
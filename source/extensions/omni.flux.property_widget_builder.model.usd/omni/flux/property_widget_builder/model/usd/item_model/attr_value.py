@@ -17,7 +17,7 @@
 
 import abc
 from copy import deepcopy
-from typing import Any, Callable, List, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 import carb
 import omni.client
@@ -29,7 +29,7 @@ from omni.flux.property_widget_builder.widget import Serializable as _Serializab
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.utils.common import path_utils as _path_utils
-from pxr import Gf, Sdf
+from pxr import Gf, Sdf, Usd
 
 from ..mapping import MULTICHANNEL_BUILDER_TABLE, TYPE_BUILDER_TABLE, VEC_TYPES, VecType
 from ..utils import get_default_attribute_value as _get_default_attribute_value
@@ -78,6 +78,7 @@ class UsdAttributeBase(_Serializable, abc.ABC):
         self._not_implemented = not_implemented
         self._ignore_refresh = False
         self._attributes = None
+        self._attribute_handles = None  # One attribute per attribute path, resolved lazily
 
     def init_attributes(self):
         # cache the attributes
@@ -220,6 +221,48 @@ class UsdAttributeBase(_Serializable, abc.ABC):
         """Set internal value from a widget value"""
         self._value = new_value
 
+    def _get_attribute_handles(self) -> List[Optional[Usd.Attribute]]:
+        """
+        Get the attribute of every attribute path, or None if the prim doesn't exist.
+
+        The attributes are cached for the lifetime of the model and only resolved again when their prim was removed, so
+        reading or writing the values of a large selection doesn't look up every prim each time.
+        """
+        if self._attribute_handles is None:
+            self._attribute_handles = [None] * len(self._attribute_paths)
+        for index, attribute_path in enumerate(self._attribute_paths):
+            attr = self._attribute_handles[index]
+            if attr is not None and attr.GetPrim().IsValid():
+                continue
+            prim = self._stage.GetPrimAtPath(attribute_path.GetPrimPath())
+            self._attribute_handles[index] = prim.GetAttribute(attribute_path.name) if prim.IsValid() else None
+        return self._attribute_handles
+
+    def _get_target_layer(self, attr: Usd.Attribute) -> Sdf.Layer:
+        """Get the layer a new value of the attribute should be authored on"""
+        # OM-75480: For props inside session layer, it will always change specs
+        # in the session layer to avoid shadowing. Why it needs to be def is that
+        # session layer is used for several runtime data for now as built-in cameras,
+        # MDL material params, and etc. Not all of them create runtime prims inside
+        # session layer. For those that are not defined inside session layer, we should
+        # avoid leaving delta inside other sublayers as they are shadowed and useless after
+        # stage close.
+        target_layer, _ = omni.usd.find_spec_on_session_or_its_sublayers(
+            self._stage, attr.GetPath().GetPrimPath(), lambda spec: spec.specifier == Sdf.SpecifierDef
+        )
+        if not target_layer:
+            target_layer = self._stage.GetEditTarget().GetLayer()
+        return target_layer
+
+    def _set_attribute_values(self, attributes: List[Usd.Attribute], new_value):
+        """
+        Set the value of multiple attributes as a single undo step. Models that can author all the values at once should
+        override this method.
+        """
+        with omni.kit.undo.group():
+            for attr in attributes:
+                self._set_attribute_value(attr, new_value)
+
     def _read_value_from_usd(self):
         """
         Return:
@@ -234,23 +277,20 @@ class UsdAttributeBase(_Serializable, abc.ABC):
         value_was_set = False
         is_mixed = False
         self._values = []
-        for attribute_path in self._attribute_paths:
-            prim = self._stage.GetPrimAtPath(attribute_path.GetPrimPath())
-            if prim.IsValid():
-                attr = prim.GetAttribute(attribute_path.name)
-                if attr.IsValid() and not attr.IsHidden():
-                    value = self._get_attribute_value(attr)
-                    if values_read == 0:
-                        # If this is the first prim with this attribute, use it for the cached value.
-                        last_value = value
-                        if self._value is None or value != self._value:
-                            self._value = value  # we can set directly from the _get_attribute_value value
-                            value_was_set = True
-                    else:
-                        if last_value is not None and last_value != value:
-                            is_mixed = True
-                    values_read += 1
-                    self._values.append(value)
+        for attr in self._get_attribute_handles():
+            if attr is not None and attr.IsValid() and not attr.IsHidden():
+                value = self._get_attribute_value(attr)
+                if values_read == 0:
+                    # If this is the first prim with this attribute, use it for the cached value.
+                    last_value = value
+                    if self._value is None or value != self._value:
+                        self._value = value  # we can set directly from the _get_attribute_value value
+                        value_was_set = True
+                else:
+                    if last_value is not None and last_value != value:
+                        is_mixed = True
+                values_read += 1
+                self._values.append(value)
 
         if is_mixed != self._is_mixed:
             value_was_set = True
@@ -303,20 +343,18 @@ class UsdAttributeBase(_Serializable, abc.ABC):
         if not self._stage:
             return False
 
-        need_refresh = False
-        for attribute_path in self._attribute_paths:
-            prim = self._stage.GetPrimAtPath(attribute_path.GetPrimPath())
-            if prim.IsValid():
-                attr = prim.GetAttribute(attribute_path.name)
-                if not attr.IsValid():
-                    continue
-                current_value = self._get_attribute_value(attr)
-                if current_value != self._value:
-                    need_refresh = True
-                    self._ignore_refresh = True
-                    self._set_attribute_value(attr, self._value)
-                    self._ignore_refresh = False
-        if need_refresh:
+        # Gather every attribute to change first to write them all at once
+        attributes = [
+            attr
+            for attr in self._get_attribute_handles()
+            if attr is not None and attr.IsValid() and self._get_attribute_value(attr) != self._value
+        ]
+        if attributes:
+            self._ignore_refresh = True
+            try:
+                self._set_attribute_values(attributes, self._value)
+            finally:
+                self._ignore_refresh = False
             self.refresh()
             return True
         # value was not changed, but we do want to refresh the delegate
@@ -426,11 +464,9 @@ class UsdAttributeValueModel(UsdAttributeBase, _ItemValueModel):
 
     # TODO: Remove usages after dealing with Asset path type. Most cases would be better served with get_value().
     def get_attributes_raw_value(self, element_current_idx) -> Optional[Any]:
-        prim = self._stage.GetPrimAtPath(self._attribute_paths[element_current_idx].GetPrimPath())
-        if prim.IsValid():
-            attr = prim.GetAttribute(self._attribute_paths[element_current_idx].name)
-            if attr.IsValid() and not attr.IsHidden():
-                return attr.Get()
+        attr = self._get_attribute_handles()[element_current_idx]
+        if attr is not None and attr.IsValid() and not attr.IsHidden():
+            return attr.Get()
         return None
 
     def _get_attribute_value(self, attr):
@@ -439,8 +475,13 @@ class UsdAttributeValueModel(UsdAttributeBase, _ItemValueModel):
             return value.path
         return value
 
-    def _set_attribute_value(self, attr, new_value):
-        attribute_path = str(attr.GetPath())
+    def _validate_attribute_value(self, new_value) -> Tuple[bool, Any]:
+        """
+        Prepare a widget value to be authored on the attributes.
+
+        Returns:
+            True if the value can be authored, and the value to author
+        """
         if self._type_name == Sdf.ValueTypeNames.Asset:  # noqa SIM102
             if isinstance(new_value, str):
                 # Force textures to always use forward slashes, and check that the path is valid
@@ -449,40 +490,35 @@ class UsdAttributeValueModel(UsdAttributeBase, _ItemValueModel):
                     edit_target_layer = self._stage.GetEditTarget().GetLayer()
                     is_valid = new_value == "" or _path_utils.is_file_path_valid(new_value, layer=edit_target_layer)
                     if not is_valid:
-                        self._has_wrong_value = True
-                        return
+                        return False, new_value
                     absolute_path = omni.client.normalize_url(edit_target_layer.ComputeAbsolutePath(new_value))
                     new_value = Sdf.AssetPath(new_value.replace("\\", "/"), absolute_path.replace("\\", "/"))
             elif isinstance(new_value, Sdf.AssetPath):
                 if self.metadata and self.metadata.get("colorSpace"):
                     edit_target_layer = self._stage.GetEditTarget().GetLayer()
                     if not _path_utils.is_file_path_valid(new_value.path, layer=edit_target_layer):
-                        self._has_wrong_value = True
-                        return
+                        return False, new_value
             else:
                 raise NotImplementedError(f"Unknown type {new_value}")
-        self._has_wrong_value = False
+        return True, new_value
 
-        # OM-75480: For props inside session layer, it will always change specs
-        # in the session layer to avoid shadowing. Why it needs to be def is that
-        # session layer is used for several runtime data for now as built-in cameras,
-        # MDL material params, and etc. Not all of them create runtime prims inside
-        # session layer. For those that are not defined inside session layer, we should
-        # avoid leaving delta inside other sublayers as they are shadowed and useless after
-        # stage close.
-        target_layer, _ = omni.usd.find_spec_on_session_or_its_sublayers(
-            self._stage, attr.GetPath().GetPrimPath(), lambda spec: spec.specifier == Sdf.SpecifierDef
-        )
-        if not target_layer:
-            target_layer = self._stage.GetEditTarget().GetLayer()
+    def _set_attribute_value(self, attr, new_value):
+        self._set_attribute_values([attr], new_value)
+
+    def _set_attribute_values(self, attributes: List[Usd.Attribute], new_value):
+        is_valid, new_value = self._validate_attribute_value(new_value)
+        if not is_valid:
+            self._has_wrong_value = True
+            return
+        self._has_wrong_value = False
 
         omni.kit.commands.execute(
-            "ChangeProperty",
-            prop_path=attribute_path,
-            value=new_value,
-            target_layer=target_layer,
-            prev=None,
-            usd_context_name=self._context_name,
+            "ChangePropertiesCommand",
+            changes=[
+                {"prop_path": attr.GetPath(), "value": new_value, "target_layer": self._get_target_layer(attr)}
+                for attr in attributes
+            ],
+            context_name=self._context_name,
         )
 
     def _on_dirty(self):
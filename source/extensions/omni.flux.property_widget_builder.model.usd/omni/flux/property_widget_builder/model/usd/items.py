@@ -108,6 +108,11 @@ class USDAttributeItem(_Item):
         )
         return default_attr
 
+    @property
+    def attribute_paths(self) -> List[Sdf.Path]:
+        """The USD attribute(s) the item represents"""
+        return self._attribute_paths
+
     def refresh(self):
         self._validate_attribute_exists()
         super().refresh()
@@ -387,6 +392,11 @@ class _BaseListModelItem(_Item):
         )
         return default_attr
 
+    @property
+    def attribute_paths(self) -> List[Sdf.Path]:
+        """The USD attribute(s) the item represents"""
+        return self._attribute_paths
+
     def __get_all_attributes(self):
         attributes = set()
         for value_model in self.value_models:
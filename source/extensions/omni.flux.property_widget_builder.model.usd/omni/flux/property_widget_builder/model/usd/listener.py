@@ -16,10 +16,12 @@
 """
 
 import typing
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
 
 from omni.flux.utils.common import reset_default_attrs as _reset_default_attrs
-from pxr import Tf, Usd
+from omni.flux.utils.common.usd_notice import UsdNoticeSubscription as _UsdNoticeSubscription
+from omni.flux.utils.common.usd_notice import subscribe_objects_changed as _subscribe_objects_changed
+from pxr import Sdf, Usd
 
 if typing.TYPE_CHECKING:
     from .model import USDModel as _USDModel
@@ -57,12 +59,14 @@ class DisableAllListenersBlock:
 class USDListener:
     def __init__(self):
         """USD listener for the property widget"""
-        self._default_attr = {"_listeners": None, "_models": None, "_tmp_models": None}
+        self._default_attr = {"_listeners": None, "_models": None, "_tmp_models": None, "_prim_path_models": None}
         for attr, value in self._default_attr.items():
             setattr(self, attr, value)
         self._models: List["_USDModel"] = []
         self._tmp_models: List["_USDModel"] = []
-        self._listeners: Dict[Usd.Stage, Tf.Listener] = {}
+        self._listeners: Dict[Usd.Stage, _UsdNoticeSubscription] = {}
+        # Stage -> prim path -> models showing attributes of the prim
+        self._prim_path_models: Dict[Usd.Stage, Dict[Sdf.Path, List["_USDModel"]]] = {}
 
     def tmp_enable_all_listeners(self):
         for model in self._tmp_models:
@@ -77,7 +81,7 @@ class USDListener:
     def _enable_listener(self, stage: Usd.Stage):
         """Enable the USD listener to see if an attribute is changed"""
         assert stage not in self._listeners
-        self._listeners[stage] = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_usd_changed, stage)
+        self._listeners[stage] = _subscribe_objects_changed(stage, self._on_usd_changed)
 
     def _disable_listener(self, stage: Usd.Stage):
         """Disable the USD listener"""
@@ -86,30 +90,45 @@ class USDListener:
             self._listeners.pop(stage)
 
     def _on_usd_changed(self, notice, stage):
-        for model in self._models:
-            if model.supress_usd_events_during_widget_edit:
-                continue
+        prim_path_models = self._prim_path_models.get(stage)
+        if not prim_path_models:
+            return
 
-            if stage != model.stage:
+        # Only the models showing the prims of the changed attributes are notified, with the changed attributes
+        changed_attribute_paths: Dict[int, Tuple["_USDModel", Set[Sdf.Path]]] = {}
+        for changed_path in [*notice.GetChangedInfoOnlyPaths(), *notice.GetResyncedPaths()]:
+            if not changed_path.IsPropertyPath():  # not an attribute
                 continue
-
-            should_refresh = False
-            for resynced_path in [*notice.GetChangedInfoOnlyPaths(), *notice.GetResyncedPaths()]:
-                if "." not in str(resynced_path):  # not an attribute
+            for model in prim_path_models.get(changed_path.GetPrimPath(), []):
+                if model.supress_usd_events_during_widget_edit:
                     continue
-                attr = stage.GetPropertyAtPath(resynced_path)
-                if not attr.IsValid():
-                    continue
-                prim = attr.GetPrim()
-                if not prim.IsValid():
-                    continue
-                if prim.GetPath() not in model.prim_paths:
-                    continue
-                should_refresh = True
-                break
-
-            if should_refresh:
-                model.refresh()
+                changed_attribute_paths.setdefault(id(model), (model, set()))[1].add(changed_path)
+
+        for model, attribute_paths in changed_attribute_paths.values():
+            valid_attribute_paths = [
+                attribute_path
+                for attribute_path in attribute_paths
+                if model.get_attribute_items(attribute_path) and stage.GetPropertyAtPath(attribute_path).IsValid()
+            ]
+            if valid_attribute_paths:
+                model.refresh_attribute_paths(valid_attribute_paths)
+
+    def _index_model(self, model: "_USDModel"):
+        prim_path_models = self._prim_path_models.setdefault(model.stage, {})
+        for prim_path in model.prim_paths or []:
+            models = prim_path_models.setdefault(Sdf.Path(str(prim_path)), [])
+            if model not in models:
+                models.append(model)
+
+    def _unindex_model(self, model: "_USDModel"):
+        for stage, prim_path_models in list(self._prim_path_models.items()):
+            for prim_path, models in list(prim_path_models.items()):
+                if model in models:
+                    models.remove(model)
+                if not models:
+                    del prim_path_models[prim_path]
+            if not prim_path_models:
+                del self._prim_path_models[stage]
 
     def refresh_all(self):
         """Refresh all attributes"""
@@ -118,7 +137,7 @@ class USDListener:
 
     def add_model(self, model: "_USDModel"):
         """
-        Add a model and delegate to listen to
+        Add a model and delegate to listen to. Add the model again after changing its prim paths.
 
         Args:
             model: the model to listen
@@ -127,7 +146,11 @@ class USDListener:
         if not any(f for f in self._models if f.stage == model.stage):
             self._enable_listener(model.stage)
 
-        self._models.append(model)
+        # The prim paths of the model could have changed since it was added: re-index it
+        self._unindex_model(model)
+        if model not in self._models:
+            self._models.append(model)
+        self._index_model(model)
 
     def remove_model(self, model: "_USDModel"):
         """
@@ -140,6 +163,7 @@ class USDListener:
             return
         if model in self._models:
             self._models.remove(model)
+        self._unindex_model(model)
         if not any(f for f in self._models if f.stage == model.stage):
             self._disable_listener(model.stage)
 
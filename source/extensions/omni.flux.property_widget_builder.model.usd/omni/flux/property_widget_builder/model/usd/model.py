@@ -17,7 +17,7 @@
 
 import abc
 import typing
-from typing import List, Union
+from typing import Dict, Iterable, List, Union
 
 import omni.usd
 from omni.flux.property_widget_builder.widget import Model as _Model
@@ -48,6 +48,7 @@ class USDModel(_Model):
         self._context_name = context_name
         self._context = omni.usd.get_context(self._context_name)
         self._prim_paths = []
+        self._attribute_items = {}
         self._subscriptions = []
         self.supress_usd_events_during_widget_edit = False
 
@@ -67,6 +68,7 @@ class USDModel(_Model):
                 "_context_name": None,
                 "_context": None,
                 "_prim_paths": None,
+                "_attribute_items": None,
                 "_subscriptions": None,
                 "_value_changed_callbacks": None,
             }
@@ -122,12 +124,51 @@ class USDModel(_Model):
             for child in _item.children:
                 add_listeners(child)
 
+        def index_attribute_paths(_item):
+            for attribute_path in getattr(_item, "attribute_paths", None) or []:
+                self._attribute_items.setdefault(attribute_path, []).append(_item)
+            for child in _item.children:
+                index_attribute_paths(child)
+
         self._subscriptions.clear()
         self._value_changed_callbacks.clear()
+        self._attribute_items = {}
         for item in items:
             add_listeners(item)
+            index_attribute_paths(item)
         super().set_items(items)
 
+    def get_attribute_items(self, attribute_path: Sdf.Path) -> List[Union["_ItemGroup", _USDAttributeItem]]:
+        """
+        Get the items representing an attribute
+
+        Args:
+            attribute_path: the path of the USD attribute
+
+        Returns:
+            The items representing the attribute. Empty if the attribute is not shown.
+        """
+        return self._attribute_items.get(attribute_path, [])
+
+    def refresh_attribute_paths(self, attribute_paths: Iterable[Sdf.Path]) -> bool:
+        """
+        Refresh only the items representing the given attributes
+
+        Args:
+            attribute_paths: the path of the USD attributes that changed
+
+        Returns:
+            True if at least 1 item was refreshed, False if none of the attributes are shown
+        """
+        items: Dict[int, Union["_ItemGroup", _USDAttributeItem]] = {}
+        for attribute_path in attribute_paths:
+            for item in self._attribute_items.get(attribute_path, []):
+                items[id(item)] = item
+        for item in items.values():
+            item.refresh()
+            self._item_changed(item)
+        return bool(items)
+
     def _on_item_model_begin_edit(self, _):
         self.supress_usd_events_during_widget_edit = True
 
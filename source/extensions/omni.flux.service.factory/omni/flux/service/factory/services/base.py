@@ -19,7 +19,7 @@ import abc
 from typing import Any, Optional, Type, Union
 
 from fast_version import VersionedAPIRouter
-from fastapi import Depends, Path, Query
+from fastapi import Depends, Path, Query, Response
 from omni.flux.factory.base import PluginBase
 from omni.flux.service.shared import BaseServiceModel
 from omni.services.core import exceptions
@@ -142,6 +142,17 @@ class ServiceBase(PluginBase, abc.ABC):
         """
         return Query(default_value, description=description)
 
+    @staticmethod
+    def not_modified_response() -> Response:
+        """
+        Get an empty "304 Not Modified" response, to reply to a query for data that didn't change since the revision
+        known by the client.
+
+        Returns:
+            The HTTP response
+        """
+        return Response(status_code=304)
+
     @staticmethod
     def raise_error(status_code: int, details: Union[Exception, str]):
         """
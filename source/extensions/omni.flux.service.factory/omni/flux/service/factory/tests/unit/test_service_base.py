@@ -17,7 +17,7 @@
 
 from unittest.mock import call, patch
 
-from fastapi import Depends, Query
+from fastapi import Depends, Query, Response
 from omni.flux.service.factory import ServiceBase
 from omni.flux.service.shared import BaseServiceModel
 from omni.kit.test.async_unittest import AsyncTestCase
@@ -127,6 +127,18 @@ class TestServiceBase(AsyncTestCase):
         self.assertEqual(query.default, expected_value)
         self.assertEqual(query.description, expected_description)
 
+    async def test_not_modified_response_returns_empty_304_response(self):
+        # Arrange
+        pass
+
+        # Act
+        value = ServiceBase.not_modified_response()
+
+        # Assert
+        self.assertIsInstance(value, Response)
+        self.assertEqual(304, value.status_code)
+        self.assertEqual(b"", value.body)
+
     async def test_raise_error_raises_kit_service_base_exception(self):
         # Arrange
         error_code = 404
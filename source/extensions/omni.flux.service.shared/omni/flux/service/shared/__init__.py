@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
-__all__ = ["BaseServiceModel"]
+__all__ = ["BaseServiceModel", "PaginatedQueryModel", "PaginatedResponseModel", "paginate"]
 
 from .base_model import BaseServiceModel
+from .pagination import PaginatedQueryModel, PaginatedResponseModel, paginate
@@ -0,0 +1,101 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["PaginatedQueryModel", "PaginatedResponseModel", "paginate"]
+
+import base64
+import json
+from typing import Any
+
+from pydantic import Field
+
+from .base_model import BaseServiceModel
+
+
+class PaginatedQueryModel(BaseServiceModel):
+    """
+    Base Model for the queries returning a list that can be split in pages.
+
+    Attributes:
+        cursor: The `next_cursor` value of the previous page. None to get the first page.
+        limit: The maximum number of items in a page. None to get all the items in a single page.
+        revision: The `revision` value of a previous response. If the data didn't change since, the service can skip
+                  the query and reply that the data was not modified.
+    """
+
+    cursor: str | None = None
+    limit: int | None = Field(None, ge=1)
+    revision: str | None = None
+
+
+class PaginatedResponseModel(BaseServiceModel):
+    """
+    Base Model for the responses containing a page of a list.
+
+    Attributes:
+        revision: The revision of the data the page was built from. None if the data is not revisioned.
+        next_cursor: The cursor to get the next page. None if this is the last page.
+    """
+
+    revision: str | None = None
+    next_cursor: str | None = None
+
+
+def _encode_cursor(offset: int, revision: str | None) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset, "revision": revision}).encode("utf8")).decode("utf8")
+
+
+def _decode_cursor(cursor: str) -> tuple[int, str | None]:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("utf8")))
+        return int(data["offset"]), data["revision"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"The cursor is not valid: {cursor}") from e
+
+
+def paginate(
+    items: list[Any], cursor: str | None, limit: int | None, revision: str | None = None
+) -> tuple[list[Any], str | None]:
+    """
+    Get a page of a list of items
+
+    Args:
+        items: The full list of items
+        cursor: The cursor returned with the previous page. None to get the first page.
+        limit: The maximum number of items in the page. None to get all the remaining items.
+        revision: The revision of the items. A cursor built for another revision is rejected, since the offsets it
+                  points to might have changed.
+
+    Raises:
+        ValueError: If the cursor is not valid or was built for another revision
+
+    Returns:
+        The items in the page and the cursor to get the next page, or None if this is the last page
+    """
+    offset = 0
+    if cursor:
+        offset, cursor_revision = _decode_cursor(cursor)
+        if cursor_revision != revision:
+            raise ValueError("The data changed since the cursor was returned. Query the first page again.")
+        if offset < 0:
+            raise ValueError(f"The cursor is not valid: {cursor}")
+
+    if limit is None:
+        return items[offset:], None
+
+    end = offset + limit
+    return items[offset:end], _encode_cursor(end, revision) if end < len(items) else None
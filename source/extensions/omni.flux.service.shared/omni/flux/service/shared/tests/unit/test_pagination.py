@@ -0,0 +1,85 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TestPagination"]
+
+import omni.kit.test
+from omni.flux.service.shared import paginate
+
+
+class TestPagination(omni.kit.test.AsyncTestCase):
+    async def test_paginate_no_limit_should_return_all_items(self):
+        # Act
+        page, next_cursor = paginate(list(range(5)), None, None, "rev-1")
+
+        # Assert
+        self.assertListEqual(list(range(5)), page)
+        self.assertIsNone(next_cursor)
+
+    async def test_paginate_should_walk_all_pages(self):
+        # Arrange
+        items = list(range(5))
+        pages = []
+        cursor = None
+
+        # Act
+        while True:
+            page, cursor = paginate(items, cursor, 2, "rev-1")
+            pages.append(page)
+            if cursor is None:
+                break
+
+        # Assert
+        self.assertListEqual([[0, 1], [2, 3], [4]], pages)
+
+    async def test_paginate_exact_last_page_should_not_return_cursor(self):
+        # Act
+        page, next_cursor = paginate(list(range(4)), None, 4, "rev-1")
+
+        # Assert
+        self.assertListEqual(list(range(4)), page)
+        self.assertIsNone(next_cursor)
+
+    async def test_paginate_cursor_without_limit_should_return_remaining_items(self):
+        # Arrange
+        _, cursor = paginate(list(range(5)), None, 2, None)
+
+        # Act
+        page, next_cursor = paginate(list(range(5)), cursor, None, None)
+
+        # Assert
+        self.assertListEqual([2, 3, 4], page)
+        self.assertIsNone(next_cursor)
+
+    async def test_paginate_other_revision_should_raise(self):
+        # Arrange
+        _, cursor = paginate(list(range(5)), None, 2, "rev-1")
+
+        # Act
+        with self.assertRaises(ValueError) as context:
+            paginate(list(range(5)), cursor, 2, "rev-2")
+
+        # Assert
+        self.assertIn("The data changed", str(context.exception))
+
+    async def test_paginate_invalid_cursor_should_raise(self):
+        # Act
+        with self.assertRaises(ValueError) as context:
+            paginate(list(range(5)), "not-a-cursor", 2, "rev-1")
+
+        # Assert
+        self.assertIn("The cursor is not valid", str(context.exception))
@@ -16,7 +16,9 @@
 """
 
 import omni.usd
-from pxr import Tf, Usd
+from omni.flux.utils.common.usd_notice import ObjectsChangedSummary as _ObjectsChangedSummary
+from omni.flux.utils.common.usd_notice import subscribe_objects_changed as _subscribe_objects_changed
+from pxr import Usd
 from pydantic import PrivateAttr
 
 from .base import StageManagerUSDListenerPlugin as _StageManagerUSDListenerPlugin
@@ -25,6 +27,8 @@ from .base import StageManagerUSDListenerPlugin as _StageManagerUSDListenerPlugi
 class StageManagerUSDNoticeListenerPlugin(_StageManagerUSDListenerPlugin[Usd.Notice.ObjectsChanged]):
     """
     A listener triggered whenever a USD notice is broadcast.
+
+    The notices are dispatched once per frame, with the changes of all the notices sent during the frame.
     """
 
     event_type: type = Usd.Notice.ObjectsChanged
@@ -38,7 +42,7 @@ class StageManagerUSDNoticeListenerPlugin(_StageManagerUSDListenerPlugin[Usd.Not
 
     def setup(self):
         stage = omni.usd.get_context(self.context_name).get_stage()
-        self._usd_listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_usd_event, stage)
+        self._usd_listener = _subscribe_objects_changed(stage, self._on_usd_event, deferred=True)
 
-    def _on_usd_event(self, notice: Usd.Notice.ObjectsChanged, _: Usd.Stage):
+    def _on_usd_event(self, notice: _ObjectsChangedSummary, _: Usd.Stage):
         self._event_occurred(notice)
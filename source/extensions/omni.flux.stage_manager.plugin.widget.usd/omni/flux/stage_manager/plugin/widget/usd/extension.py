@@ -22,6 +22,7 @@ from omni.flux.stage_manager.factory import get_instance as _get_factory_instanc
 
 from .prim_tree import PrimTreeWidgetPlugin as _PrimTreeWidgetPlugin
 from .state_is_visible import IsVisibleStateWidgetPlugin as _IsVisibleStateWidgetPlugin
+from .visibility_cache import destroy_visibility_caches as _destroy_visibility_caches
 
 
 class StageManagerUSDWidgetPluginsExtension(omni.ext.IExt):
@@ -37,3 +38,4 @@ class StageManagerUSDWidgetPluginsExtension(omni.ext.IExt):
         carb.log_info("[omni.flux.stage_manager.plugin.widget.usd] Shutdown")
 
         _get_factory_instance().unregister_plugins(self._PLUGINS)
+        _destroy_visibility_caches()
@@ -22,6 +22,7 @@ from omni import ui
 from pxr import Usd, UsdGeom
 
 from .base import StageManagerStateWidgetPlugin as _StageManagerStateWidgetPlugin
+from .visibility_cache import get_visibility_cache as _get_visibility_cache
 
 if TYPE_CHECKING:
     from omni.flux.stage_manager.factory.plugins.tree_plugin import StageManagerTreeItem as _StageManagerTreeItem
@@ -35,7 +36,8 @@ class IsVisibleStateWidgetPlugin(_StageManagerStateWidgetPlugin):
         enabled = prim and UsdGeom.Imageable(prim)
 
         if enabled:
-            is_visible = UsdGeom.Imageable(prim).ComputeVisibility(Usd.TimeCode.Default()) != UsdGeom.Tokens.invisible
+            # The cache reuses the visibility of the parent rows instead of walking the ancestors of every row
+            is_visible = _get_visibility_cache(self.context_name).is_visible(prim)
 
             icon = "Eye" if is_visible else "EyeOff"
             tooltip = (
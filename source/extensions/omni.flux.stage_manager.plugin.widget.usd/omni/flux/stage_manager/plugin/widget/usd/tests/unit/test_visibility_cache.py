@@ -0,0 +1,146 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["TestVisibilityCache"]
+
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+from omni.flux.stage_manager.plugin.widget.usd.visibility_cache import (
+    VisibilityCache,
+    destroy_visibility_caches,
+    get_visibility_cache,
+)
+from pxr import Sdf, Usd, UsdGeom
+
+
+class TestVisibilityCache(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+        self.stage = self.context.get_stage()
+        for path in ["/World/Group/Mesh", "/World/Other/Mesh"]:
+            UsdGeom.Xform.Define(self.stage, path)
+        self.cache = VisibilityCache()
+
+    # After running each test
+    async def tearDown(self):
+        self.cache.destroy()
+        self.cache = None
+        if self.context.get_stage():
+            await self.context.close_stage_async()
+        self.stage = None
+
+    def _is_visible(self, path: str) -> bool:
+        return self.cache.is_visible(self.stage.GetPrimAtPath(path))
+
+    def _get_cached_paths(self) -> set[Sdf.Path]:
+        return set(self.cache._visibility)  # noqa PLW0212
+
+    async def test_is_visible_should_match_computed_visibility(self):
+        # Arrange
+        UsdGeom.Imageable(self.stage.GetPrimAtPath("/World/Group")).MakeInvisible()
+
+        # Act
+        group_mesh_visible = self._is_visible("/World/Group/Mesh")
+        other_mesh_visible = self._is_visible("/World/Other/Mesh")
+
+        # Assert
+        self.assertFalse(group_mesh_visible)
+        self.assertTrue(other_mesh_visible)
+        self.assertIn(Sdf.Path("/World"), self._get_cached_paths())
+
+    async def test_visibility_change_should_invalidate_subtree_only(self):
+        # Arrange
+        self._is_visible("/World/Group/Mesh")
+        self._is_visible("/World/Other/Mesh")
+
+        # Act
+        UsdGeom.Imageable(self.stage.GetPrimAtPath("/World/Group")).MakeInvisible()
+        # The visibility attribute is authored: the next change is an info-only change
+        self._is_visible("/World/Group/Mesh")
+        cached_paths = self._get_cached_paths()
+        UsdGeom.Imageable(self.stage.GetPrimAtPath("/World/Group")).MakeVisible()
+        self.cache._update()  # noqa PLW0212
+
+        # Assert
+        self.assertIn(Sdf.Path("/World/Group/Mesh"), cached_paths)
+        self.assertSetEqual(
+            {Sdf.Path("/World"), Sdf.Path("/World/Other"), Sdf.Path("/World/Other/Mesh")}, self._get_cached_paths()
+        )
+        self.assertTrue(self._is_visible("/World/Group/Mesh"))
+
+    async def test_purpose_change_should_keep_cached_visibility(self):
+        # Arrange
+        UsdGeom.Imageable(self.stage.GetPrimAtPath("/World/Group")).CreatePurposeAttr(UsdGeom.Tokens.default_)
+        self._is_visible("/World/Group/Mesh")
+        cached_paths = self._get_cached_paths()
+
+        # Act
+        # The purpose doesn't change the computed visibility
+        UsdGeom.Imageable(self.stage.GetPrimAtPath("/World/Group")).GetPurposeAttr().Set(UsdGeom.Tokens.guide)
+        self.cache._update()  # noqa PLW0212
+
+        # Assert
+        self.assertSetEqual(cached_paths, self._get_cached_paths())
+        self.assertEqual(
+            UsdGeom.Imageable(self.stage.GetPrimAtPath("/World/Group/Mesh")).ComputeVisibility(Usd.TimeCode.Default())
+            != UsdGeom.Tokens.invisible,
+            self._is_visible("/World/Group/Mesh"),
+        )
+
+    async def test_ancestor_resync_should_invalidate_subtree(self):
+        # Arrange
+        self._is_visible("/World/Group/Mesh")
+        self._is_visible("/World/Other/Mesh")
+
+        # Act
+        self.stage.GetPrimAtPath("/World/Group").SetTypeName("Scope")
+        self.cache._update()  # noqa PLW0212
+
+        # Assert
+        self.assertSetEqual(
+            {Sdf.Path("/World"), Sdf.Path("/World/Other"), Sdf.Path("/World/Other/Mesh")}, self._get_cached_paths()
+        )
+
+    async def test_closed_stage_should_clear_cache(self):
+        # Arrange
+        self._is_visible("/World/Group/Mesh")
+
+        # Act
+        await self.context.close_stage_async()
+        # The stage events are dispatched on the next update
+        await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertFalse(self.cache._listener.listening)  # noqa PLW0212
+        self.assertSetEqual(set(), self._get_cached_paths())
+
+    async def test_destroy_visibility_caches_should_destroy_shared_caches(self):
+        # Arrange
+        cache = get_visibility_cache()
+        cache.is_visible(self.stage.GetPrimAtPath("/World/Group/Mesh"))
+
+        # Act
+        destroy_visibility_caches()
+
+        # Assert
+        self.assertFalse(cache._listener.listening)  # noqa PLW0212
+        self.assertDictEqual({}, cache._visibility)  # noqa PLW0212
+        self.assertIsNot(cache, get_visibility_cache())
+        destroy_visibility_caches()
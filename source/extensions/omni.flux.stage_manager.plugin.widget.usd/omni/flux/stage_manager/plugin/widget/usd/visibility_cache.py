@@ -0,0 +1,131 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["VisibilityCache", "destroy_visibility_caches", "get_visibility_cache"]
+
+from omni.flux.utils.common.context_listener import ContextInstances as _ContextInstances
+from omni.flux.utils.common.context_listener import ContextStageListener as _ContextStageListener
+from pxr import Sdf, Usd, UsdGeom
+
+
+class VisibilityCache:
+    """
+    Cache of the computed visibility of the prims in a stage.
+
+    The visibility is computed top-down: a prim reuses the cached visibility of its parent instead of walking its
+    whole ancestor chain, so computing the visibility of every prim in a tree is linear in the number of prims.
+
+    Cached values are invalidated by subtree when the `ObjectsChanged` notices of the stage report a changed visibility
+    attribute or a resynced prim. The cache is dropped when another stage is opened or the stage is closed.
+    """
+
+    def __init__(self, context_name: str = ""):
+        self._visibility: dict[Sdf.Path, bool] = {}
+        self._invalid_paths: set[Sdf.Path] = set()
+        self._listener = _ContextStageListener(
+            context_name, self._on_objects_changed, name="VisibilityCache", on_stage_changed=self.clear
+        )
+
+    def is_visible(self, prim: Usd.Prim) -> bool:
+        """
+        Get the computed visibility of a prim, like `UsdGeom.Imageable.ComputeVisibility` at the default time code.
+
+        Args:
+            prim: The prim to get the visibility of
+
+        Returns:
+            False if the prim or one of its ancestors is invisible, True otherwise
+        """
+        self._update()
+
+        # Find the closest ancestor with a cached visibility
+        uncached_prims = []
+        visible = True
+        while prim and not prim.IsPseudoRoot():
+            cached = self._visibility.get(prim.GetPath())
+            if cached is not None:
+                visible = cached
+                break
+            uncached_prims.append(prim)
+            prim = prim.GetParent()
+
+        # Compute the visibility down from this ancestor
+        for uncached_prim in reversed(uncached_prims):
+            if visible:
+                imageable = UsdGeom.Imageable(uncached_prim)
+                if imageable:
+                    visible = imageable.GetVisibilityAttr().Get(Usd.TimeCode.Default()) != UsdGeom.Tokens.invisible
+            self._visibility[uncached_prim.GetPath()] = visible
+
+        return visible
+
+    def clear(self):
+        """Drop all the cached values"""
+        self._visibility.clear()
+        self._invalid_paths.clear()
+
+    def destroy(self):
+        self._listener.destroy()
+        self.clear()
+
+    def _on_objects_changed(self, notice, _sender):
+        if not self._visibility:
+            return
+        self._invalid_paths.update(path.GetPrimPath() for path in notice.GetResyncedPaths())
+        self._invalid_paths.update(
+            path.GetPrimPath()
+            for path in notice.GetChangedInfoOnlyPaths()
+            if path.IsPropertyPath() and path.name == UsdGeom.Tokens.visibility
+        )
+
+    def _update(self):
+        # Listen to the stage of the context, the cache is cleared when another stage is opened
+        self._listener.update()
+
+        if not self._invalid_paths:
+            return
+
+        invalid_roots = set(Sdf.Path.RemoveDescendentPaths(list(self._invalid_paths)))
+        self._invalid_paths.clear()
+        if Sdf.Path.absoluteRootPath in invalid_roots:
+            self._visibility.clear()
+            return
+
+        for path in list(self._visibility):
+            if any(prefix in invalid_roots for prefix in path.GetPrefixes()):
+                del self._visibility[path]
+
+
+_CACHES = _ContextInstances(VisibilityCache)
+
+
+def get_visibility_cache(context_name: str = "") -> VisibilityCache:
+    """
+    Get the visibility cache shared by every widget working on a USD context
+
+    Args:
+        context_name: The USD context name
+
+    Returns:
+        The visibility cache of the context
+    """
+    return _CACHES.get(context_name)
+
+
+def destroy_visibility_caches():
+    """Drop the visibility cache of every USD context. Called when the extension shuts down."""
+    _CACHES.destroy()
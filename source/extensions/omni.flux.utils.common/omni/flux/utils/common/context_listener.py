@@ -0,0 +1,145 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = ["ContextInstances", "ContextStageListener"]
+
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+import omni.usd
+from pxr import Usd
+
+from .usd_notice import UsdNoticeSubscription
+from .usd_notice import subscribe_objects_changed as _subscribe_objects_changed
+
+_T = TypeVar("_T")
+
+
+class ContextStageListener:
+    """
+    Listen to the `Usd.Notice.ObjectsChanged` notices of the stage opened in a USD context, through the USD notice
+    dispatcher of the stage.
+
+    The subscription follows the stage of the context: it is created for the current stage by `update`, moved to the
+    new stage when another stage is opened and revoked as soon as the stage is closed.
+    """
+
+    def __init__(
+        self,
+        context_name: str,
+        callback: Callable,
+        name: Optional[str] = None,
+        on_stage_changed: Optional[Callable[[], None]] = None,
+        deferred: bool = False,
+    ):
+        """
+        Args:
+            context_name: the USD context name
+            callback: called with the notice and the stage, like the subscribers of the USD notice dispatcher
+            name: the name of the subscriber in the profiler statistics
+            on_stage_changed: called when the listened stage changes: another stage was opened or the stage was closed
+            deferred: call the callback once at the next frame instead of once per notice
+        """
+        self._context = omni.usd.get_context(context_name)
+        self._callback = callback
+        self._name = name
+        self._on_stage_changed = on_stage_changed
+        self._deferred = deferred
+
+        self._stage_id = None
+        self._subscription: Optional[UsdNoticeSubscription] = None
+        self._stage_event_sub = self._context.get_stage_event_stream().create_subscription_to_pop(
+            self._on_stage_event, name=f"ContextStageListener {name or ''}".strip()
+        )
+
+    @property
+    def listening(self) -> bool:
+        """Whether a stage is currently listened to"""
+        return self._subscription is not None
+
+    def update(self) -> Optional[Usd.Stage]:
+        """
+        Listen to the current stage of the context if it's not listened to yet
+
+        Returns:
+            The current stage of the context, or None if no stage is opened
+        """
+        stage = self._context.get_stage()
+        stage_id = self._context.get_stage_id() if stage else None
+        if stage_id != self._stage_id:
+            self._revoke()
+            if stage:
+                self._subscription = _subscribe_objects_changed(
+                    stage, self._callback, name=self._name, deferred=self._deferred
+                )
+            self._stage_id = stage_id
+            if self._on_stage_changed:
+                self._on_stage_changed()
+        return stage
+
+    def destroy(self):
+        self._revoke()
+        self._stage_id = None
+        self._stage_event_sub = None
+
+    def _revoke(self):
+        if self._subscription:
+            self._subscription.Revoke()
+        self._subscription = None
+
+    def _on_stage_event(self, event):
+        if event.type != int(omni.usd.StageEventType.CLOSED) or self._stage_id is None:
+            return
+        # Don't keep the closed stage alive, and drop what was computed for it
+        self._revoke()
+        self._stage_id = None
+        if self._on_stage_changed:
+            self._on_stage_changed()
+
+
+class ContextInstances(Generic[_T]):
+    """
+    The instances of a class shared by everything working on the same USD context.
+
+    The owning extension should call `destroy` when it shuts down, so the instances stop listening to their stage.
+    """
+
+    def __init__(self, factory: Callable[[str], _T]):
+        """
+        Args:
+            factory: creates the instance of a context, from the context name. The instances must have a `destroy`
+                     method.
+        """
+        self._factory = factory
+        self._instances: Dict[str, _T] = {}
+
+    def get(self, context_name: str = "") -> _T:
+        """
+        Args:
+            context_name: the USD context name
+
+        Returns:
+            The instance of the context, created on first access
+        """
+        if context_name not in self._instances:
+            self._instances[context_name] = self._factory(context_name)
+        return self._instances[context_name]
+
+    def destroy(self):
+        """Destroy every instance"""
+        for instance in self._instances.values():
+            instance.destroy()
+        self._instances.clear()
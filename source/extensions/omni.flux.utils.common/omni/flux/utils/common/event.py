@@ -15,6 +15,12 @@
 * limitations under the License.
 """
 
+import sys as _sys
+import time as _time
+
+from .event_profiler import get_callable_name as _get_callable_name
+from .event_profiler import get_event_profiler as _get_event_profiler
+
 
 class Event(set):
     """
@@ -22,7 +28,7 @@ class Event(set):
     call to each item in the list in ascending order by index.
     """
 
-    def __init__(self, *args, copy: bool = False, **kwargs):
+    def __init__(self, *args, copy: bool = False, name: str = None, **kwargs):
         """
         Init of a set function
 
@@ -34,13 +40,18 @@ class Event(set):
                 re-creating the button itself (and the event).
                 As a result, you could have an error like `RuntimeError: Set changed size during iteration`.
                 We don't set this to True by default to force the dev to be aware of the pattern he is doing.
+            name: the name of the event in the profiler statistics. By default, the function calling the event is used.
             **kwargs: any kwargs
         """
         super().__init__(*args, **kwargs)
         self.__copy = copy
+        self.__name = name
 
     def __call__(self, *args, **kwargs):
         """Called when the instance is “called” as a function"""
+        if _get_event_profiler().enabled:
+            self.__call_profiled(*args, **kwargs)
+            return
         # Call all the saved functions
         if self.__copy:
             for function in self.copy():
@@ -49,6 +60,23 @@ class Event(set):
             for function in self:
                 function(*args, **kwargs)
 
+    def __call_profiled(self, *args, **kwargs):
+        profiler = _get_event_profiler()
+        name = self.__name
+        if name is None:
+            # The frame calling the event is 2 levels up: the caller -> __call__ -> __call_profiled
+            frame = _sys._getframe(2)  # noqa PLW0212
+            name = f"{frame.f_globals.get('__name__')}.{frame.f_code.co_name}"
+
+        event_start = _time.perf_counter()
+        for function in self.copy() if self.__copy else self:
+            start = _time.perf_counter()
+            try:
+                function(*args, **kwargs)
+            finally:
+                profiler.record_subscriber(name, _get_callable_name(function), _time.perf_counter() - start)
+        profiler.record_event(name, _time.perf_counter() - event_start)
+
     def __repr__(self):
         """
         Called by the repr() built-in function to compute the “official”
@@ -0,0 +1,253 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "EventProfiler",
+    "EventStats",
+    "get_callable_name",
+    "get_event_profiler",
+]
+
+import contextlib
+import functools
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+_DEFAULT_SAMPLE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class EventStats:
+    """
+    Timing statistics of an event, or of a subscriber of an event. All the times are in seconds.
+    """
+
+    event_name: str
+    subscriber_name: Optional[str]  # None for the statistics of the whole event
+    call_count: int
+    total_time: float
+    max_time: float
+    p99_time: float  # Computed on the most recent calls only
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.call_count if self.call_count else 0.0
+
+
+class _Record:
+    __slots__ = ("call_count", "total_time", "max_time", "samples")
+
+    def __init__(self, sample_size: int):
+        self.call_count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.samples: Deque[float] = deque(maxlen=sample_size)
+
+    def add(self, duration: float):
+        self.call_count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self.samples.append(duration)
+
+    def to_stats(self, event_name: str, subscriber_name: Optional[str]) -> EventStats:
+        samples = sorted(self.samples)
+        p99_time = samples[min(len(samples) - 1, int(len(samples) * 0.99))] if samples else 0.0
+        return EventStats(
+            event_name=event_name,
+            subscriber_name=subscriber_name,
+            call_count=self.call_count,
+            total_time=self.total_time,
+            max_time=self.max_time,
+            p99_time=p99_time,
+        )
+
+
+def get_callable_name(function: Callable) -> str:
+    """
+    Get a readable name for a callable: the module and qualified name of the function or method
+
+    Args:
+        function: the callable to get the name of
+
+    Returns:
+        The name of the callable
+    """
+    if isinstance(function, functools.partial):
+        return get_callable_name(function.func)
+    qualified_name = getattr(function, "__qualname__", None) or type(function).__qualname__
+    module = getattr(function, "__module__", None)
+    return f"{module}.{qualified_name}" if module else qualified_name
+
+
+class EventProfiler:
+    """
+    Opt-in profiler of the `Event` objects. When enabled, every call of an event and of each of its subscribers is
+    timed.
+
+    The profiling is disabled by default and costs a single check per event call when disabled.
+    """
+
+    def __init__(self, sample_size: int = _DEFAULT_SAMPLE_SIZE):
+        """
+        Args:
+            sample_size: the number of most recent calls kept to compute the p99 time of an event or a subscriber
+        """
+        self.__enabled = False
+        self.__sample_size = sample_size
+        self.__lock = threading.Lock()
+        self.__event_records: Dict[str, _Record] = {}
+        self.__subscriber_records: Dict[Tuple[str, str], _Record] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the events are profiled or not"""
+        return self.__enabled
+
+    def enable(self):
+        """Start profiling the events"""
+        self.__enabled = True
+
+    def disable(self):
+        """Stop profiling the events. The recorded statistics are kept."""
+        self.__enabled = False
+
+    def reset(self):
+        """Clear the recorded statistics"""
+        with self.__lock:
+            self.__event_records.clear()
+            self.__subscriber_records.clear()
+
+    @contextlib.contextmanager
+    def profile(self, reset: bool = True):
+        """
+        Profile the events in a `with` block. The profiler is restored to its previous state at the end of the block.
+
+        Args:
+            reset: clear the recorded statistics before profiling
+        """
+        was_enabled = self.__enabled
+        if reset:
+            self.reset()
+        self.enable()
+        try:
+            yield self
+        finally:
+            self.__enabled = was_enabled
+
+    def record_subscriber(self, event_name: str, subscriber_name: str, duration: float):
+        """
+        Record the duration of a subscriber call
+
+        Args:
+            event_name: the name of the event
+            subscriber_name: the name of the subscriber
+            duration: the time the subscriber took, in seconds
+        """
+        key = (event_name, subscriber_name)
+        with self.__lock:
+            record = self.__subscriber_records.get(key)
+            if record is None:
+                record = self.__subscriber_records[key] = _Record(self.__sample_size)
+            record.add(duration)
+
+    def record_event(self, event_name: str, duration: float):
+        """
+        Record the duration of an event call, including all its subscribers
+
+        Args:
+            event_name: the name of the event
+            duration: the time the event took, in seconds
+        """
+        with self.__lock:
+            record = self.__event_records.get(event_name)
+            if record is None:
+                record = self.__event_records[event_name] = _Record(self.__sample_size)
+            record.add(duration)
+
+    def get_event_stats(self, event_name: Optional[str] = None) -> List[EventStats]:
+        """
+        Get the statistics of the events, slowest first
+
+        Args:
+            event_name: only get the statistics of this event
+
+        Returns:
+            The statistics of every recorded event, sorted by total time
+        """
+        with self.__lock:
+            stats = [
+                record.to_stats(name, None)
+                for name, record in self.__event_records.items()
+                if event_name is None or name == event_name
+            ]
+        return sorted(stats, key=lambda s: s.total_time, reverse=True)
+
+    def get_subscriber_stats(self, event_name: Optional[str] = None) -> List[EventStats]:
+        """
+        Get the statistics of the subscribers, slowest first
+
+        Args:
+            event_name: only get the statistics of the subscribers of this event
+
+        Returns:
+            The statistics of every recorded subscriber, sorted by total time
+        """
+        with self.__lock:
+            stats = [
+                record.to_stats(name, subscriber_name)
+                for (name, subscriber_name), record in self.__subscriber_records.items()
+                if event_name is None or name == event_name
+            ]
+        return sorted(stats, key=lambda s: s.total_time, reverse=True)
+
+    def dump(self, limit: Optional[int] = None) -> str:
+        """
+        Format the recorded statistics as a table, slowest first
+
+        Args:
+            limit: the maximum number of events and subscribers to list
+
+        Returns:
+            The formatted statistics
+        """
+        lines = [f"{'Calls':>8} {'Total (ms)':>12} {'Mean (ms)':>10} {'P99 (ms)':>10} {'Max (ms)':>10}  Name"]
+
+        def format_stats(stats: EventStats, name: str) -> str:
+            return (
+                f"{stats.call_count:>8} {stats.total_time * 1000:>12.3f} {stats.mean_time * 1000:>10.3f} "
+                f"{stats.p99_time * 1000:>10.3f} {stats.max_time * 1000:>10.3f}  {name}"
+            )
+
+        lines.append("Events:")
+        lines.extend(format_stats(s, s.event_name) for s in self.get_event_stats()[:limit])
+        lines.append("Subscribers:")
+        lines.extend(
+            format_stats(s, f"{s.subscriber_name} ({s.event_name})") for s in self.get_subscriber_stats()[:limit]
+        )
+        return "\n".join(lines)
+
+
+_EVENT_PROFILER = EventProfiler()
+
+
+def get_event_profiler() -> EventProfiler:
+    """
+    Get the profiler used by every `Event`
+    """
+    return _EVENT_PROFILER
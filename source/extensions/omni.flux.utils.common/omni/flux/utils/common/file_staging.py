@@ -0,0 +1,184 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "StagingMethod",
+    "files_are_identical",
+    "stage_file",
+    "stage_files_async",
+]
+
+import asyncio
+import filecmp
+import os
+import shutil
+import sys
+import threading
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+# Linux ioctl used to clone a file on copy-on-write filesystems (Btrfs, XFS, etc.)
+_FICLONE = 0x40049409
+
+
+class StagingMethod(Enum):
+    SKIPPED = "skipped"  # The destination already had the same content
+    REFLINK = "reflink"  # Copy-on-write clone of the source
+    HARDLINK = "hardlink"  # Hard link to the source
+    COPY = "copy"  # Regular copy
+
+
+def files_are_identical(source: Union[str, Path], destination: Union[str, Path]) -> bool:
+    """
+    Check if 2 files have the same content. The file sizes are compared first so different files are usually detected
+    without reading them.
+
+    Args:
+        source: the first file path
+        destination: the second file path
+
+    Returns:
+        True if both files exist and have the same content, False otherwise
+    """
+    try:
+        if os.path.getsize(source) != os.path.getsize(destination):
+            return False
+        return filecmp.cmp(source, destination, shallow=False)
+    except OSError:
+        return False
+
+
+def _same_volume(source: Union[str, Path], destination: Union[str, Path]) -> bool:
+    try:
+        return os.stat(source).st_dev == os.stat(Path(destination).parent).st_dev
+    except OSError:
+        return False
+
+
+def _reflink(source: Union[str, Path], destination: Union[str, Path]) -> bool:
+    if sys.platform != "linux":
+        return False
+    import fcntl
+
+    # Clone into a temporary file so the destination is left untouched if the clone is not supported
+    destination = Path(destination)
+    temp_destination = destination.with_name(f".{destination.name}.{os.getpid()}.{threading.get_ident()}.reflink")
+    try:
+        with open(source, "rb") as source_file, open(temp_destination, "wb") as destination_file:
+            fcntl.ioctl(destination_file.fileno(), _FICLONE, source_file.fileno())
+        os.replace(temp_destination, destination)
+    except OSError:
+        try:
+            os.remove(temp_destination)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def stage_file(
+    source: Union[str, Path], destination: Union[str, Path], allow_hardlink: bool = False
+) -> Tuple[StagingMethod, int]:
+    """
+    Make the content of a file available at a destination path using the cheapest method available:
+
+    - Nothing is done if the destination already has the same content
+    - A copy-on-write clone is made if the filesystem supports it
+    - A hard link is made if allowed and both paths are on the same volume
+    - Else, the file is copied
+
+    Hard links share the data with the source, so a file edited in-place at the destination will also edit the source.
+
+    Args:
+        source: the file to stage
+        destination: the path to stage the file at
+        allow_hardlink: allow to hard link the destination to the source
+
+    Raises:
+        OSError: if the file can't be staged
+        shutil.SameFileError: if the source and the destination are the same file
+
+    Returns:
+        The method that was used and the number of bytes staged
+    """
+    size = os.path.getsize(source)
+    if files_are_identical(source, destination):
+        return StagingMethod.SKIPPED, size
+
+    same_volume = _same_volume(source, destination)
+    if same_volume and _reflink(source, destination):
+        return StagingMethod.REFLINK, size
+
+    if allow_hardlink and same_volume:
+        try:
+            if os.path.lexists(destination):
+                os.remove(destination)
+            os.link(source, destination)
+            return StagingMethod.HARDLINK, size
+        except OSError:
+            pass
+
+    shutil.copyfile(str(source), str(destination))
+    return StagingMethod.COPY, size
+
+
+async def stage_files_async(
+    sources_destinations: List[Tuple[Union[str, Path], Union[str, Path]]],
+    max_concurrent: Optional[int] = None,
+    allow_hardlink: bool = False,
+    progress_callback: Optional[Callable[[int, int, float], None]] = None,
+) -> List[StagingMethod]:
+    """
+    Stage files in a thread pool, with a bounded number of files in flight. See `stage_file`.
+
+    Args:
+        sources_destinations: the list of source and destination paths
+        max_concurrent: the number of files to stage concurrently. Defaults to the CPU count.
+        allow_hardlink: allow to hard link the destinations to the sources
+        progress_callback: called after each file with the staged bytes, the total bytes and the bytes per second
+
+    Raises:
+        OSError: if a file can't be staged. The other files are staged before the error is raised.
+
+    Returns:
+        The method used for every file, in the input order
+    """
+    loop = asyncio.get_event_loop()
+    semaphore = asyncio.Semaphore(max_concurrent or os.cpu_count() or 1)
+    total_bytes = sum(os.path.getsize(source) for source, _ in sources_destinations)
+    staged_bytes = 0
+    start = time.perf_counter()
+
+    async def stage(source, destination):
+        nonlocal staged_bytes
+        async with semaphore:
+            method, size = await loop.run_in_executor(None, stage_file, source, destination, allow_hardlink)
+        staged_bytes += size
+        if progress_callback:
+            elapsed = time.perf_counter() - start
+            progress_callback(staged_bytes, total_bytes, staged_bytes / elapsed if elapsed > 0 else 0.0)
+        return method
+
+    results = await asyncio.gather(
+        *[stage(source, destination) for source, destination in sources_destinations], return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
@@ -15,9 +15,13 @@
 * limitations under the License.
 """
 
+from .unit.test_context_listener import TestContextListener
 from .unit.test_decorators import TestLimitRecursion
+from .unit.test_event_profiler import TestEventProfiler
+from .unit.test_file_staging import TestFileStaging
 from .unit.test_layer_utils import TestLayerUtils
 from .unit.test_omni_url import TestOmniUrl
 from .unit.test_path_utils import TestPathUtils
 from .unit.test_serialize import TestSerializer
 from .unit.test_symlink import TestSymlink
+from .unit.test_usd_notice import TestUsdNotice
@@ -0,0 +1,129 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from unittest.mock import Mock
+
+import omni.kit.app
+import omni.kit.test
+import omni.usd
+from omni.flux.utils.common.context_listener import ContextInstances, ContextStageListener
+from pxr import Sdf, UsdGeom
+
+
+class TestContextListener(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.context = omni.usd.get_context()
+        await self.context.new_stage_async()
+
+    # After running each test
+    async def tearDown(self):
+        if self.context.get_stage():
+            await self.context.close_stage_async()
+
+    async def test_update_should_listen_to_current_stage(self):
+        # Arrange
+        callback = Mock()
+        on_stage_changed = Mock()
+        listener = ContextStageListener("", callback, on_stage_changed=on_stage_changed)
+
+        # Act
+        stage = listener.update()
+        listener.update()
+        UsdGeom.Xform.Define(stage, "/World")
+
+        # Assert
+        self.assertIs(stage, self.context.get_stage())
+        self.assertTrue(listener.listening)
+        self.assertEqual(1, on_stage_changed.call_count)
+        self.assertTrue(callback.called)
+        self.assertIs(stage, callback.call_args.args[1])
+
+        listener.destroy()
+
+    async def test_closed_stage_should_revoke_subscription(self):
+        # Arrange
+        callback = Mock()
+        on_stage_changed = Mock()
+        listener = ContextStageListener("", callback, on_stage_changed=on_stage_changed)
+        stage = listener.update()
+
+        # Act
+        await self.context.close_stage_async()
+        # The stage events are dispatched on the next update
+        await omni.kit.app.get_app().next_update_async()
+        stage.DefinePrim("/World")
+
+        # Assert
+        self.assertFalse(listener.listening)
+        self.assertEqual(2, on_stage_changed.call_count)
+        callback.assert_not_called()
+
+        listener.destroy()
+
+    async def test_new_stage_should_move_subscription(self):
+        # Arrange
+        callback = Mock()
+        listener = ContextStageListener("", callback)
+        previous_stage = listener.update()
+
+        # Act
+        await self.context.new_stage_async()
+        stage = listener.update()
+        previous_stage.DefinePrim("/Previous")
+        callback.assert_not_called()
+        stage.DefinePrim("/Current")
+
+        # Assert
+        self.assertIsNot(previous_stage, stage)
+        self.assertEqual(1, callback.call_count)
+        self.assertIn(Sdf.Path("/Current"), callback.call_args.args[0].GetResyncedPaths())
+
+        listener.destroy()
+
+    async def test_destroy_should_stop_listening(self):
+        # Arrange
+        callback = Mock()
+        listener = ContextStageListener("", callback)
+        stage = listener.update()
+
+        # Act
+        listener.destroy()
+        stage.DefinePrim("/World")
+
+        # Assert
+        self.assertFalse(listener.listening)
+        callback.assert_not_called()
+
+    async def test_context_instances_should_share_and_destroy_instances(self):
+        # Arrange
+        factory = Mock(side_effect=lambda context_name: Mock(context_name=context_name))
+        instances = ContextInstances(factory)
+
+        # Act
+        instance = instances.get()
+        same_instance = instances.get("")
+        other_instance = instances.get("other")
+        instances.destroy()
+
+        # Assert
+        self.assertIs(instance, same_instance)
+        self.assertIsNot(instance, other_instance)
+        self.assertEqual(2, factory.call_count)
+        instance.destroy.assert_called_once()
+        other_instance.destroy.assert_called_once()
+        self.assertIsNot(instance, instances.get())
@@ -0,0 +1,139 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import time
+from unittest.mock import Mock
+
+import omni.kit.test
+from omni.flux.utils.common import Event, EventSubscription
+from omni.flux.utils.common.event_profiler import EventProfiler, get_event_profiler
+
+
+class TestEventProfiler(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        get_event_profiler().reset()
+
+    # After running each test
+    async def tearDown(self):
+        get_event_profiler().reset()
+
+    async def test_disabled_profiler_should_not_record(self):
+        # Arrange
+        event = Event(name="TestEvent")
+        _sub = EventSubscription(event, Mock())  # noqa
+
+        # Act
+        event()
+
+        # Assert
+        self.assertFalse(get_event_profiler().enabled)
+        self.assertFalse(get_event_profiler().get_event_stats())
+        self.assertFalse(get_event_profiler().get_subscriber_stats())
+
+    async def test_profile_should_record_every_subscriber(self):
+        # Arrange
+        def slow_subscriber(value):
+            time.sleep(0.01)
+
+        fast_subscriber = Mock()
+        event = Event(name="TestEvent")
+        _sub1 = EventSubscription(event, slow_subscriber)  # noqa
+        _sub2 = EventSubscription(event, fast_subscriber)  # noqa
+
+        # Act
+        with get_event_profiler().profile():
+            for i in range(3):
+                event(i)
+
+        # Assert
+        self.assertFalse(get_event_profiler().enabled)
+        self.assertEqual(3, fast_subscriber.call_count)
+
+        event_stats = get_event_profiler().get_event_stats("TestEvent")
+        self.assertEqual(1, len(event_stats))
+        self.assertEqual(3, event_stats[0].call_count)
+        self.assertIsNone(event_stats[0].subscriber_name)
+
+        subscriber_stats = get_event_profiler().get_subscriber_stats("TestEvent")
+        self.assertEqual(2, len(subscriber_stats))
+        # slowest first
+        self.assertTrue(subscriber_stats[0].subscriber_name.endswith("slow_subscriber"))
+        self.assertEqual(3, subscriber_stats[0].call_count)
+        self.assertGreaterEqual(subscriber_stats[0].total_time, 0.03)
+        self.assertGreaterEqual(subscriber_stats[0].p99_time, 0.01)
+        self.assertGreaterEqual(subscriber_stats[0].max_time, subscriber_stats[0].p99_time)
+        self.assertAlmostEqual(subscriber_stats[0].total_time / 3, subscriber_stats[0].mean_time)
+        self.assertLess(subscriber_stats[1].total_time, subscriber_stats[0].total_time)
+
+    async def test_unnamed_event_should_use_calling_function_name(self):
+        # Arrange
+        event = Event()
+        _sub = EventSubscription(event, Mock())  # noqa
+
+        def trigger_event():
+            event()
+
+        # Act
+        with get_event_profiler().profile():
+            trigger_event()
+
+        # Assert
+        event_stats = get_event_profiler().get_event_stats()
+        self.assertEqual(1, len(event_stats))
+        self.assertEqual(f"{__name__}.trigger_event", event_stats[0].event_name)
+
+    async def test_failing_subscriber_should_be_recorded(self):
+        # Arrange
+        event = Event(name="TestEvent")
+        _sub = EventSubscription(event, Mock(side_effect=ValueError("Test")))  # noqa
+
+        # Act
+        with get_event_profiler().profile():
+            with self.assertRaises(ValueError):
+                event()
+
+        # Assert
+        self.assertEqual(1, get_event_profiler().get_subscriber_stats("TestEvent")[0].call_count)
+
+    async def test_p99_should_use_the_most_recent_samples(self):
+        # Arrange
+        profiler = EventProfiler(sample_size=10)
+
+        # Act
+        profiler.record_subscriber("TestEvent", "subscriber", 1.0)
+        for _ in range(10):
+            profiler.record_subscriber("TestEvent", "subscriber", 0.001)
+
+        # Assert
+        stats = profiler.get_subscriber_stats()[0]
+        self.assertEqual(11, stats.call_count)
+        self.assertEqual(1.0, stats.max_time)
+        self.assertEqual(0.001, stats.p99_time)
+
+    async def test_dump_should_list_events_and_subscribers(self):
+        # Arrange
+        profiler = EventProfiler()
+        profiler.record_event("TestEvent", 0.002)
+        profiler.record_subscriber("TestEvent", "subscriber", 0.001)
+
+        # Act
+        dump = profiler.dump()
+
+        # Assert
+        self.assertIn("TestEvent", dump)
+        self.assertIn("subscriber (TestEvent)", dump)
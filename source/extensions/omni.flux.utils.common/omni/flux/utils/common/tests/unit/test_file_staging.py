@@ -0,0 +1,138 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import omni.kit.test
+from omni.flux.utils.common import file_staging as _file_staging
+
+
+class TestFileStaging(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # noqa PLR1732
+        self.temp_path = Path(self.temp_dir.name)
+        self.sources = []
+        for i in range(4):
+            source = self.temp_path / f"source_{i}.bin"
+            source.write_bytes(os.urandom(1024 * (i + 1)))
+            self.sources.append(source)
+        self.output_path = self.temp_path / "output"
+        self.output_path.mkdir()
+
+    async def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def test_files_are_identical(self):
+        # Arrange
+        destination = self.output_path / "copy.bin"
+        destination.write_bytes(self.sources[0].read_bytes())
+
+        # Act / Assert
+        self.assertTrue(_file_staging.files_are_identical(self.sources[0], destination))
+        self.assertFalse(_file_staging.files_are_identical(self.sources[0], self.sources[1]))
+        self.assertFalse(_file_staging.files_are_identical(self.sources[0], self.output_path / "missing.bin"))
+
+    async def test_stage_file_skips_identical_destination(self):
+        # Arrange
+        destination = self.output_path / "copy.bin"
+        destination.write_bytes(self.sources[0].read_bytes())
+
+        # Act
+        with patch("shutil.copyfile") as copy_mock:
+            method, size = _file_staging.stage_file(self.sources[0], destination)
+
+        # Assert
+        self.assertEqual(_file_staging.StagingMethod.SKIPPED, method)
+        self.assertEqual(self.sources[0].stat().st_size, size)
+        self.assertFalse(copy_mock.called)
+
+    async def test_stage_file_hardlink(self):
+        # Arrange
+        destination = self.output_path / "link.bin"
+        destination.write_bytes(b"outdated")
+
+        # Act
+        with patch.object(_file_staging, "_reflink", return_value=False):
+            method, _ = _file_staging.stage_file(self.sources[0], destination, allow_hardlink=True)
+
+        # Assert
+        self.assertEqual(_file_staging.StagingMethod.HARDLINK, method)
+        self.assertTrue(os.path.samefile(self.sources[0], destination))
+
+    async def test_stage_file_copy(self):
+        # Arrange
+        destination = self.output_path / "copy.bin"
+
+        # Act
+        with patch.object(_file_staging, "_reflink", return_value=False):
+            method, _ = _file_staging.stage_file(self.sources[0], destination)
+
+        # Assert
+        self.assertEqual(_file_staging.StagingMethod.COPY, method)
+        self.assertFalse(os.path.samefile(self.sources[0], destination))
+        self.assertTrue(_file_staging.files_are_identical(self.sources[0], destination))
+
+    async def test_reflink_failure_should_keep_destination(self):
+        if sys.platform != "linux":
+            self.skipTest("Reflinks are only attempted on Linux")
+
+        # Arrange
+        destination = self.output_path / "copy.bin"
+        destination.write_bytes(b"outdated")
+
+        # Act
+        with patch("fcntl.ioctl", side_effect=OSError("Not supported")):
+            result = _file_staging._reflink(self.sources[0], destination)  # noqa PLW0212
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(b"outdated", destination.read_bytes())
+        self.assertListEqual([destination], list(self.output_path.iterdir()))
+
+    async def test_stage_files_async_progress(self):
+        # Arrange
+        sources_destinations = [(source, self.output_path / source.name) for source in self.sources]
+        progress = []
+
+        # Act
+        methods = await _file_staging.stage_files_async(
+            sources_destinations, max_concurrent=2, progress_callback=lambda *args: progress.append(args)
+        )
+
+        # Assert
+        total_bytes = sum(source.stat().st_size for source in self.sources)
+        self.assertEqual(len(self.sources), len(methods))
+        self.assertEqual(len(self.sources), len(progress))
+        self.assertEqual((total_bytes, total_bytes), progress[-1][:2])
+        for source, destination in sources_destinations:
+            self.assertTrue(_file_staging.files_are_identical(source, destination))
+
+        # Staging again should skip every file
+        methods = await _file_staging.stage_files_async(sources_destinations, max_concurrent=2)
+        self.assertListEqual([_file_staging.StagingMethod.SKIPPED] * len(self.sources), methods)
+
+    async def test_stage_files_async_error(self):
+        # Arrange
+        sources_destinations = [(self.sources[0], self.temp_path / "missing_folder" / "file.bin")]
+
+        # Act / Assert
+        with self.assertRaises(OSError):
+            await _file_staging.stage_files_async(sources_destinations)
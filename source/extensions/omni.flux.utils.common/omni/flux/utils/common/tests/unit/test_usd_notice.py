@@ -0,0 +1,111 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from unittest.mock import Mock, patch
+
+import carb
+import omni.kit.app
+import omni.kit.test
+from omni.flux.utils.common.event_profiler import get_event_profiler
+from omni.flux.utils.common.usd_notice import subscribe_objects_changed
+from pxr import Sdf, Usd, UsdGeom
+
+
+class TestUsdNotice(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        UsdGeom.Xform.Define(self.stage, "/World/A")
+        UsdGeom.Xform.Define(self.stage, "/World/B")
+        get_event_profiler().reset()
+
+    # After running each test
+    async def tearDown(self):
+        get_event_profiler().reset()
+        self.stage = None
+
+    async def test_subscribers_should_share_a_single_registration(self):
+        # Arrange
+        subscriber_01 = Mock()
+        subscriber_02 = Mock()
+        subscription_01 = subscribe_objects_changed(self.stage, subscriber_01)
+        subscription_02 = subscribe_objects_changed(self.stage, subscriber_02)
+
+        # Act
+        self.stage.GetPrimAtPath("/World/A").CreateAttribute("test", Sdf.ValueTypeNames.Int).Set(1)
+        subscription_01.Revoke()
+        self.stage.GetPrimAtPath("/World/A").GetAttribute("test").Set(2)
+
+        # Assert
+        self.assertIs(subscription_01._dispatcher, None)  # noqa PLW0212
+        self.assertIs(subscription_02._dispatcher.subscriptions[0], subscription_02)  # noqa PLW0212
+        self.assertEqual(subscriber_01.call_count, 1)
+        self.assertEqual(subscriber_02.call_count, 2)
+
+    async def test_path_filter_should_skip_unrelated_changes(self):
+        # Arrange
+        subscriber_a = Mock()
+        subscriber_b = Mock()
+        _sub_a = subscribe_objects_changed(self.stage, subscriber_a, paths=[Sdf.Path("/World/A")])  # noqa
+        _sub_b = subscribe_objects_changed(self.stage, subscriber_b, paths=[Sdf.Path("/World/B")])  # noqa
+
+        # Act
+        self.stage.GetPrimAtPath("/World/A").CreateAttribute("test", Sdf.ValueTypeNames.Int).Set(1)
+
+        # Assert
+        self.assertTrue(subscriber_a.called)
+        self.assertFalse(subscriber_b.called)
+
+    async def test_deferred_subscriber_should_be_called_once_per_frame(self):
+        # Arrange
+        subscriber = Mock()
+        _sub = subscribe_objects_changed(self.stage, subscriber, deferred=True)  # noqa
+        attribute = self.stage.GetPrimAtPath("/World/A").CreateAttribute("test", Sdf.ValueTypeNames.Int)
+
+        # Act
+        for i in range(10):
+            attribute.Set(i)
+        called_before_next_frame = subscriber.called
+        for _ in range(2):
+            await omni.kit.app.get_app().next_update_async()
+
+        # Assert
+        self.assertFalse(called_before_next_frame)
+        self.assertEqual(subscriber.call_count, 1)
+        summary, stage = subscriber.call_args[0]
+        self.assertEqual(stage, self.stage)
+        self.assertIn(Sdf.Path("/World/A.test"), summary.GetResyncedPaths())
+        self.assertIn(Sdf.Path("/World/A.test"), summary.GetChangedInfoOnlyPaths())
+
+    async def test_failing_subscriber_should_not_block_other_subscribers(self):
+        # Arrange
+        failing_subscriber = Mock(side_effect=ValueError("Test"))
+        subscriber = Mock()
+        _sub_01 = subscribe_objects_changed(self.stage, failing_subscriber, name="FailingSubscriber")  # noqa
+        _sub_02 = subscribe_objects_changed(self.stage, subscriber, name="Subscriber")  # noqa
+
+        # Act
+        with get_event_profiler().profile(), patch.object(carb, "log_error") as log_error_mock:
+            self.stage.GetPrimAtPath("/World/A").CreateAttribute("test", Sdf.ValueTypeNames.Int).Set(1)
+
+        # Assert
+        self.assertTrue(subscriber.called)
+        self.assertEqual(log_error_mock.call_count, 1)
+        self.assertSetEqual(
+            {stats.subscriber_name for stats in get_event_profiler().get_subscriber_stats("Usd.Notice.ObjectsChanged")},
+            {"FailingSubscriber", "Subscriber"},
+        )
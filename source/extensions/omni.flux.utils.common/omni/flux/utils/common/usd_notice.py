@@ -0,0 +1,285 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+__all__ = [
+    "ObjectsChangedSummary",
+    "UsdNoticeDispatcher",
+    "UsdNoticeSubscription",
+    "subscribe_objects_changed",
+]
+
+import asyncio
+import time
+import traceback
+import weakref
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import carb
+import omni.kit.app
+from pxr import Sdf, Tf, Usd
+
+from .event_profiler import get_callable_name as _get_callable_name
+from .event_profiler import get_event_profiler as _get_event_profiler
+
+_EVENT_NAME = "Usd.Notice.ObjectsChanged"
+_DEFERRED_EVENT_NAME = "Usd.Notice.ObjectsChanged (deferred)"
+
+
+class ObjectsChangedSummary:
+    """
+    The changes of all the `Usd.Notice.ObjectsChanged` notices sent during a frame, given to the deferred subscribers.
+
+    Implements the part of the notice API used to read the changes, since the notices themselves can't be used after
+    they were sent.
+    """
+
+    def __init__(self, stage: Usd.Stage):
+        self._stage = stage
+        self._resynced_paths: Dict[Sdf.Path, None] = {}
+        self._info_only_paths: Dict[Sdf.Path, None] = {}
+        self._changed_fields: Dict[Sdf.Path, Set[str]] = {}
+
+    def add_notice(self, notice: Usd.Notice.ObjectsChanged):
+        """
+        Merge the changes of a notice in the summary
+
+        Args:
+            notice: the notice to merge
+        """
+        for paths, notice_paths in (
+            (self._resynced_paths, notice.GetResyncedPaths()),
+            (self._info_only_paths, notice.GetChangedInfoOnlyPaths()),
+        ):
+            for path in notice_paths:
+                paths[path] = None
+                self._changed_fields.setdefault(path, set()).update(notice.GetChangedFields(path))
+
+    def GetStage(self) -> Usd.Stage:  # noqa N802
+        return self._stage
+
+    def GetResyncedPaths(self) -> List[Sdf.Path]:  # noqa N802
+        return list(self._resynced_paths)
+
+    def GetChangedInfoOnlyPaths(self) -> List[Sdf.Path]:  # noqa N802
+        return list(self._info_only_paths)
+
+    def GetChangedFields(self, path: Sdf.Path) -> List[str]:  # noqa N802
+        return list(self._changed_fields.get(path, ()))
+
+
+class UsdNoticeSubscription:
+    """
+    A subscription to the notices of a stage. The subscriber is called while this object exists and until `Revoke` is
+    called, like a `Tf.Notice.Listener`.
+    """
+
+    def __init__(
+        self,
+        dispatcher: "UsdNoticeDispatcher",
+        callback: Callable,
+        name: Optional[str],
+        paths: Optional[Iterable[Sdf.Path]],
+        deferred: bool,
+    ):
+        self.callback = callback
+        self.name = name or _get_callable_name(callback)
+        self.paths = [Sdf.Path(str(path)) for path in paths] if paths is not None else None
+        self.deferred = deferred
+        self._dispatcher = dispatcher
+
+    def is_interested(self, changed_paths: Iterable[Sdf.Path]) -> bool:
+        """
+        Args:
+            changed_paths: the paths changed by a notice
+
+        Returns:
+            True if one of the changed paths is under, or is an ancestor of, one of the filtered paths
+        """
+        if self.paths is None:
+            return True
+        for changed_path in changed_paths:
+            for path in self.paths:
+                if changed_path.HasPrefix(path) or path.HasPrefix(changed_path.GetPrimPath()):
+                    return True
+        return False
+
+    @property
+    def active(self) -> bool:
+        return self._dispatcher is not None
+
+    def Revoke(self):  # noqa N802
+        if self._dispatcher:
+            self._dispatcher.unsubscribe(self)
+            self._dispatcher = None
+
+    def __del__(self):
+        self.Revoke()
+
+
+class UsdNoticeDispatcher:
+    """
+    Own the single `Usd.Notice.ObjectsChanged` registration of a stage and dispatch the notices to the subscribers.
+
+    Synchronous subscribers are called in the notice callback. Deferred subscribers are called once at the next frame
+    with the changes of all the notices sent in between, so bursts of notices (like interactive transform drags) only
+    cost them a single call per frame. The subscribers are timed by the `EventProfiler` when it is enabled.
+    """
+
+    def __init__(self, stage: Usd.Stage):
+        self._stage = stage
+        # The subscriptions are weakly referenced so they are revoked when their owner releases them
+        self._subscriptions: List[weakref.ref] = []
+        self._summary: Optional[ObjectsChangedSummary] = None
+        self._flush_task = None
+        self._listener = Tf.Notice.Register(Usd.Notice.ObjectsChanged, self._on_objects_changed, stage)
+
+    @property
+    def subscriptions(self) -> List[UsdNoticeSubscription]:
+        return [
+            subscription
+            for subscription in (reference() for reference in self._subscriptions)
+            if subscription is not None and subscription.active
+        ]
+
+    def subscribe(
+        self,
+        callback: Callable,
+        name: Optional[str] = None,
+        paths: Optional[Iterable[Sdf.Path]] = None,
+        deferred: bool = False,
+    ) -> UsdNoticeSubscription:
+        """
+        Subscribe to the `Usd.Notice.ObjectsChanged` notices of the stage
+
+        Args:
+            callback: called with the notice and the stage. Deferred subscribers get an `ObjectsChangedSummary`.
+            name: the name of the subscriber in the profiler statistics. By default, the name of the callback is used.
+            paths: only call the subscriber for changes under these paths, or resyncs of their ancestors
+            deferred: call the subscriber once at the next frame instead of once per notice
+
+        Returns:
+            The subscription object. The subscriber is removed when the object is revoked or destroyed.
+        """
+        subscription = UsdNoticeSubscription(self, callback, name, paths, deferred)
+        self._subscriptions.append(weakref.ref(subscription))
+        return subscription
+
+    def unsubscribe(self, subscription: UsdNoticeSubscription):
+        self._subscriptions = [
+            reference for reference in self._subscriptions if reference() not in (None, subscription)
+        ]
+        if not self._subscriptions:
+            self.destroy()
+
+    def _on_objects_changed(self, notice: Usd.Notice.ObjectsChanged, stage: Usd.Stage):
+        profiler = _get_event_profiler()
+        start = time.perf_counter() if profiler.enabled else None
+
+        subscriptions = self.subscriptions
+        changed_paths = None
+        for subscription in subscriptions:
+            if subscription.deferred or not subscription.active:
+                continue
+            if subscription.paths is not None:
+                if changed_paths is None:
+                    changed_paths = [*notice.GetResyncedPaths(), *notice.GetChangedInfoOnlyPaths()]
+                if not subscription.is_interested(changed_paths):
+                    continue
+            self._call(_EVENT_NAME, subscription, notice, stage)
+
+        if any(subscription.deferred for subscription in subscriptions):
+            if self._summary is None:
+                self._summary = ObjectsChangedSummary(stage)
+            self._summary.add_notice(notice)
+            if self._flush_task is None:
+                self._flush_task = asyncio.ensure_future(self._flush_deferred())
+
+        if start is not None:
+            profiler.record_event(_EVENT_NAME, time.perf_counter() - start)
+
+    async def _flush_deferred(self):
+        await omni.kit.app.get_app().next_update_async()
+        summary = self._summary
+        self._summary = None
+        self._flush_task = None
+        if summary is None:
+            return
+
+        profiler = _get_event_profiler()
+        start = time.perf_counter() if profiler.enabled else None
+
+        changed_paths = [*summary.GetResyncedPaths(), *summary.GetChangedInfoOnlyPaths()]
+        for subscription in self.subscriptions:
+            if subscription.deferred and subscription.active and subscription.is_interested(changed_paths):
+                self._call(_DEFERRED_EVENT_NAME, subscription, summary, self._stage)
+
+        if start is not None:
+            profiler.record_event(_DEFERRED_EVENT_NAME, time.perf_counter() - start)
+
+    @staticmethod
+    def _call(event_name: str, subscription: UsdNoticeSubscription, notice, stage: Usd.Stage):
+        # A failing subscriber should not prevent the others from being notified
+        profiler = _get_event_profiler()
+        start = time.perf_counter() if profiler.enabled else None
+        try:
+            subscription.callback(notice, stage)
+        except Exception:  # noqa PLW0718
+            carb.log_error(f"Error in the USD notice subscriber {subscription.name}:\n{traceback.format_exc()}")
+        if start is not None:
+            profiler.record_subscriber(event_name, subscription.name, time.perf_counter() - start)
+
+    def destroy(self):
+        if self._listener:
+            self._listener.Revoke()
+            self._listener = None
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._summary = None
+        self._subscriptions.clear()
+        if _DISPATCHERS.get(self._stage) is self:
+            del _DISPATCHERS[self._stage]
+
+
+_DISPATCHERS: Dict[Usd.Stage, UsdNoticeDispatcher] = {}
+
+
+def subscribe_objects_changed(
+    stage: Usd.Stage,
+    callback: Callable,
+    name: Optional[str] = None,
+    paths: Optional[Iterable[Sdf.Path]] = None,
+    deferred: bool = False,
+) -> UsdNoticeSubscription:
+    """
+    Subscribe to the `Usd.Notice.ObjectsChanged` notices of a stage through the dispatcher of the stage. All the
+    subscribers of a stage share a single notice registration.
+
+    Args:
+        stage: the stage to listen to
+        callback: called with the notice and the stage. Deferred subscribers get an `ObjectsChangedSummary`.
+        name: the name of the subscriber in the profiler statistics. By default, the name of the callback is used.
+        paths: only call the subscriber for changes under these paths, or resyncs of their ancestors
+        deferred: call the subscriber once at the next frame instead of once per notice
+
+    Returns:
+        The subscription object. The subscriber is removed when the object is revoked or destroyed.
+    """
+    dispatcher = _DISPATCHERS.get(stage)
+    if dispatcher is None:
+        dispatcher = _DISPATCHERS[stage] = UsdNoticeDispatcher(stage)
+    return dispatcher.subscribe(callback, name=name, paths=paths, deferred=deferred)
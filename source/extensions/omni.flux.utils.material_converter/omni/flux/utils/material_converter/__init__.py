@@ -17,6 +17,7 @@
 
 __all__ = [
     "MaterialConverterCore",
+    "MaterialConverterExtension",
     "NoneToAperturePBRConverterBuilder",
     "OmniGlassToAperturePBRConverterBuilder",
     "OmniPBRToAperturePBRConverterBuilder",
@@ -24,6 +25,7 @@ __all__ = [
 ]
 
 from .core import MaterialConverterCore
+from .extension import MaterialConverterExtension
 from .impl.none_to_aperture_pbr import NoneToAperturePBRConverterBuilder
 from .impl.omni_glass_to_aperture_pbr import OmniGlassToAperturePBRConverterBuilder
 from .impl.omni_pbr_to_aperture_pbr import OmniPBRToAperturePBRConverterBuilder
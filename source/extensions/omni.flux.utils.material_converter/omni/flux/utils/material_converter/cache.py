@@ -0,0 +1,185 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+import carb
+from pxr import Sdf, Usd, UsdShade
+
+if TYPE_CHECKING:
+    import omni.usd
+
+_SCRATCH_ROOT_PATH = Sdf.Path("/__MdlParameterCache")
+
+
+class MdlParameterCache:
+    """
+    Cache of the parameters of MDL shaders, per MDL module and sub-identifier.
+
+    Loading the MDL parameters of a shader compiles the MDL module, which is slow. The parameters are loaded once on a
+    scratch shader for every module & sub-identifier pair, and the resulting attribute specs are copied on the session
+    layer of every other shader using the same pair.
+    """
+
+    def __init__(self):
+        self._layer = Sdf.Layer.CreateAnonymous("MdlParameterCache")
+        # Key -> Path of the cached specs in the cache layer. Failures are not cached so the next shader can retry.
+        self._entries: Dict[Tuple[str, str, Optional[float]], Sdf.Path] = {}
+
+    def clear(self):
+        """Clear every cached MDL parameter"""
+        self._layer.Clear()
+        self._entries.clear()
+
+    @staticmethod
+    def get_key(shader_prim: "Usd.Prim") -> Optional[Tuple[str, str, Optional[float]]]:
+        """
+        Get the cache key of a shader: the resolved MDL module path, the sub-identifier and the module modification
+        time when it can be fetched.
+
+        When the module path can't be resolved, it is anchored to the layer authoring it so identically named relative
+        modules from different directories don't share a key.
+
+        Returns:
+            The key, or None if the shader doesn't use an MDL source asset
+        """
+        shader = UsdShade.Shader(shader_prim)
+        if not shader or shader.GetImplementationSource() != UsdShade.Tokens.sourceAsset:
+            return None
+        source_asset = shader.GetSourceAsset("mdl")
+        if not source_asset or not source_asset.path:
+            return None
+        module_path = source_asset.resolvedPath or MdlParameterCache._anchor_module_path(shader, source_asset.path)
+        try:
+            modification_time = os.path.getmtime(module_path)
+        except OSError:
+            modification_time = None
+        return module_path, shader.GetSourceAssetSubIdentifier("mdl") or "", modification_time
+
+    @staticmethod
+    def _anchor_module_path(shader: "UsdShade.Shader", module_path: str) -> str:
+        attribute = shader.GetPrim().GetAttribute("info:mdl:sourceAsset")
+        for property_spec in attribute.GetPropertyStack(Usd.TimeCode.Default()) if attribute else []:
+            if property_spec.default is None:
+                continue
+            # Search paths that don't exist next to the layer are kept as-is
+            return (
+                module_path if property_spec.layer.anonymous else property_spec.layer.ComputeAbsolutePath(module_path)
+            )
+        return module_path
+
+    async def load_mdl_parameters_for_prim_async(
+        self, context: "omni.usd.UsdContext", shader_prim: "Usd.Prim", timeout: Optional[float] = None
+    ):
+        """
+        Same as `UsdContext.load_mdl_parameters_for_prim_async`, but the MDL module is only loaded once per module &
+        sub-identifier.
+
+        Args:
+            context: the context the shader prim lives in
+            shader_prim: the shader to load the MDL parameters for
+            timeout: the maximum time to wait for the MDL module to load, in seconds
+
+        Raises:
+            asyncio.TimeoutError: if the MDL parameters can't be loaded in time. The next call for the same key will
+                                  try to load them again, since cold MDL compilations can time out the first time.
+        """
+        key = self.get_key(shader_prim)
+        if key is None:
+            await asyncio.wait_for(context.load_mdl_parameters_for_prim_async(shader_prim), timeout=timeout)
+            return
+
+        if key not in self._entries:
+            await self._cache_parameters(context, shader_prim, key, timeout)
+
+        self._apply_parameters(shader_prim, self._entries[key])
+
+    async def _cache_parameters(
+        self,
+        context: "omni.usd.UsdContext",
+        shader_prim: "Usd.Prim",
+        key: Tuple[str, str, Optional[float]],
+        timeout: Optional[float],
+    ):
+        stage = shader_prim.GetStage()
+        session_layer = stage.GetSessionLayer()
+        scratch_path = _SCRATCH_ROOT_PATH.AppendChild(f"Shader_{len(self._entries)}")
+
+        # Build a shader without any authored parameter so every MDL parameter gets loaded
+        with Usd.EditContext(stage, session_layer):
+            scratch_shader = UsdShade.Shader.Define(stage, scratch_path)
+            scratch_shader.SetSourceAsset(Sdf.AssetPath(key[0]), "mdl")
+            scratch_shader.SetSourceAssetSubIdentifier(key[1], "mdl")
+
+        try:
+            await asyncio.wait_for(
+                context.load_mdl_parameters_for_prim_async(scratch_shader.GetPrim()), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            carb.log_warn(f"Unable to load the MDL parameters of {key[0]}::{key[1]}")
+            raise
+        else:
+            entry_path = Sdf.Path.absoluteRootPath.AppendChild(f"Entry_{len(self._entries)}")
+            Sdf.CreatePrimInLayer(self._layer, entry_path)
+            # The parameters are usually created on the session layer, but look at the edit target too
+            for layer in (session_layer, stage.GetEditTarget().GetLayer()):
+                scratch_spec = layer.GetPrimAtPath(scratch_path)
+                if not scratch_spec:
+                    continue
+                for property_spec in scratch_spec.properties:
+                    if not property_spec.name.startswith("inputs:"):
+                        continue
+                    destination_path = entry_path.AppendProperty(property_spec.name)
+                    if self._layer.GetPropertyAtPath(destination_path):
+                        continue
+                    Sdf.CopySpec(layer, property_spec.path, self._layer, destination_path)
+            self._entries[key] = entry_path
+        finally:
+            self._remove_scratch_prim(stage, scratch_path)
+
+    @staticmethod
+    def _remove_scratch_prim(stage: "Usd.Stage", scratch_path: Sdf.Path):
+        for layer in {stage.GetSessionLayer(), stage.GetEditTarget().GetLayer()}:
+            if not layer.GetPrimAtPath(scratch_path):
+                continue
+            edit = Sdf.BatchNamespaceEdit()
+            edit.Add(scratch_path, Sdf.Path.emptyPath)
+            # Remove the scratch root too if it's now empty
+            if len(layer.GetPrimAtPath(_SCRATCH_ROOT_PATH).nameChildren) == 1:
+                edit = Sdf.BatchNamespaceEdit()
+                edit.Add(_SCRATCH_ROOT_PATH, Sdf.Path.emptyPath)
+            layer.Apply(edit)
+
+    def _apply_parameters(self, shader_prim: "Usd.Prim", entry_path: Sdf.Path):
+        session_layer = shader_prim.GetStage().GetSessionLayer()
+        entry_spec = self._layer.GetPrimAtPath(entry_path)
+        shader_path = shader_prim.GetPath()
+
+        with Sdf.ChangeBlock():
+            for property_spec in entry_spec.properties:
+                destination_path = shader_path.AppendProperty(property_spec.name)
+                if session_layer.GetPropertyAtPath(destination_path):
+                    continue
+                # Don't override values authored on the shader
+                attribute = shader_prim.GetAttribute(property_spec.name)
+                if attribute and attribute.HasAuthoredValue():
+                    continue
+                if not session_layer.GetPrimAtPath(shader_path):
+                    Sdf.CreatePrimInLayer(session_layer, shader_path)
+                Sdf.CopySpec(self._layer, property_spec.path, session_layer, destination_path)
@@ -15,13 +15,14 @@
 * limitations under the License.
 """
 
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, Tuple
 
 import carb
 import omni.kit
 import omni.usd
 from pxr import Sdf, Usd, UsdShade
 
+from .cache import MdlParameterCache as _MdlParameterCache
 from .mapping import Converters as _ConvertersEnum
 
 if TYPE_CHECKING:
@@ -30,6 +31,44 @@ if TYPE_CHECKING:
 
 
 class MaterialConverterCore:
+    _MDL_PARAMETER_CACHE: Optional[_MdlParameterCache] = None
+    # Converter -> input attributes required for a shader to match the converter
+    _CONVERTER_INPUT_ATTRIBUTES: Dict[_ConvertersEnum, FrozenSet[str]] = {}
+    # Input attributes of a shader -> matching converter builder & supported input shader
+    _MATCHING_CONVERTER_PLANS: Dict[FrozenSet[str], Tuple[Optional[type], Optional["_SupportedShaderInputs"]]] = {}
+
+    @staticmethod
+    async def load_mdl_parameters_for_prim_async(
+        context: "omni.usd.UsdContext", shader_prim: "Usd.Prim", timeout: Optional[float] = None
+    ):
+        """
+        Load the MDL parameters of a shader prim. The MDL module is only loaded once per module & sub-identifier, the
+        parameters are then reused for every shader using the same module & sub-identifier.
+
+        Args:
+            context: the context the shader prim lives in
+            shader_prim: the shader to load the MDL parameters for
+            timeout: the maximum time to wait for the MDL module to load, in seconds
+
+        Raises:
+            asyncio.TimeoutError: if the MDL parameters can't be loaded in time
+        """
+        if MaterialConverterCore._MDL_PARAMETER_CACHE is None:
+            MaterialConverterCore._MDL_PARAMETER_CACHE = _MdlParameterCache()
+        await MaterialConverterCore._MDL_PARAMETER_CACHE.load_mdl_parameters_for_prim_async(
+            context, shader_prim, timeout=timeout
+        )
+
+    @staticmethod
+    def clear_caches():
+        """
+        Clear the cached MDL parameters and converter matches
+        """
+        if MaterialConverterCore._MDL_PARAMETER_CACHE is not None:
+            MaterialConverterCore._MDL_PARAMETER_CACHE.clear()
+        MaterialConverterCore._CONVERTER_INPUT_ATTRIBUTES.clear()
+        MaterialConverterCore._MATCHING_CONVERTER_PLANS.clear()
+
     @staticmethod
     async def convert(context_name: str, converter: "ConverterBase") -> Tuple[bool, Optional[str], bool]:
         """
@@ -281,21 +320,29 @@ class MaterialConverterCore:
         But the MDL is not supported. So to check if this is really supported, we check if the attributes are matching
         with a supported MDL
         """
-        for converter in _ConvertersEnum:
-            all_valid = []
-            if converter.value[1].value is None:
-                continue
-            converter_instance = converter.value[0]().build(input_shader_prim, converter.value[1].value)
-            for attr in converter_instance.attributes:
-                if attr.fake_attribute:
+        if not MaterialConverterCore._CONVERTER_INPUT_ATTRIBUTES:
+            for converter in _ConvertersEnum:
+                if converter.value[1].value is None:
                     continue
-                if not input_shader_prim.HasAttribute(attr.input_attr_name):
-                    all_valid.append(False)
+                converter_instance = converter.value[0]().build(input_shader_prim, converter.value[1].value)
+                MaterialConverterCore._CONVERTER_INPUT_ATTRIBUTES[converter] = frozenset(
+                    attr.input_attr_name for attr in converter_instance.attributes if not attr.fake_attribute
+                )
+
+        # Shaders with the same matching attributes will always match the same converter
+        signature = frozenset(
+            attr_name
+            for attr_name in frozenset().union(*MaterialConverterCore._CONVERTER_INPUT_ATTRIBUTES.values())
+            if input_shader_prim.HasAttribute(attr_name)
+        )
+        if signature not in MaterialConverterCore._MATCHING_CONVERTER_PLANS:
+            plan = (None, None)
+            for converter, input_attributes in MaterialConverterCore._CONVERTER_INPUT_ATTRIBUTES.items():
+                if input_attributes.issubset(signature):
+                    plan = (converter.value[0], converter.value[1])
                     break
-                all_valid.append(True)
-            if all(all_valid):
-                return converter.value[0], converter.value[1]
-        return None, None
+            MaterialConverterCore._MATCHING_CONVERTER_PLANS[signature] = plan
+        return MaterialConverterCore._MATCHING_CONVERTER_PLANS[signature]
 
     @staticmethod
     async def _create_material_attributes(
@@ -0,0 +1,151 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import omni.kit.test
+from omni.flux.utils.material_converter.cache import MdlParameterCache
+from pxr import Sdf, Usd, UsdShade
+
+
+class TestMdlParameterCache(omni.kit.test.AsyncTestCase):
+    # Before running each test
+    async def setUp(self):
+        self.stage = Usd.Stage.CreateInMemory()
+        self.cache = MdlParameterCache()
+
+    # After running each test
+    async def tearDown(self):
+        self.cache.clear()
+        self.cache = None
+        self.stage = None
+
+    def _define_shader(self, path: str, sub_identifier: str = "OmniPBR") -> Usd.Prim:
+        shader = UsdShade.Shader.Define(self.stage, path)
+        shader.SetSourceAsset(Sdf.AssetPath("OmniPBR.mdl"), "mdl")
+        shader.SetSourceAssetSubIdentifier(sub_identifier, "mdl")
+        return shader.GetPrim()
+
+    def _get_context_mock(self, succeed: bool = True) -> Mock:
+        async def load_mdl_parameters(prim):
+            if not succeed:
+                raise asyncio.TimeoutError()
+            # Mimic the MDL loading: the parameters are authored on the session layer
+            with Usd.EditContext(self.stage, self.stage.GetSessionLayer()):
+                prim.CreateAttribute("inputs:diffuse_color_constant", Sdf.ValueTypeNames.Color3f).Set((0.2, 0.2, 0.2))
+                prim.CreateAttribute("inputs:metallic_constant", Sdf.ValueTypeNames.Float).Set(0.0)
+
+        context_mock = Mock()
+        context_mock.load_mdl_parameters_for_prim_async.side_effect = load_mdl_parameters
+        return context_mock
+
+    async def test_get_key_should_return_module_and_sub_identifier(self):
+        # Arrange
+        shader_prim = self._define_shader("/Looks/Material/Shader")
+
+        # Act
+        key = MdlParameterCache.get_key(shader_prim)
+
+        # Assert
+        self.assertEqual(("OmniPBR.mdl", "OmniPBR", None), key)
+
+    async def test_get_key_unresolved_relative_module_should_be_anchored(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as temp_dir:
+            shader_prims = []
+            for directory in ["a", "b"]:
+                (Path(temp_dir) / directory).mkdir()
+                stage = Usd.Stage.CreateNew(str(Path(temp_dir) / directory / "materials.usda"))
+                shader = UsdShade.Shader.Define(stage, "/Looks/Material/Shader")
+                shader.SetSourceAsset(Sdf.AssetPath("./custom.mdl"), "mdl")
+                shader_prims.append(shader.GetPrim())
+
+            # Act
+            keys = [MdlParameterCache.get_key(shader_prim) for shader_prim in shader_prims]
+
+        # Assert
+        self.assertNotEqual(keys[0][0], keys[1][0])
+        for directory, key in zip(["a", "b"], keys):
+            self.assertEqual(Path(temp_dir) / directory / "custom.mdl", Path(key[0]))
+
+    async def test_get_key_not_mdl_should_return_none(self):
+        # Arrange
+        shader_prim = UsdShade.Shader.Define(self.stage, "/Looks/Material/Shader").GetPrim()
+
+        # Act
+        key = MdlParameterCache.get_key(shader_prim)
+
+        # Assert
+        self.assertIsNone(key)
+
+    async def test_load_mdl_parameters_same_module_should_load_once(self):
+        # Arrange
+        shader_prim_01 = self._define_shader("/Looks/Material01/Shader")
+        shader_prim_02 = self._define_shader("/Looks/Material02/Shader")
+        shader_prim_02.CreateAttribute("inputs:metallic_constant", Sdf.ValueTypeNames.Float).Set(1.0)
+        context_mock = self._get_context_mock()
+
+        # Act
+        await self.cache.load_mdl_parameters_for_prim_async(context_mock, shader_prim_01)
+        await self.cache.load_mdl_parameters_for_prim_async(context_mock, shader_prim_02)
+
+        # Assert
+        self.assertEqual(1, context_mock.load_mdl_parameters_for_prim_async.call_count)
+        for shader_prim in (shader_prim_01, shader_prim_02):
+            self.assertTrue(shader_prim.HasAttribute("inputs:diffuse_color_constant"))
+            self.assertTrue(shader_prim.HasAttribute("inputs:metallic_constant"))
+        # Authored values are kept
+        self.assertEqual(0.0, shader_prim_01.GetAttribute("inputs:metallic_constant").Get())
+        self.assertEqual(1.0, shader_prim_02.GetAttribute("inputs:metallic_constant").Get())
+        # The scratch shader was cleaned up
+        self.assertFalse(self.stage.GetPrimAtPath("/__MdlParameterCache"))
+
+    async def test_load_mdl_parameters_different_sub_identifiers_should_load_each(self):
+        # Arrange
+        shader_prim_01 = self._define_shader("/Looks/Material01/Shader", sub_identifier="OmniPBR")
+        shader_prim_02 = self._define_shader("/Looks/Material02/Shader", sub_identifier="OmniPBR_Opacity")
+        context_mock = self._get_context_mock()
+
+        # Act
+        await self.cache.load_mdl_parameters_for_prim_async(context_mock, shader_prim_01)
+        await self.cache.load_mdl_parameters_for_prim_async(context_mock, shader_prim_02)
+
+        # Assert
+        self.assertEqual(2, context_mock.load_mdl_parameters_for_prim_async.call_count)
+
+    async def test_load_mdl_parameters_failed_should_retry(self):
+        # Arrange
+        shader_prim_01 = self._define_shader("/Looks/Material01/Shader")
+        shader_prim_02 = self._define_shader("/Looks/Material02/Shader")
+        context_mock = self._get_context_mock(succeed=False)
+
+        # Act
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.cache.load_mdl_parameters_for_prim_async(context_mock, shader_prim_01)
+        scratch_prim_after_failure = self.stage.GetPrimAtPath("/__MdlParameterCache")
+        context_mock.load_mdl_parameters_for_prim_async.side_effect = (
+            self._get_context_mock().load_mdl_parameters_for_prim_async.side_effect
+        )
+        await self.cache.load_mdl_parameters_for_prim_async(context_mock, shader_prim_02)
+
+        # Assert
+        self.assertEqual(2, context_mock.load_mdl_parameters_for_prim_async.call_count)
+        self.assertFalse(scratch_prim_after_failure)
+        self.assertTrue(shader_prim_02.GetAttribute("inputs:metallic_constant"))
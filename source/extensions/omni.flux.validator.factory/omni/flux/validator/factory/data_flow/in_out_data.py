@@ -15,7 +15,9 @@
 * limitations under the License.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pydantic import PrivateAttr
 
 from .base_data_flow import DataFlow as _DataFlow
 
@@ -26,3 +28,43 @@ class InOutDataFlow(_DataFlow):
     push_input_data: bool = False
     output_data: Optional[List[str]] = None
     push_output_data: bool = False
+
+    # Index of the values of `input_data`/`output_data` to dedup in constant time: (indexed list, length, values)
+    _data_indexes: Dict[str, Tuple[List[str], int, Set[str]]] = PrivateAttr(default_factory=dict)
+
+    def add_input_data(self, values: Iterable[str]):
+        """
+        Append values to `input_data`, skipping the values that are already in it. The order is kept.
+
+        Args:
+            values: the values to add
+        """
+        self._add_data("input_data", values)
+
+    def add_output_data(self, values: Iterable[str]):
+        """
+        Append values to `output_data`, skipping the values that are already in it. The order is kept.
+
+        Args:
+            values: the values to add
+        """
+        self._add_data("output_data", values)
+
+    def _add_data(self, attribute: str, values: Iterable[str]):
+        data = getattr(self, attribute)
+        if data is None:
+            data = []
+            setattr(self, attribute, data)
+
+        # The list can be replaced or edited from outside: rebuild the index when it doesn't match the list anymore
+        indexed_data, length, index = self._data_indexes.get(attribute, (None, 0, None))
+        if indexed_data is not data or length != len(data):
+            index = set(data)
+
+        for value in values:
+            if value in index:
+                continue
+            index.add(value)
+            data.append(value)
+
+        self._data_indexes[attribute] = (data, len(data), index)
@@ -15,7 +15,7 @@
 * limitations under the License.
 """
 
-from typing import List
+from typing import List, Optional
 
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 
@@ -28,15 +28,7 @@ def push_input_data(schema_data, file_paths: List[str]):
         schema_data: the schema to use
         file_paths: the list of files to push
     """
-    for data_flow in schema_data.data_flows or []:
-        if data_flow.name == "InOutData" and data_flow.push_input_data:
-            if data_flow.input_data is None:
-                data_flow.input_data = []
-            for file_path in file_paths:
-                url_in_path_str = _OmniUrl(file_path)
-                if str(url_in_path_str) in data_flow.input_data:
-                    continue
-                data_flow.input_data.append(str(url_in_path_str))
+    push_data(schema_data, input_file_paths=file_paths)
 
 
 def push_output_data(schema_data, file_paths: List[str]):
@@ -47,12 +39,28 @@ def push_output_data(schema_data, file_paths: List[str]):
         schema_data: the schema to use
         file_paths: the list of files to push
     """
+    push_data(schema_data, output_file_paths=file_paths)
+
+
+def push_data(schema_data, input_file_paths: Optional[List[str]] = None, output_file_paths: Optional[List[str]] = None):
+    """
+    Push lists of files into the data flow input and output in one pass. Files already in the data flow are skipped.
+
+    Args:
+        schema_data: the schema to use
+        input_file_paths: the list of files to push into the input
+        output_file_paths: the list of files to push into the output
+    """
+    input_data = None
+    output_data = None
     for data_flow in schema_data.data_flows or []:
-        if data_flow.name == "InOutData" and data_flow.push_output_data:
-            if data_flow.output_data is None:
-                data_flow.output_data = []
-            for file_path in file_paths:
-                url_texture_path = _OmniUrl(file_path)
-                if str(url_texture_path) in data_flow.output_data:
-                    continue
-                data_flow.output_data.append(str(url_texture_path))
+        if data_flow.name != "InOutData":
+            continue
+        if input_file_paths is not None and data_flow.push_input_data:
+            if input_data is None:
+                input_data = [str(_OmniUrl(file_path)) for file_path in input_file_paths]
+            data_flow.add_input_data(input_data)
+        if output_file_paths is not None and data_flow.push_output_data:
+            if output_data is None:
+                output_data = [str(_OmniUrl(file_path)) for file_path in output_file_paths]
+            data_flow.add_output_data(output_data)
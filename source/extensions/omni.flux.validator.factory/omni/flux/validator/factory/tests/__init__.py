@@ -16,3 +16,4 @@
 """
 
 from .unit.test_factory import TestValidatorFactory
+from .unit.test_data_flow import TestDataFlow
@@ -0,0 +1,79 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+from types import SimpleNamespace
+
+from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
+from omni.flux.validator.factory import InOutDataFlow as _InOutDataFlow
+from omni.flux.validator.factory import utils as _utils
+from omni.kit.test.async_unittest import AsyncTestCase
+
+
+class TestDataFlow(AsyncTestCase):
+    async def test_add_data_should_skip_existing_values_and_keep_order(self):
+        # Arrange
+        data_flow = _InOutDataFlow(input_data=["c"])
+
+        # Act
+        data_flow.add_input_data(["a", "c", "b", "a"])
+        data_flow.add_input_data(["b", "d"])
+        data_flow.add_output_data(["a", "a"])
+
+        # Assert
+        self.assertListEqual(data_flow.input_data, ["c", "a", "b", "d"])
+        self.assertListEqual(data_flow.output_data, ["a"])
+        self.assertDictEqual(
+            data_flow.dict(),
+            {
+                "name": "InOutData",
+                "channel": "Default",
+                "input_data": ["c", "a", "b", "d"],
+                "push_input_data": False,
+                "output_data": ["a"],
+                "push_output_data": False,
+            },
+        )
+
+    async def test_add_data_replaced_list_should_rebuild_index(self):
+        # Arrange
+        data_flow = _InOutDataFlow()
+        data_flow.add_input_data(["a", "b"])
+
+        # Act
+        data_flow.input_data = ["b"]
+        data_flow.add_input_data(["a", "b"])
+        data_flow.input_data.append("c")
+        data_flow.add_input_data(["c", "d"])
+
+        # Assert
+        self.assertListEqual(data_flow.input_data, ["b", "a", "c", "d"])
+
+    async def test_push_data_should_only_push_enabled_data_flows(self):
+        # Arrange
+        pushed_data_flow = _InOutDataFlow(push_input_data=True, push_output_data=True)
+        not_pushed_data_flow = _InOutDataFlow()
+        schema_data = SimpleNamespace(data_flows=[pushed_data_flow, not_pushed_data_flow])
+
+        # Act
+        _utils.push_data(schema_data, input_file_paths=["/a.usda", "/a.usda"], output_file_paths=["/b.usda"])
+        _utils.push_input_data(schema_data, ["/a.usda", "/c.usda"])
+
+        # Assert
+        self.assertListEqual(pushed_data_flow.input_data, [str(_OmniUrl("/a.usda")), str(_OmniUrl("/c.usda"))])
+        self.assertListEqual(pushed_data_flow.output_data, [str(_OmniUrl("/b.usda"))])
+        self.assertIsNone(not_pushed_data_flow.input_data)
+        self.assertIsNone(not_pushed_data_flow.output_data)
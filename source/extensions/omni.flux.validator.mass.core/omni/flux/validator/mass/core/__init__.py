@@ -15,7 +15,7 @@
 * limitations under the License.
 """
 
-__all__ = ["Executors", "ManagerMassCore", "Model", "Item", "HEADER_DICT", "SCHEMA_PATH_SETTING"]
+__all__ = ["Executors", "ManagerMassCore", "Model", "Item", "CookedSchema", "HEADER_DICT", "SCHEMA_PATH_SETTING"]
 
 from .manager import SCHEMA_PATH_SETTING, Executors, ManagerMassCore
-from .schema_tree.model import HEADER_DICT, Item, Model
+from .schema_tree.model import HEADER_DICT, CookedSchema, Item, Model
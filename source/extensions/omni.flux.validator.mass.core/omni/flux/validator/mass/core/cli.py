@@ -53,6 +53,13 @@ def main():
         "-t", "--timeout", help="Timeout for the validation. Default 600sc.", nargs="?", const=1, type=int
     )
     parser.add_argument("-si", "--silent", help="Silent the stdout", default=False, action="store_true")
+    parser.add_argument(
+        "-mif",
+        "--max-in-flight",
+        help="Maximum number of cooked schemas to validate at the same time. Default 4.",
+        type=int,
+        default=4,
+    )
     parser.add_argument("-sfar", "--start-future-args-remove", help=argparse.SUPPRESS)
     parser.add_argument("-efar", "--end-future-args-remove", help=argparse.SUPPRESS)
     args = parser.parse_args()
@@ -69,6 +76,7 @@ def main():
             args.print_result,
             args.silent,
             args.timeout,
+            max_in_flight=args.max_in_flight,
         )
     )
 
@@ -79,6 +87,7 @@ async def run(
     print_result: bool,
     silent: bool,
     timeout: Optional[int] = None,
+    max_in_flight: int = 4,
 ):
     exit_code = 0
 
@@ -109,7 +118,7 @@ async def run(
                 carb.log_error(message)
                 return
             try:
-                result = await item.cook_template_no_exception()
+                result = await item.cook_template_lazy_no_exception()
             except ValidationError as e:
                 carb.log_error("Exception when async cook_template_no_exception()")
                 carb.log_error(f"{e}")
@@ -123,6 +132,7 @@ async def run(
                 silent=silent,
                 timeout=timeout,
                 standalone=True,
+                max_in_flight=max_in_flight,
             )
             print(f"Global progress {i+1}/{size_items}")
     finally:
@@ -15,6 +15,7 @@
 * limitations under the License.
 """
 
+import asyncio
 import subprocess
 import sys
 import tempfile
@@ -193,13 +194,16 @@ class ProcessExecutor(_BaseExecutor):
         timeout: Optional[int] = None,
         standalone: Optional[bool] = False,
         queue_id: str | None = None,
-    ):
-        return self._EXECUTOR.submit(
-            self._worker,
-            core,
-            print_result=print_result,
-            silent=silent,
-            timeout=timeout,
-            standalone=standalone,
-            queue_id=queue_id,
+    ) -> asyncio.Future:
+        # The worker thread resolves the asyncio future directly, so the result can be awaited without polling
+        return asyncio.wrap_future(
+            self._EXECUTOR.submit(
+                self._worker,
+                core,
+                print_result=print_result,
+                silent=silent,
+                timeout=timeout,
+                standalone=standalone,
+                queue_id=queue_id,
+            )
         )
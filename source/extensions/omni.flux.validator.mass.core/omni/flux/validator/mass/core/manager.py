@@ -16,10 +16,9 @@
 """
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import carb.settings
-import omni.kit.app
 import omni.usd
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
@@ -29,6 +28,7 @@ from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
 from .data_models import Executors
 from .executors import AsyncExecutor, ProcessExecutor
 from .schema_tree import model as _schema_model
+from .schema_tree.model import CookedSchema as _CookedSchema
 
 SCHEMA_PATH_SETTING = "/exts/omni.flux.validator.mass.widget/schemas"  # list of paths of schema separated by a coma
 
@@ -119,32 +119,48 @@ class ManagerMassCore:
     async def create_tasks(
         self,
         executor: Executors,
-        data: List[Dict[Any, Any]],
+        data: List[Union[Dict[Any, Any], _CookedSchema]],
         print_result: bool = False,
         silent: bool = False,
         timeout: Optional[int] = None,
         standalone: Optional[bool] = False,
         queue_id: str | None = None,
+        max_in_flight: Optional[int] = None,
     ) -> List[Tuple[_ManagerCore, asyncio.Future]]:
         """
         Run the validation using the current schema
 
         Args:
             executor: the executor to use
-            data: list of schemas to run
+            data: list of schemas or cooked schemas to run
             print_result: print the result or not into stdout
             silent: silent the stdout
             timeout: the maximum time a task should take
             standalone: does the process run in a standalone mode or not (like a CLI)
             queue_id: the queue ID to use. Needed if you have multiple widgets that shows different queues
+            max_in_flight: if set, only this number of schemas are built and submitted at the same time. The next
+                           schema is built when a task is finished, and finished tasks are not kept.
 
         Returns:
-            The created core validation manager + the corresponding task
+            The created core validation manager + the corresponding task. Empty if `max_in_flight` is set.
         """
+        if max_in_flight is not None:
+            await self.__run_tasks_in_flight(
+                executor,
+                data,
+                max_in_flight,
+                print_result=print_result,
+                silent=silent,
+                timeout=timeout,
+                standalone=standalone,
+                queue_id=queue_id,
+            )
+            return []
+
         result = []
         size = len(data)
         for schema in data:
-            core = _ManagerCore(schema)
+            core = _ManagerCore(self.__to_schema_dict(schema))
 
             task = self.__executors[int(executor)].submit(
                 core,
@@ -159,22 +175,80 @@ class ManagerMassCore:
             self._on_core_added(core)
 
         if self.__standalone:
+            cores = {task: core for core, task in result}
             counter = 0
-            while bool(result):
-                await omni.kit.app.get_app().next_update_async()
-                to_delete = []
-                for result_data in result:
-                    core, task = result_data
-                    if not task.done():
-                        continue
-                    to_delete.append(result_data)
-                    result_validation, message_validation = task.result()
-                    self._on_run_finished(core, counter, size, result_validation, message_validation)
-                    counter += 1
-                for to_d in to_delete:
-                    result.remove(to_d)
+
+            def _on_task_done(task):
+                nonlocal counter
+                result.remove((cores[task], task))
+                result_validation, message_validation = task.result()
+                self._on_run_finished(cores[task], counter, size, result_validation, message_validation)
+                counter += 1
+
+            await self.wait_tasks(list(cores.keys()), callback=_on_task_done)
 
         return result
 
+    @staticmethod
+    async def wait_tasks(
+        tasks: List[asyncio.Future], callback: Optional[Callable[[asyncio.Future], Any]] = None
+    ) -> List[asyncio.Future]:
+        """
+        Wait for the tasks to finish. The tasks wake up this function when they finish, no app update is needed.
+
+        Args:
+            tasks: the tasks returned by `create_tasks()`
+            callback: function called with each task as soon as it finishes
+
+        Returns:
+            The tasks, in the order they finished
+        """
+        pending = {asyncio.wrap_future(task): task for task in tasks}
+        finished = []
+        while pending:
+            done, _ = await asyncio.wait(pending.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                task = pending.pop(future)
+                finished.append(task)
+                if callback:
+                    callback(task)
+        return finished
+
+    @staticmethod
+    def __to_schema_dict(schema: Union[Dict[Any, Any], _CookedSchema]) -> Dict[Any, Any]:
+        return schema.to_dict() if isinstance(schema, _CookedSchema) else schema
+
+    async def __run_tasks_in_flight(
+        self,
+        executor: Executors,
+        data: List[Union[Dict[Any, Any], _CookedSchema]],
+        max_in_flight: int,
+        **kwargs,
+    ):
+        """
+        Build and submit the schemas to the executor, with at most `max_in_flight` tasks at the same time.
+        The validation manager of a schema only exists while its task runs.
+        """
+        size = len(data)
+        counter = 0
+        in_flight = {}
+        schemas = iter(data)
+        while True:
+            while len(in_flight) < max(max_in_flight, 1):
+                schema = next(schemas, None)
+                if schema is None:
+                    break
+                core = _ManagerCore(self.__to_schema_dict(schema))
+                in_flight[asyncio.wrap_future(self.__executors[int(executor)].submit(core, **kwargs))] = core
+                self._on_core_added(core)
+            if not in_flight:
+                break
+            done, _ = await asyncio.wait(in_flight.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                core = in_flight.pop(task)
+                result_validation, message_validation = task.result()
+                self._on_run_finished(core, counter, size, result_validation, message_validation)
+                counter += 1
+
     def destroy(self):
         pass
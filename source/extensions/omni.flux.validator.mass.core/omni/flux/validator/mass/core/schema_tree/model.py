@@ -15,18 +15,111 @@
 * limitations under the License.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import copy
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import omni.ui as ui
 import omni.usd
 from omni.flux.utils.common import Event as _Event
 from omni.flux.utils.common import EventSubscription as _EventSubscription
 from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
-from omni.flux.validator.manager.core import ValidationSchema as _ValidationSchema
 
 HEADER_DICT = {0: "Items"}
 
 
+def _get_plugin(schema: Any, plugin_path: Tuple[Union[str, int], ...]) -> Any:
+    """Get the plugin of a schema model or dictionary from its path, like `("check_plugins", 0, "context_plugin")`"""
+    plugin = schema
+    for key in plugin_path:
+        plugin = plugin[key] if isinstance(key, int) or isinstance(plugin, dict) else getattr(plugin, key)
+    return plugin
+
+
+class CookedSchema:
+    """
+    A template cooked by the plugins. Only the plugin data edited by the cooking are kept, the template dictionary
+    is shared between all the cooked schemas of a template.
+    """
+
+    __slots__ = ("_template", "_plugin_datas", "_name", "_uuid", "_name_tooltip")
+
+    def __init__(
+        self,
+        template: Dict[Any, Any],
+        plugin_datas: Optional[Dict[Tuple[Union[str, int], ...], Any]] = None,
+        name: Optional[str] = None,
+        uuid: Optional[str] = None,
+        name_tooltip: Optional[str] = None,
+    ):
+        """
+        Args:
+            template: the validated template dictionary. Should not be modified
+            plugin_datas: the cooked data of the plugins, by plugin path
+            name: the name of the cooked schema. If None, the template name is used
+            uuid: the uuid of the cooked schema. If None, the template uuid is used
+            name_tooltip: the tooltip of the name of the cooked schema
+        """
+        self._template = template
+        self._plugin_datas = plugin_datas or {}
+        self._name = name
+        self._uuid = uuid
+        self._name_tooltip = name_tooltip
+
+    @property
+    def name(self) -> str:
+        """The name of the cooked schema"""
+        return self._name or self._template["name"]
+
+    @property
+    def uuid(self) -> Optional[str]:
+        """The uuid of the cooked schema"""
+        return self._uuid or self._template.get("uuid")
+
+    @property
+    def name_tooltip(self) -> Optional[str]:
+        """The tooltip of the name of the cooked schema"""
+        return self._name_tooltip
+
+    def cook(
+        self,
+        plugin_path: Tuple[Union[str, int], ...],
+        data: Any,
+        name: Optional[str] = None,
+        uuid: Optional[str] = None,
+        name_tooltip: Optional[str] = None,
+    ) -> "CookedSchema":
+        """
+        Create a new cooked schema from this one, with the data of a plugin replaced
+
+        Args:
+            plugin_path: the path of the plugin in the schema, like `("check_plugins", 0, "context_plugin")`
+            data: the cooked data of the plugin
+            name: the name of the new cooked schema
+            uuid: the uuid of the new cooked schema
+            name_tooltip: the tooltip of the name of the new cooked schema
+
+        Returns:
+            The new cooked schema
+        """
+        plugin_datas = dict(self._plugin_datas)
+        plugin_datas[plugin_path] = data
+        return CookedSchema(self._template, plugin_datas, name=name, uuid=uuid, name_tooltip=name_tooltip)
+
+    def to_dict(self) -> Dict[Any, Any]:
+        """Build the schema dictionary of the cooked schema"""
+        schema = copy.deepcopy(self._template)
+        for plugin_path, data in self._plugin_datas.items():
+            _get_plugin(schema, plugin_path)["data"] = data.dict()
+        if self._name:
+            schema["name"] = self._name
+        if self._uuid:
+            schema["uuid"] = self._uuid
+        if self._name_tooltip:
+            schema["data"] = dict(schema.get("data") or {})
+            schema["data"]["name_tooltip"] = self._name_tooltip
+        return schema
+
+
 class Item(ui.AbstractItem):
     """Item of the model"""
 
@@ -74,88 +167,67 @@ class Item(ui.AbstractItem):
         Returns:
             List of new/cooked template
         """
+        return [cooked_schema.to_dict() for cooked_schema in await self.cook_template_lazy_no_exception()]
 
-        async def _cook_mass_template(cooked_plugins, _cooked_schemas: List[_ValidationSchema]):
+    @omni.usd.handle_exception
+    async def cook_template_lazy(self) -> List["CookedSchema"]:
+        return await self.cook_template_lazy_no_exception()
+
+    async def cook_template_lazy_no_exception(self) -> List["CookedSchema"]:
+        """
+        Same as `cook_template_no_exception()`, but the cooked templates are not built.
+
+        The template is validated once, and each cooked template only keeps the plugin data that the cooking changed.
+        The schema dictionary of a cooked template is built when `CookedSchema.to_dict()` is called.
+
+        Returns:
+            List of cooked template
+        """
+        template = self._model.model.dict()
+        template_model = _ManagerCore(template).model
+
+        async def _cook_mass_template(plugin_path: Tuple[Union[str, int], ...], _cooked_schemas: List[CookedSchema]):
+            template_plugin = _get_plugin(template_model, plugin_path)
+            if not template_plugin.data.cook_mass_template:
+                return _cooked_schemas
+            self.__sub_mass_cook_template = template_plugin.instance.subscribe_mass_cook_template(  # noqa PLW0238
+                self.on_mass_cook_template
+            )
             result_schema = []
-            if cooked_plugins[0].data.cook_mass_template:
-                self.__sub_mass_cook_template = cooked_plugins[0].instance.subscribe_mass_cook_template(  # noqa PLW0238
-                    self.on_mass_cook_template
-                )
-                for cooked_schema in _cooked_schemas:
-                    success, message, result = (
-                        await cooked_plugins[0].instance.mass_cook_template(cooked_plugins[0].data) or []
+            for cooked_schema in _cooked_schemas:
+                success, message, result = await template_plugin.instance.mass_cook_template(template_plugin.data) or []
+                if not success:
+                    raise ValueError(message)
+                # the name, uuid and tooltip set by a cooked data are kept for the next cooked data, like the previous
+                # schema was edited
+                name, schema_uuid, name_tooltip = cooked_schema.name, cooked_schema.uuid, cooked_schema.name_tooltip
+                for data in result:
+                    name = data.display_name_mass_template or name
+                    schema_uuid = data.uuid or schema_uuid
+                    name_tooltip = data.display_name_mass_template_tooltip or name_tooltip
+                    result_schema.append(
+                        cooked_schema.cook(plugin_path, data, name=name, uuid=schema_uuid, name_tooltip=name_tooltip)
                     )
-                    if not success:
-                        raise ValueError(message)
-                    for data in result:
-                        for cooked_plugin in cooked_plugins:
-                            cooked_plugin.data = data
-                        if data.display_name_mass_template:
-                            cooked_schema.name = data.display_name_mass_template
-                        if data.uuid:
-                            cooked_schema.uuid = data.uuid
-                        if data.display_name_mass_template_tooltip:
-                            current_data = cooked_schema.data
-                            if current_data is None:
-                                current_data = {}
-                            current_data.update({"name_tooltip": data.display_name_mass_template_tooltip})
-                            cooked_schema.data = current_data
-                        result_schema.append(_ValidationSchema(**cooked_schema.dict()))
-            if not result_schema:
-                result_schema = list(_cooked_schemas)
-            return result_schema
-
-        model_clone = _ManagerCore(self._model.model.dict())
-        final_result = await _cook_mass_template([model_clone.model.context_plugin], [model_clone.model])
-
-        cooked_schemas5 = []
-        for i, schema in enumerate(final_result):  # noqa
-            cooked_schemas = [schema]
-            for i2, _cooked_check_plugin_model in enumerate(cooked_schemas[-1].check_plugins):
-                # sub context
-                cooked_schemas = await _cook_mass_template(
-                    [cooked_schema.check_plugins[i2].context_plugin for cooked_schema in cooked_schemas], cooked_schemas
-                )
-
-                # selector
-                cooked_schemas2 = list(cooked_schemas)
-                for i3, _cooked_select_plugins_model in enumerate(
-                    cooked_schemas2[0].check_plugins[i2].selector_plugins
-                ):
-                    cooked_select_plugins_models = []
-                    for cooked_schema2 in cooked_schemas2:
-                        cooked_select_plugins_models.append(cooked_schema2.check_plugins[i2].selector_plugins[i3])
-                    cooked_schemas2 = await _cook_mass_template(cooked_select_plugins_models, cooked_schemas2)
-
-                # check
-                cooked_schemas3 = list(cooked_schemas2)
-                cooked_schemas3 = await _cook_mass_template(
-                    [cooked_schema3.check_plugins[i2] for cooked_schema3 in cooked_schemas3], cooked_schemas3
-                )
-
-                # resultors
-                cooked_schemas4 = list(cooked_schemas3)
-                if cooked_schemas4[0].check_plugins[i2].resultor_plugins:
-                    for i4, _cooked_resultor_plugins_model in enumerate(
-                        cooked_schemas4[0].check_plugins[i2].resultor_plugins
-                    ):
-                        cooked_resultor_plugins_models = []
-                        for cooked_schema4 in cooked_schemas4:
-                            cooked_resultor_plugins_models.append(cooked_schema4.check_plugins[i2].resultor_plugins[i4])
-                        cooked_schemas4 = await _cook_mass_template(cooked_resultor_plugins_models, cooked_schemas4)
-
-                cooked_schemas = list(cooked_schemas4)
-
-            # resultor
-            if cooked_schemas[-1].resultor_plugins:
-                cooked_resultor_plugins = []
-                for i4, _cooked_resultor_plugin in enumerate(cooked_schemas[-1].resultor_plugins):
-                    for cooked_schema in cooked_schemas:
-                        cooked_resultor_plugins.append(cooked_schema.resultor_plugins[i4])
-                cooked_schemas5 = await _cook_mass_template(cooked_resultor_plugins, cooked_schemas5)
-            cooked_schemas5.extend(cooked_schemas)
-
-        return [cooked_schemas.dict() for cooked_schemas in cooked_schemas5]
+            return result_schema or _cooked_schemas
+
+        cooked_schemas = await _cook_mass_template(("context_plugin",), [CookedSchema(template)])
+        for i, check_plugin_model in enumerate(template_model.check_plugins):
+            # sub context
+            cooked_schemas = await _cook_mass_template(("check_plugins", i, "context_plugin"), cooked_schemas)
+            # selector
+            for i2 in range(len(check_plugin_model.selector_plugins)):
+                cooked_schemas = await _cook_mass_template(("check_plugins", i, "selector_plugins", i2), cooked_schemas)
+            # check
+            cooked_schemas = await _cook_mass_template(("check_plugins", i), cooked_schemas)
+            # resultors
+            for i2 in range(len(check_plugin_model.resultor_plugins or [])):
+                cooked_schemas = await _cook_mass_template(("check_plugins", i, "resultor_plugins", i2), cooked_schemas)
+
+        # resultor
+        for i in range(len(template_model.resultor_plugins or [])):
+            cooked_schemas = await _cook_mass_template(("resultor_plugins", i), cooked_schemas)
+
+        return cooked_schemas
 
     @omni.usd.handle_exception
     async def build_ui(self):
@@ -647,3 +647,37 @@ class TestCore(AsyncTestCase):
             self.assertEqual(
                 result[8]["check_plugins"][2]["selector_plugins"][0]["data"]["last_select_message"], default_values
             )
+
+    async def test_cook_template_lazy_only_keeps_cooked_data(self):
+        core = _ManagerMassCore()
+        fake_schema = _get_fake_context_not_cook_template()
+
+        fake_schema["check_plugins"][1]["data"].update({"cook_mass_template": True})
+        core.add_schemas([fake_schema])
+        items = core.schema_model.get_item_children(None)
+
+        def my_side_effect(schema_data_template):
+            mass_fake_schema = schema_data_template.dict()
+            mass_fake_schema.update({"last_check_message": "hello01", "display_name_mass_template": "Cooked"})
+            return True, None, [_FakeCheck.data_type(**mass_fake_schema), schema_data_template]
+
+        with (
+            patch.object(_FakeCheck, "mass_cook_template", side_effect=my_side_effect),
+            patch("omni.flux.validator.mass.core.schema_tree.model._ManagerCore") as manager_core_mock,
+        ):
+            manager_core_mock.return_value.model = items[0].model.model
+            result = await items[0].cook_template_lazy()
+
+            # the template is validated once, not once by cooked schema
+            manager_core_mock.assert_called_once()
+
+        self.assertEqual(len(result), 2)
+        self.assertListEqual([cooked_schema.name for cooked_schema in result], ["Cooked", "Cooked"])
+
+        default_values = _ValidationSchema(**fake_schema).dict()["check_plugins"][0]["data"]["last_check_message"]
+        result_dicts = [cooked_schema.to_dict() for cooked_schema in result]
+        self.assertEqual(result_dicts[0]["check_plugins"][1]["data"]["last_check_message"], "hello01")
+        self.assertEqual(result_dicts[1]["check_plugins"][1]["data"]["last_check_message"], default_values)
+        # the template is not edited by the cooked schemas
+        self.assertNotEqual(result_dicts[0]["check_plugins"][1]["data"], result_dicts[1]["check_plugins"][1]["data"])
+        self.assertEqual(result_dicts[0]["check_plugins"][0], result_dicts[1]["check_plugins"][0])
@@ -15,6 +15,9 @@
 * limitations under the License.
 """
 
+import asyncio
+import concurrent.futures
+import threading
 from unittest.mock import patch
 
 import omni.kit.app
@@ -111,3 +114,54 @@ class TestExecutors(AsyncTestCase):
                 self.assertEqual(run_mock.call_count, 4)
                 self.assertEqual(core_added_mock.call_count, 4)
                 self.assertIsNotNone(result)
+
+    async def test_create_tasks_max_in_flight(self):
+        core = _ManagerMassCore(schema_paths=self.SCHEMAS)
+        items = core.schema_model.get_item_children(None)
+
+        in_flight = []
+        max_in_flight = []
+
+        async def _run(*_args, **_kwargs):
+            in_flight.append(True)
+            max_in_flight.append(len(in_flight))
+            await omni.kit.app.get_app().next_update_async()
+            in_flight.pop()
+            return True, None
+
+        # only 2 cores should run at the same time, and the finished cores are not kept
+        with (
+            patch("omni.flux.validator.mass.core.executors.async_executor.AsyncExecutor.submit") as submit_mock,
+            patch.object(core, "_on_run_finished") as run_finished_mock,
+        ):
+
+            submit_mock.side_effect = lambda *_args, **_kwargs: asyncio.ensure_future(_run())
+            result = await core.create_tasks(0, [item._data for item in items] * 3, max_in_flight=2)  # noqa
+
+            self.assertListEqual(result, [])
+            self.assertEqual(submit_mock.call_count, 6)
+            self.assertEqual(run_finished_mock.call_count, 6)
+            self.assertLessEqual(max(max_in_flight), 2)
+
+    async def test_wait_tasks_without_app_update(self):
+        loop = asyncio.get_event_loop()
+        async_task = loop.create_future()
+        thread_task = concurrent.futures.Future()
+
+        finished = []
+        with patch.object(omni.kit.app.get_app(), "next_update_async") as next_update_mock:
+            waiter = asyncio.ensure_future(
+                _ManagerMassCore.wait_tasks([async_task, thread_task], callback=finished.append)
+            )
+            # the thread future is resolved from another thread, like the process executor does
+            threading.Thread(target=thread_task.set_result, args=((True, None),)).start()
+            await asyncio.sleep(0.1)
+            self.assertListEqual(finished, [thread_task])
+
+            async_task.set_result((True, None))
+            result = await waiter
+
+            next_update_mock.assert_not_called()
+
+        self.assertListEqual(result, [thread_task, async_task])
+        self.assertListEqual(finished, [thread_task, async_task])
@@ -21,7 +21,6 @@ import traceback
 from json import dumps, loads
 
 import carb
-import omni.kit.app
 from omni.flux.service.factory import ServiceBase
 from omni.flux.utils.common import path_utils
 from omni.flux.validator.manager.core import ValidationSchema, validation_schema_json_encoder
@@ -143,19 +142,8 @@ class MassValidatorService(ServiceBase):
                             lambda updated_schema, queue_id: tasks.update({task: updated_schema})  # noqa
                         )
 
-                # Executors can be asyncio or concurrent libraries
-                tasks_in_progress = list(tasks.keys())
-                while bool(tasks_in_progress):
-                    await omni.kit.app.get_app().next_update_async()
-                    completed_tasks = []
-                    for task in tasks_in_progress:
-                        if not task.done():
-                            continue
-                        completed_tasks.append(task)
-                    for task in completed_tasks:
-                        # Remove the task subscription when the task completes
-                        self._update_subscriptions.pop(task)
-                        tasks_in_progress.remove(task)
+                # Remove the task subscription as soon as the task completes
+                await mass_core.wait_tasks(list(tasks.keys()), callback=self._update_subscriptions.pop)
 
                 if not all(v.validation_passed for v in tasks.values()):
                     ServiceBase.raise_error(
@@ -16,7 +16,9 @@
 """
 
 import abc
-from typing import Any, Optional
+import asyncio
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import carb.settings
 import omni.client
@@ -24,7 +26,7 @@ import omni.kit.app
 import omni.usd
 from omni.flux.validator.factory import ContextBase as _ContextBase
 from omni.flux.validator.factory import SetupDataTypeVar as _SetupDataTypeVar
-from pxr import Sdf
+from pxr import Sdf, UsdUtils
 from pydantic import Field
 
 _WAS_FLUX_CLI_CHECKED = False
@@ -63,6 +65,133 @@ class ContextBaseUSD(_ContextBase, abc.ABC):
 
         return context
 
+    async def _process_files_in_context_pool(
+        self,
+        schema_data: "ContextBaseUSD.Data",
+        file_paths: List[str],
+        run_callback: Callable[[_SetupDataTypeVar], Awaitable[None]],
+        max_concurrent: int,
+        save_stage: bool = False,
+    ) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Open each file in a pool of dedicated USD contexts. Up to `max_concurrent` files are opened, saved and closed at
+        the same time, while the validation itself runs on one file at a time.
+
+        The plugins of the schema share their data and the state of the validation manager between every run of
+        `run_callback` (the computed context of the nested context plugins, the check results, the stop and pause
+        state), so the validation is never reentrant. An exception raised by the validation of a file stops the
+        processing of every file, like when the files are processed one by one.
+
+        Layers are shared between the stages of every context, so files that share a layer (a file referencing another
+        processed file, or two files with a common dependency) are processed one after another in the same context.
+
+        Args:
+            schema_data: the data of the plugin from the schema
+            file_paths: the USD files to process
+            run_callback: the validation that will be run in the context of each file
+            max_concurrent: the number of USD contexts to use
+            save_stage: save the stage after the validation
+
+        Returns:
+            The files that were processed successfully, in the input order, and the error message of each file that
+            could not be opened or saved
+        """
+        file_groups = self._group_files_sharing_layers(file_paths)
+        base_context_name = schema_data.computed_context or ""
+        pool_size = max(1, min(max_concurrent, len(file_groups)))
+        context_names = [f"{base_context_name}_pool_{i}" for i in range(pool_size)]
+        created_context_names = []
+        available_contexts = asyncio.Queue()
+        is_flux_cli = carb.settings.get_settings().get("is_flux_cli")
+        for context_name in context_names:
+            context = omni.usd.get_context(context_name)
+            if not context:
+                context = omni.usd.create_context(context_name)
+                created_context_names.append(context_name)
+            if is_flux_cli:
+                omni.usd.add_hydra_engine("pxr", context)
+            available_contexts.put_nowait(context_name)
+
+        validation_lock = asyncio.Lock()
+        processed = 0
+        errors = {}
+
+        def report_progress(file_path: str):
+            nonlocal processed
+            processed += 1
+            if file_path in errors:
+                carb.log_error(errors[file_path])
+                self.on_progress(processed / len(file_paths), errors[file_path], False)
+            else:
+                self.on_progress(processed / len(file_paths), f"Processed {Path(file_path).name}", True)
+
+        async def process_file(context_name: str, file_path: str):
+            context = omni.usd.get_context(context_name)
+            result, error = await context.open_stage_async(file_path)
+            if not result:
+                errors[file_path] = f"Can't open the file {file_path}: {error}"
+                report_progress(file_path)
+                return
+            async with validation_lock:
+                await run_callback(context_name)
+            if save_stage:
+                result, error, _saved_layers = await context.save_stage_async()
+                if not result:
+                    errors[file_path] = f"Can't save the file {file_path}: {error}"
+            await self._close_stage(context_name)
+            report_progress(file_path)
+
+        async def process_group(file_group: List[str]):
+            context_name = await available_contexts.get()
+            try:
+                for file_path in file_group:
+                    await process_file(context_name, file_path)
+            finally:
+                available_contexts.put_nowait(context_name)
+
+        tasks = [asyncio.ensure_future(process_group(file_group)) for file_group in file_groups]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Stop the other files if the validation of a file raised
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for context_name in context_names:
+                await self._close_stage(context_name)
+            # Only destroy the contexts created by the pool
+            for context_name in created_context_names:
+                omni.usd.destroy_context(context_name)
+
+        return [file_path for file_path in file_paths if file_path not in errors], errors
+
+    @staticmethod
+    def _group_files_sharing_layers(file_paths: List[str]) -> List[List[str]]:
+        """
+        Group the files that share at least one layer, including the files themselves
+
+        Args:
+            file_paths: the USD files to group
+
+        Returns:
+            The groups of files, in the input order. Files without shared layers are in their own group.
+        """
+        groups: List[List[str]] = []
+        group_layers: List[set] = []
+        for file_path in file_paths:
+            all_layers, _assets, _unresolved = UsdUtils.ComputeAllDependencies(file_path)
+            # The dependencies include the file itself
+            layers = {layer.realPath or layer.identifier for layer in all_layers} or {str(file_path)}
+            # Merge every group sharing a layer with this file
+            file_group = [file_path]
+            for index in reversed(range(len(groups))):
+                if group_layers[index] & layers:
+                    file_group = groups.pop(index) + file_group
+                    layers |= group_layers.pop(index)
+            groups.append(file_group)
+            group_layers.append(layers)
+        return [sorted(group, key=file_paths.index) for group in groups]
+
     async def _close_stage(self, usd_context_name: str):
         """
         Function that will be called to after the check of the data. For example, save the input USD stage
@@ -87,7 +87,7 @@ class DependencyIterator(_ContextBaseUSD):
 
         root_layer = stage.GetRootLayer()
         root_layer_identifier = root_layer.identifier
-        (all_layers, _assets, _unresolved) = UsdUtils.ComputeAllDependencies(root_layer_identifier)
+        all_layers, _assets, _unresolved = UsdUtils.ComputeAllDependencies(root_layer_identifier)
 
         if not all_layers:
             all_layers = [layer for layer in stage.GetLayerStack() if not layer.anonymous]
@@ -18,6 +18,7 @@
 from .e2e.test_asset_importer import *
 from .e2e.test_current_stage import *
 from .e2e.test_texture_importer import *
+from .e2e.test_usd_directory import *
 from .e2e.test_usd_file import *
 from .unit.test_asset_importer import *
 from .unit.test_texture_importer import *
@@ -0,0 +1,190 @@
+"""
+* SPDX-FileCopyrightText: Copyright (c) 2024 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+* SPDX-License-Identifier: Apache-2.0
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+* https://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+"""
+
+import asyncio
+import shutil
+import tempfile
+from pathlib import Path
+
+import omni.client
+import omni.usd
+from omni.flux.validator.manager.core import ManagerCore as _ManagerCore
+from omni.flux.validator.plugin.context.usd_stage.usd_directory import USDDirectory as _USDDirectory
+from omni.kit.test.async_unittest import AsyncTestCase
+from omni.kit.test_suite.helpers import arrange_windows, get_test_data_path, wait_stage_loading
+from pxr import Sdf
+
+
+class TestUsdDirectory(AsyncTestCase):
+    async def setUp(self):
+        await arrange_windows()
+        self.temp_dir = tempfile.TemporaryDirectory()  # noqa PLR1732
+        for i in range(4):
+            shutil.copyfile(
+                get_test_data_path(__name__, "usd/cubes.usda"), Path(self.temp_dir.name) / f"cubes_{i}.usda"
+            )
+
+    # After running each test
+    async def tearDown(self):
+        await wait_stage_loading()
+        self.temp_dir.cleanup()
+
+    def _get_schema(self, max_concurrent_files: int):
+        return {
+            "name": "Test",
+            "context_plugin": {
+                "name": "USDDirectory",
+                "data": {
+                    "directory": self.temp_dir.name,
+                    "context_name": "",
+                    "max_concurrent_files": max_concurrent_files,
+                    "data_flows": [{"name": "InOutData", "push_input_data": True}],
+                },
+            },
+            "check_plugins": [
+                {
+                    "name": "PrintPrims",
+                    "selector_plugins": [{"name": "AllPrims", "data": {}}],
+                    "data": {},
+                    "context_plugin": {"name": "CurrentStage", "data": {}},
+                }
+            ],
+        }
+
+    async def test_run_concurrent_files_ok(self):
+        core = _ManagerCore(self._get_schema(2))
+
+        progress_messages = []
+
+        def on_progress(_progress, _message, _result):
+            progress_messages.append((_message, _result))
+
+        _sub_progress = core.model.context_plugin.instance.subscribe_progress(on_progress)  # noqa
+
+        await core.deferred_run()
+
+        self.assertTrue(core.model.finished[0])
+        # Every file is reported individually
+        for i in range(4):
+            self.assertIn((f"Processed cubes_{i}.usda", True), progress_messages)
+        # Every file was pushed to the data flow
+        input_data = core.model.context_plugin.data.data_flows[0].input_data
+        self.assertListEqual(
+            sorted(str(omni.client.normalize_url(str(Path(self.temp_dir.name) / f"cubes_{i}.usda"))) for i in range(4)),
+            sorted(str(omni.client.normalize_url(path)) for path in input_data),
+        )
+
+    async def test_run_concurrent_files_failure_reported(self):
+        with open(Path(self.temp_dir.name) / "broken.usda", "w", encoding="utf8") as file:
+            file.write("this is not a usd file")
+
+        core = _ManagerCore(self._get_schema(2))
+
+        failures = []
+
+        def on_progress(_progress, _message, _result):
+            if not _result and "broken.usda" in _message:
+                failures.append(_message)
+
+        _sub_progress = core.model.context_plugin.instance.subscribe_progress(on_progress)  # noqa
+
+        with self.assertRaises(ValueError):
+            # The broken file makes the context setup fail once every file was processed
+            await core.deferred_run()
+
+        self.assertEqual(1, len(failures))
+
+    async def test_run_concurrent_files_should_only_destroy_created_contexts(self):
+        # Arrange
+        existing_context = omni.usd.create_context("_pool_0")
+        core = _ManagerCore(self._get_schema(2))
+
+        try:
+            # Act
+            await core.deferred_run()
+
+            # Assert
+            self.assertTrue(core.model.finished[0])
+            self.assertIs(omni.usd.get_context("_pool_0"), existing_context)
+            self.assertIsNone(omni.usd.get_context("_pool_1"))
+        finally:
+            omni.usd.destroy_context("_pool_0")
+
+    async def test_process_files_in_context_pool_should_validate_one_file_at_a_time(self):
+        # Arrange
+        core = _ManagerCore(self._get_schema(4))
+        plugin = core.model.context_plugin
+        file_paths = [str(Path(self.temp_dir.name) / f"cubes_{i}.usda") for i in range(4)]
+
+        running = []
+        max_running = 0
+
+        async def run_callback(context_name):
+            nonlocal max_running
+            running.append(context_name)
+            max_running = max(max_running, len(running))
+            await asyncio.sleep(0.01)
+            running.remove(context_name)
+
+        # Act
+        processed_files, errors = await plugin.instance._process_files_in_context_pool(  # noqa PLW0212
+            plugin.data, file_paths, run_callback, 4
+        )
+
+        # Assert
+        self.assertEqual(1, max_running)
+        self.assertListEqual(file_paths, processed_files)
+        self.assertDictEqual({}, errors)
+
+    async def test_process_files_in_context_pool_should_raise_validation_exceptions(self):
+        # Arrange
+        core = _ManagerCore(self._get_schema(2))
+        plugin = core.model.context_plugin
+        file_paths = [str(Path(self.temp_dir.name) / f"cubes_{i}.usda") for i in range(4)]
+
+        validated = []
+
+        async def run_callback(context_name):
+            validated.append(context_name)
+            raise ValueError("Fix failed")
+
+        # Act
+        with self.assertRaises(ValueError):
+            await plugin.instance._process_files_in_context_pool(  # noqa PLW0212
+                plugin.data, file_paths, run_callback, 2
+            )
+
+        # Assert
+        self.assertEqual(1, len(validated))
+        self.assertIsNone(omni.usd.get_context("_pool_0"))
+        self.assertIsNone(omni.usd.get_context("_pool_1"))
+
+    async def test_group_files_sharing_layers_should_group_dependent_files(self):
+        # Arrange
+        base_path = Path(self.temp_dir.name)
+        Sdf.Layer.CreateNew(str(base_path / "shared.usda")).Save()
+        for name in ["a", "b"]:
+            layer = Sdf.Layer.CreateNew(str(base_path / f"{name}.usda"))
+            layer.subLayerPaths.append("./shared.usda")
+            layer.Save()
+        file_paths = [str(base_path / f"{name}.usda") for name in ["a", "cubes_0", "b", "shared"]]
+
+        # Act
+        groups = _USDDirectory._group_files_sharing_layers(file_paths)  # noqa PLW0212
+
+        # Assert
+        self.assertListEqual(sorted(groups), sorted([[file_paths[0], file_paths[2], file_paths[3]], [file_paths[1]]]))
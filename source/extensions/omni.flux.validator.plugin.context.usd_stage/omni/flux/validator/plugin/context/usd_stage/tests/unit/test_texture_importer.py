@@ -16,7 +16,6 @@
 """
 
 import asyncio
-import shutil
 from typing import Any, Dict, List, Optional
 from unittest.mock import Mock, PropertyMock, call, patch
 
@@ -265,6 +264,8 @@ class TestTextureImporterUnit(omni.kit.test.AsyncTestCase):
         schema_mock.create_context_if_not_exist = False
         schema_mock.input_files = [(input_texture_path, input_texture_type)]
         schema_mock.output_directory = "C:/Test/Output"
+        schema_mock.max_concurrent_copies = 4
+        schema_mock.allow_hardlinks = False
         schema_mock.data_flows = [_InOutDataFlow(**data_fl) for data_fl in data_flows] if data_flows else []
 
         imported_texture_path = "C:/Test/Output/test_0.png"
@@ -282,9 +283,14 @@ class TestTextureImporterUnit(omni.kit.test.AsyncTestCase):
         new_stage_future.set_result(None)
         new_stage_mock.return_value = new_stage_future
 
+        stage_files_future = asyncio.Future()
+        stage_files_future.set_result(None)
+
         with (
             patch.object(omni.client, "normalize_url") as normalize_mock,
-            patch.object(shutil, "copyfile") as copy_mock,
+            patch(
+                "omni.flux.validator.plugin.context.usd_stage.texture_importer._stage_files_async"
+            ) as stage_files_mock,
             patch.object(omni.usd, "get_context") as get_context_mock,
             patch(
                 "omni.flux.validator.plugin.context.usd_stage.texture_importer._create_prims_and_link_assets"
@@ -293,6 +299,7 @@ class TestTextureImporterUnit(omni.kit.test.AsyncTestCase):
             normalize_mock.side_effect = lambda v: v
             get_context_mock.return_value = context_mock if valid_context else None
             create_prims_mock.return_value = create_prims_future
+            stage_files_mock.return_value = stage_files_future
 
             # Act
             is_valid, message, value = await texture_importer._setup(  # noqa PLW0212
@@ -312,8 +319,10 @@ class TestTextureImporterUnit(omni.kit.test.AsyncTestCase):
         self.assertEqual(call(input_texture_path), normalize_mock.call_args_list[0])
         self.assertEqual(call(imported_texture_path), normalize_mock.call_args_list[1])
 
-        self.assertEqual(1, copy_mock.call_count)
-        self.assertEqual(call(input_texture_path, imported_texture_path), copy_mock.call_args)
+        self.assertEqual(1, stage_files_mock.call_count)
+        self.assertEqual([(input_texture_path, imported_texture_path)], stage_files_mock.call_args.args[0])
+        self.assertEqual(4, stage_files_mock.call_args.kwargs["max_concurrent"])
+        self.assertFalse(stage_files_mock.call_args.kwargs["allow_hardlink"])
 
         self.assertEqual(1, get_context_mock.call_count)
         self.assertEqual(call(context_name), get_context_mock.call_args)
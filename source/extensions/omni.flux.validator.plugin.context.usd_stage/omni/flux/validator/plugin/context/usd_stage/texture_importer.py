@@ -38,6 +38,7 @@ from omni.flux.asset_importer.widget.texture_import_list.utils import (
 )
 from omni.flux.info_icon.widget import InfoIconWidget as _InfoIconWidget
 from omni.flux.utils.common.decorators import ignore_function_decorator as _ignore_function_decorator
+from omni.flux.utils.common.file_staging import stage_files_async as _stage_files_async
 from omni.flux.utils.common.omni_url import OmniUrl as _OmniUrl
 from omni.flux.utils.common.path_utils import get_invalid_extensions as _get_invalid_extensions
 from omni.flux.utils.widget.file_pickers import open_file_picker as _open_file_picker
@@ -61,6 +62,10 @@ class TextureImporter(_ContextBaseUSD):
         error_on_texture_types: Optional[List[_TextureTypes]] = None  # if we set texture with this type, it will crash
         create_output_directory_if_missing: bool = True
         output_directory: _OmniUrl
+        max_concurrent_copies: int = 4  # Number of textures copied to the output directory at the same time
+        # Hard link the textures in the output directory when they are on the same volume as the inputs instead of
+        # copying them. Only use this if the check plugins don't edit the textures in-place.
+        allow_hardlinks: bool = False
 
         _compatible_data_flow_names = ["InOutData"]
         data_flows: Optional[List[_InOutDataFlow]] = None  # override base argument with the good typing
@@ -181,9 +186,8 @@ class TextureImporter(_ContextBaseUSD):
             except Exception as e:  # noqa PLW0718
                 return False, str(e), None
 
-        # Copy every input file in the output directory
-        for input_file in schema_data.input_files:
-            input_file_path, input_file_type = input_file
+        sources_destinations = []
+        for input_file_path, _ in schema_data.input_files:
             input_path = carb.tokens.get_tokens_interface().resolve(str(input_file_path))
             input_path = omni.client.normalize_url(input_path)
 
@@ -192,12 +196,29 @@ class TextureImporter(_ContextBaseUSD):
             output_path = carb.tokens.get_tokens_interface().resolve(str((output_dir / _OmniUrl(input_path).name)))
             output_path = omni.client.normalize_url(output_path)
 
-            try:
-                shutil.copyfile(str(input_path), str(output_path))
-            except (shutil.SameFileError, OSError) as e:
-                return False, str(e), None
+            sources_destinations.append((str(input_path), str(output_path)))
+
+        def on_staging_progress(staged_bytes: int, total_bytes: int, bytes_per_second: float):
+            self.on_progress(
+                staged_bytes / total_bytes if total_bytes else 1.0,
+                f"Copied {staged_bytes / 1024**2:.1f}/{total_bytes / 1024**2:.1f} MB "
+                f"({bytes_per_second / 1024**2:.1f} MB/s)",
+                True,
+            )
+
+        # Copy every input file in the output directory. Files with the same content are not copied again.
+        try:
+            await _stage_files_async(
+                sources_destinations,
+                max_concurrent=schema_data.max_concurrent_copies,
+                allow_hardlink=schema_data.allow_hardlinks,
+                progress_callback=on_staging_progress,
+            )
+        except (shutil.SameFileError, OSError) as e:
+            return False, str(e), None
 
-            _validator_factory_utils.push_output_data(schema_data, [str(output_path)])
+        for (_, output_path), (_, input_file_type) in zip(sources_destinations, schema_data.input_files):
+            _validator_factory_utils.push_output_data(schema_data, [output_path])
 
             # Make sure to retain what kind of texture we imported
             imported_files.append((output_path, _TextureTypes[input_file_type]))  # noqa
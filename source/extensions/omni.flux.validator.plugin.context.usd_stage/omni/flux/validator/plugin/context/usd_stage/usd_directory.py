@@ -47,6 +47,9 @@ class USDDirectory(_ContextBaseUSD):
         # will close each dependency layer at the end. But NOT the main layer. Use close_stage_on_exit for the main
         # layer
         close_dependency_between_round: bool = True
+        # Number of files opened, saved and closed concurrently, each in its own USD context. The validation still runs
+        # on one file at a time. 1 processes the files one by one in the plugin context.
+        max_concurrent_files: int = 1
 
         skip_validated_files: bool = False
         file_validated_fixes: set[str] | None = None  # List of fixes that should be applied to skip the validation
@@ -132,6 +135,9 @@ class USDDirectory(_ContextBaseUSD):
             )
         )
 
+        if schema_data.max_concurrent_files > 1:
+            return await self.__setup_concurrent(schema_data, run_callback, directory_path, usd_file_paths)
+
         progress = 0
         progress_delta = 1 / len(usd_file_paths)
 
@@ -175,6 +181,44 @@ class USDDirectory(_ContextBaseUSD):
 
         return True, directory_path, usd_file_paths
 
+    async def __setup_concurrent(
+        self,
+        schema_data: Data,
+        run_callback: Callable[[_SetupDataTypeVar], Awaitable[None]],
+        directory_path: str,
+        usd_file_paths: List[str],
+    ) -> Tuple[bool, str, _SetupDataTypeVar]:
+        files_to_validate = [
+            file_path
+            for file_path in usd_file_paths
+            if not (
+                schema_data.skip_validated_files
+                and schema_data.file_validated_fixes.intersection(
+                    _path_utils.read_metadata(file_path, _FIXES_APPLIED) or []
+                )
+            )
+        ]
+        if not files_to_validate:
+            return False, "All the files within the directory were already validated.", None
+
+        _validator_factory_utils.push_input_data(schema_data, [str(file_path) for file_path in files_to_validate])
+
+        processed_files, errors = await self._process_files_in_context_pool(
+            schema_data,
+            files_to_validate,
+            run_callback,
+            schema_data.max_concurrent_files,
+            save_stage=schema_data.save_all_layers_on_exit,
+        )
+
+        if schema_data.save_all_layers_on_exit:
+            _validator_factory_utils.push_output_data(schema_data, [str(file_path) for file_path in processed_files])
+
+        if errors:
+            return False, f"{len(errors)} file(s) failed:\n" + "\n".join(errors.values()), None
+
+        return True, directory_path, usd_file_paths
+
     async def _on_exit(self, schema_data: Data, parent_context: _SetupDataTypeVar) -> Tuple[bool, str]:
         """
         Function that will be called to after the check of the data. For example, save the input USD stage